@@ -0,0 +1,148 @@
+"""
+Content-addressed store of raw log content. Content is kept gzipped on the filesystem under the BLAKE2 hash of its
+uncompressed bytes, so storing the same content twice only keeps it once, and it can be read back as a stream. The hash
+is taken as content is written, and doubles as the digest logs are deduplicated by.
+"""
+import codecs
+import gzip
+import hashlib
+import os
+import tempfile
+from typing import Iterable, Iterator, Tuple, Union
+
+from django.conf import settings
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _encode(chunks: Iterable[Union[str, bytes]]) -> Iterator[bytes]:
+    """
+    Encode chunks of content, regrouped into blocks of about `CHUNK_SIZE` so large strings are never encoded at once
+    and many small ones aren't hashed and written one by one.
+    :param chunks: Chunks of content, encoded as UTF-8 if they're strings.
+    """
+    buffer, buffered = [], 0
+    for chunk in chunks:
+        for start in range(0, len(chunk), CHUNK_SIZE):
+            part = chunk[start:start + CHUNK_SIZE]
+            if isinstance(part, str):
+                part = part.encode('utf-8', 'surrogatepass')
+            buffer.append(part)
+            buffered += len(part)
+            if buffered >= CHUNK_SIZE:
+                yield b''.join(buffer)
+                buffer, buffered = [], 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+def digest(content: Union[str, bytes, Iterable[Union[str, bytes]]]) -> str:
+    """
+    Get the key content would be stored under, without storing it.
+    :param content: Content, or chunks of it, encoded as UTF-8 if it's a string.
+    :return: Hex BLAKE2 digest of the content.
+    """
+    content_hash = hashlib.blake2b(digest_size=32)
+    for chunk in _encode([content] if isinstance(content, (str, bytes)) else content):
+        content_hash.update(chunk)
+    return content_hash.hexdigest()
+
+
+class FileSystemBlobStore:
+    """
+    Blob store keeping blobs as gzipped files in a directory.
+    :param root: Directory to keep blobs in.
+    """
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], key[2:4], f'{key}.gz')
+
+    def put(self, content: Union[str, bytes]) -> Tuple[str, int]:
+        """
+        Store content.
+        :param content: Content to store, encoded as UTF-8 if it's a string.
+        :return: Key and uncompressed size of the content.
+        """
+        return self.put_stream([content])
+
+    def put_stream(self, chunks: Iterable[Union[str, bytes]]) -> Tuple[str, int]:
+        """
+        Store content as it is read, without holding all of it in memory.
+        :param chunks: Chunks of content, encoded as UTF-8 if they're strings.
+        :return: Key and uncompressed size of the content.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        content_hash = hashlib.blake2b(digest_size=32)
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=self.root, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file, gzip.GzipFile(fileobj=file, mode='wb', mtime=0) as blob:
+                for chunk in _encode(chunks):
+                    content_hash.update(chunk)
+                    size += len(chunk)
+                    blob.write(chunk)
+            key = content_hash.hexdigest()
+            path = self.path(key)
+            if os.path.exists(path):
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return key, size
+
+    def open(self, key: str):
+        """
+        Open stored content for reading.
+        :param key: Content key.
+        :return: Binary file object of the uncompressed content.
+        """
+        return gzip.open(self.path(key), 'rb')
+
+    def read(self, key: str) -> str:
+        """
+        Read all of a piece of content.
+        :param key: Content key.
+        """
+        with self.open(key) as blob:
+            return blob.read().decode('utf-8', 'surrogatepass')
+
+    def iter_text(self, key: str, chunk_size: int = CHUNK_SIZE, progress=None) -> Iterator[str]:
+        """
+        Read stored content in chunks of text.
+        :param key: Content key.
+        :param chunk_size: Number of bytes read at once.
+        :param progress: Progress recorder, given the number of compressed bytes read.
+        """
+        decoder = codecs.getincrementaldecoder('utf-8')('surrogatepass')
+        total = os.path.getsize(self.path(key)) if progress else 0
+        with self.open(key) as blob:
+            while chunk := blob.read(chunk_size):
+                if progress:
+                    progress.set_progress(min(blob.fileobj.tell(), total), total)
+                if text := decoder.decode(chunk):
+                    yield text
+        if text := decoder.decode(b'', final=True):
+            yield text
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self.path(key))
+
+    def delete(self, key: str):
+        """
+        Delete stored content, if it exists.
+        :param key: Content key.
+        """
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+
+blob_store = FileSystemBlobStore(settings.BLOB_STORE_ROOT)
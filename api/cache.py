@@ -0,0 +1,99 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import redis
+
+
+class RenderCache:
+    """
+    Cache of rendered content, kept in an in-process LRU and optionally shared between processes through Redis.
+    :param size: Maximum number of entries kept in process, 0 to not keep any.
+    :param client: Redis client for the shared tier, None to not share entries.
+    :param ttl: Seconds entries are kept in Redis for, None to keep them until Redis evicts them.
+    :param prefix: Prefix of Redis keys.
+    """
+
+    def __init__(self, size: int, client: redis.Redis = None, ttl: int = None, prefix: str = 'render'):
+        self.size = size
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return bool(self.size or self.client)
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Hash everything an entry depends on into a key."""
+        return hashlib.blake2b('\0'.join(map(str, parts)).encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+    def get(self, key: str):
+        """
+        Get an entry, checking the process first and Redis second.
+        :param key: Entry key.
+        :return: Cached value, or None if it isn't cached.
+        """
+        if self.size:
+            with self.lock:
+                if (value := self.entries.get(key)) is not None:
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+        if self.client:
+            try:
+                value = self.client.get(f'{self.prefix}:{key}')
+            except redis.RedisError:
+                value = None
+            if value is not None:
+                value = value.decode('utf-8', 'surrogatepass')
+                self._remember(key, value)
+                self.shared_hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: str):
+        """
+        Store an entry in both tiers.
+        :param key: Entry key.
+        :param value: Value to cache.
+        """
+        self._remember(key, value)
+        if self.client:
+            try:
+                self.client.set(f'{self.prefix}:{key}', value.encode('utf-8', 'surrogatepass'), ex=self.ttl)
+            except redis.RedisError:
+                pass
+
+    def _remember(self, key, value):
+        if not self.size:
+            return
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def stats(self) -> dict:
+        """Get hit and miss counters of this process."""
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            'hits': self.hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.shared_hits) / lookups if lookups else 0,
+            'entries': len(self.entries),
+        }
+
+    def clear(self):
+        """Forget every entry kept in process and reset the counters."""
+        with self.lock:
+            self.entries.clear()
+        self.hits = self.shared_hits = self.misses = 0
@@ -0,0 +1,100 @@
+"""
+Zstandard codec for stored pages. Messages of one type of log look a lot alike, so pages are compressed with a
+dictionary trained on pages of the same type when there is one. Requires the optional `zstandard` package.
+"""
+import functools
+import json
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _require():
+    if zstandard is None:
+        raise ImproperlyConfigured('Page compression requires the zstandard package!')
+
+
+@functools.lru_cache(maxsize=32)
+def _dictionary(pk: int):
+    from api.models import CompressionDictionary
+
+    return zstandard.ZstdCompressionDict(CompressionDictionary.objects.values_list('data', flat=True).get(pk=pk))
+
+
+def compress(messages: list, dictionary_id: int = None) -> bytes:
+    """
+    Compress the messages of a page.
+    :param messages: Formatted messages.
+    :param dictionary_id: Id of the compression dictionary to use, None to not use one.
+    :return: Compressed messages.
+    """
+    _require()
+    compressor = zstandard.ZstdCompressor(
+        level=settings.PAGE_COMPRESSION_LEVEL, dict_data=_dictionary(dictionary_id) if dictionary_id else None
+    )
+    return compressor.compress(json.dumps(messages, separators=(',', ':')).encode('utf-8'))
+
+
+def decompress(data: bytes, dictionary_id: int = None) -> list:
+    """
+    Decompress the messages of a page.
+    :param data: Compressed messages.
+    :param dictionary_id: Id of the compression dictionary they were compressed with.
+    :return: Formatted messages.
+    """
+    _require()
+    decompressor = zstandard.ZstdDecompressor(dict_data=_dictionary(dictionary_id) if dictionary_id else None)
+    return json.loads(decompressor.decompress(bytes(data)))
+
+
+def train(samples: list, size: int) -> bytes:
+    """
+    Train a compression dictionary.
+    :param samples: Formatted messages to train on.
+    :param size: Maximum size of the dictionary, in bytes.
+    :return: Dictionary data.
+    """
+    _require()
+    return zstandard.train_dictionary(size, [
+        json.dumps(sample, separators=(',', ':')).encode('utf-8') for sample in samples
+    ]).as_bytes()
+
+
+def dictionary_for(log_type: str):
+    """
+    Get the id of the newest compression dictionary trained on a type of log.
+    :param log_type: Log type, None for logs uploaded as JSON.
+    :return: Dictionary id, or None if there isn't one.
+    """
+    from api.models import CompressionDictionary
+
+    return CompressionDictionary.objects.filter(log_type=log_type).order_by('-created').values_list(
+        'pk', flat=True).first()
+
+
+def encode_page(messages: list, dictionary_id: int = None) -> dict:
+    """
+    Get the fields of a page storing some messages, compressed if `PAGE_COMPRESSION` is set.
+    :param messages: Formatted messages.
+    :param dictionary_id: Id of the compression dictionary to use, None to not use one.
+    :return: Page fields.
+    """
+    if not settings.PAGE_COMPRESSION:
+        return {'messages': messages, 'compressed': None, 'dictionary_id': None}
+    return {'messages': None, 'compressed': compress(messages, dictionary_id), 'dictionary_id': dictionary_id}
+
+
+def decode_page(messages, compressed, dictionary_id) -> list:
+    """
+    Get the messages of a page from its fields, whether it's compressed or not.
+    :param messages: Messages field.
+    :param compressed: Compressed messages field.
+    :param dictionary_id: Compression dictionary field.
+    :return: Formatted messages.
+    """
+    return messages if compressed is None else decompress(compressed, dictionary_id)
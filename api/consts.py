@@ -35,6 +35,8 @@ vortex_re = r'\[(?P<timestamp>[\w, :]{28,29})\] (?P<username>.*?)#(?P<discrimina
 yggdrasil_re = r'\[Author ID: (?P<user_id>\d{16,19}) \| Message ID: (?P<message_id>\d{16,19})\] (?:<=|=>) ' \
                r'(?P<username>.*?)#(?P<discriminator>\d{4}|\d) : (?P<content>[\S\s]*?)?$'
 
+yggdrasil_header_re = r'-- Phone Report --\nReport By : .*\nReason : [\S\s]+?\nConnected Parties :\n=> .*\n<= .*\n\n'
+
 
 _private_types = {
     'giraffeduck': 'GiraffeDuck',
@@ -93,7 +95,11 @@ privacy_types = [p[0] for p in form_privacy_types]
 
 
 task_messages = [
-    '{current}/{total} messages parsed... ({percent}%)',
+    'Parsing messages... ({percent}%)',
     '{current}/{total} messages formatted... ({percent}%)',
     'Saving messages... ({percent}%)'
 ]
+
+ingest_message = 'Processing messages... ({percent}%)'
+
+fetch_message = 'Downloading log... ({percent}%)'
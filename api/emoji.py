@@ -1,4684 +1,137 @@
 """
+Emoji data used by the formatter, built ahead of time with `python -m api.emoji` and loaded the first time it's used.
+If it wasn't built, it's built then from the emoji list demoji has cached, without downloading anything.
+
 using emoji list from
 https://gist.github.com/Vexs/629488c4bb4126ad2a9909309ed6bd71/da8c23f4a42f3ad7cf829398b89bda5347907fef
 © 2019 Vexs, licensed under "do-whatever-the-fuck-you-want"
+
+Unicode emoji and their descriptions come from the Unicode emoji test file, as downloaded by demoji.
 """
 
 import json
+import logging
+import os
+import re
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+NAMES_PATH = os.path.join(DATA_DIR, 'emoji_names.json')
+DATA_PATH = os.path.join(DATA_DIR, 'emoji.json')
+
+logger = logging.getLogger(__name__)
+
+_data = None
+_lock = threading.Lock()
+
+
+class EmojiTrie:
+    """
+    Trie of unicode emoji, finding the longest emoji at a position in a single walk over it, which is what an
+    alternation of every emoji sorted from longest to shortest finds.
+    :param codes: Emoji to find.
+    """
+
+    def __init__(self, codes):
+        self.root = {}
+        self.longest = 0
+        for code in codes:
+            self.longest = max(self.longest, len(code))
+            node = self.root
+            for char in code:
+                node = node.setdefault(char, {})
+            node[None] = code
+
+    def match(self, text: str, pos: int = 0):
+        """
+        Find the longest emoji starting at a position.
+        :param text: Text to search.
+        :param pos: Position of the emoji.
+        :return: Emoji, or None if there isn't one there.
+        """
+        node = self.root
+        code = None
+        for char in text[pos:pos + self.longest]:
+            if (node := node.get(char)) is None:
+                break
+            code = node.get(None, code)
+        return code
+
+
+def build(url: str = None, cached: bool = False) -> dict:
+    """
+    Build emoji data out of the Unicode emoji list and emoji names.
+    :param url: URL of the Unicode emoji test file, the one demoji uses if not supplied.
+    :param cached: Whether to only use the emoji list demoji keeps in its cache, instead of downloading it.
+    :return: Built data.
+    """
+    import demoji
+
+    with open(NAMES_PATH, encoding='utf-8') as file:
+        names = json.load(file)
+    if cached:
+        if not demoji.last_downloaded_timestamp():
+            raise ImproperlyConfigured(f'Emoji data not found at {DATA_PATH}, and demoji has no cached emoji list to '
+                                       f'build it from. Build it with `python -m api.emoji`.')
+        descriptions = demoji._load_codes_from_file()[1]
+    else:
+        descriptions = dict(demoji.stream_unicodeorg_emojifile(url or demoji.URL))
+    return {
+        'names': names,
+        'descriptions': descriptions,
+        # Longest emoji first, so that sequences win over the emoji they start with
+        'pattern': '|'.join(re.escape(code) for code in sorted(descriptions, key=len, reverse=True)),
+    }
+
+
+def save(data: dict, path: str = DATA_PATH):
+    """
+    Write emoji data to the emoji data file.
+    :param data: Built data.
+    :param path: Path to write the data to.
+    """
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, separators=(',', ':'))
+
+
+def load() -> dict:
+    """Load the emoji data file once, building it first from demoji's cache if it's missing, never downloading it."""
+    global _data
+    if _data is None:
+        with _lock:
+            if _data is None:
+                try:
+                    with open(DATA_PATH, encoding='utf-8') as file:
+                        data = json.load(file)
+                except FileNotFoundError:
+                    logger.warning('Emoji data not found at %s, building it from the emoji list demoji has cached. '
+                                   'Build it ahead of time with `python -m api.emoji`.', DATA_PATH)
+                    data = build(cached=True)
+                    try:
+                        save(data)
+                    except OSError as e:
+                        logger.warning('Emoji data could not be written to %s: %s', DATA_PATH, e)
+                _data = {
+                    'EMOJI_LIST': data['names'],
+                    'UNICODE_LIST': {v: k for k, v in data['names'].items()},
+                    'CODE_TO_DESC': data['descriptions'],
+                    'UNICODE_EMOJI_PAT': data['pattern'],
+                    'UNICODE_EMOJI': EmojiTrie(data['descriptions']),
+                }
+    return _data
+
 
-_EMOJI_LIST = {
-    "grinning": "\ud83d\ude00",
-    "smiley": "\ud83d\ude03",
-    "smile": "\ud83d\ude04",
-    "grin": "\ud83d\ude01",
-    "laughing": "\ud83d\ude06",
-    "satisfied": "\ud83d\ude06",
-    "sweat_smile": "\ud83d\ude05",
-    "joy": "\ud83d\ude02",
-    "rofl": "\ud83e\udd23",
-    "rolling_on_the_floor_laughing": "\ud83e\udd23",
-    "relaxed": "\u263a\ufe0f",
-    "blush": "\ud83d\ude0a",
-    "innocent": "\ud83d\ude07",
-    "slight_smile": "\ud83d\ude42",
-    "slightly_smiling_face": "\ud83d\ude42",
-    "upside_down": "\ud83d\ude43",
-    "upside_down_face": "\ud83d\ude43",
-    "wink": "\ud83d\ude09",
-    "relieved": "\ud83d\ude0c",
-    "smiling_face_with_tear": "\ud83e\udd72",
-    "heart_eyes": "\ud83d\ude0d",
-    "smiling_face_with_3_hearts": "\ud83e\udd70",
-    "kissing_heart": "\ud83d\ude18",
-    "kissing": "\ud83d\ude17",
-    "kissing_smiling_eyes": "\ud83d\ude19",
-    "kissing_closed_eyes": "\ud83d\ude1a",
-    "yum": "\ud83d\ude0b",
-    "stuck_out_tongue": "\ud83d\ude1b",
-    "stuck_out_tongue_closed_eyes": "\ud83d\ude1d",
-    "stuck_out_tongue_winking_eye": "\ud83d\ude1c",
-    "zany_face": "\ud83e\udd2a",
-    "face_with_raised_eyebrow": "\ud83e\udd28",
-    "face_with_monocle": "\ud83e\uddd0",
-    "nerd": "\ud83e\udd13",
-    "nerd_face": "\ud83e\udd13",
-    "sunglasses": "\ud83d\ude0e",
-    "star_struck": "\ud83e\udd29",
-    "partying_face": "\ud83e\udd73",
-    "smirk": "\ud83d\ude0f",
-    "unamused": "\ud83d\ude12",
-    "disappointed": "\ud83d\ude1e",
-    "pensive": "\ud83d\ude14",
-    "worried": "\ud83d\ude1f",
-    "confused": "\ud83d\ude15",
-    "slight_frown": "\ud83d\ude41",
-    "slightly_frowning_face": "\ud83d\ude41",
-    "frowning2": "\u2639\ufe0f",
-    "white_frowning_face": "\u2639\ufe0f",
-    "persevere": "\ud83d\ude23",
-    "confounded": "\ud83d\ude16",
-    "tired_face": "\ud83d\ude2b",
-    "weary": "\ud83d\ude29",
-    "pleading_face": "\ud83e\udd7a",
-    "cry": "\ud83d\ude22",
-    "sob": "\ud83d\ude2d",
-    "triumph": "\ud83d\ude24",
-    "angry": "\ud83d\ude20",
-    "rage": "\ud83d\ude21",
-    "face_with_symbols_over_mouth": "\ud83e\udd2c",
-    "exploding_head": "\ud83e\udd2f",
-    "flushed": "\ud83d\ude33",
-    "hot_face": "\ud83e\udd75",
-    "cold_face": "\ud83e\udd76",
-    "scream": "\ud83d\ude31",
-    "fearful": "\ud83d\ude28",
-    "cold_sweat": "\ud83d\ude30",
-    "disappointed_relieved": "\ud83d\ude25",
-    "sweat": "\ud83d\ude13",
-    "hugging": "\ud83e\udd17",
-    "hugging_face": "\ud83e\udd17",
-    "thinking": "\ud83e\udd14",
-    "thinking_face": "\ud83e\udd14",
-    "face_with_hand_over_mouth": "\ud83e\udd2d",
-    "yawning_face": "\ud83e\udd71",
-    "shushing_face": "\ud83e\udd2b",
-    "lying_face": "\ud83e\udd25",
-    "liar": "\ud83e\udd25",
-    "no_mouth": "\ud83d\ude36",
-    "neutral_face": "\ud83d\ude10",
-    "expressionless": "\ud83d\ude11",
-    "grimacing": "\ud83d\ude2c",
-    "rolling_eyes": "\ud83d\ude44",
-    "face_with_rolling_eyes": "\ud83d\ude44",
-    "hushed": "\ud83d\ude2f",
-    "frowning": "\ud83d\ude26",
-    "anguished": "\ud83d\ude27",
-    "open_mouth": "\ud83d\ude2e",
-    "astonished": "\ud83d\ude32",
-    "sleeping": "\ud83d\ude34",
-    "drooling_face": "\ud83e\udd24",
-    "drool": "\ud83e\udd24",
-    "sleepy": "\ud83d\ude2a",
-    "dizzy_face": "\ud83d\ude35",
-    "zipper_mouth": "\ud83e\udd10",
-    "zipper_mouth_face": "\ud83e\udd10",
-    "woozy_face": "\ud83e\udd74",
-    "nauseated_face": "\ud83e\udd22",
-    "sick": "\ud83e\udd22",
-    "face_vomiting": "\ud83e\udd2e",
-    "sneezing_face": "\ud83e\udd27",
-    "sneeze": "\ud83e\udd27",
-    "mask": "\ud83d\ude37",
-    "thermometer_face": "\ud83e\udd12",
-    "face_with_thermometer": "\ud83e\udd12",
-    "head_bandage": "\ud83e\udd15",
-    "face_with_head_bandage": "\ud83e\udd15",
-    "money_mouth": "\ud83e\udd11",
-    "money_mouth_face": "\ud83e\udd11",
-    "cowboy": "\ud83e\udd20",
-    "face_with_cowboy_hat": "\ud83e\udd20",
-    "disguised_face": "\ud83e\udd78",
-    "smiling_imp": "\ud83d\ude08",
-    "imp": "\ud83d\udc7f",
-    "japanese_ogre": "\ud83d\udc79",
-    "japanese_goblin": "\ud83d\udc7a",
-    "clown": "\ud83e\udd21",
-    "clown_face": "\ud83e\udd21",
-    "poop": "\ud83d\udca9",
-    "shit": "\ud83d\udca9",
-    "hankey": "\ud83d\udca9",
-    "poo": "\ud83d\udca9",
-    "ghost": "\ud83d\udc7b",
-    "skull": "\ud83d\udc80",
-    "skeleton": "\ud83d\udc80",
-    "skull_crossbones": "\u2620\ufe0f",
-    "skull_and_crossbones": "\u2620\ufe0f",
-    "alien": "\ud83d\udc7d",
-    "space_invader": "\ud83d\udc7e",
-    "robot": "\ud83e\udd16",
-    "robot_face": "\ud83e\udd16",
-    "jack_o_lantern": "\ud83c\udf83",
-    "smiley_cat": "\ud83d\ude3a",
-    "smile_cat": "\ud83d\ude38",
-    "joy_cat": "\ud83d\ude39",
-    "heart_eyes_cat": "\ud83d\ude3b",
-    "smirk_cat": "\ud83d\ude3c",
-    "kissing_cat": "\ud83d\ude3d",
-    "scream_cat": "\ud83d\ude40",
-    "crying_cat_face": "\ud83d\ude3f",
-    "pouting_cat": "\ud83d\ude3e",
-    "palms_up_together": "\ud83e\udd32",
-    "palms_up_together_tone1": "\ud83e\udd32\ud83c\udffb",
-    "palms_up_together_light_skin_tone": "\ud83e\udd32\ud83c\udffb",
-    "palms_up_together_tone2": "\ud83e\udd32\ud83c\udffc",
-    "palms_up_together_medium_light_skin_tone": "\ud83e\udd32\ud83c\udffc",
-    "palms_up_together_tone3": "\ud83e\udd32\ud83c\udffd",
-    "palms_up_together_medium_skin_tone": "\ud83e\udd32\ud83c\udffd",
-    "palms_up_together_tone4": "\ud83e\udd32\ud83c\udffe",
-    "palms_up_together_medium_dark_skin_tone": "\ud83e\udd32\ud83c\udffe",
-    "palms_up_together_tone5": "\ud83e\udd32\ud83c\udfff",
-    "palms_up_together_dark_skin_tone": "\ud83e\udd32\ud83c\udfff",
-    "open_hands": "\ud83d\udc50",
-    "open_hands_tone1": "\ud83d\udc50\ud83c\udffb",
-    "open_hands_tone2": "\ud83d\udc50\ud83c\udffc",
-    "open_hands_tone3": "\ud83d\udc50\ud83c\udffd",
-    "open_hands_tone4": "\ud83d\udc50\ud83c\udffe",
-    "open_hands_tone5": "\ud83d\udc50\ud83c\udfff",
-    "raised_hands": "\ud83d\ude4c",
-    "raised_hands_tone1": "\ud83d\ude4c\ud83c\udffb",
-    "raised_hands_tone2": "\ud83d\ude4c\ud83c\udffc",
-    "raised_hands_tone3": "\ud83d\ude4c\ud83c\udffd",
-    "raised_hands_tone4": "\ud83d\ude4c\ud83c\udffe",
-    "raised_hands_tone5": "\ud83d\ude4c\ud83c\udfff",
-    "clap": "\ud83d\udc4f",
-    "clap_tone1": "\ud83d\udc4f\ud83c\udffb",
-    "clap_tone2": "\ud83d\udc4f\ud83c\udffc",
-    "clap_tone3": "\ud83d\udc4f\ud83c\udffd",
-    "clap_tone4": "\ud83d\udc4f\ud83c\udffe",
-    "clap_tone5": "\ud83d\udc4f\ud83c\udfff",
-    "handshake": "\ud83e\udd1d",
-    "shaking_hands": "\ud83e\udd1d",
-    "thumbsup": "\ud83d\udc4d",
-    "thumbsup_tone1": "\ud83d\udc4d\ud83c\udffb",
-    "+1_tone1": "\ud83d\udc4d\ud83c\udffb",
-    "thumbup_tone1": "\ud83d\udc4d\ud83c\udffb",
-    "thumbsup_tone2": "\ud83d\udc4d\ud83c\udffc",
-    "+1_tone2": "\ud83d\udc4d\ud83c\udffc",
-    "thumbup_tone2": "\ud83d\udc4d\ud83c\udffc",
-    "thumbsup_tone3": "\ud83d\udc4d\ud83c\udffd",
-    "+1_tone3": "\ud83d\udc4d\ud83c\udffd",
-    "thumbup_tone3": "\ud83d\udc4d\ud83c\udffd",
-    "thumbsup_tone4": "\ud83d\udc4d\ud83c\udffe",
-    "+1_tone4": "\ud83d\udc4d\ud83c\udffe",
-    "thumbup_tone4": "\ud83d\udc4d\ud83c\udffe",
-    "thumbsup_tone5": "\ud83d\udc4d\ud83c\udfff",
-    "+1_tone5": "\ud83d\udc4d\ud83c\udfff",
-    "thumbup_tone5": "\ud83d\udc4d\ud83c\udfff",
-    "+1": "\ud83d\udc4d",
-    "thumbup": "\ud83d\udc4d",
-    "thumbsdown": "\ud83d\udc4e",
-    "thumbsdown_tone1": "\ud83d\udc4e\ud83c\udffb",
-    "_1_tone1": "\ud83d\udc4e\ud83c\udffb",
-    "thumbdown_tone1": "\ud83d\udc4e\ud83c\udffb",
-    "thumbsdown_tone2": "\ud83d\udc4e\ud83c\udffc",
-    "_1_tone2": "\ud83d\udc4e\ud83c\udffc",
-    "thumbdown_tone2": "\ud83d\udc4e\ud83c\udffc",
-    "thumbsdown_tone3": "\ud83d\udc4e\ud83c\udffd",
-    "_1_tone3": "\ud83d\udc4e\ud83c\udffd",
-    "thumbdown_tone3": "\ud83d\udc4e\ud83c\udffd",
-    "thumbsdown_tone4": "\ud83d\udc4e\ud83c\udffe",
-    "_1_tone4": "\ud83d\udc4e\ud83c\udffe",
-    "thumbdown_tone4": "\ud83d\udc4e\ud83c\udffe",
-    "thumbsdown_tone5": "\ud83d\udc4e\ud83c\udfff",
-    "_1_tone5": "\ud83d\udc4e\ud83c\udfff",
-    "thumbdown_tone5": "\ud83d\udc4e\ud83c\udfff",
-    "-1": "\ud83d\udc4e",
-    "thumbdown": "\ud83d\udc4e",
-    "punch": "\ud83d\udc4a",
-    "punch_tone1": "\ud83d\udc4a\ud83c\udffb",
-    "punch_tone2": "\ud83d\udc4a\ud83c\udffc",
-    "punch_tone3": "\ud83d\udc4a\ud83c\udffd",
-    "punch_tone4": "\ud83d\udc4a\ud83c\udffe",
-    "punch_tone5": "\ud83d\udc4a\ud83c\udfff",
-    "fist": "\u270a",
-    "fist_tone1": "\u270a\ud83c\udffb",
-    "fist_tone2": "\u270a\ud83c\udffc",
-    "fist_tone3": "\u270a\ud83c\udffd",
-    "fist_tone4": "\u270a\ud83c\udffe",
-    "fist_tone5": "\u270a\ud83c\udfff",
-    "left_facing_fist": "\ud83e\udd1b",
-    "left_facing_fist_tone1": "\ud83e\udd1b\ud83c\udffb",
-    "left_fist_tone1": "\ud83e\udd1b\ud83c\udffb",
-    "left_facing_fist_tone2": "\ud83e\udd1b\ud83c\udffc",
-    "left_fist_tone2": "\ud83e\udd1b\ud83c\udffc",
-    "left_facing_fist_tone3": "\ud83e\udd1b\ud83c\udffd",
-    "left_fist_tone3": "\ud83e\udd1b\ud83c\udffd",
-    "left_facing_fist_tone4": "\ud83e\udd1b\ud83c\udffe",
-    "left_fist_tone4": "\ud83e\udd1b\ud83c\udffe",
-    "left_facing_fist_tone5": "\ud83e\udd1b\ud83c\udfff",
-    "left_fist_tone5": "\ud83e\udd1b\ud83c\udfff",
-    "left_fist": "\ud83e\udd1b",
-    "right_facing_fist": "\ud83e\udd1c",
-    "right_facing_fist_tone1": "\ud83e\udd1c\ud83c\udffb",
-    "right_fist_tone1": "\ud83e\udd1c\ud83c\udffb",
-    "right_facing_fist_tone2": "\ud83e\udd1c\ud83c\udffc",
-    "right_fist_tone2": "\ud83e\udd1c\ud83c\udffc",
-    "right_facing_fist_tone3": "\ud83e\udd1c\ud83c\udffd",
-    "right_fist_tone3": "\ud83e\udd1c\ud83c\udffd",
-    "right_facing_fist_tone4": "\ud83e\udd1c\ud83c\udffe",
-    "right_fist_tone4": "\ud83e\udd1c\ud83c\udffe",
-    "right_facing_fist_tone5": "\ud83e\udd1c\ud83c\udfff",
-    "right_fist_tone5": "\ud83e\udd1c\ud83c\udfff",
-    "right_fist": "\ud83e\udd1c",
-    "fingers_crossed": "\ud83e\udd1e",
-    "fingers_crossed_tone1": "\ud83e\udd1e\ud83c\udffb",
-    "hand_with_index_and_middle_fingers_crossed_tone1": "\ud83e\udd1e\ud83c\udffb",
-    "fingers_crossed_tone2": "\ud83e\udd1e\ud83c\udffc",
-    "hand_with_index_and_middle_fingers_crossed_tone2": "\ud83e\udd1e\ud83c\udffc",
-    "fingers_crossed_tone3": "\ud83e\udd1e\ud83c\udffd",
-    "hand_with_index_and_middle_fingers_crossed_tone3": "\ud83e\udd1e\ud83c\udffd",
-    "fingers_crossed_tone4": "\ud83e\udd1e\ud83c\udffe",
-    "hand_with_index_and_middle_fingers_crossed_tone4": "\ud83e\udd1e\ud83c\udffe",
-    "fingers_crossed_tone5": "\ud83e\udd1e\ud83c\udfff",
-    "hand_with_index_and_middle_fingers_crossed_tone5": "\ud83e\udd1e\ud83c\udfff",
-    "hand_with_index_and_middle_finger_crossed": "\ud83e\udd1e",
-    "v": "\u270c\ufe0f",
-    "v_tone1": "\u270c\ud83c\udffb",
-    "v_tone2": "\u270c\ud83c\udffc",
-    "v_tone3": "\u270c\ud83c\udffd",
-    "v_tone4": "\u270c\ud83c\udffe",
-    "v_tone5": "\u270c\ud83c\udfff",
-    "love_you_gesture": "\ud83e\udd1f",
-    "love_you_gesture_tone1": "\ud83e\udd1f\ud83c\udffb",
-    "love_you_gesture_light_skin_tone": "\ud83e\udd1f\ud83c\udffb",
-    "love_you_gesture_tone2": "\ud83e\udd1f\ud83c\udffc",
-    "love_you_gesture_medium_light_skin_tone": "\ud83e\udd1f\ud83c\udffc",
-    "love_you_gesture_tone3": "\ud83e\udd1f\ud83c\udffd",
-    "love_you_gesture_medium_skin_tone": "\ud83e\udd1f\ud83c\udffd",
-    "love_you_gesture_tone4": "\ud83e\udd1f\ud83c\udffe",
-    "love_you_gesture_medium_dark_skin_tone": "\ud83e\udd1f\ud83c\udffe",
-    "love_you_gesture_tone5": "\ud83e\udd1f\ud83c\udfff",
-    "love_you_gesture_dark_skin_tone": "\ud83e\udd1f\ud83c\udfff",
-    "metal": "\ud83e\udd18",
-    "metal_tone1": "\ud83e\udd18\ud83c\udffb",
-    "sign_of_the_horns_tone1": "\ud83e\udd18\ud83c\udffb",
-    "metal_tone2": "\ud83e\udd18\ud83c\udffc",
-    "sign_of_the_horns_tone2": "\ud83e\udd18\ud83c\udffc",
-    "metal_tone3": "\ud83e\udd18\ud83c\udffd",
-    "sign_of_the_horns_tone3": "\ud83e\udd18\ud83c\udffd",
-    "metal_tone4": "\ud83e\udd18\ud83c\udffe",
-    "sign_of_the_horns_tone4": "\ud83e\udd18\ud83c\udffe",
-    "metal_tone5": "\ud83e\udd18\ud83c\udfff",
-    "sign_of_the_horns_tone5": "\ud83e\udd18\ud83c\udfff",
-    "sign_of_the_horns": "\ud83e\udd18",
-    "ok_hand": "\ud83d\udc4c",
-    "ok_hand_tone1": "\ud83d\udc4c\ud83c\udffb",
-    "ok_hand_tone2": "\ud83d\udc4c\ud83c\udffc",
-    "ok_hand_tone3": "\ud83d\udc4c\ud83c\udffd",
-    "ok_hand_tone4": "\ud83d\udc4c\ud83c\udffe",
-    "ok_hand_tone5": "\ud83d\udc4c\ud83c\udfff",
-    "pinching_hand": "\ud83e\udd0f",
-    "pinching_hand_tone1": "\ud83e\udd0f\ud83c\udffb",
-    "pinching_hand_light_skin_tone": "\ud83e\udd0f\ud83c\udffb",
-    "pinching_hand_tone2": "\ud83e\udd0f\ud83c\udffc",
-    "pinching_hand_medium_light_skin_tone": "\ud83e\udd0f\ud83c\udffc",
-    "pinching_hand_tone3": "\ud83e\udd0f\ud83c\udffd",
-    "pinching_hand_medium_skin_tone": "\ud83e\udd0f\ud83c\udffd",
-    "pinching_hand_tone4": "\ud83e\udd0f\ud83c\udffe",
-    "pinching_hand_medium_dark_skin_tone": "\ud83e\udd0f\ud83c\udffe",
-    "pinching_hand_tone5": "\ud83e\udd0f\ud83c\udfff",
-    "pinching_hand_dark_skin_tone": "\ud83e\udd0f\ud83c\udfff",
-    "pinched_fingers": "\ud83e\udd0c",
-    "pinched_fingers_tone2": "\ud83e\udd0c\ud83c\udffc",
-    "pinched_fingers_medium_light_skin_tone": "\ud83e\udd0c\ud83c\udffc",
-    "pinched_fingers_tone1": "\ud83e\udd0c\ud83c\udffb",
-    "pinched_fingers_light_skin_tone": "\ud83e\udd0c\ud83c\udffb",
-    "pinched_fingers_tone3": "\ud83e\udd0c\ud83c\udffd",
-    "pinched_fingers_medium_skin_tone": "\ud83e\udd0c\ud83c\udffd",
-    "pinched_fingers_tone4": "\ud83e\udd0c\ud83c\udffe",
-    "pinched_fingers_medium_dark_skin_tone": "\ud83e\udd0c\ud83c\udffe",
-    "pinched_fingers_tone5": "\ud83e\udd0c\ud83c\udfff",
-    "pinched_fingers_dark_skin_tone": "\ud83e\udd0c\ud83c\udfff",
-    "point_left": "\ud83d\udc48",
-    "point_left_tone1": "\ud83d\udc48\ud83c\udffb",
-    "point_left_tone2": "\ud83d\udc48\ud83c\udffc",
-    "point_left_tone3": "\ud83d\udc48\ud83c\udffd",
-    "point_left_tone4": "\ud83d\udc48\ud83c\udffe",
-    "point_left_tone5": "\ud83d\udc48\ud83c\udfff",
-    "point_right": "\ud83d\udc49",
-    "point_right_tone1": "\ud83d\udc49\ud83c\udffb",
-    "point_right_tone2": "\ud83d\udc49\ud83c\udffc",
-    "point_right_tone3": "\ud83d\udc49\ud83c\udffd",
-    "point_right_tone4": "\ud83d\udc49\ud83c\udffe",
-    "point_right_tone5": "\ud83d\udc49\ud83c\udfff",
-    "point_up_2": "\ud83d\udc46",
-    "point_up_2_tone1": "\ud83d\udc46\ud83c\udffb",
-    "point_up_2_tone2": "\ud83d\udc46\ud83c\udffc",
-    "point_up_2_tone3": "\ud83d\udc46\ud83c\udffd",
-    "point_up_2_tone4": "\ud83d\udc46\ud83c\udffe",
-    "point_up_2_tone5": "\ud83d\udc46\ud83c\udfff",
-    "point_down": "\ud83d\udc47",
-    "point_down_tone1": "\ud83d\udc47\ud83c\udffb",
-    "point_down_tone2": "\ud83d\udc47\ud83c\udffc",
-    "point_down_tone3": "\ud83d\udc47\ud83c\udffd",
-    "point_down_tone4": "\ud83d\udc47\ud83c\udffe",
-    "point_down_tone5": "\ud83d\udc47\ud83c\udfff",
-    "point_up": "\u261d\ufe0f",
-    "point_up_tone1": "\u261d\ud83c\udffb",
-    "point_up_tone2": "\u261d\ud83c\udffc",
-    "point_up_tone3": "\u261d\ud83c\udffd",
-    "point_up_tone4": "\u261d\ud83c\udffe",
-    "point_up_tone5": "\u261d\ud83c\udfff",
-    "raised_hand": "\u270b",
-    "raised_hand_tone1": "\u270b\ud83c\udffb",
-    "raised_hand_tone2": "\u270b\ud83c\udffc",
-    "raised_hand_tone3": "\u270b\ud83c\udffd",
-    "raised_hand_tone4": "\u270b\ud83c\udffe",
-    "raised_hand_tone5": "\u270b\ud83c\udfff",
-    "raised_back_of_hand": "\ud83e\udd1a",
-    "raised_back_of_hand_tone1": "\ud83e\udd1a\ud83c\udffb",
-    "back_of_hand_tone1": "\ud83e\udd1a\ud83c\udffb",
-    "raised_back_of_hand_tone2": "\ud83e\udd1a\ud83c\udffc",
-    "back_of_hand_tone2": "\ud83e\udd1a\ud83c\udffc",
-    "raised_back_of_hand_tone3": "\ud83e\udd1a\ud83c\udffd",
-    "back_of_hand_tone3": "\ud83e\udd1a\ud83c\udffd",
-    "raised_back_of_hand_tone4": "\ud83e\udd1a\ud83c\udffe",
-    "back_of_hand_tone4": "\ud83e\udd1a\ud83c\udffe",
-    "raised_back_of_hand_tone5": "\ud83e\udd1a\ud83c\udfff",
-    "back_of_hand_tone5": "\ud83e\udd1a\ud83c\udfff",
-    "back_of_hand": "\ud83e\udd1a",
-    "hand_splayed": "\ud83d\udd90\ufe0f",
-    "hand_splayed_tone1": "\ud83d\udd90\ud83c\udffb",
-    "raised_hand_with_fingers_splayed_tone1": "\ud83d\udd90\ud83c\udffb",
-    "hand_splayed_tone2": "\ud83d\udd90\ud83c\udffc",
-    "raised_hand_with_fingers_splayed_tone2": "\ud83d\udd90\ud83c\udffc",
-    "hand_splayed_tone3": "\ud83d\udd90\ud83c\udffd",
-    "raised_hand_with_fingers_splayed_tone3": "\ud83d\udd90\ud83c\udffd",
-    "hand_splayed_tone4": "\ud83d\udd90\ud83c\udffe",
-    "raised_hand_with_fingers_splayed_tone4": "\ud83d\udd90\ud83c\udffe",
-    "hand_splayed_tone5": "\ud83d\udd90\ud83c\udfff",
-    "raised_hand_with_fingers_splayed_tone5": "\ud83d\udd90\ud83c\udfff",
-    "raised_hand_with_fingers_splayed": "\ud83d\udd90\ufe0f",
-    "vulcan": "\ud83d\udd96",
-    "vulcan_tone1": "\ud83d\udd96\ud83c\udffb",
-    "raised_hand_with_part_between_middle_and_ring_fingers_tone1": "\ud83d\udd96\ud83c\udffb",
-    "vulcan_tone2": "\ud83d\udd96\ud83c\udffc",
-    "raised_hand_with_part_between_middle_and_ring_fingers_tone2": "\ud83d\udd96\ud83c\udffc",
-    "vulcan_tone3": "\ud83d\udd96\ud83c\udffd",
-    "raised_hand_with_part_between_middle_and_ring_fingers_tone3": "\ud83d\udd96\ud83c\udffd",
-    "vulcan_tone4": "\ud83d\udd96\ud83c\udffe",
-    "raised_hand_with_part_between_middle_and_ring_fingers_tone4": "\ud83d\udd96\ud83c\udffe",
-    "vulcan_tone5": "\ud83d\udd96\ud83c\udfff",
-    "raised_hand_with_part_between_middle_and_ring_fingers_tone5": "\ud83d\udd96\ud83c\udfff",
-    "raised_hand_with_part_between_middle_and_ring_fingers": "\ud83d\udd96",
-    "wave": "\ud83d\udc4b",
-    "wave_tone1": "\ud83d\udc4b\ud83c\udffb",
-    "wave_tone2": "\ud83d\udc4b\ud83c\udffc",
-    "wave_tone3": "\ud83d\udc4b\ud83c\udffd",
-    "wave_tone4": "\ud83d\udc4b\ud83c\udffe",
-    "wave_tone5": "\ud83d\udc4b\ud83c\udfff",
-    "call_me": "\ud83e\udd19",
-    "call_me_tone1": "\ud83e\udd19\ud83c\udffb",
-    "call_me_hand_tone1": "\ud83e\udd19\ud83c\udffb",
-    "call_me_tone2": "\ud83e\udd19\ud83c\udffc",
-    "call_me_hand_tone2": "\ud83e\udd19\ud83c\udffc",
-    "call_me_tone3": "\ud83e\udd19\ud83c\udffd",
-    "call_me_hand_tone3": "\ud83e\udd19\ud83c\udffd",
-    "call_me_tone4": "\ud83e\udd19\ud83c\udffe",
-    "call_me_hand_tone4": "\ud83e\udd19\ud83c\udffe",
-    "call_me_tone5": "\ud83e\udd19\ud83c\udfff",
-    "call_me_hand_tone5": "\ud83e\udd19\ud83c\udfff",
-    "call_me_hand": "\ud83e\udd19",
-    "muscle": "\ud83d\udcaa",
-    "muscle_tone1": "\ud83d\udcaa\ud83c\udffb",
-    "muscle_tone2": "\ud83d\udcaa\ud83c\udffc",
-    "muscle_tone3": "\ud83d\udcaa\ud83c\udffd",
-    "muscle_tone4": "\ud83d\udcaa\ud83c\udffe",
-    "muscle_tone5": "\ud83d\udcaa\ud83c\udfff",
-    "mechanical_arm": "\ud83e\uddbe",
-    "middle_finger": "\ud83d\udd95",
-    "middle_finger_tone1": "\ud83d\udd95\ud83c\udffb",
-    "reversed_hand_with_middle_finger_extended_tone1": "\ud83d\udd95\ud83c\udffb",
-    "middle_finger_tone2": "\ud83d\udd95\ud83c\udffc",
-    "reversed_hand_with_middle_finger_extended_tone2": "\ud83d\udd95\ud83c\udffc",
-    "middle_finger_tone3": "\ud83d\udd95\ud83c\udffd",
-    "reversed_hand_with_middle_finger_extended_tone3": "\ud83d\udd95\ud83c\udffd",
-    "middle_finger_tone4": "\ud83d\udd95\ud83c\udffe",
-    "reversed_hand_with_middle_finger_extended_tone4": "\ud83d\udd95\ud83c\udffe",
-    "middle_finger_tone5": "\ud83d\udd95\ud83c\udfff",
-    "reversed_hand_with_middle_finger_extended_tone5": "\ud83d\udd95\ud83c\udfff",
-    "reversed_hand_with_middle_finger_extended": "\ud83d\udd95",
-    "writing_hand": "\u270d\ufe0f",
-    "writing_hand_tone1": "\u270d\ud83c\udffb",
-    "writing_hand_tone2": "\u270d\ud83c\udffc",
-    "writing_hand_tone3": "\u270d\ud83c\udffd",
-    "writing_hand_tone4": "\u270d\ud83c\udffe",
-    "writing_hand_tone5": "\u270d\ud83c\udfff",
-    "pray": "\ud83d\ude4f",
-    "pray_tone1": "\ud83d\ude4f\ud83c\udffb",
-    "pray_tone2": "\ud83d\ude4f\ud83c\udffc",
-    "pray_tone3": "\ud83d\ude4f\ud83c\udffd",
-    "pray_tone4": "\ud83d\ude4f\ud83c\udffe",
-    "pray_tone5": "\ud83d\ude4f\ud83c\udfff",
-    "foot": "\ud83e\uddb6",
-    "foot_tone1": "\ud83e\uddb6\ud83c\udffb",
-    "foot_light_skin_tone": "\ud83e\uddb6\ud83c\udffb",
-    "foot_tone2": "\ud83e\uddb6\ud83c\udffc",
-    "foot_medium_light_skin_tone": "\ud83e\uddb6\ud83c\udffc",
-    "foot_tone3": "\ud83e\uddb6\ud83c\udffd",
-    "foot_medium_skin_tone": "\ud83e\uddb6\ud83c\udffd",
-    "foot_tone4": "\ud83e\uddb6\ud83c\udffe",
-    "foot_medium_dark_skin_tone": "\ud83e\uddb6\ud83c\udffe",
-    "foot_tone5": "\ud83e\uddb6\ud83c\udfff",
-    "foot_dark_skin_tone": "\ud83e\uddb6\ud83c\udfff",
-    "leg": "\ud83e\uddb5",
-    "leg_tone1": "\ud83e\uddb5\ud83c\udffb",
-    "leg_light_skin_tone": "\ud83e\uddb5\ud83c\udffb",
-    "leg_tone2": "\ud83e\uddb5\ud83c\udffc",
-    "leg_medium_light_skin_tone": "\ud83e\uddb5\ud83c\udffc",
-    "leg_tone3": "\ud83e\uddb5\ud83c\udffd",
-    "leg_medium_skin_tone": "\ud83e\uddb5\ud83c\udffd",
-    "leg_tone4": "\ud83e\uddb5\ud83c\udffe",
-    "leg_medium_dark_skin_tone": "\ud83e\uddb5\ud83c\udffe",
-    "leg_tone5": "\ud83e\uddb5\ud83c\udfff",
-    "leg_dark_skin_tone": "\ud83e\uddb5\ud83c\udfff",
-    "mechanical_leg": "\ud83e\uddbf",
-    "lipstick": "\ud83d\udc84",
-    "kiss": "\ud83d\udc8b",
-    "lips": "\ud83d\udc44",
-    "tooth": "\ud83e\uddb7",
-    "bone": "\ud83e\uddb4",
-    "tongue": "\ud83d\udc45",
-    "ear": "\ud83d\udc42",
-    "ear_tone1": "\ud83d\udc42\ud83c\udffb",
-    "ear_tone2": "\ud83d\udc42\ud83c\udffc",
-    "ear_tone3": "\ud83d\udc42\ud83c\udffd",
-    "ear_tone4": "\ud83d\udc42\ud83c\udffe",
-    "ear_tone5": "\ud83d\udc42\ud83c\udfff",
-    "ear_with_hearing_aid": "\ud83e\uddbb",
-    "ear_with_hearing_aid_tone1": "\ud83e\uddbb\ud83c\udffb",
-    "ear_with_hearing_aid_light_skin_tone": "\ud83e\uddbb\ud83c\udffb",
-    "ear_with_hearing_aid_tone2": "\ud83e\uddbb\ud83c\udffc",
-    "ear_with_hearing_aid_medium_light_skin_tone": "\ud83e\uddbb\ud83c\udffc",
-    "ear_with_hearing_aid_tone3": "\ud83e\uddbb\ud83c\udffd",
-    "ear_with_hearing_aid_medium_skin_tone": "\ud83e\uddbb\ud83c\udffd",
-    "ear_with_hearing_aid_tone4": "\ud83e\uddbb\ud83c\udffe",
-    "ear_with_hearing_aid_medium_dark_skin_tone": "\ud83e\uddbb\ud83c\udffe",
-    "ear_with_hearing_aid_tone5": "\ud83e\uddbb\ud83c\udfff",
-    "ear_with_hearing_aid_dark_skin_tone": "\ud83e\uddbb\ud83c\udfff",
-    "nose": "\ud83d\udc43",
-    "nose_tone1": "\ud83d\udc43\ud83c\udffb",
-    "nose_tone2": "\ud83d\udc43\ud83c\udffc",
-    "nose_tone3": "\ud83d\udc43\ud83c\udffd",
-    "nose_tone4": "\ud83d\udc43\ud83c\udffe",
-    "nose_tone5": "\ud83d\udc43\ud83c\udfff",
-    "footprints": "\ud83d\udc63",
-    "eye": "\ud83d\udc41\ufe0f",
-    "eyes": "\ud83d\udc40",
-    "brain": "\ud83e\udde0",
-    "anatomical_heart": "\ud83e\udec0",
-    "lungs": "\ud83e\udec1",
-    "speaking_head": "\ud83d\udde3\ufe0f",
-    "speaking_head_in_silhouette": "\ud83d\udde3\ufe0f",
-    "bust_in_silhouette": "\ud83d\udc64",
-    "busts_in_silhouette": "\ud83d\udc65",
-    "people_hugging": "\ud83e\udec2",
-    "baby": "\ud83d\udc76",
-    "baby_tone1": "\ud83d\udc76\ud83c\udffb",
-    "baby_tone2": "\ud83d\udc76\ud83c\udffc",
-    "baby_tone3": "\ud83d\udc76\ud83c\udffd",
-    "baby_tone4": "\ud83d\udc76\ud83c\udffe",
-    "baby_tone5": "\ud83d\udc76\ud83c\udfff",
-    "girl": "\ud83d\udc67",
-    "girl_tone1": "\ud83d\udc67\ud83c\udffb",
-    "girl_tone2": "\ud83d\udc67\ud83c\udffc",
-    "girl_tone3": "\ud83d\udc67\ud83c\udffd",
-    "girl_tone4": "\ud83d\udc67\ud83c\udffe",
-    "girl_tone5": "\ud83d\udc67\ud83c\udfff",
-    "child": "\ud83e\uddd2",
-    "child_tone1": "\ud83e\uddd2\ud83c\udffb",
-    "child_light_skin_tone": "\ud83e\uddd2\ud83c\udffb",
-    "child_tone2": "\ud83e\uddd2\ud83c\udffc",
-    "child_medium_light_skin_tone": "\ud83e\uddd2\ud83c\udffc",
-    "child_tone3": "\ud83e\uddd2\ud83c\udffd",
-    "child_medium_skin_tone": "\ud83e\uddd2\ud83c\udffd",
-    "child_tone4": "\ud83e\uddd2\ud83c\udffe",
-    "child_medium_dark_skin_tone": "\ud83e\uddd2\ud83c\udffe",
-    "child_tone5": "\ud83e\uddd2\ud83c\udfff",
-    "child_dark_skin_tone": "\ud83e\uddd2\ud83c\udfff",
-    "boy": "\ud83d\udc66",
-    "boy_tone1": "\ud83d\udc66\ud83c\udffb",
-    "boy_tone2": "\ud83d\udc66\ud83c\udffc",
-    "boy_tone3": "\ud83d\udc66\ud83c\udffd",
-    "boy_tone4": "\ud83d\udc66\ud83c\udffe",
-    "boy_tone5": "\ud83d\udc66\ud83c\udfff",
-    "woman": "\ud83d\udc69",
-    "woman_tone1": "\ud83d\udc69\ud83c\udffb",
-    "woman_tone2": "\ud83d\udc69\ud83c\udffc",
-    "woman_tone3": "\ud83d\udc69\ud83c\udffd",
-    "woman_tone4": "\ud83d\udc69\ud83c\udffe",
-    "woman_tone5": "\ud83d\udc69\ud83c\udfff",
-    "adult": "\ud83e\uddd1",
-    "adult_tone1": "\ud83e\uddd1\ud83c\udffb",
-    "adult_light_skin_tone": "\ud83e\uddd1\ud83c\udffb",
-    "adult_tone2": "\ud83e\uddd1\ud83c\udffc",
-    "adult_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc",
-    "adult_tone3": "\ud83e\uddd1\ud83c\udffd",
-    "adult_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd",
-    "adult_tone4": "\ud83e\uddd1\ud83c\udffe",
-    "adult_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe",
-    "adult_tone5": "\ud83e\uddd1\ud83c\udfff",
-    "adult_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff",
-    "man": "\ud83d\udc68",
-    "man_tone1": "\ud83d\udc68\ud83c\udffb",
-    "man_tone2": "\ud83d\udc68\ud83c\udffc",
-    "man_tone3": "\ud83d\udc68\ud83c\udffd",
-    "man_tone4": "\ud83d\udc68\ud83c\udffe",
-    "man_tone5": "\ud83d\udc68\ud83c\udfff",
-    "person_curly_hair": "\ud83e\uddd1\u200d\ud83e\uddb1",
-    "person_tone1_curly_hair": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddb1",
-    "person_light_skin_tone_curly_hair": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddb1",
-    "person_tone2_curly_hair": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddb1",
-    "person_medium_light_skin_tone_curly_hair": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddb1",
-    "person_tone3_curly_hair": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddb1",
-    "person_medium_skin_tone_curly_hair": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddb1",
-    "person_tone4_curly_hair": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddb1",
-    "person_medium_dark_skin_tone_curly_hair": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddb1",
-    "person_tone5_curly_hair": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddb1",
-    "person_dark_skin_tone_curly_hair": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddb1",
-    "woman_curly_haired": "\ud83d\udc69\u200d\ud83e\uddb1",
-    "woman_curly_haired_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddb1",
-    "woman_curly_haired_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddb1",
-    "woman_curly_haired_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddb1",
-    "woman_curly_haired_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddb1",
-    "woman_curly_haired_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddb1",
-    "woman_curly_haired_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddb1",
-    "woman_curly_haired_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddb1",
-    "woman_curly_haired_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddb1",
-    "woman_curly_haired_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddb1",
-    "woman_curly_haired_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddb1",
-    "man_curly_haired": "\ud83d\udc68\u200d\ud83e\uddb1",
-    "man_curly_haired_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddb1",
-    "man_curly_haired_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddb1",
-    "man_curly_haired_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddb1",
-    "man_curly_haired_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddb1",
-    "man_curly_haired_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddb1",
-    "man_curly_haired_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddb1",
-    "man_curly_haired_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddb1",
-    "man_curly_haired_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddb1",
-    "man_curly_haired_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddb1",
-    "man_curly_haired_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddb1",
-    "person_red_hair": "\ud83e\uddd1\u200d\ud83e\uddb0",
-    "person_tone1_red_hair": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddb0",
-    "person_light_skin_tone_red_hair": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddb0",
-    "person_tone2_red_hair": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddb0",
-    "person_medium_light_skin_tone_red_hair": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddb0",
-    "person_tone3_red_hair": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddb0",
-    "person_medium_skin_tone_red_hair": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddb0",
-    "person_tone4_red_hair": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddb0",
-    "person_medium_dark_skin_tone_red_hair": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddb0",
-    "person_tone5_red_hair": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddb0",
-    "person_dark_skin_tone_red_hair": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddb0",
-    "woman_red_haired": "\ud83d\udc69\u200d\ud83e\uddb0",
-    "woman_red_haired_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddb0",
-    "woman_red_haired_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddb0",
-    "woman_red_haired_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddb0",
-    "woman_red_haired_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddb0",
-    "woman_red_haired_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddb0",
-    "woman_red_haired_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddb0",
-    "woman_red_haired_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddb0",
-    "woman_red_haired_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddb0",
-    "woman_red_haired_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddb0",
-    "woman_red_haired_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddb0",
-    "man_red_haired": "\ud83d\udc68\u200d\ud83e\uddb0",
-    "man_red_haired_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddb0",
-    "man_red_haired_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddb0",
-    "man_red_haired_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddb0",
-    "man_red_haired_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddb0",
-    "man_red_haired_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddb0",
-    "man_red_haired_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddb0",
-    "man_red_haired_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddb0",
-    "man_red_haired_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddb0",
-    "man_red_haired_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddb0",
-    "man_red_haired_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddb0",
-    "blond_haired_woman": "\ud83d\udc71\u200d\u2640\ufe0f",
-    "blond_haired_woman_tone1": "\ud83d\udc71\ud83c\udffb\u200d\u2640\ufe0f",
-    "blond_haired_woman_light_skin_tone": "\ud83d\udc71\ud83c\udffb\u200d\u2640\ufe0f",
-    "blond_haired_woman_tone2": "\ud83d\udc71\ud83c\udffc\u200d\u2640\ufe0f",
-    "blond_haired_woman_medium_light_skin_tone": "\ud83d\udc71\ud83c\udffc\u200d\u2640\ufe0f",
-    "blond_haired_woman_tone3": "\ud83d\udc71\ud83c\udffd\u200d\u2640\ufe0f",
-    "blond_haired_woman_medium_skin_tone": "\ud83d\udc71\ud83c\udffd\u200d\u2640\ufe0f",
-    "blond_haired_woman_tone4": "\ud83d\udc71\ud83c\udffe\u200d\u2640\ufe0f",
-    "blond_haired_woman_medium_dark_skin_tone": "\ud83d\udc71\ud83c\udffe\u200d\u2640\ufe0f",
-    "blond_haired_woman_tone5": "\ud83d\udc71\ud83c\udfff\u200d\u2640\ufe0f",
-    "blond_haired_woman_dark_skin_tone": "\ud83d\udc71\ud83c\udfff\u200d\u2640\ufe0f",
-    "blond_haired_person": "\ud83d\udc71",
-    "blond_haired_person_tone1": "\ud83d\udc71\ud83c\udffb",
-    "person_with_blond_hair_tone1": "\ud83d\udc71\ud83c\udffb",
-    "blond_haired_person_tone2": "\ud83d\udc71\ud83c\udffc",
-    "person_with_blond_hair_tone2": "\ud83d\udc71\ud83c\udffc",
-    "blond_haired_person_tone3": "\ud83d\udc71\ud83c\udffd",
-    "person_with_blond_hair_tone3": "\ud83d\udc71\ud83c\udffd",
-    "blond_haired_person_tone4": "\ud83d\udc71\ud83c\udffe",
-    "person_with_blond_hair_tone4": "\ud83d\udc71\ud83c\udffe",
-    "blond_haired_person_tone5": "\ud83d\udc71\ud83c\udfff",
-    "person_with_blond_hair_tone5": "\ud83d\udc71\ud83c\udfff",
-    "person_with_blond_hair": "\ud83d\udc71",
-    "blond_haired_man": "\ud83d\udc71\u200d\u2642\ufe0f",
-    "blond_haired_man_tone1": "\ud83d\udc71\ud83c\udffb\u200d\u2642\ufe0f",
-    "blond_haired_man_light_skin_tone": "\ud83d\udc71\ud83c\udffb\u200d\u2642\ufe0f",
-    "blond_haired_man_tone2": "\ud83d\udc71\ud83c\udffc\u200d\u2642\ufe0f",
-    "blond_haired_man_medium_light_skin_tone": "\ud83d\udc71\ud83c\udffc\u200d\u2642\ufe0f",
-    "blond_haired_man_tone3": "\ud83d\udc71\ud83c\udffd\u200d\u2642\ufe0f",
-    "blond_haired_man_medium_skin_tone": "\ud83d\udc71\ud83c\udffd\u200d\u2642\ufe0f",
-    "blond_haired_man_tone4": "\ud83d\udc71\ud83c\udffe\u200d\u2642\ufe0f",
-    "blond_haired_man_medium_dark_skin_tone": "\ud83d\udc71\ud83c\udffe\u200d\u2642\ufe0f",
-    "blond_haired_man_tone5": "\ud83d\udc71\ud83c\udfff\u200d\u2642\ufe0f",
-    "blond_haired_man_dark_skin_tone": "\ud83d\udc71\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_white_hair": "\ud83e\uddd1\u200d\ud83e\uddb3",
-    "person_tone1_white_hair": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddb3",
-    "person_light_skin_tone_white_hair": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddb3",
-    "person_tone2_white_hair": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddb3",
-    "person_medium_light_skin_tone_white_hair": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddb3",
-    "person_tone3_white_hair": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddb3",
-    "person_medium_skin_tone_white_hair": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddb3",
-    "person_tone4_white_hair": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddb3",
-    "person_medium_dark_skin_tone_white_hair": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddb3",
-    "person_tone5_white_hair": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddb3",
-    "person_dark_skin_tone_white_hair": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddb3",
-    "woman_white_haired": "\ud83d\udc69\u200d\ud83e\uddb3",
-    "woman_white_haired_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddb3",
-    "woman_white_haired_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddb3",
-    "woman_white_haired_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddb3",
-    "woman_white_haired_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddb3",
-    "woman_white_haired_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddb3",
-    "woman_white_haired_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddb3",
-    "woman_white_haired_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddb3",
-    "woman_white_haired_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddb3",
-    "woman_white_haired_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddb3",
-    "woman_white_haired_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddb3",
-    "man_white_haired": "\ud83d\udc68\u200d\ud83e\uddb3",
-    "man_white_haired_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddb3",
-    "man_white_haired_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddb3",
-    "man_white_haired_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddb3",
-    "man_white_haired_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddb3",
-    "man_white_haired_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddb3",
-    "man_white_haired_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddb3",
-    "man_white_haired_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddb3",
-    "man_white_haired_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddb3",
-    "man_white_haired_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddb3",
-    "man_white_haired_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddb3",
-    "person_bald": "\ud83e\uddd1\u200d\ud83e\uddb2",
-    "person_tone1_bald": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddb2",
-    "person_light_skin_tone_bald": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddb2",
-    "person_tone2_bald": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddb2",
-    "person_medium_light_skin_tone_bald": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddb2",
-    "person_tone3_bald": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddb2",
-    "person_medium_skin_tone_bald": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddb2",
-    "person_tone4_bald": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddb2",
-    "person_medium_dark_skin_tone_bald": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddb2",
-    "person_tone5_bald": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddb2",
-    "person_dark_skin_tone_bald": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddb2",
-    "woman_bald": "\ud83d\udc69\u200d\ud83e\uddb2",
-    "woman_bald_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddb2",
-    "woman_bald_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddb2",
-    "woman_bald_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddb2",
-    "woman_bald_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddb2",
-    "woman_bald_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddb2",
-    "woman_bald_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddb2",
-    "woman_bald_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddb2",
-    "woman_bald_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddb2",
-    "woman_bald_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddb2",
-    "woman_bald_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddb2",
-    "man_bald": "\ud83d\udc68\u200d\ud83e\uddb2",
-    "man_bald_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddb2",
-    "man_bald_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddb2",
-    "man_bald_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddb2",
-    "man_bald_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddb2",
-    "man_bald_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddb2",
-    "man_bald_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddb2",
-    "man_bald_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddb2",
-    "man_bald_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddb2",
-    "man_bald_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddb2",
-    "man_bald_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddb2",
-    "bearded_person": "\ud83e\uddd4",
-    "bearded_person_tone1": "\ud83e\uddd4\ud83c\udffb",
-    "bearded_person_light_skin_tone": "\ud83e\uddd4\ud83c\udffb",
-    "bearded_person_tone2": "\ud83e\uddd4\ud83c\udffc",
-    "bearded_person_medium_light_skin_tone": "\ud83e\uddd4\ud83c\udffc",
-    "bearded_person_tone3": "\ud83e\uddd4\ud83c\udffd",
-    "bearded_person_medium_skin_tone": "\ud83e\uddd4\ud83c\udffd",
-    "bearded_person_tone4": "\ud83e\uddd4\ud83c\udffe",
-    "bearded_person_medium_dark_skin_tone": "\ud83e\uddd4\ud83c\udffe",
-    "bearded_person_tone5": "\ud83e\uddd4\ud83c\udfff",
-    "bearded_person_dark_skin_tone": "\ud83e\uddd4\ud83c\udfff",
-    "older_woman": "\ud83d\udc75",
-    "older_woman_tone1": "\ud83d\udc75\ud83c\udffb",
-    "grandma_tone1": "\ud83d\udc75\ud83c\udffb",
-    "older_woman_tone2": "\ud83d\udc75\ud83c\udffc",
-    "grandma_tone2": "\ud83d\udc75\ud83c\udffc",
-    "older_woman_tone3": "\ud83d\udc75\ud83c\udffd",
-    "grandma_tone3": "\ud83d\udc75\ud83c\udffd",
-    "older_woman_tone4": "\ud83d\udc75\ud83c\udffe",
-    "grandma_tone4": "\ud83d\udc75\ud83c\udffe",
-    "older_woman_tone5": "\ud83d\udc75\ud83c\udfff",
-    "grandma_tone5": "\ud83d\udc75\ud83c\udfff",
-    "grandma": "\ud83d\udc75",
-    "older_adult": "\ud83e\uddd3",
-    "older_adult_tone1": "\ud83e\uddd3\ud83c\udffb",
-    "older_adult_light_skin_tone": "\ud83e\uddd3\ud83c\udffb",
-    "older_adult_tone2": "\ud83e\uddd3\ud83c\udffc",
-    "older_adult_medium_light_skin_tone": "\ud83e\uddd3\ud83c\udffc",
-    "older_adult_tone3": "\ud83e\uddd3\ud83c\udffd",
-    "older_adult_medium_skin_tone": "\ud83e\uddd3\ud83c\udffd",
-    "older_adult_tone4": "\ud83e\uddd3\ud83c\udffe",
-    "older_adult_medium_dark_skin_tone": "\ud83e\uddd3\ud83c\udffe",
-    "older_adult_tone5": "\ud83e\uddd3\ud83c\udfff",
-    "older_adult_dark_skin_tone": "\ud83e\uddd3\ud83c\udfff",
-    "older_man": "\ud83d\udc74",
-    "older_man_tone1": "\ud83d\udc74\ud83c\udffb",
-    "older_man_tone2": "\ud83d\udc74\ud83c\udffc",
-    "older_man_tone3": "\ud83d\udc74\ud83c\udffd",
-    "older_man_tone4": "\ud83d\udc74\ud83c\udffe",
-    "older_man_tone5": "\ud83d\udc74\ud83c\udfff",
-    "man_with_chinese_cap": "\ud83d\udc72",
-    "man_with_chinese_cap_tone1": "\ud83d\udc72\ud83c\udffb",
-    "man_with_gua_pi_mao_tone1": "\ud83d\udc72\ud83c\udffb",
-    "man_with_chinese_cap_tone2": "\ud83d\udc72\ud83c\udffc",
-    "man_with_gua_pi_mao_tone2": "\ud83d\udc72\ud83c\udffc",
-    "man_with_chinese_cap_tone3": "\ud83d\udc72\ud83c\udffd",
-    "man_with_gua_pi_mao_tone3": "\ud83d\udc72\ud83c\udffd",
-    "man_with_chinese_cap_tone4": "\ud83d\udc72\ud83c\udffe",
-    "man_with_gua_pi_mao_tone4": "\ud83d\udc72\ud83c\udffe",
-    "man_with_chinese_cap_tone5": "\ud83d\udc72\ud83c\udfff",
-    "man_with_gua_pi_mao_tone5": "\ud83d\udc72\ud83c\udfff",
-    "man_with_gua_pi_mao": "\ud83d\udc72",
-    "person_wearing_turban": "\ud83d\udc73",
-    "person_wearing_turban_tone1": "\ud83d\udc73\ud83c\udffb",
-    "man_with_turban_tone1": "\ud83d\udc73\ud83c\udffb",
-    "person_wearing_turban_tone2": "\ud83d\udc73\ud83c\udffc",
-    "man_with_turban_tone2": "\ud83d\udc73\ud83c\udffc",
-    "person_wearing_turban_tone3": "\ud83d\udc73\ud83c\udffd",
-    "man_with_turban_tone3": "\ud83d\udc73\ud83c\udffd",
-    "person_wearing_turban_tone4": "\ud83d\udc73\ud83c\udffe",
-    "man_with_turban_tone4": "\ud83d\udc73\ud83c\udffe",
-    "person_wearing_turban_tone5": "\ud83d\udc73\ud83c\udfff",
-    "man_with_turban_tone5": "\ud83d\udc73\ud83c\udfff",
-    "man_with_turban": "\ud83d\udc73",
-    "woman_wearing_turban": "\ud83d\udc73\u200d\u2640\ufe0f",
-    "woman_wearing_turban_tone1": "\ud83d\udc73\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_wearing_turban_light_skin_tone": "\ud83d\udc73\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_wearing_turban_tone2": "\ud83d\udc73\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_wearing_turban_medium_light_skin_tone": "\ud83d\udc73\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_wearing_turban_tone3": "\ud83d\udc73\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_wearing_turban_medium_skin_tone": "\ud83d\udc73\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_wearing_turban_tone4": "\ud83d\udc73\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_wearing_turban_medium_dark_skin_tone": "\ud83d\udc73\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_wearing_turban_tone5": "\ud83d\udc73\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_wearing_turban_dark_skin_tone": "\ud83d\udc73\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_wearing_turban": "\ud83d\udc73\u200d\u2642\ufe0f",
-    "man_wearing_turban_tone1": "\ud83d\udc73\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_wearing_turban_light_skin_tone": "\ud83d\udc73\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_wearing_turban_tone2": "\ud83d\udc73\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_wearing_turban_medium_light_skin_tone": "\ud83d\udc73\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_wearing_turban_tone3": "\ud83d\udc73\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_wearing_turban_medium_skin_tone": "\ud83d\udc73\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_wearing_turban_tone4": "\ud83d\udc73\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_wearing_turban_medium_dark_skin_tone": "\ud83d\udc73\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_wearing_turban_tone5": "\ud83d\udc73\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_wearing_turban_dark_skin_tone": "\ud83d\udc73\ud83c\udfff\u200d\u2642\ufe0f",
-    "woman_with_headscarf": "\ud83e\uddd5",
-    "woman_with_headscarf_tone1": "\ud83e\uddd5\ud83c\udffb",
-    "woman_with_headscarf_light_skin_tone": "\ud83e\uddd5\ud83c\udffb",
-    "woman_with_headscarf_tone2": "\ud83e\uddd5\ud83c\udffc",
-    "woman_with_headscarf_medium_light_skin_tone": "\ud83e\uddd5\ud83c\udffc",
-    "woman_with_headscarf_tone3": "\ud83e\uddd5\ud83c\udffd",
-    "woman_with_headscarf_medium_skin_tone": "\ud83e\uddd5\ud83c\udffd",
-    "woman_with_headscarf_tone4": "\ud83e\uddd5\ud83c\udffe",
-    "woman_with_headscarf_medium_dark_skin_tone": "\ud83e\uddd5\ud83c\udffe",
-    "woman_with_headscarf_tone5": "\ud83e\uddd5\ud83c\udfff",
-    "woman_with_headscarf_dark_skin_tone": "\ud83e\uddd5\ud83c\udfff",
-    "police_officer": "\ud83d\udc6e",
-    "police_officer_tone1": "\ud83d\udc6e\ud83c\udffb",
-    "cop_tone1": "\ud83d\udc6e\ud83c\udffb",
-    "police_officer_tone2": "\ud83d\udc6e\ud83c\udffc",
-    "cop_tone2": "\ud83d\udc6e\ud83c\udffc",
-    "police_officer_tone3": "\ud83d\udc6e\ud83c\udffd",
-    "cop_tone3": "\ud83d\udc6e\ud83c\udffd",
-    "police_officer_tone4": "\ud83d\udc6e\ud83c\udffe",
-    "cop_tone4": "\ud83d\udc6e\ud83c\udffe",
-    "police_officer_tone5": "\ud83d\udc6e\ud83c\udfff",
-    "cop_tone5": "\ud83d\udc6e\ud83c\udfff",
-    "cop": "\ud83d\udc6e",
-    "woman_police_officer": "\ud83d\udc6e\u200d\u2640\ufe0f",
-    "woman_police_officer_tone1": "\ud83d\udc6e\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_police_officer_light_skin_tone": "\ud83d\udc6e\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_police_officer_tone2": "\ud83d\udc6e\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_police_officer_medium_light_skin_tone": "\ud83d\udc6e\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_police_officer_tone3": "\ud83d\udc6e\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_police_officer_medium_skin_tone": "\ud83d\udc6e\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_police_officer_tone4": "\ud83d\udc6e\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_police_officer_medium_dark_skin_tone": "\ud83d\udc6e\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_police_officer_tone5": "\ud83d\udc6e\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_police_officer_dark_skin_tone": "\ud83d\udc6e\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_police_officer": "\ud83d\udc6e\u200d\u2642\ufe0f",
-    "man_police_officer_tone1": "\ud83d\udc6e\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_police_officer_light_skin_tone": "\ud83d\udc6e\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_police_officer_tone2": "\ud83d\udc6e\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_police_officer_medium_light_skin_tone": "\ud83d\udc6e\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_police_officer_tone3": "\ud83d\udc6e\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_police_officer_medium_skin_tone": "\ud83d\udc6e\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_police_officer_tone4": "\ud83d\udc6e\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_police_officer_medium_dark_skin_tone": "\ud83d\udc6e\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_police_officer_tone5": "\ud83d\udc6e\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_police_officer_dark_skin_tone": "\ud83d\udc6e\ud83c\udfff\u200d\u2642\ufe0f",
-    "construction_worker": "\ud83d\udc77",
-    "construction_worker_tone1": "\ud83d\udc77\ud83c\udffb",
-    "construction_worker_tone2": "\ud83d\udc77\ud83c\udffc",
-    "construction_worker_tone3": "\ud83d\udc77\ud83c\udffd",
-    "construction_worker_tone4": "\ud83d\udc77\ud83c\udffe",
-    "construction_worker_tone5": "\ud83d\udc77\ud83c\udfff",
-    "woman_construction_worker": "\ud83d\udc77\u200d\u2640\ufe0f",
-    "woman_construction_worker_tone1": "\ud83d\udc77\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_construction_worker_light_skin_tone": "\ud83d\udc77\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_construction_worker_tone2": "\ud83d\udc77\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_construction_worker_medium_light_skin_tone": "\ud83d\udc77\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_construction_worker_tone3": "\ud83d\udc77\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_construction_worker_medium_skin_tone": "\ud83d\udc77\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_construction_worker_tone4": "\ud83d\udc77\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_construction_worker_medium_dark_skin_tone": "\ud83d\udc77\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_construction_worker_tone5": "\ud83d\udc77\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_construction_worker_dark_skin_tone": "\ud83d\udc77\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_construction_worker": "\ud83d\udc77\u200d\u2642\ufe0f",
-    "man_construction_worker_tone1": "\ud83d\udc77\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_construction_worker_light_skin_tone": "\ud83d\udc77\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_construction_worker_tone2": "\ud83d\udc77\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_construction_worker_medium_light_skin_tone": "\ud83d\udc77\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_construction_worker_tone3": "\ud83d\udc77\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_construction_worker_medium_skin_tone": "\ud83d\udc77\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_construction_worker_tone4": "\ud83d\udc77\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_construction_worker_medium_dark_skin_tone": "\ud83d\udc77\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_construction_worker_tone5": "\ud83d\udc77\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_construction_worker_dark_skin_tone": "\ud83d\udc77\ud83c\udfff\u200d\u2642\ufe0f",
-    "guard": "\ud83d\udc82",
-    "guard_tone1": "\ud83d\udc82\ud83c\udffb",
-    "guardsman_tone1": "\ud83d\udc82\ud83c\udffb",
-    "guard_tone2": "\ud83d\udc82\ud83c\udffc",
-    "guardsman_tone2": "\ud83d\udc82\ud83c\udffc",
-    "guard_tone3": "\ud83d\udc82\ud83c\udffd",
-    "guardsman_tone3": "\ud83d\udc82\ud83c\udffd",
-    "guard_tone4": "\ud83d\udc82\ud83c\udffe",
-    "guardsman_tone4": "\ud83d\udc82\ud83c\udffe",
-    "guard_tone5": "\ud83d\udc82\ud83c\udfff",
-    "guardsman_tone5": "\ud83d\udc82\ud83c\udfff",
-    "guardsman": "\ud83d\udc82",
-    "woman_guard": "\ud83d\udc82\u200d\u2640\ufe0f",
-    "woman_guard_tone1": "\ud83d\udc82\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_guard_light_skin_tone": "\ud83d\udc82\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_guard_tone2": "\ud83d\udc82\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_guard_medium_light_skin_tone": "\ud83d\udc82\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_guard_tone3": "\ud83d\udc82\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_guard_medium_skin_tone": "\ud83d\udc82\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_guard_tone4": "\ud83d\udc82\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_guard_medium_dark_skin_tone": "\ud83d\udc82\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_guard_tone5": "\ud83d\udc82\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_guard_dark_skin_tone": "\ud83d\udc82\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_guard": "\ud83d\udc82\u200d\u2642\ufe0f",
-    "man_guard_tone1": "\ud83d\udc82\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_guard_light_skin_tone": "\ud83d\udc82\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_guard_tone2": "\ud83d\udc82\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_guard_medium_light_skin_tone": "\ud83d\udc82\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_guard_tone3": "\ud83d\udc82\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_guard_medium_skin_tone": "\ud83d\udc82\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_guard_tone4": "\ud83d\udc82\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_guard_medium_dark_skin_tone": "\ud83d\udc82\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_guard_tone5": "\ud83d\udc82\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_guard_dark_skin_tone": "\ud83d\udc82\ud83c\udfff\u200d\u2642\ufe0f",
-    "detective": "\ud83d\udd75\ufe0f",
-    "detective_tone1": "\ud83d\udd75\ud83c\udffb",
-    "spy_tone1": "\ud83d\udd75\ud83c\udffb",
-    "sleuth_or_spy_tone1": "\ud83d\udd75\ud83c\udffb",
-    "detective_tone2": "\ud83d\udd75\ud83c\udffc",
-    "spy_tone2": "\ud83d\udd75\ud83c\udffc",
-    "sleuth_or_spy_tone2": "\ud83d\udd75\ud83c\udffc",
-    "detective_tone3": "\ud83d\udd75\ud83c\udffd",
-    "spy_tone3": "\ud83d\udd75\ud83c\udffd",
-    "sleuth_or_spy_tone3": "\ud83d\udd75\ud83c\udffd",
-    "detective_tone4": "\ud83d\udd75\ud83c\udffe",
-    "spy_tone4": "\ud83d\udd75\ud83c\udffe",
-    "sleuth_or_spy_tone4": "\ud83d\udd75\ud83c\udffe",
-    "detective_tone5": "\ud83d\udd75\ud83c\udfff",
-    "spy_tone5": "\ud83d\udd75\ud83c\udfff",
-    "sleuth_or_spy_tone5": "\ud83d\udd75\ud83c\udfff",
-    "spy": "\ud83d\udd75\ufe0f",
-    "sleuth_or_spy": "\ud83d\udd75\ufe0f",
-    "woman_detective": "\ud83d\udd75\ufe0f\u200d\u2640\ufe0f",
-    "woman_detective_tone1": "\ud83d\udd75\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_detective_light_skin_tone": "\ud83d\udd75\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_detective_tone2": "\ud83d\udd75\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_detective_medium_light_skin_tone": "\ud83d\udd75\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_detective_tone3": "\ud83d\udd75\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_detective_medium_skin_tone": "\ud83d\udd75\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_detective_tone4": "\ud83d\udd75\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_detective_medium_dark_skin_tone": "\ud83d\udd75\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_detective_tone5": "\ud83d\udd75\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_detective_dark_skin_tone": "\ud83d\udd75\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_detective": "\ud83d\udd75\ufe0f\u200d\u2642\ufe0f",
-    "man_detective_tone1": "\ud83d\udd75\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_detective_light_skin_tone": "\ud83d\udd75\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_detective_tone2": "\ud83d\udd75\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_detective_medium_light_skin_tone": "\ud83d\udd75\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_detective_tone3": "\ud83d\udd75\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_detective_medium_skin_tone": "\ud83d\udd75\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_detective_tone4": "\ud83d\udd75\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_detective_medium_dark_skin_tone": "\ud83d\udd75\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_detective_tone5": "\ud83d\udd75\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_detective_dark_skin_tone": "\ud83d\udd75\ud83c\udfff\u200d\u2642\ufe0f",
-    "health_worker": "\ud83e\uddd1\u200d\u2695\ufe0f",
-    "health_worker_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\u2695\ufe0f",
-    "health_worker_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\u2695\ufe0f",
-    "health_worker_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\u2695\ufe0f",
-    "health_worker_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\u2695\ufe0f",
-    "health_worker_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\u2695\ufe0f",
-    "health_worker_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\u2695\ufe0f",
-    "health_worker_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\u2695\ufe0f",
-    "health_worker_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\u2695\ufe0f",
-    "health_worker_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\u2695\ufe0f",
-    "health_worker_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\u2695\ufe0f",
-    "woman_health_worker": "\ud83d\udc69\u200d\u2695\ufe0f",
-    "woman_health_worker_tone1": "\ud83d\udc69\ud83c\udffb\u200d\u2695\ufe0f",
-    "woman_health_worker_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\u2695\ufe0f",
-    "woman_health_worker_tone2": "\ud83d\udc69\ud83c\udffc\u200d\u2695\ufe0f",
-    "woman_health_worker_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\u2695\ufe0f",
-    "woman_health_worker_tone3": "\ud83d\udc69\ud83c\udffd\u200d\u2695\ufe0f",
-    "woman_health_worker_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\u2695\ufe0f",
-    "woman_health_worker_tone4": "\ud83d\udc69\ud83c\udffe\u200d\u2695\ufe0f",
-    "woman_health_worker_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\u2695\ufe0f",
-    "woman_health_worker_tone5": "\ud83d\udc69\ud83c\udfff\u200d\u2695\ufe0f",
-    "woman_health_worker_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\u2695\ufe0f",
-    "man_health_worker": "\ud83d\udc68\u200d\u2695\ufe0f",
-    "man_health_worker_tone1": "\ud83d\udc68\ud83c\udffb\u200d\u2695\ufe0f",
-    "man_health_worker_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\u2695\ufe0f",
-    "man_health_worker_tone2": "\ud83d\udc68\ud83c\udffc\u200d\u2695\ufe0f",
-    "man_health_worker_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\u2695\ufe0f",
-    "man_health_worker_tone3": "\ud83d\udc68\ud83c\udffd\u200d\u2695\ufe0f",
-    "man_health_worker_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\u2695\ufe0f",
-    "man_health_worker_tone4": "\ud83d\udc68\ud83c\udffe\u200d\u2695\ufe0f",
-    "man_health_worker_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\u2695\ufe0f",
-    "man_health_worker_tone5": "\ud83d\udc68\ud83c\udfff\u200d\u2695\ufe0f",
-    "man_health_worker_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\u2695\ufe0f",
-    "farmer": "\ud83e\uddd1\u200d\ud83c\udf3e",
-    "farmer_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf3e",
-    "farmer_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf3e",
-    "farmer_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf3e",
-    "farmer_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf3e",
-    "farmer_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf3e",
-    "farmer_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf3e",
-    "farmer_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf3e",
-    "farmer_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf3e",
-    "farmer_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf3e",
-    "farmer_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf3e",
-    "woman_farmer": "\ud83d\udc69\u200d\ud83c\udf3e",
-    "woman_farmer_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udf3e",
-    "woman_farmer_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udf3e",
-    "woman_farmer_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udf3e",
-    "woman_farmer_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udf3e",
-    "woman_farmer_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udf3e",
-    "woman_farmer_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udf3e",
-    "woman_farmer_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udf3e",
-    "woman_farmer_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udf3e",
-    "woman_farmer_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udf3e",
-    "woman_farmer_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udf3e",
-    "man_farmer": "\ud83d\udc68\u200d\ud83c\udf3e",
-    "man_farmer_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udf3e",
-    "man_farmer_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udf3e",
-    "man_farmer_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udf3e",
-    "man_farmer_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udf3e",
-    "man_farmer_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udf3e",
-    "man_farmer_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udf3e",
-    "man_farmer_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udf3e",
-    "man_farmer_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udf3e",
-    "man_farmer_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udf3e",
-    "man_farmer_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udf3e",
-    "cook": "\ud83e\uddd1\u200d\ud83c\udf73",
-    "cook_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf73",
-    "cook_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf73",
-    "cook_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf73",
-    "cook_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf73",
-    "cook_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf73",
-    "cook_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf73",
-    "cook_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf73",
-    "cook_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf73",
-    "cook_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf73",
-    "cook_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf73",
-    "woman_cook": "\ud83d\udc69\u200d\ud83c\udf73",
-    "woman_cook_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udf73",
-    "woman_cook_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udf73",
-    "woman_cook_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udf73",
-    "woman_cook_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udf73",
-    "woman_cook_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udf73",
-    "woman_cook_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udf73",
-    "woman_cook_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udf73",
-    "woman_cook_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udf73",
-    "woman_cook_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udf73",
-    "woman_cook_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udf73",
-    "man_cook": "\ud83d\udc68\u200d\ud83c\udf73",
-    "man_cook_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udf73",
-    "man_cook_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udf73",
-    "man_cook_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udf73",
-    "man_cook_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udf73",
-    "man_cook_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udf73",
-    "man_cook_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udf73",
-    "man_cook_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udf73",
-    "man_cook_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udf73",
-    "man_cook_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udf73",
-    "man_cook_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udf73",
-    "student": "\ud83e\uddd1\u200d\ud83c\udf93",
-    "student_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf93",
-    "student_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf93",
-    "student_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf93",
-    "student_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf93",
-    "student_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf93",
-    "student_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf93",
-    "student_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf93",
-    "student_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf93",
-    "student_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf93",
-    "student_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf93",
-    "woman_student": "\ud83d\udc69\u200d\ud83c\udf93",
-    "woman_student_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udf93",
-    "woman_student_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udf93",
-    "woman_student_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udf93",
-    "woman_student_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udf93",
-    "woman_student_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udf93",
-    "woman_student_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udf93",
-    "woman_student_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udf93",
-    "woman_student_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udf93",
-    "woman_student_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udf93",
-    "woman_student_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udf93",
-    "man_student": "\ud83d\udc68\u200d\ud83c\udf93",
-    "man_student_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udf93",
-    "man_student_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udf93",
-    "man_student_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udf93",
-    "man_student_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udf93",
-    "man_student_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udf93",
-    "man_student_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udf93",
-    "man_student_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udf93",
-    "man_student_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udf93",
-    "man_student_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udf93",
-    "man_student_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udf93",
-    "singer": "\ud83e\uddd1\u200d\ud83c\udfa4",
-    "singer_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udfa4",
-    "singer_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udfa4",
-    "singer_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udfa4",
-    "singer_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udfa4",
-    "singer_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udfa4",
-    "singer_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udfa4",
-    "singer_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udfa4",
-    "singer_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udfa4",
-    "singer_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udfa4",
-    "singer_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udfa4",
-    "woman_singer": "\ud83d\udc69\u200d\ud83c\udfa4",
-    "woman_singer_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udfa4",
-    "woman_singer_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udfa4",
-    "woman_singer_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udfa4",
-    "woman_singer_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udfa4",
-    "woman_singer_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udfa4",
-    "woman_singer_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udfa4",
-    "woman_singer_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udfa4",
-    "woman_singer_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udfa4",
-    "woman_singer_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udfa4",
-    "woman_singer_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udfa4",
-    "man_singer": "\ud83d\udc68\u200d\ud83c\udfa4",
-    "man_singer_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udfa4",
-    "man_singer_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udfa4",
-    "man_singer_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udfa4",
-    "man_singer_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udfa4",
-    "man_singer_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udfa4",
-    "man_singer_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udfa4",
-    "man_singer_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udfa4",
-    "man_singer_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udfa4",
-    "man_singer_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udfa4",
-    "man_singer_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udfa4",
-    "teacher": "\ud83e\uddd1\u200d\ud83c\udfeb",
-    "teacher_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udfeb",
-    "teacher_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udfeb",
-    "teacher_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udfeb",
-    "teacher_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udfeb",
-    "teacher_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udfeb",
-    "teacher_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udfeb",
-    "teacher_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udfeb",
-    "teacher_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udfeb",
-    "teacher_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udfeb",
-    "teacher_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udfeb",
-    "woman_teacher": "\ud83d\udc69\u200d\ud83c\udfeb",
-    "woman_teacher_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udfeb",
-    "woman_teacher_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udfeb",
-    "woman_teacher_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udfeb",
-    "woman_teacher_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udfeb",
-    "woman_teacher_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udfeb",
-    "woman_teacher_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udfeb",
-    "woman_teacher_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udfeb",
-    "woman_teacher_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udfeb",
-    "woman_teacher_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udfeb",
-    "woman_teacher_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udfeb",
-    "man_teacher": "\ud83d\udc68\u200d\ud83c\udfeb",
-    "man_teacher_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udfeb",
-    "man_teacher_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udfeb",
-    "man_teacher_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udfeb",
-    "man_teacher_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udfeb",
-    "man_teacher_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udfeb",
-    "man_teacher_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udfeb",
-    "man_teacher_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udfeb",
-    "man_teacher_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udfeb",
-    "man_teacher_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udfeb",
-    "man_teacher_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udfeb",
-    "factory_worker": "\ud83e\uddd1\u200d\ud83c\udfed",
-    "factory_worker_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udfed",
-    "factory_worker_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udfed",
-    "factory_worker_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udfed",
-    "factory_worker_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udfed",
-    "factory_worker_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udfed",
-    "factory_worker_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udfed",
-    "factory_worker_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udfed",
-    "factory_worker_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udfed",
-    "factory_worker_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udfed",
-    "factory_worker_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udfed",
-    "woman_factory_worker": "\ud83d\udc69\u200d\ud83c\udfed",
-    "woman_factory_worker_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udfed",
-    "woman_factory_worker_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udfed",
-    "woman_factory_worker_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udfed",
-    "woman_factory_worker_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udfed",
-    "woman_factory_worker_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udfed",
-    "woman_factory_worker_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udfed",
-    "woman_factory_worker_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udfed",
-    "woman_factory_worker_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udfed",
-    "woman_factory_worker_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udfed",
-    "woman_factory_worker_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udfed",
-    "man_factory_worker": "\ud83d\udc68\u200d\ud83c\udfed",
-    "man_factory_worker_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udfed",
-    "man_factory_worker_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udfed",
-    "man_factory_worker_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udfed",
-    "man_factory_worker_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udfed",
-    "man_factory_worker_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udfed",
-    "man_factory_worker_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udfed",
-    "man_factory_worker_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udfed",
-    "man_factory_worker_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udfed",
-    "man_factory_worker_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udfed",
-    "man_factory_worker_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udfed",
-    "technologist": "\ud83e\uddd1\u200d\ud83d\udcbb",
-    "technologist_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\udcbb",
-    "technologist_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\udcbb",
-    "technologist_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\udcbb",
-    "technologist_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\udcbb",
-    "technologist_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\udcbb",
-    "technologist_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\udcbb",
-    "technologist_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\udcbb",
-    "technologist_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\udcbb",
-    "technologist_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\udcbb",
-    "technologist_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\udcbb",
-    "woman_technologist": "\ud83d\udc69\u200d\ud83d\udcbb",
-    "woman_technologist_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\udcbb",
-    "woman_technologist_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\udcbb",
-    "woman_technologist_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\udcbb",
-    "woman_technologist_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\udcbb",
-    "woman_technologist_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\udcbb",
-    "woman_technologist_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\udcbb",
-    "woman_technologist_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\udcbb",
-    "woman_technologist_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\udcbb",
-    "woman_technologist_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\udcbb",
-    "woman_technologist_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\udcbb",
-    "man_technologist": "\ud83d\udc68\u200d\ud83d\udcbb",
-    "man_technologist_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\udcbb",
-    "man_technologist_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\udcbb",
-    "man_technologist_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\udcbb",
-    "man_technologist_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\udcbb",
-    "man_technologist_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\udcbb",
-    "man_technologist_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\udcbb",
-    "man_technologist_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\udcbb",
-    "man_technologist_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\udcbb",
-    "man_technologist_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\udcbb",
-    "man_technologist_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\udcbb",
-    "office_worker": "\ud83e\uddd1\u200d\ud83d\udcbc",
-    "office_worker_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\udcbc",
-    "office_worker_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\udcbc",
-    "office_worker_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\udcbc",
-    "office_worker_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\udcbc",
-    "office_worker_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\udcbc",
-    "office_worker_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\udcbc",
-    "office_worker_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\udcbc",
-    "office_worker_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\udcbc",
-    "office_worker_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\udcbc",
-    "office_worker_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\udcbc",
-    "woman_office_worker": "\ud83d\udc69\u200d\ud83d\udcbc",
-    "woman_office_worker_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\udcbc",
-    "woman_office_worker_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\udcbc",
-    "woman_office_worker_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\udcbc",
-    "woman_office_worker_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\udcbc",
-    "woman_office_worker_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\udcbc",
-    "woman_office_worker_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\udcbc",
-    "woman_office_worker_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\udcbc",
-    "woman_office_worker_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\udcbc",
-    "woman_office_worker_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\udcbc",
-    "woman_office_worker_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\udcbc",
-    "man_office_worker": "\ud83d\udc68\u200d\ud83d\udcbc",
-    "man_office_worker_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\udcbc",
-    "man_office_worker_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\udcbc",
-    "man_office_worker_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\udcbc",
-    "man_office_worker_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\udcbc",
-    "man_office_worker_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\udcbc",
-    "man_office_worker_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\udcbc",
-    "man_office_worker_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\udcbc",
-    "man_office_worker_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\udcbc",
-    "man_office_worker_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\udcbc",
-    "man_office_worker_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\udcbc",
-    "mechanic": "\ud83e\uddd1\u200d\ud83d\udd27",
-    "mechanic_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\udd27",
-    "mechanic_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\udd27",
-    "mechanic_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\udd27",
-    "mechanic_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\udd27",
-    "mechanic_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\udd27",
-    "mechanic_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\udd27",
-    "mechanic_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\udd27",
-    "mechanic_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\udd27",
-    "mechanic_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\udd27",
-    "mechanic_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\udd27",
-    "woman_mechanic": "\ud83d\udc69\u200d\ud83d\udd27",
-    "woman_mechanic_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\udd27",
-    "woman_mechanic_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\udd27",
-    "woman_mechanic_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\udd27",
-    "woman_mechanic_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\udd27",
-    "woman_mechanic_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\udd27",
-    "woman_mechanic_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\udd27",
-    "woman_mechanic_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\udd27",
-    "woman_mechanic_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\udd27",
-    "woman_mechanic_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\udd27",
-    "woman_mechanic_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\udd27",
-    "man_mechanic": "\ud83d\udc68\u200d\ud83d\udd27",
-    "man_mechanic_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\udd27",
-    "man_mechanic_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\udd27",
-    "man_mechanic_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\udd27",
-    "man_mechanic_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\udd27",
-    "man_mechanic_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\udd27",
-    "man_mechanic_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\udd27",
-    "man_mechanic_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\udd27",
-    "man_mechanic_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\udd27",
-    "man_mechanic_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\udd27",
-    "man_mechanic_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\udd27",
-    "scientist": "\ud83e\uddd1\u200d\ud83d\udd2c",
-    "scientist_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\udd2c",
-    "scientist_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\udd2c",
-    "scientist_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\udd2c",
-    "scientist_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\udd2c",
-    "scientist_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\udd2c",
-    "scientist_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\udd2c",
-    "scientist_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\udd2c",
-    "scientist_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\udd2c",
-    "scientist_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\udd2c",
-    "scientist_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\udd2c",
-    "woman_scientist": "\ud83d\udc69\u200d\ud83d\udd2c",
-    "woman_scientist_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\udd2c",
-    "woman_scientist_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\udd2c",
-    "woman_scientist_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\udd2c",
-    "woman_scientist_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\udd2c",
-    "woman_scientist_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\udd2c",
-    "woman_scientist_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\udd2c",
-    "woman_scientist_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\udd2c",
-    "woman_scientist_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\udd2c",
-    "woman_scientist_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\udd2c",
-    "woman_scientist_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\udd2c",
-    "man_scientist": "\ud83d\udc68\u200d\ud83d\udd2c",
-    "man_scientist_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\udd2c",
-    "man_scientist_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\udd2c",
-    "man_scientist_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\udd2c",
-    "man_scientist_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\udd2c",
-    "man_scientist_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\udd2c",
-    "man_scientist_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\udd2c",
-    "man_scientist_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\udd2c",
-    "man_scientist_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\udd2c",
-    "man_scientist_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\udd2c",
-    "man_scientist_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\udd2c",
-    "artist": "\ud83e\uddd1\u200d\ud83c\udfa8",
-    "artist_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udfa8",
-    "artist_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udfa8",
-    "artist_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udfa8",
-    "artist_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udfa8",
-    "artist_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udfa8",
-    "artist_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udfa8",
-    "artist_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udfa8",
-    "artist_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udfa8",
-    "artist_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udfa8",
-    "artist_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udfa8",
-    "woman_artist": "\ud83d\udc69\u200d\ud83c\udfa8",
-    "woman_artist_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udfa8",
-    "woman_artist_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udfa8",
-    "woman_artist_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udfa8",
-    "woman_artist_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udfa8",
-    "woman_artist_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udfa8",
-    "woman_artist_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udfa8",
-    "woman_artist_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udfa8",
-    "woman_artist_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udfa8",
-    "woman_artist_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udfa8",
-    "woman_artist_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udfa8",
-    "man_artist": "\ud83d\udc68\u200d\ud83c\udfa8",
-    "man_artist_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udfa8",
-    "man_artist_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udfa8",
-    "man_artist_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udfa8",
-    "man_artist_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udfa8",
-    "man_artist_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udfa8",
-    "man_artist_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udfa8",
-    "man_artist_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udfa8",
-    "man_artist_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udfa8",
-    "man_artist_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udfa8",
-    "man_artist_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udfa8",
-    "firefighter": "\ud83e\uddd1\u200d\ud83d\ude92",
-    "firefighter_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\ude92",
-    "firefighter_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\ude92",
-    "firefighter_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\ude92",
-    "firefighter_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\ude92",
-    "firefighter_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\ude92",
-    "firefighter_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\ude92",
-    "firefighter_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\ude92",
-    "firefighter_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\ude92",
-    "firefighter_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\ude92",
-    "firefighter_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\ude92",
-    "woman_firefighter": "\ud83d\udc69\u200d\ud83d\ude92",
-    "woman_firefighter_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\ude92",
-    "woman_firefighter_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\ude92",
-    "woman_firefighter_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\ude92",
-    "woman_firefighter_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\ude92",
-    "woman_firefighter_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\ude92",
-    "woman_firefighter_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\ude92",
-    "woman_firefighter_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\ude92",
-    "woman_firefighter_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\ude92",
-    "woman_firefighter_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\ude92",
-    "woman_firefighter_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\ude92",
-    "man_firefighter": "\ud83d\udc68\u200d\ud83d\ude92",
-    "man_firefighter_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\ude92",
-    "man_firefighter_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\ude92",
-    "man_firefighter_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\ude92",
-    "man_firefighter_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\ude92",
-    "man_firefighter_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\ude92",
-    "man_firefighter_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\ude92",
-    "man_firefighter_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\ude92",
-    "man_firefighter_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\ude92",
-    "man_firefighter_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\ude92",
-    "man_firefighter_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\ude92",
-    "pilot": "\ud83e\uddd1\u200d\u2708\ufe0f",
-    "pilot_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\u2708\ufe0f",
-    "pilot_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\u2708\ufe0f",
-    "pilot_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\u2708\ufe0f",
-    "pilot_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\u2708\ufe0f",
-    "pilot_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\u2708\ufe0f",
-    "pilot_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\u2708\ufe0f",
-    "pilot_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\u2708\ufe0f",
-    "pilot_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\u2708\ufe0f",
-    "pilot_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\u2708\ufe0f",
-    "pilot_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\u2708\ufe0f",
-    "woman_pilot": "\ud83d\udc69\u200d\u2708\ufe0f",
-    "woman_pilot_tone1": "\ud83d\udc69\ud83c\udffb\u200d\u2708\ufe0f",
-    "woman_pilot_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\u2708\ufe0f",
-    "woman_pilot_tone2": "\ud83d\udc69\ud83c\udffc\u200d\u2708\ufe0f",
-    "woman_pilot_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\u2708\ufe0f",
-    "woman_pilot_tone3": "\ud83d\udc69\ud83c\udffd\u200d\u2708\ufe0f",
-    "woman_pilot_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\u2708\ufe0f",
-    "woman_pilot_tone4": "\ud83d\udc69\ud83c\udffe\u200d\u2708\ufe0f",
-    "woman_pilot_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\u2708\ufe0f",
-    "woman_pilot_tone5": "\ud83d\udc69\ud83c\udfff\u200d\u2708\ufe0f",
-    "woman_pilot_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\u2708\ufe0f",
-    "man_pilot": "\ud83d\udc68\u200d\u2708\ufe0f",
-    "man_pilot_tone1": "\ud83d\udc68\ud83c\udffb\u200d\u2708\ufe0f",
-    "man_pilot_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\u2708\ufe0f",
-    "man_pilot_tone2": "\ud83d\udc68\ud83c\udffc\u200d\u2708\ufe0f",
-    "man_pilot_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\u2708\ufe0f",
-    "man_pilot_tone3": "\ud83d\udc68\ud83c\udffd\u200d\u2708\ufe0f",
-    "man_pilot_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\u2708\ufe0f",
-    "man_pilot_tone4": "\ud83d\udc68\ud83c\udffe\u200d\u2708\ufe0f",
-    "man_pilot_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\u2708\ufe0f",
-    "man_pilot_tone5": "\ud83d\udc68\ud83c\udfff\u200d\u2708\ufe0f",
-    "man_pilot_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\u2708\ufe0f",
-    "astronaut": "\ud83e\uddd1\u200d\ud83d\ude80",
-    "astronaut_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\ude80",
-    "astronaut_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83d\ude80",
-    "astronaut_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\ude80",
-    "astronaut_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83d\ude80",
-    "astronaut_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\ude80",
-    "astronaut_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83d\ude80",
-    "astronaut_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\ude80",
-    "astronaut_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83d\ude80",
-    "astronaut_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\ude80",
-    "astronaut_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83d\ude80",
-    "woman_astronaut": "\ud83d\udc69\u200d\ud83d\ude80",
-    "woman_astronaut_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\ude80",
-    "woman_astronaut_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83d\ude80",
-    "woman_astronaut_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\ude80",
-    "woman_astronaut_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83d\ude80",
-    "woman_astronaut_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\ude80",
-    "woman_astronaut_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83d\ude80",
-    "woman_astronaut_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\ude80",
-    "woman_astronaut_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83d\ude80",
-    "woman_astronaut_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\ude80",
-    "woman_astronaut_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83d\ude80",
-    "man_astronaut": "\ud83d\udc68\u200d\ud83d\ude80",
-    "man_astronaut_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\ude80",
-    "man_astronaut_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83d\ude80",
-    "man_astronaut_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\ude80",
-    "man_astronaut_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83d\ude80",
-    "man_astronaut_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\ude80",
-    "man_astronaut_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83d\ude80",
-    "man_astronaut_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\ude80",
-    "man_astronaut_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83d\ude80",
-    "man_astronaut_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\ude80",
-    "man_astronaut_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83d\ude80",
-    "judge": "\ud83e\uddd1\u200d\u2696\ufe0f",
-    "judge_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\u2696\ufe0f",
-    "judge_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\u2696\ufe0f",
-    "judge_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\u2696\ufe0f",
-    "judge_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\u2696\ufe0f",
-    "judge_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\u2696\ufe0f",
-    "judge_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\u2696\ufe0f",
-    "judge_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\u2696\ufe0f",
-    "judge_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\u2696\ufe0f",
-    "judge_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\u2696\ufe0f",
-    "judge_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\u2696\ufe0f",
-    "woman_judge": "\ud83d\udc69\u200d\u2696\ufe0f",
-    "woman_judge_tone1": "\ud83d\udc69\ud83c\udffb\u200d\u2696\ufe0f",
-    "woman_judge_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\u2696\ufe0f",
-    "woman_judge_tone2": "\ud83d\udc69\ud83c\udffc\u200d\u2696\ufe0f",
-    "woman_judge_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\u2696\ufe0f",
-    "woman_judge_tone3": "\ud83d\udc69\ud83c\udffd\u200d\u2696\ufe0f",
-    "woman_judge_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\u2696\ufe0f",
-    "woman_judge_tone4": "\ud83d\udc69\ud83c\udffe\u200d\u2696\ufe0f",
-    "woman_judge_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\u2696\ufe0f",
-    "woman_judge_tone5": "\ud83d\udc69\ud83c\udfff\u200d\u2696\ufe0f",
-    "woman_judge_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\u2696\ufe0f",
-    "man_judge": "\ud83d\udc68\u200d\u2696\ufe0f",
-    "man_judge_tone1": "\ud83d\udc68\ud83c\udffb\u200d\u2696\ufe0f",
-    "man_judge_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\u2696\ufe0f",
-    "man_judge_tone2": "\ud83d\udc68\ud83c\udffc\u200d\u2696\ufe0f",
-    "man_judge_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\u2696\ufe0f",
-    "man_judge_tone3": "\ud83d\udc68\ud83c\udffd\u200d\u2696\ufe0f",
-    "man_judge_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\u2696\ufe0f",
-    "man_judge_tone4": "\ud83d\udc68\ud83c\udffe\u200d\u2696\ufe0f",
-    "man_judge_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\u2696\ufe0f",
-    "man_judge_tone5": "\ud83d\udc68\ud83c\udfff\u200d\u2696\ufe0f",
-    "man_judge_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\u2696\ufe0f",
-    "person_with_veil": "\ud83d\udc70",
-    "person_with_veil_tone1": "\ud83d\udc70\ud83c\udffb",
-    "person_with_veil_tone2": "\ud83d\udc70\ud83c\udffc",
-    "person_with_veil_tone3": "\ud83d\udc70\ud83c\udffd",
-    "person_with_veil_tone4": "\ud83d\udc70\ud83c\udffe",
-    "person_with_veil_tone5": "\ud83d\udc70\ud83c\udfff",
-    "woman_with_veil": "\ud83d\udc70\u200d\u2640\ufe0f",
-    "woman_with_veil_tone1": "\ud83d\udc70\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_with_veil_light_skin_tone": "\ud83d\udc70\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_with_veil_tone2": "\ud83d\udc70\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_with_veil_medium_light_skin_tone": "\ud83d\udc70\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_with_veil_tone3": "\ud83d\udc70\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_with_veil_medium_skin_tone": "\ud83d\udc70\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_with_veil_tone4": "\ud83d\udc70\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_with_veil_medium_dark_skin_tone": "\ud83d\udc70\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_with_veil_tone5": "\ud83d\udc70\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_with_veil_dark_skin_tone": "\ud83d\udc70\ud83c\udfff\u200d\u2640\ufe0f",
-    "bride_with_veil": "\ud83d\udc70\u200d\u2640\ufe0f",
-    "man_with_veil": "\ud83d\udc70\u200d\u2642\ufe0f",
-    "man_with_veil_tone1": "\ud83d\udc70\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_with_veil_light_skin_tone": "\ud83d\udc70\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_with_veil_tone2": "\ud83d\udc70\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_with_veil_medium_light_skin_tone": "\ud83d\udc70\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_with_veil_tone3": "\ud83d\udc70\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_with_veil_medium_skin_tone": "\ud83d\udc70\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_with_veil_tone4": "\ud83d\udc70\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_with_veil_medium_dark_skin_tone": "\ud83d\udc70\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_with_veil_tone5": "\ud83d\udc70\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_with_veil_dark_skin_tone": "\ud83d\udc70\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_in_tuxedo": "\ud83e\udd35",
-    "person_in_tuxedo_tone1": "\ud83e\udd35\ud83c\udffb",
-    "tuxedo_tone1": "\ud83e\udd35\ud83c\udffb",
-    "person_in_tuxedo_tone2": "\ud83e\udd35\ud83c\udffc",
-    "tuxedo_tone2": "\ud83e\udd35\ud83c\udffc",
-    "person_in_tuxedo_tone3": "\ud83e\udd35\ud83c\udffd",
-    "tuxedo_tone3": "\ud83e\udd35\ud83c\udffd",
-    "person_in_tuxedo_tone4": "\ud83e\udd35\ud83c\udffe",
-    "tuxedo_tone4": "\ud83e\udd35\ud83c\udffe",
-    "person_in_tuxedo_tone5": "\ud83e\udd35\ud83c\udfff",
-    "tuxedo_tone5": "\ud83e\udd35\ud83c\udfff",
-    "woman_in_tuxedo": "\ud83e\udd35\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_tone1": "\ud83e\udd35\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_light_skin_tone": "\ud83e\udd35\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_tone2": "\ud83e\udd35\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_medium_light_skin_tone": "\ud83e\udd35\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_tone3": "\ud83e\udd35\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_medium_skin_tone": "\ud83e\udd35\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_tone4": "\ud83e\udd35\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_medium_dark_skin_tone": "\ud83e\udd35\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_tone5": "\ud83e\udd35\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_in_tuxedo_dark_skin_tone": "\ud83e\udd35\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_in_tuxedo": "\ud83e\udd35\u200d\u2642\ufe0f",
-    "man_in_tuxedo_tone1": "\ud83e\udd35\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_in_tuxedo_light_skin_tone": "\ud83e\udd35\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_in_tuxedo_tone2": "\ud83e\udd35\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_in_tuxedo_medium_light_skin_tone": "\ud83e\udd35\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_in_tuxedo_tone3": "\ud83e\udd35\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_in_tuxedo_medium_skin_tone": "\ud83e\udd35\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_in_tuxedo_tone4": "\ud83e\udd35\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_in_tuxedo_medium_dark_skin_tone": "\ud83e\udd35\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_in_tuxedo_tone5": "\ud83e\udd35\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_in_tuxedo_dark_skin_tone": "\ud83e\udd35\ud83c\udfff\u200d\u2642\ufe0f",
-    "princess": "\ud83d\udc78",
-    "princess_tone1": "\ud83d\udc78\ud83c\udffb",
-    "princess_tone2": "\ud83d\udc78\ud83c\udffc",
-    "princess_tone3": "\ud83d\udc78\ud83c\udffd",
-    "princess_tone4": "\ud83d\udc78\ud83c\udffe",
-    "princess_tone5": "\ud83d\udc78\ud83c\udfff",
-    "prince": "\ud83e\udd34",
-    "prince_tone1": "\ud83e\udd34\ud83c\udffb",
-    "prince_tone2": "\ud83e\udd34\ud83c\udffc",
-    "prince_tone3": "\ud83e\udd34\ud83c\udffd",
-    "prince_tone4": "\ud83e\udd34\ud83c\udffe",
-    "prince_tone5": "\ud83e\udd34\ud83c\udfff",
-    "superhero": "\ud83e\uddb8",
-    "superhero_tone1": "\ud83e\uddb8\ud83c\udffb",
-    "superhero_light_skin_tone": "\ud83e\uddb8\ud83c\udffb",
-    "superhero_tone2": "\ud83e\uddb8\ud83c\udffc",
-    "superhero_medium_light_skin_tone": "\ud83e\uddb8\ud83c\udffc",
-    "superhero_tone3": "\ud83e\uddb8\ud83c\udffd",
-    "superhero_medium_skin_tone": "\ud83e\uddb8\ud83c\udffd",
-    "superhero_tone4": "\ud83e\uddb8\ud83c\udffe",
-    "superhero_medium_dark_skin_tone": "\ud83e\uddb8\ud83c\udffe",
-    "superhero_tone5": "\ud83e\uddb8\ud83c\udfff",
-    "superhero_dark_skin_tone": "\ud83e\uddb8\ud83c\udfff",
-    "woman_superhero": "\ud83e\uddb8\u200d\u2640\ufe0f",
-    "woman_superhero_tone1": "\ud83e\uddb8\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_superhero_light_skin_tone": "\ud83e\uddb8\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_superhero_tone2": "\ud83e\uddb8\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_superhero_medium_light_skin_tone": "\ud83e\uddb8\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_superhero_tone3": "\ud83e\uddb8\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_superhero_medium_skin_tone": "\ud83e\uddb8\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_superhero_tone4": "\ud83e\uddb8\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_superhero_medium_dark_skin_tone": "\ud83e\uddb8\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_superhero_tone5": "\ud83e\uddb8\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_superhero_dark_skin_tone": "\ud83e\uddb8\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_superhero": "\ud83e\uddb8\u200d\u2642\ufe0f",
-    "man_superhero_tone1": "\ud83e\uddb8\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_superhero_light_skin_tone": "\ud83e\uddb8\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_superhero_tone2": "\ud83e\uddb8\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_superhero_medium_light_skin_tone": "\ud83e\uddb8\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_superhero_tone3": "\ud83e\uddb8\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_superhero_medium_skin_tone": "\ud83e\uddb8\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_superhero_tone4": "\ud83e\uddb8\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_superhero_medium_dark_skin_tone": "\ud83e\uddb8\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_superhero_tone5": "\ud83e\uddb8\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_superhero_dark_skin_tone": "\ud83e\uddb8\ud83c\udfff\u200d\u2642\ufe0f",
-    "supervillain": "\ud83e\uddb9",
-    "supervillain_tone1": "\ud83e\uddb9\ud83c\udffb",
-    "supervillain_light_skin_tone": "\ud83e\uddb9\ud83c\udffb",
-    "supervillain_tone2": "\ud83e\uddb9\ud83c\udffc",
-    "supervillain_medium_light_skin_tone": "\ud83e\uddb9\ud83c\udffc",
-    "supervillain_tone3": "\ud83e\uddb9\ud83c\udffd",
-    "supervillain_medium_skin_tone": "\ud83e\uddb9\ud83c\udffd",
-    "supervillain_tone4": "\ud83e\uddb9\ud83c\udffe",
-    "supervillain_medium_dark_skin_tone": "\ud83e\uddb9\ud83c\udffe",
-    "supervillain_tone5": "\ud83e\uddb9\ud83c\udfff",
-    "supervillain_dark_skin_tone": "\ud83e\uddb9\ud83c\udfff",
-    "woman_supervillain": "\ud83e\uddb9\u200d\u2640\ufe0f",
-    "woman_supervillain_tone1": "\ud83e\uddb9\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_supervillain_light_skin_tone": "\ud83e\uddb9\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_supervillain_tone2": "\ud83e\uddb9\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_supervillain_medium_light_skin_tone": "\ud83e\uddb9\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_supervillain_tone3": "\ud83e\uddb9\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_supervillain_medium_skin_tone": "\ud83e\uddb9\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_supervillain_tone4": "\ud83e\uddb9\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_supervillain_medium_dark_skin_tone": "\ud83e\uddb9\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_supervillain_tone5": "\ud83e\uddb9\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_supervillain_dark_skin_tone": "\ud83e\uddb9\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_supervillain": "\ud83e\uddb9\u200d\u2642\ufe0f",
-    "man_supervillain_tone1": "\ud83e\uddb9\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_supervillain_light_skin_tone": "\ud83e\uddb9\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_supervillain_tone2": "\ud83e\uddb9\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_supervillain_medium_light_skin_tone": "\ud83e\uddb9\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_supervillain_tone3": "\ud83e\uddb9\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_supervillain_medium_skin_tone": "\ud83e\uddb9\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_supervillain_tone4": "\ud83e\uddb9\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_supervillain_medium_dark_skin_tone": "\ud83e\uddb9\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_supervillain_tone5": "\ud83e\uddb9\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_supervillain_dark_skin_tone": "\ud83e\uddb9\ud83c\udfff\u200d\u2642\ufe0f",
-    "ninja": "\ud83e\udd77",
-    "ninja_tone1": "\ud83e\udd77\ud83c\udffb",
-    "ninja_light_skin_tone": "\ud83e\udd77\ud83c\udffb",
-    "ninja_tone2": "\ud83e\udd77\ud83c\udffc",
-    "ninja_medium_light_skin_tone": "\ud83e\udd77\ud83c\udffc",
-    "ninja_tone3": "\ud83e\udd77\ud83c\udffd",
-    "ninja_medium_skin_tone": "\ud83e\udd77\ud83c\udffd",
-    "ninja_tone4": "\ud83e\udd77\ud83c\udffe",
-    "ninja_medium_dark_skin_tone": "\ud83e\udd77\ud83c\udffe",
-    "ninja_tone5": "\ud83e\udd77\ud83c\udfff",
-    "ninja_dark_skin_tone": "\ud83e\udd77\ud83c\udfff",
-    "mx_claus": "\ud83e\uddd1\u200d\ud83c\udf84",
-    "mx_claus_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf84",
-    "mx_claus_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf84",
-    "mx_claus_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf84",
-    "mx_claus_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf84",
-    "mx_claus_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf84",
-    "mx_claus_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf84",
-    "mx_claus_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf84",
-    "mx_claus_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf84",
-    "mx_claus_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf84",
-    "mx_claus_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf84",
-    "mrs_claus": "\ud83e\udd36",
-    "mrs_claus_tone1": "\ud83e\udd36\ud83c\udffb",
-    "mother_christmas_tone1": "\ud83e\udd36\ud83c\udffb",
-    "mrs_claus_tone2": "\ud83e\udd36\ud83c\udffc",
-    "mother_christmas_tone2": "\ud83e\udd36\ud83c\udffc",
-    "mrs_claus_tone3": "\ud83e\udd36\ud83c\udffd",
-    "mother_christmas_tone3": "\ud83e\udd36\ud83c\udffd",
-    "mrs_claus_tone4": "\ud83e\udd36\ud83c\udffe",
-    "mother_christmas_tone4": "\ud83e\udd36\ud83c\udffe",
-    "mrs_claus_tone5": "\ud83e\udd36\ud83c\udfff",
-    "mother_christmas_tone5": "\ud83e\udd36\ud83c\udfff",
-    "mother_christmas": "\ud83e\udd36",
-    "santa": "\ud83c\udf85",
-    "santa_tone1": "\ud83c\udf85\ud83c\udffb",
-    "santa_tone2": "\ud83c\udf85\ud83c\udffc",
-    "santa_tone3": "\ud83c\udf85\ud83c\udffd",
-    "santa_tone4": "\ud83c\udf85\ud83c\udffe",
-    "santa_tone5": "\ud83c\udf85\ud83c\udfff",
-    "mage": "\ud83e\uddd9",
-    "mage_tone1": "\ud83e\uddd9\ud83c\udffb",
-    "mage_light_skin_tone": "\ud83e\uddd9\ud83c\udffb",
-    "mage_tone2": "\ud83e\uddd9\ud83c\udffc",
-    "mage_medium_light_skin_tone": "\ud83e\uddd9\ud83c\udffc",
-    "mage_tone3": "\ud83e\uddd9\ud83c\udffd",
-    "mage_medium_skin_tone": "\ud83e\uddd9\ud83c\udffd",
-    "mage_tone4": "\ud83e\uddd9\ud83c\udffe",
-    "mage_medium_dark_skin_tone": "\ud83e\uddd9\ud83c\udffe",
-    "mage_tone5": "\ud83e\uddd9\ud83c\udfff",
-    "mage_dark_skin_tone": "\ud83e\uddd9\ud83c\udfff",
-    "woman_mage": "\ud83e\uddd9\u200d\u2640\ufe0f",
-    "woman_mage_tone1": "\ud83e\uddd9\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_mage_light_skin_tone": "\ud83e\uddd9\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_mage_tone2": "\ud83e\uddd9\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_mage_medium_light_skin_tone": "\ud83e\uddd9\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_mage_tone3": "\ud83e\uddd9\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_mage_medium_skin_tone": "\ud83e\uddd9\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_mage_tone4": "\ud83e\uddd9\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_mage_medium_dark_skin_tone": "\ud83e\uddd9\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_mage_tone5": "\ud83e\uddd9\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_mage_dark_skin_tone": "\ud83e\uddd9\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_mage": "\ud83e\uddd9\u200d\u2642\ufe0f",
-    "man_mage_tone1": "\ud83e\uddd9\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_mage_light_skin_tone": "\ud83e\uddd9\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_mage_tone2": "\ud83e\uddd9\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_mage_medium_light_skin_tone": "\ud83e\uddd9\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_mage_tone3": "\ud83e\uddd9\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_mage_medium_skin_tone": "\ud83e\uddd9\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_mage_tone4": "\ud83e\uddd9\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_mage_medium_dark_skin_tone": "\ud83e\uddd9\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_mage_tone5": "\ud83e\uddd9\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_mage_dark_skin_tone": "\ud83e\uddd9\ud83c\udfff\u200d\u2642\ufe0f",
-    "elf": "\ud83e\udddd",
-    "elf_tone1": "\ud83e\udddd\ud83c\udffb",
-    "elf_light_skin_tone": "\ud83e\udddd\ud83c\udffb",
-    "elf_tone2": "\ud83e\udddd\ud83c\udffc",
-    "elf_medium_light_skin_tone": "\ud83e\udddd\ud83c\udffc",
-    "elf_tone3": "\ud83e\udddd\ud83c\udffd",
-    "elf_medium_skin_tone": "\ud83e\udddd\ud83c\udffd",
-    "elf_tone4": "\ud83e\udddd\ud83c\udffe",
-    "elf_medium_dark_skin_tone": "\ud83e\udddd\ud83c\udffe",
-    "elf_tone5": "\ud83e\udddd\ud83c\udfff",
-    "elf_dark_skin_tone": "\ud83e\udddd\ud83c\udfff",
-    "woman_elf": "\ud83e\udddd\u200d\u2640\ufe0f",
-    "woman_elf_tone1": "\ud83e\udddd\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_elf_light_skin_tone": "\ud83e\udddd\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_elf_tone2": "\ud83e\udddd\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_elf_medium_light_skin_tone": "\ud83e\udddd\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_elf_tone3": "\ud83e\udddd\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_elf_medium_skin_tone": "\ud83e\udddd\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_elf_tone4": "\ud83e\udddd\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_elf_medium_dark_skin_tone": "\ud83e\udddd\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_elf_tone5": "\ud83e\udddd\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_elf_dark_skin_tone": "\ud83e\udddd\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_elf": "\ud83e\udddd\u200d\u2642\ufe0f",
-    "man_elf_tone1": "\ud83e\udddd\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_elf_light_skin_tone": "\ud83e\udddd\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_elf_tone2": "\ud83e\udddd\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_elf_medium_light_skin_tone": "\ud83e\udddd\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_elf_tone3": "\ud83e\udddd\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_elf_medium_skin_tone": "\ud83e\udddd\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_elf_tone4": "\ud83e\udddd\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_elf_medium_dark_skin_tone": "\ud83e\udddd\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_elf_tone5": "\ud83e\udddd\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_elf_dark_skin_tone": "\ud83e\udddd\ud83c\udfff\u200d\u2642\ufe0f",
-    "vampire": "\ud83e\udddb",
-    "vampire_tone1": "\ud83e\udddb\ud83c\udffb",
-    "vampire_light_skin_tone": "\ud83e\udddb\ud83c\udffb",
-    "vampire_tone2": "\ud83e\udddb\ud83c\udffc",
-    "vampire_medium_light_skin_tone": "\ud83e\udddb\ud83c\udffc",
-    "vampire_tone3": "\ud83e\udddb\ud83c\udffd",
-    "vampire_medium_skin_tone": "\ud83e\udddb\ud83c\udffd",
-    "vampire_tone4": "\ud83e\udddb\ud83c\udffe",
-    "vampire_medium_dark_skin_tone": "\ud83e\udddb\ud83c\udffe",
-    "vampire_tone5": "\ud83e\udddb\ud83c\udfff",
-    "vampire_dark_skin_tone": "\ud83e\udddb\ud83c\udfff",
-    "woman_vampire": "\ud83e\udddb\u200d\u2640\ufe0f",
-    "woman_vampire_tone1": "\ud83e\udddb\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_vampire_light_skin_tone": "\ud83e\udddb\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_vampire_tone2": "\ud83e\udddb\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_vampire_medium_light_skin_tone": "\ud83e\udddb\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_vampire_tone3": "\ud83e\udddb\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_vampire_medium_skin_tone": "\ud83e\udddb\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_vampire_tone4": "\ud83e\udddb\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_vampire_medium_dark_skin_tone": "\ud83e\udddb\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_vampire_tone5": "\ud83e\udddb\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_vampire_dark_skin_tone": "\ud83e\udddb\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_vampire": "\ud83e\udddb\u200d\u2642\ufe0f",
-    "man_vampire_tone1": "\ud83e\udddb\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_vampire_light_skin_tone": "\ud83e\udddb\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_vampire_tone2": "\ud83e\udddb\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_vampire_medium_light_skin_tone": "\ud83e\udddb\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_vampire_tone3": "\ud83e\udddb\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_vampire_medium_skin_tone": "\ud83e\udddb\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_vampire_tone4": "\ud83e\udddb\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_vampire_medium_dark_skin_tone": "\ud83e\udddb\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_vampire_tone5": "\ud83e\udddb\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_vampire_dark_skin_tone": "\ud83e\udddb\ud83c\udfff\u200d\u2642\ufe0f",
-    "zombie": "\ud83e\udddf",
-    "woman_zombie": "\ud83e\udddf\u200d\u2640\ufe0f",
-    "man_zombie": "\ud83e\udddf\u200d\u2642\ufe0f",
-    "genie": "\ud83e\uddde",
-    "woman_genie": "\ud83e\uddde\u200d\u2640\ufe0f",
-    "man_genie": "\ud83e\uddde\u200d\u2642\ufe0f",
-    "merperson": "\ud83e\udddc",
-    "merperson_tone1": "\ud83e\udddc\ud83c\udffb",
-    "merperson_light_skin_tone": "\ud83e\udddc\ud83c\udffb",
-    "merperson_tone2": "\ud83e\udddc\ud83c\udffc",
-    "merperson_medium_light_skin_tone": "\ud83e\udddc\ud83c\udffc",
-    "merperson_tone3": "\ud83e\udddc\ud83c\udffd",
-    "merperson_medium_skin_tone": "\ud83e\udddc\ud83c\udffd",
-    "merperson_tone4": "\ud83e\udddc\ud83c\udffe",
-    "merperson_medium_dark_skin_tone": "\ud83e\udddc\ud83c\udffe",
-    "merperson_tone5": "\ud83e\udddc\ud83c\udfff",
-    "merperson_dark_skin_tone": "\ud83e\udddc\ud83c\udfff",
-    "mermaid": "\ud83e\udddc\u200d\u2640\ufe0f",
-    "mermaid_tone1": "\ud83e\udddc\ud83c\udffb\u200d\u2640\ufe0f",
-    "mermaid_light_skin_tone": "\ud83e\udddc\ud83c\udffb\u200d\u2640\ufe0f",
-    "mermaid_tone2": "\ud83e\udddc\ud83c\udffc\u200d\u2640\ufe0f",
-    "mermaid_medium_light_skin_tone": "\ud83e\udddc\ud83c\udffc\u200d\u2640\ufe0f",
-    "mermaid_tone3": "\ud83e\udddc\ud83c\udffd\u200d\u2640\ufe0f",
-    "mermaid_medium_skin_tone": "\ud83e\udddc\ud83c\udffd\u200d\u2640\ufe0f",
-    "mermaid_tone4": "\ud83e\udddc\ud83c\udffe\u200d\u2640\ufe0f",
-    "mermaid_medium_dark_skin_tone": "\ud83e\udddc\ud83c\udffe\u200d\u2640\ufe0f",
-    "mermaid_tone5": "\ud83e\udddc\ud83c\udfff\u200d\u2640\ufe0f",
-    "mermaid_dark_skin_tone": "\ud83e\udddc\ud83c\udfff\u200d\u2640\ufe0f",
-    "merman": "\ud83e\udddc\u200d\u2642\ufe0f",
-    "merman_tone1": "\ud83e\udddc\ud83c\udffb\u200d\u2642\ufe0f",
-    "merman_light_skin_tone": "\ud83e\udddc\ud83c\udffb\u200d\u2642\ufe0f",
-    "merman_tone2": "\ud83e\udddc\ud83c\udffc\u200d\u2642\ufe0f",
-    "merman_medium_light_skin_tone": "\ud83e\udddc\ud83c\udffc\u200d\u2642\ufe0f",
-    "merman_tone3": "\ud83e\udddc\ud83c\udffd\u200d\u2642\ufe0f",
-    "merman_medium_skin_tone": "\ud83e\udddc\ud83c\udffd\u200d\u2642\ufe0f",
-    "merman_tone4": "\ud83e\udddc\ud83c\udffe\u200d\u2642\ufe0f",
-    "merman_medium_dark_skin_tone": "\ud83e\udddc\ud83c\udffe\u200d\u2642\ufe0f",
-    "merman_tone5": "\ud83e\udddc\ud83c\udfff\u200d\u2642\ufe0f",
-    "merman_dark_skin_tone": "\ud83e\udddc\ud83c\udfff\u200d\u2642\ufe0f",
-    "fairy": "\ud83e\uddda",
-    "fairy_tone1": "\ud83e\uddda\ud83c\udffb",
-    "fairy_light_skin_tone": "\ud83e\uddda\ud83c\udffb",
-    "fairy_tone2": "\ud83e\uddda\ud83c\udffc",
-    "fairy_medium_light_skin_tone": "\ud83e\uddda\ud83c\udffc",
-    "fairy_tone3": "\ud83e\uddda\ud83c\udffd",
-    "fairy_medium_skin_tone": "\ud83e\uddda\ud83c\udffd",
-    "fairy_tone4": "\ud83e\uddda\ud83c\udffe",
-    "fairy_medium_dark_skin_tone": "\ud83e\uddda\ud83c\udffe",
-    "fairy_tone5": "\ud83e\uddda\ud83c\udfff",
-    "fairy_dark_skin_tone": "\ud83e\uddda\ud83c\udfff",
-    "woman_fairy": "\ud83e\uddda\u200d\u2640\ufe0f",
-    "woman_fairy_tone1": "\ud83e\uddda\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_fairy_light_skin_tone": "\ud83e\uddda\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_fairy_tone2": "\ud83e\uddda\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_fairy_medium_light_skin_tone": "\ud83e\uddda\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_fairy_tone3": "\ud83e\uddda\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_fairy_medium_skin_tone": "\ud83e\uddda\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_fairy_tone4": "\ud83e\uddda\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_fairy_medium_dark_skin_tone": "\ud83e\uddda\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_fairy_tone5": "\ud83e\uddda\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_fairy_dark_skin_tone": "\ud83e\uddda\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_fairy": "\ud83e\uddda\u200d\u2642\ufe0f",
-    "man_fairy_tone1": "\ud83e\uddda\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_fairy_light_skin_tone": "\ud83e\uddda\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_fairy_tone2": "\ud83e\uddda\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_fairy_medium_light_skin_tone": "\ud83e\uddda\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_fairy_tone3": "\ud83e\uddda\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_fairy_medium_skin_tone": "\ud83e\uddda\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_fairy_tone4": "\ud83e\uddda\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_fairy_medium_dark_skin_tone": "\ud83e\uddda\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_fairy_tone5": "\ud83e\uddda\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_fairy_dark_skin_tone": "\ud83e\uddda\ud83c\udfff\u200d\u2642\ufe0f",
-    "angel": "\ud83d\udc7c",
-    "angel_tone1": "\ud83d\udc7c\ud83c\udffb",
-    "angel_tone2": "\ud83d\udc7c\ud83c\udffc",
-    "angel_tone3": "\ud83d\udc7c\ud83c\udffd",
-    "angel_tone4": "\ud83d\udc7c\ud83c\udffe",
-    "angel_tone5": "\ud83d\udc7c\ud83c\udfff",
-    "pregnant_woman": "\ud83e\udd30",
-    "pregnant_woman_tone1": "\ud83e\udd30\ud83c\udffb",
-    "expecting_woman_tone1": "\ud83e\udd30\ud83c\udffb",
-    "pregnant_woman_tone2": "\ud83e\udd30\ud83c\udffc",
-    "expecting_woman_tone2": "\ud83e\udd30\ud83c\udffc",
-    "pregnant_woman_tone3": "\ud83e\udd30\ud83c\udffd",
-    "expecting_woman_tone3": "\ud83e\udd30\ud83c\udffd",
-    "pregnant_woman_tone4": "\ud83e\udd30\ud83c\udffe",
-    "expecting_woman_tone4": "\ud83e\udd30\ud83c\udffe",
-    "pregnant_woman_tone5": "\ud83e\udd30\ud83c\udfff",
-    "expecting_woman_tone5": "\ud83e\udd30\ud83c\udfff",
-    "expecting_woman": "\ud83e\udd30",
-    "breast_feeding": "\ud83e\udd31",
-    "breast_feeding_tone1": "\ud83e\udd31\ud83c\udffb",
-    "breast_feeding_light_skin_tone": "\ud83e\udd31\ud83c\udffb",
-    "breast_feeding_tone2": "\ud83e\udd31\ud83c\udffc",
-    "breast_feeding_medium_light_skin_tone": "\ud83e\udd31\ud83c\udffc",
-    "breast_feeding_tone3": "\ud83e\udd31\ud83c\udffd",
-    "breast_feeding_medium_skin_tone": "\ud83e\udd31\ud83c\udffd",
-    "breast_feeding_tone4": "\ud83e\udd31\ud83c\udffe",
-    "breast_feeding_medium_dark_skin_tone": "\ud83e\udd31\ud83c\udffe",
-    "breast_feeding_tone5": "\ud83e\udd31\ud83c\udfff",
-    "breast_feeding_dark_skin_tone": "\ud83e\udd31\ud83c\udfff",
-    "person_feeding_baby": "\ud83e\uddd1\u200d\ud83c\udf7c",
-    "person_feeding_baby_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf7c",
-    "person_feeding_baby_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83c\udf7c",
-    "person_feeding_baby_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf7c",
-    "person_feeding_baby_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83c\udf7c",
-    "person_feeding_baby_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf7c",
-    "person_feeding_baby_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83c\udf7c",
-    "person_feeding_baby_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf7c",
-    "person_feeding_baby_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83c\udf7c",
-    "person_feeding_baby_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf7c",
-    "person_feeding_baby_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83c\udf7c",
-    "woman_feeding_baby": "\ud83d\udc69\u200d\ud83c\udf7c",
-    "woman_feeding_baby_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udf7c",
-    "woman_feeding_baby_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83c\udf7c",
-    "woman_feeding_baby_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udf7c",
-    "woman_feeding_baby_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83c\udf7c",
-    "woman_feeding_baby_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udf7c",
-    "woman_feeding_baby_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83c\udf7c",
-    "woman_feeding_baby_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udf7c",
-    "woman_feeding_baby_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83c\udf7c",
-    "woman_feeding_baby_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udf7c",
-    "woman_feeding_baby_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83c\udf7c",
-    "man_feeding_baby": "\ud83d\udc68\u200d\ud83c\udf7c",
-    "man_feeding_baby_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udf7c",
-    "man_feeding_baby_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83c\udf7c",
-    "man_feeding_baby_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udf7c",
-    "man_feeding_baby_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83c\udf7c",
-    "man_feeding_baby_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udf7c",
-    "man_feeding_baby_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83c\udf7c",
-    "man_feeding_baby_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udf7c",
-    "man_feeding_baby_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83c\udf7c",
-    "man_feeding_baby_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udf7c",
-    "man_feeding_baby_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83c\udf7c",
-    "person_bowing": "\ud83d\ude47",
-    "person_bowing_tone1": "\ud83d\ude47\ud83c\udffb",
-    "bow_tone1": "\ud83d\ude47\ud83c\udffb",
-    "person_bowing_tone2": "\ud83d\ude47\ud83c\udffc",
-    "bow_tone2": "\ud83d\ude47\ud83c\udffc",
-    "person_bowing_tone3": "\ud83d\ude47\ud83c\udffd",
-    "bow_tone3": "\ud83d\ude47\ud83c\udffd",
-    "person_bowing_tone4": "\ud83d\ude47\ud83c\udffe",
-    "bow_tone4": "\ud83d\ude47\ud83c\udffe",
-    "person_bowing_tone5": "\ud83d\ude47\ud83c\udfff",
-    "bow_tone5": "\ud83d\ude47\ud83c\udfff",
-    "bow": "\ud83d\ude47",
-    "woman_bowing": "\ud83d\ude47\u200d\u2640\ufe0f",
-    "woman_bowing_tone1": "\ud83d\ude47\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_bowing_light_skin_tone": "\ud83d\ude47\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_bowing_tone2": "\ud83d\ude47\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_bowing_medium_light_skin_tone": "\ud83d\ude47\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_bowing_tone3": "\ud83d\ude47\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_bowing_medium_skin_tone": "\ud83d\ude47\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_bowing_tone4": "\ud83d\ude47\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_bowing_medium_dark_skin_tone": "\ud83d\ude47\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_bowing_tone5": "\ud83d\ude47\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_bowing_dark_skin_tone": "\ud83d\ude47\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_bowing": "\ud83d\ude47\u200d\u2642\ufe0f",
-    "man_bowing_tone1": "\ud83d\ude47\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_bowing_light_skin_tone": "\ud83d\ude47\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_bowing_tone2": "\ud83d\ude47\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_bowing_medium_light_skin_tone": "\ud83d\ude47\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_bowing_tone3": "\ud83d\ude47\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_bowing_medium_skin_tone": "\ud83d\ude47\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_bowing_tone4": "\ud83d\ude47\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_bowing_medium_dark_skin_tone": "\ud83d\ude47\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_bowing_tone5": "\ud83d\ude47\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_bowing_dark_skin_tone": "\ud83d\ude47\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_tipping_hand": "\ud83d\udc81",
-    "person_tipping_hand_tone1": "\ud83d\udc81\ud83c\udffb",
-    "information_desk_person_tone1": "\ud83d\udc81\ud83c\udffb",
-    "person_tipping_hand_tone2": "\ud83d\udc81\ud83c\udffc",
-    "information_desk_person_tone2": "\ud83d\udc81\ud83c\udffc",
-    "person_tipping_hand_tone3": "\ud83d\udc81\ud83c\udffd",
-    "information_desk_person_tone3": "\ud83d\udc81\ud83c\udffd",
-    "person_tipping_hand_tone4": "\ud83d\udc81\ud83c\udffe",
-    "information_desk_person_tone4": "\ud83d\udc81\ud83c\udffe",
-    "person_tipping_hand_tone5": "\ud83d\udc81\ud83c\udfff",
-    "information_desk_person_tone5": "\ud83d\udc81\ud83c\udfff",
-    "information_desk_person": "\ud83d\udc81",
-    "woman_tipping_hand": "\ud83d\udc81\u200d\u2640\ufe0f",
-    "woman_tipping_hand_tone1": "\ud83d\udc81\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_tipping_hand_light_skin_tone": "\ud83d\udc81\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_tipping_hand_tone2": "\ud83d\udc81\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_tipping_hand_medium_light_skin_tone": "\ud83d\udc81\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_tipping_hand_tone3": "\ud83d\udc81\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_tipping_hand_medium_skin_tone": "\ud83d\udc81\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_tipping_hand_tone4": "\ud83d\udc81\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_tipping_hand_medium_dark_skin_tone": "\ud83d\udc81\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_tipping_hand_tone5": "\ud83d\udc81\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_tipping_hand_dark_skin_tone": "\ud83d\udc81\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_tipping_hand": "\ud83d\udc81\u200d\u2642\ufe0f",
-    "man_tipping_hand_tone1": "\ud83d\udc81\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_tipping_hand_light_skin_tone": "\ud83d\udc81\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_tipping_hand_tone2": "\ud83d\udc81\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_tipping_hand_medium_light_skin_tone": "\ud83d\udc81\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_tipping_hand_tone3": "\ud83d\udc81\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_tipping_hand_medium_skin_tone": "\ud83d\udc81\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_tipping_hand_tone4": "\ud83d\udc81\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_tipping_hand_medium_dark_skin_tone": "\ud83d\udc81\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_tipping_hand_tone5": "\ud83d\udc81\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_tipping_hand_dark_skin_tone": "\ud83d\udc81\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_gesturing_no": "\ud83d\ude45",
-    "person_gesturing_no_tone1": "\ud83d\ude45\ud83c\udffb",
-    "no_good_tone1": "\ud83d\ude45\ud83c\udffb",
-    "person_gesturing_no_tone2": "\ud83d\ude45\ud83c\udffc",
-    "no_good_tone2": "\ud83d\ude45\ud83c\udffc",
-    "person_gesturing_no_tone3": "\ud83d\ude45\ud83c\udffd",
-    "no_good_tone3": "\ud83d\ude45\ud83c\udffd",
-    "person_gesturing_no_tone4": "\ud83d\ude45\ud83c\udffe",
-    "no_good_tone4": "\ud83d\ude45\ud83c\udffe",
-    "person_gesturing_no_tone5": "\ud83d\ude45\ud83c\udfff",
-    "no_good_tone5": "\ud83d\ude45\ud83c\udfff",
-    "no_good": "\ud83d\ude45",
-    "woman_gesturing_no": "\ud83d\ude45\u200d\u2640\ufe0f",
-    "woman_gesturing_no_tone1": "\ud83d\ude45\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_gesturing_no_light_skin_tone": "\ud83d\ude45\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_gesturing_no_tone2": "\ud83d\ude45\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_gesturing_no_medium_light_skin_tone": "\ud83d\ude45\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_gesturing_no_tone3": "\ud83d\ude45\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_gesturing_no_medium_skin_tone": "\ud83d\ude45\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_gesturing_no_tone4": "\ud83d\ude45\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_gesturing_no_medium_dark_skin_tone": "\ud83d\ude45\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_gesturing_no_tone5": "\ud83d\ude45\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_gesturing_no_dark_skin_tone": "\ud83d\ude45\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_gesturing_no": "\ud83d\ude45\u200d\u2642\ufe0f",
-    "man_gesturing_no_tone1": "\ud83d\ude45\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_gesturing_no_light_skin_tone": "\ud83d\ude45\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_gesturing_no_tone2": "\ud83d\ude45\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_gesturing_no_medium_light_skin_tone": "\ud83d\ude45\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_gesturing_no_tone3": "\ud83d\ude45\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_gesturing_no_medium_skin_tone": "\ud83d\ude45\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_gesturing_no_tone4": "\ud83d\ude45\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_gesturing_no_medium_dark_skin_tone": "\ud83d\ude45\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_gesturing_no_tone5": "\ud83d\ude45\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_gesturing_no_dark_skin_tone": "\ud83d\ude45\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_gesturing_ok": "\ud83d\ude46",
-    "person_gesturing_ok_tone1": "\ud83d\ude46\ud83c\udffb",
-    "ok_woman_tone1": "\ud83d\ude46\ud83c\udffb",
-    "person_gesturing_ok_tone2": "\ud83d\ude46\ud83c\udffc",
-    "ok_woman_tone2": "\ud83d\ude46\ud83c\udffc",
-    "person_gesturing_ok_tone3": "\ud83d\ude46\ud83c\udffd",
-    "ok_woman_tone3": "\ud83d\ude46\ud83c\udffd",
-    "person_gesturing_ok_tone4": "\ud83d\ude46\ud83c\udffe",
-    "ok_woman_tone4": "\ud83d\ude46\ud83c\udffe",
-    "person_gesturing_ok_tone5": "\ud83d\ude46\ud83c\udfff",
-    "ok_woman_tone5": "\ud83d\ude46\ud83c\udfff",
-    "ok_woman": "\ud83d\ude46",
-    "woman_gesturing_ok": "\ud83d\ude46\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_tone1": "\ud83d\ude46\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_light_skin_tone": "\ud83d\ude46\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_tone2": "\ud83d\ude46\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_medium_light_skin_tone": "\ud83d\ude46\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_tone3": "\ud83d\ude46\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_medium_skin_tone": "\ud83d\ude46\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_tone4": "\ud83d\ude46\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_medium_dark_skin_tone": "\ud83d\ude46\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_tone5": "\ud83d\ude46\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_gesturing_ok_dark_skin_tone": "\ud83d\ude46\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_gesturing_ok": "\ud83d\ude46\u200d\u2642\ufe0f",
-    "man_gesturing_ok_tone1": "\ud83d\ude46\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_gesturing_ok_light_skin_tone": "\ud83d\ude46\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_gesturing_ok_tone2": "\ud83d\ude46\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_gesturing_ok_medium_light_skin_tone": "\ud83d\ude46\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_gesturing_ok_tone3": "\ud83d\ude46\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_gesturing_ok_medium_skin_tone": "\ud83d\ude46\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_gesturing_ok_tone4": "\ud83d\ude46\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_gesturing_ok_medium_dark_skin_tone": "\ud83d\ude46\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_gesturing_ok_tone5": "\ud83d\ude46\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_gesturing_ok_dark_skin_tone": "\ud83d\ude46\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_raising_hand": "\ud83d\ude4b",
-    "person_raising_hand_tone1": "\ud83d\ude4b\ud83c\udffb",
-    "raising_hand_tone1": "\ud83d\ude4b\ud83c\udffb",
-    "person_raising_hand_tone2": "\ud83d\ude4b\ud83c\udffc",
-    "raising_hand_tone2": "\ud83d\ude4b\ud83c\udffc",
-    "person_raising_hand_tone3": "\ud83d\ude4b\ud83c\udffd",
-    "raising_hand_tone3": "\ud83d\ude4b\ud83c\udffd",
-    "person_raising_hand_tone4": "\ud83d\ude4b\ud83c\udffe",
-    "raising_hand_tone4": "\ud83d\ude4b\ud83c\udffe",
-    "person_raising_hand_tone5": "\ud83d\ude4b\ud83c\udfff",
-    "raising_hand_tone5": "\ud83d\ude4b\ud83c\udfff",
-    "raising_hand": "\ud83d\ude4b",
-    "woman_raising_hand": "\ud83d\ude4b\u200d\u2640\ufe0f",
-    "woman_raising_hand_tone1": "\ud83d\ude4b\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_raising_hand_light_skin_tone": "\ud83d\ude4b\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_raising_hand_tone2": "\ud83d\ude4b\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_raising_hand_medium_light_skin_tone": "\ud83d\ude4b\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_raising_hand_tone3": "\ud83d\ude4b\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_raising_hand_medium_skin_tone": "\ud83d\ude4b\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_raising_hand_tone4": "\ud83d\ude4b\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_raising_hand_medium_dark_skin_tone": "\ud83d\ude4b\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_raising_hand_tone5": "\ud83d\ude4b\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_raising_hand_dark_skin_tone": "\ud83d\ude4b\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_raising_hand": "\ud83d\ude4b\u200d\u2642\ufe0f",
-    "man_raising_hand_tone1": "\ud83d\ude4b\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_raising_hand_light_skin_tone": "\ud83d\ude4b\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_raising_hand_tone2": "\ud83d\ude4b\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_raising_hand_medium_light_skin_tone": "\ud83d\ude4b\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_raising_hand_tone3": "\ud83d\ude4b\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_raising_hand_medium_skin_tone": "\ud83d\ude4b\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_raising_hand_tone4": "\ud83d\ude4b\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_raising_hand_medium_dark_skin_tone": "\ud83d\ude4b\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_raising_hand_tone5": "\ud83d\ude4b\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_raising_hand_dark_skin_tone": "\ud83d\ude4b\ud83c\udfff\u200d\u2642\ufe0f",
-    "deaf_person": "\ud83e\uddcf",
-    "deaf_person_tone1": "\ud83e\uddcf\ud83c\udffb",
-    "deaf_person_light_skin_tone": "\ud83e\uddcf\ud83c\udffb",
-    "deaf_person_tone2": "\ud83e\uddcf\ud83c\udffc",
-    "deaf_person_medium_light_skin_tone": "\ud83e\uddcf\ud83c\udffc",
-    "deaf_person_tone3": "\ud83e\uddcf\ud83c\udffd",
-    "deaf_person_medium_skin_tone": "\ud83e\uddcf\ud83c\udffd",
-    "deaf_person_tone4": "\ud83e\uddcf\ud83c\udffe",
-    "deaf_person_medium_dark_skin_tone": "\ud83e\uddcf\ud83c\udffe",
-    "deaf_person_tone5": "\ud83e\uddcf\ud83c\udfff",
-    "deaf_person_dark_skin_tone": "\ud83e\uddcf\ud83c\udfff",
-    "deaf_woman": "\ud83e\uddcf\u200d\u2640\ufe0f",
-    "deaf_woman_tone1": "\ud83e\uddcf\ud83c\udffb\u200d\u2640\ufe0f",
-    "deaf_woman_light_skin_tone": "\ud83e\uddcf\ud83c\udffb\u200d\u2640\ufe0f",
-    "deaf_woman_tone2": "\ud83e\uddcf\ud83c\udffc\u200d\u2640\ufe0f",
-    "deaf_woman_medium_light_skin_tone": "\ud83e\uddcf\ud83c\udffc\u200d\u2640\ufe0f",
-    "deaf_woman_tone3": "\ud83e\uddcf\ud83c\udffd\u200d\u2640\ufe0f",
-    "deaf_woman_medium_skin_tone": "\ud83e\uddcf\ud83c\udffd\u200d\u2640\ufe0f",
-    "deaf_woman_tone4": "\ud83e\uddcf\ud83c\udffe\u200d\u2640\ufe0f",
-    "deaf_woman_medium_dark_skin_tone": "\ud83e\uddcf\ud83c\udffe\u200d\u2640\ufe0f",
-    "deaf_woman_tone5": "\ud83e\uddcf\ud83c\udfff\u200d\u2640\ufe0f",
-    "deaf_woman_dark_skin_tone": "\ud83e\uddcf\ud83c\udfff\u200d\u2640\ufe0f",
-    "deaf_man": "\ud83e\uddcf\u200d\u2642\ufe0f",
-    "deaf_man_tone1": "\ud83e\uddcf\ud83c\udffb\u200d\u2642\ufe0f",
-    "deaf_man_light_skin_tone": "\ud83e\uddcf\ud83c\udffb\u200d\u2642\ufe0f",
-    "deaf_man_tone2": "\ud83e\uddcf\ud83c\udffc\u200d\u2642\ufe0f",
-    "deaf_man_medium_light_skin_tone": "\ud83e\uddcf\ud83c\udffc\u200d\u2642\ufe0f",
-    "deaf_man_tone3": "\ud83e\uddcf\ud83c\udffd\u200d\u2642\ufe0f",
-    "deaf_man_medium_skin_tone": "\ud83e\uddcf\ud83c\udffd\u200d\u2642\ufe0f",
-    "deaf_man_tone4": "\ud83e\uddcf\ud83c\udffe\u200d\u2642\ufe0f",
-    "deaf_man_medium_dark_skin_tone": "\ud83e\uddcf\ud83c\udffe\u200d\u2642\ufe0f",
-    "deaf_man_tone5": "\ud83e\uddcf\ud83c\udfff\u200d\u2642\ufe0f",
-    "deaf_man_dark_skin_tone": "\ud83e\uddcf\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_facepalming": "\ud83e\udd26",
-    "person_facepalming_tone1": "\ud83e\udd26\ud83c\udffb",
-    "face_palm_tone1": "\ud83e\udd26\ud83c\udffb",
-    "facepalm_tone1": "\ud83e\udd26\ud83c\udffb",
-    "person_facepalming_tone2": "\ud83e\udd26\ud83c\udffc",
-    "face_palm_tone2": "\ud83e\udd26\ud83c\udffc",
-    "facepalm_tone2": "\ud83e\udd26\ud83c\udffc",
-    "person_facepalming_tone3": "\ud83e\udd26\ud83c\udffd",
-    "face_palm_tone3": "\ud83e\udd26\ud83c\udffd",
-    "facepalm_tone3": "\ud83e\udd26\ud83c\udffd",
-    "person_facepalming_tone4": "\ud83e\udd26\ud83c\udffe",
-    "face_palm_tone4": "\ud83e\udd26\ud83c\udffe",
-    "facepalm_tone4": "\ud83e\udd26\ud83c\udffe",
-    "person_facepalming_tone5": "\ud83e\udd26\ud83c\udfff",
-    "face_palm_tone5": "\ud83e\udd26\ud83c\udfff",
-    "facepalm_tone5": "\ud83e\udd26\ud83c\udfff",
-    "face_palm": "\ud83e\udd26",
-    "facepalm": "\ud83e\udd26",
-    "woman_facepalming": "\ud83e\udd26\u200d\u2640\ufe0f",
-    "woman_facepalming_tone1": "\ud83e\udd26\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_facepalming_light_skin_tone": "\ud83e\udd26\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_facepalming_tone2": "\ud83e\udd26\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_facepalming_medium_light_skin_tone": "\ud83e\udd26\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_facepalming_tone3": "\ud83e\udd26\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_facepalming_medium_skin_tone": "\ud83e\udd26\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_facepalming_tone4": "\ud83e\udd26\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_facepalming_medium_dark_skin_tone": "\ud83e\udd26\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_facepalming_tone5": "\ud83e\udd26\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_facepalming_dark_skin_tone": "\ud83e\udd26\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_facepalming": "\ud83e\udd26\u200d\u2642\ufe0f",
-    "man_facepalming_tone1": "\ud83e\udd26\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_facepalming_light_skin_tone": "\ud83e\udd26\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_facepalming_tone2": "\ud83e\udd26\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_facepalming_medium_light_skin_tone": "\ud83e\udd26\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_facepalming_tone3": "\ud83e\udd26\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_facepalming_medium_skin_tone": "\ud83e\udd26\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_facepalming_tone4": "\ud83e\udd26\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_facepalming_medium_dark_skin_tone": "\ud83e\udd26\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_facepalming_tone5": "\ud83e\udd26\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_facepalming_dark_skin_tone": "\ud83e\udd26\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_shrugging": "\ud83e\udd37",
-    "person_shrugging_tone1": "\ud83e\udd37\ud83c\udffb",
-    "shrug_tone1": "\ud83e\udd37\ud83c\udffb",
-    "person_shrugging_tone2": "\ud83e\udd37\ud83c\udffc",
-    "shrug_tone2": "\ud83e\udd37\ud83c\udffc",
-    "person_shrugging_tone3": "\ud83e\udd37\ud83c\udffd",
-    "shrug_tone3": "\ud83e\udd37\ud83c\udffd",
-    "person_shrugging_tone4": "\ud83e\udd37\ud83c\udffe",
-    "shrug_tone4": "\ud83e\udd37\ud83c\udffe",
-    "person_shrugging_tone5": "\ud83e\udd37\ud83c\udfff",
-    "shrug_tone5": "\ud83e\udd37\ud83c\udfff",
-    "shrug": "\ud83e\udd37",
-    "woman_shrugging": "\ud83e\udd37\u200d\u2640\ufe0f",
-    "woman_shrugging_tone1": "\ud83e\udd37\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_shrugging_light_skin_tone": "\ud83e\udd37\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_shrugging_tone2": "\ud83e\udd37\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_shrugging_medium_light_skin_tone": "\ud83e\udd37\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_shrugging_tone3": "\ud83e\udd37\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_shrugging_medium_skin_tone": "\ud83e\udd37\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_shrugging_tone4": "\ud83e\udd37\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_shrugging_medium_dark_skin_tone": "\ud83e\udd37\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_shrugging_tone5": "\ud83e\udd37\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_shrugging_dark_skin_tone": "\ud83e\udd37\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_shrugging": "\ud83e\udd37\u200d\u2642\ufe0f",
-    "man_shrugging_tone1": "\ud83e\udd37\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_shrugging_light_skin_tone": "\ud83e\udd37\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_shrugging_tone2": "\ud83e\udd37\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_shrugging_medium_light_skin_tone": "\ud83e\udd37\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_shrugging_tone3": "\ud83e\udd37\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_shrugging_medium_skin_tone": "\ud83e\udd37\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_shrugging_tone4": "\ud83e\udd37\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_shrugging_medium_dark_skin_tone": "\ud83e\udd37\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_shrugging_tone5": "\ud83e\udd37\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_shrugging_dark_skin_tone": "\ud83e\udd37\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_pouting": "\ud83d\ude4e",
-    "person_pouting_tone1": "\ud83d\ude4e\ud83c\udffb",
-    "person_with_pouting_face_tone1": "\ud83d\ude4e\ud83c\udffb",
-    "person_pouting_tone2": "\ud83d\ude4e\ud83c\udffc",
-    "person_with_pouting_face_tone2": "\ud83d\ude4e\ud83c\udffc",
-    "person_pouting_tone3": "\ud83d\ude4e\ud83c\udffd",
-    "person_with_pouting_face_tone3": "\ud83d\ude4e\ud83c\udffd",
-    "person_pouting_tone4": "\ud83d\ude4e\ud83c\udffe",
-    "person_with_pouting_face_tone4": "\ud83d\ude4e\ud83c\udffe",
-    "person_pouting_tone5": "\ud83d\ude4e\ud83c\udfff",
-    "person_with_pouting_face_tone5": "\ud83d\ude4e\ud83c\udfff",
-    "person_with_pouting_face": "\ud83d\ude4e",
-    "woman_pouting": "\ud83d\ude4e\u200d\u2640\ufe0f",
-    "woman_pouting_tone1": "\ud83d\ude4e\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_pouting_light_skin_tone": "\ud83d\ude4e\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_pouting_tone2": "\ud83d\ude4e\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_pouting_medium_light_skin_tone": "\ud83d\ude4e\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_pouting_tone3": "\ud83d\ude4e\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_pouting_medium_skin_tone": "\ud83d\ude4e\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_pouting_tone4": "\ud83d\ude4e\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_pouting_medium_dark_skin_tone": "\ud83d\ude4e\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_pouting_tone5": "\ud83d\ude4e\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_pouting_dark_skin_tone": "\ud83d\ude4e\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_pouting": "\ud83d\ude4e\u200d\u2642\ufe0f",
-    "man_pouting_tone1": "\ud83d\ude4e\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_pouting_light_skin_tone": "\ud83d\ude4e\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_pouting_tone2": "\ud83d\ude4e\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_pouting_medium_light_skin_tone": "\ud83d\ude4e\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_pouting_tone3": "\ud83d\ude4e\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_pouting_medium_skin_tone": "\ud83d\ude4e\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_pouting_tone4": "\ud83d\ude4e\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_pouting_medium_dark_skin_tone": "\ud83d\ude4e\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_pouting_tone5": "\ud83d\ude4e\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_pouting_dark_skin_tone": "\ud83d\ude4e\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_frowning": "\ud83d\ude4d",
-    "person_frowning_tone1": "\ud83d\ude4d\ud83c\udffb",
-    "person_frowning_tone2": "\ud83d\ude4d\ud83c\udffc",
-    "person_frowning_tone3": "\ud83d\ude4d\ud83c\udffd",
-    "person_frowning_tone4": "\ud83d\ude4d\ud83c\udffe",
-    "person_frowning_tone5": "\ud83d\ude4d\ud83c\udfff",
-    "woman_frowning": "\ud83d\ude4d\u200d\u2640\ufe0f",
-    "woman_frowning_tone1": "\ud83d\ude4d\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_frowning_light_skin_tone": "\ud83d\ude4d\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_frowning_tone2": "\ud83d\ude4d\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_frowning_medium_light_skin_tone": "\ud83d\ude4d\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_frowning_tone3": "\ud83d\ude4d\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_frowning_medium_skin_tone": "\ud83d\ude4d\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_frowning_tone4": "\ud83d\ude4d\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_frowning_medium_dark_skin_tone": "\ud83d\ude4d\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_frowning_tone5": "\ud83d\ude4d\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_frowning_dark_skin_tone": "\ud83d\ude4d\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_frowning": "\ud83d\ude4d\u200d\u2642\ufe0f",
-    "man_frowning_tone1": "\ud83d\ude4d\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_frowning_light_skin_tone": "\ud83d\ude4d\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_frowning_tone2": "\ud83d\ude4d\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_frowning_medium_light_skin_tone": "\ud83d\ude4d\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_frowning_tone3": "\ud83d\ude4d\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_frowning_medium_skin_tone": "\ud83d\ude4d\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_frowning_tone4": "\ud83d\ude4d\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_frowning_medium_dark_skin_tone": "\ud83d\ude4d\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_frowning_tone5": "\ud83d\ude4d\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_frowning_dark_skin_tone": "\ud83d\ude4d\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_getting_haircut": "\ud83d\udc87",
-    "person_getting_haircut_tone1": "\ud83d\udc87\ud83c\udffb",
-    "haircut_tone1": "\ud83d\udc87\ud83c\udffb",
-    "person_getting_haircut_tone2": "\ud83d\udc87\ud83c\udffc",
-    "haircut_tone2": "\ud83d\udc87\ud83c\udffc",
-    "person_getting_haircut_tone3": "\ud83d\udc87\ud83c\udffd",
-    "haircut_tone3": "\ud83d\udc87\ud83c\udffd",
-    "person_getting_haircut_tone4": "\ud83d\udc87\ud83c\udffe",
-    "haircut_tone4": "\ud83d\udc87\ud83c\udffe",
-    "person_getting_haircut_tone5": "\ud83d\udc87\ud83c\udfff",
-    "haircut_tone5": "\ud83d\udc87\ud83c\udfff",
-    "haircut": "\ud83d\udc87",
-    "woman_getting_haircut": "\ud83d\udc87\u200d\u2640\ufe0f",
-    "woman_getting_haircut_tone1": "\ud83d\udc87\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_getting_haircut_light_skin_tone": "\ud83d\udc87\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_getting_haircut_tone2": "\ud83d\udc87\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_getting_haircut_medium_light_skin_tone": "\ud83d\udc87\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_getting_haircut_tone3": "\ud83d\udc87\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_getting_haircut_medium_skin_tone": "\ud83d\udc87\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_getting_haircut_tone4": "\ud83d\udc87\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_getting_haircut_medium_dark_skin_tone": "\ud83d\udc87\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_getting_haircut_tone5": "\ud83d\udc87\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_getting_haircut_dark_skin_tone": "\ud83d\udc87\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_getting_haircut": "\ud83d\udc87\u200d\u2642\ufe0f",
-    "man_getting_haircut_tone1": "\ud83d\udc87\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_getting_haircut_light_skin_tone": "\ud83d\udc87\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_getting_haircut_tone2": "\ud83d\udc87\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_getting_haircut_medium_light_skin_tone": "\ud83d\udc87\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_getting_haircut_tone3": "\ud83d\udc87\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_getting_haircut_medium_skin_tone": "\ud83d\udc87\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_getting_haircut_tone4": "\ud83d\udc87\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_getting_haircut_medium_dark_skin_tone": "\ud83d\udc87\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_getting_haircut_tone5": "\ud83d\udc87\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_getting_haircut_dark_skin_tone": "\ud83d\udc87\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_getting_massage": "\ud83d\udc86",
-    "person_getting_massage_tone1": "\ud83d\udc86\ud83c\udffb",
-    "massage_tone1": "\ud83d\udc86\ud83c\udffb",
-    "person_getting_massage_tone2": "\ud83d\udc86\ud83c\udffc",
-    "massage_tone2": "\ud83d\udc86\ud83c\udffc",
-    "person_getting_massage_tone3": "\ud83d\udc86\ud83c\udffd",
-    "massage_tone3": "\ud83d\udc86\ud83c\udffd",
-    "person_getting_massage_tone4": "\ud83d\udc86\ud83c\udffe",
-    "massage_tone4": "\ud83d\udc86\ud83c\udffe",
-    "person_getting_massage_tone5": "\ud83d\udc86\ud83c\udfff",
-    "massage_tone5": "\ud83d\udc86\ud83c\udfff",
-    "massage": "\ud83d\udc86",
-    "woman_getting_face_massage": "\ud83d\udc86\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_tone1": "\ud83d\udc86\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_light_skin_tone": "\ud83d\udc86\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_tone2": "\ud83d\udc86\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_medium_light_skin_tone": "\ud83d\udc86\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_tone3": "\ud83d\udc86\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_medium_skin_tone": "\ud83d\udc86\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_tone4": "\ud83d\udc86\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_medium_dark_skin_tone": "\ud83d\udc86\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_tone5": "\ud83d\udc86\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_getting_face_massage_dark_skin_tone": "\ud83d\udc86\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_getting_face_massage": "\ud83d\udc86\u200d\u2642\ufe0f",
-    "man_getting_face_massage_tone1": "\ud83d\udc86\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_getting_face_massage_light_skin_tone": "\ud83d\udc86\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_getting_face_massage_tone2": "\ud83d\udc86\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_getting_face_massage_medium_light_skin_tone": "\ud83d\udc86\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_getting_face_massage_tone3": "\ud83d\udc86\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_getting_face_massage_medium_skin_tone": "\ud83d\udc86\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_getting_face_massage_tone4": "\ud83d\udc86\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_getting_face_massage_medium_dark_skin_tone": "\ud83d\udc86\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_getting_face_massage_tone5": "\ud83d\udc86\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_getting_face_massage_dark_skin_tone": "\ud83d\udc86\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_in_steamy_room": "\ud83e\uddd6",
-    "person_in_steamy_room_tone1": "\ud83e\uddd6\ud83c\udffb",
-    "person_in_steamy_room_light_skin_tone": "\ud83e\uddd6\ud83c\udffb",
-    "person_in_steamy_room_tone2": "\ud83e\uddd6\ud83c\udffc",
-    "person_in_steamy_room_medium_light_skin_tone": "\ud83e\uddd6\ud83c\udffc",
-    "person_in_steamy_room_tone3": "\ud83e\uddd6\ud83c\udffd",
-    "person_in_steamy_room_medium_skin_tone": "\ud83e\uddd6\ud83c\udffd",
-    "person_in_steamy_room_tone4": "\ud83e\uddd6\ud83c\udffe",
-    "person_in_steamy_room_medium_dark_skin_tone": "\ud83e\uddd6\ud83c\udffe",
-    "person_in_steamy_room_tone5": "\ud83e\uddd6\ud83c\udfff",
-    "person_in_steamy_room_dark_skin_tone": "\ud83e\uddd6\ud83c\udfff",
-    "woman_in_steamy_room": "\ud83e\uddd6\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_tone1": "\ud83e\uddd6\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_light_skin_tone": "\ud83e\uddd6\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_tone2": "\ud83e\uddd6\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_medium_light_skin_tone": "\ud83e\uddd6\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_tone3": "\ud83e\uddd6\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_medium_skin_tone": "\ud83e\uddd6\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_tone4": "\ud83e\uddd6\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_medium_dark_skin_tone": "\ud83e\uddd6\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_tone5": "\ud83e\uddd6\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_in_steamy_room_dark_skin_tone": "\ud83e\uddd6\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_in_steamy_room": "\ud83e\uddd6\u200d\u2642\ufe0f",
-    "man_in_steamy_room_tone1": "\ud83e\uddd6\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_in_steamy_room_light_skin_tone": "\ud83e\uddd6\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_in_steamy_room_tone2": "\ud83e\uddd6\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_in_steamy_room_medium_light_skin_tone": "\ud83e\uddd6\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_in_steamy_room_tone3": "\ud83e\uddd6\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_in_steamy_room_medium_skin_tone": "\ud83e\uddd6\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_in_steamy_room_tone4": "\ud83e\uddd6\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_in_steamy_room_medium_dark_skin_tone": "\ud83e\uddd6\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_in_steamy_room_tone5": "\ud83e\uddd6\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_in_steamy_room_dark_skin_tone": "\ud83e\uddd6\ud83c\udfff\u200d\u2642\ufe0f",
-    "nail_care": "\ud83d\udc85",
-    "nail_care_tone1": "\ud83d\udc85\ud83c\udffb",
-    "nail_care_tone2": "\ud83d\udc85\ud83c\udffc",
-    "nail_care_tone3": "\ud83d\udc85\ud83c\udffd",
-    "nail_care_tone4": "\ud83d\udc85\ud83c\udffe",
-    "nail_care_tone5": "\ud83d\udc85\ud83c\udfff",
-    "selfie": "\ud83e\udd33",
-    "selfie_tone1": "\ud83e\udd33\ud83c\udffb",
-    "selfie_tone2": "\ud83e\udd33\ud83c\udffc",
-    "selfie_tone3": "\ud83e\udd33\ud83c\udffd",
-    "selfie_tone4": "\ud83e\udd33\ud83c\udffe",
-    "selfie_tone5": "\ud83e\udd33\ud83c\udfff",
-    "dancer": "\ud83d\udc83",
-    "dancer_tone1": "\ud83d\udc83\ud83c\udffb",
-    "dancer_tone2": "\ud83d\udc83\ud83c\udffc",
-    "dancer_tone3": "\ud83d\udc83\ud83c\udffd",
-    "dancer_tone4": "\ud83d\udc83\ud83c\udffe",
-    "dancer_tone5": "\ud83d\udc83\ud83c\udfff",
-    "man_dancing": "\ud83d\udd7a",
-    "man_dancing_tone1": "\ud83d\udd7a\ud83c\udffb",
-    "male_dancer_tone1": "\ud83d\udd7a\ud83c\udffb",
-    "man_dancing_tone2": "\ud83d\udd7a\ud83c\udffc",
-    "male_dancer_tone2": "\ud83d\udd7a\ud83c\udffc",
-    "man_dancing_tone3": "\ud83d\udd7a\ud83c\udffd",
-    "male_dancer_tone3": "\ud83d\udd7a\ud83c\udffd",
-    "man_dancing_tone5": "\ud83d\udd7a\ud83c\udfff",
-    "male_dancer_tone5": "\ud83d\udd7a\ud83c\udfff",
-    "man_dancing_tone4": "\ud83d\udd7a\ud83c\udffe",
-    "male_dancer_tone4": "\ud83d\udd7a\ud83c\udffe",
-    "male_dancer": "\ud83d\udd7a",
-    "people_with_bunny_ears_partying": "\ud83d\udc6f",
-    "dancers": "\ud83d\udc6f",
-    "women_with_bunny_ears_partying": "\ud83d\udc6f\u200d\u2640\ufe0f",
-    "men_with_bunny_ears_partying": "\ud83d\udc6f\u200d\u2642\ufe0f",
-    "levitate": "\ud83d\udd74\ufe0f",
-    "levitate_tone1": "\ud83d\udd74\ud83c\udffb",
-    "man_in_business_suit_levitating_tone1": "\ud83d\udd74\ud83c\udffb",
-    "man_in_business_suit_levitating_light_skin_tone": "\ud83d\udd74\ud83c\udffb",
-    "levitate_tone2": "\ud83d\udd74\ud83c\udffc",
-    "man_in_business_suit_levitating_tone2": "\ud83d\udd74\ud83c\udffc",
-    "man_in_business_suit_levitating_medium_light_skin_tone": "\ud83d\udd74\ud83c\udffc",
-    "levitate_tone3": "\ud83d\udd74\ud83c\udffd",
-    "man_in_business_suit_levitating_tone3": "\ud83d\udd74\ud83c\udffd",
-    "man_in_business_suit_levitating_medium_skin_tone": "\ud83d\udd74\ud83c\udffd",
-    "levitate_tone4": "\ud83d\udd74\ud83c\udffe",
-    "man_in_business_suit_levitating_tone4": "\ud83d\udd74\ud83c\udffe",
-    "man_in_business_suit_levitating_medium_dark_skin_tone": "\ud83d\udd74\ud83c\udffe",
-    "levitate_tone5": "\ud83d\udd74\ud83c\udfff",
-    "man_in_business_suit_levitating_tone5": "\ud83d\udd74\ud83c\udfff",
-    "man_in_business_suit_levitating_dark_skin_tone": "\ud83d\udd74\ud83c\udfff",
-    "man_in_business_suit_levitating": "\ud83d\udd74\ufe0f",
-    "person_in_manual_wheelchair": "\ud83e\uddd1\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddbd",
-    "person_in_manual_wheelchair_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair": "\ud83d\udc69\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddbd",
-    "woman_in_manual_wheelchair_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair": "\ud83d\udc68\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddbd",
-    "man_in_manual_wheelchair_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddbd",
-    "person_in_motorized_wheelchair": "\ud83e\uddd1\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddbc",
-    "person_in_motorized_wheelchair_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair": "\ud83d\udc69\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddbc",
-    "woman_in_motorized_wheelchair_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair": "\ud83d\udc68\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddbc",
-    "man_in_motorized_wheelchair_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddbc",
-    "person_walking": "\ud83d\udeb6",
-    "person_walking_tone1": "\ud83d\udeb6\ud83c\udffb",
-    "walking_tone1": "\ud83d\udeb6\ud83c\udffb",
-    "person_walking_tone2": "\ud83d\udeb6\ud83c\udffc",
-    "walking_tone2": "\ud83d\udeb6\ud83c\udffc",
-    "person_walking_tone3": "\ud83d\udeb6\ud83c\udffd",
-    "walking_tone3": "\ud83d\udeb6\ud83c\udffd",
-    "person_walking_tone4": "\ud83d\udeb6\ud83c\udffe",
-    "walking_tone4": "\ud83d\udeb6\ud83c\udffe",
-    "person_walking_tone5": "\ud83d\udeb6\ud83c\udfff",
-    "walking_tone5": "\ud83d\udeb6\ud83c\udfff",
-    "walking": "\ud83d\udeb6",
-    "woman_walking": "\ud83d\udeb6\u200d\u2640\ufe0f",
-    "woman_walking_tone1": "\ud83d\udeb6\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_walking_light_skin_tone": "\ud83d\udeb6\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_walking_tone2": "\ud83d\udeb6\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_walking_medium_light_skin_tone": "\ud83d\udeb6\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_walking_tone3": "\ud83d\udeb6\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_walking_medium_skin_tone": "\ud83d\udeb6\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_walking_tone4": "\ud83d\udeb6\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_walking_medium_dark_skin_tone": "\ud83d\udeb6\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_walking_tone5": "\ud83d\udeb6\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_walking_dark_skin_tone": "\ud83d\udeb6\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_walking": "\ud83d\udeb6\u200d\u2642\ufe0f",
-    "man_walking_tone1": "\ud83d\udeb6\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_walking_light_skin_tone": "\ud83d\udeb6\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_walking_tone2": "\ud83d\udeb6\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_walking_medium_light_skin_tone": "\ud83d\udeb6\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_walking_tone3": "\ud83d\udeb6\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_walking_medium_skin_tone": "\ud83d\udeb6\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_walking_tone4": "\ud83d\udeb6\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_walking_medium_dark_skin_tone": "\ud83d\udeb6\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_walking_tone5": "\ud83d\udeb6\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_walking_dark_skin_tone": "\ud83d\udeb6\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_with_probing_cane": "\ud83e\uddd1\u200d\ud83e\uddaf",
-    "person_with_probing_cane_tone1": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddaf",
-    "person_with_probing_cane_light_skin_tone": "\ud83e\uddd1\ud83c\udffb\u200d\ud83e\uddaf",
-    "person_with_probing_cane_tone2": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddaf",
-    "person_with_probing_cane_medium_light_skin_tone": "\ud83e\uddd1\ud83c\udffc\u200d\ud83e\uddaf",
-    "person_with_probing_cane_tone3": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddaf",
-    "person_with_probing_cane_medium_skin_tone": "\ud83e\uddd1\ud83c\udffd\u200d\ud83e\uddaf",
-    "person_with_probing_cane_tone4": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddaf",
-    "person_with_probing_cane_medium_dark_skin_tone": "\ud83e\uddd1\ud83c\udffe\u200d\ud83e\uddaf",
-    "person_with_probing_cane_tone5": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddaf",
-    "person_with_probing_cane_dark_skin_tone": "\ud83e\uddd1\ud83c\udfff\u200d\ud83e\uddaf",
-    "woman_with_probing_cane": "\ud83d\udc69\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_tone1": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_light_skin_tone": "\ud83d\udc69\ud83c\udffb\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_tone2": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_medium_light_skin_tone": "\ud83d\udc69\ud83c\udffc\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_tone3": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_medium_skin_tone": "\ud83d\udc69\ud83c\udffd\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_tone4": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_medium_dark_skin_tone": "\ud83d\udc69\ud83c\udffe\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_tone5": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddaf",
-    "woman_with_probing_cane_dark_skin_tone": "\ud83d\udc69\ud83c\udfff\u200d\ud83e\uddaf",
-    "man_with_probing_cane": "\ud83d\udc68\u200d\ud83e\uddaf",
-    "man_with_probing_cane_tone1": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddaf",
-    "man_with_probing_cane_light_skin_tone": "\ud83d\udc68\ud83c\udffb\u200d\ud83e\uddaf",
-    "man_with_probing_cane_tone3": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddaf",
-    "man_with_probing_cane_medium_skin_tone": "\ud83d\udc68\ud83c\udffd\u200d\ud83e\uddaf",
-    "man_with_probing_cane_tone2": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddaf",
-    "man_with_probing_cane_medium_light_skin_tone": "\ud83d\udc68\ud83c\udffc\u200d\ud83e\uddaf",
-    "man_with_probing_cane_tone4": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddaf",
-    "man_with_probing_cane_medium_dark_skin_tone": "\ud83d\udc68\ud83c\udffe\u200d\ud83e\uddaf",
-    "man_with_probing_cane_tone5": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddaf",
-    "man_with_probing_cane_dark_skin_tone": "\ud83d\udc68\ud83c\udfff\u200d\ud83e\uddaf",
-    "person_kneeling": "\ud83e\uddce",
-    "person_kneeling_tone1": "\ud83e\uddce\ud83c\udffb",
-    "person_kneeling_light_skin_tone": "\ud83e\uddce\ud83c\udffb",
-    "person_kneeling_tone2": "\ud83e\uddce\ud83c\udffc",
-    "person_kneeling_medium_light_skin_tone": "\ud83e\uddce\ud83c\udffc",
-    "person_kneeling_tone3": "\ud83e\uddce\ud83c\udffd",
-    "person_kneeling_medium_skin_tone": "\ud83e\uddce\ud83c\udffd",
-    "person_kneeling_tone4": "\ud83e\uddce\ud83c\udffe",
-    "person_kneeling_medium_dark_skin_tone": "\ud83e\uddce\ud83c\udffe",
-    "person_kneeling_tone5": "\ud83e\uddce\ud83c\udfff",
-    "person_kneeling_dark_skin_tone": "\ud83e\uddce\ud83c\udfff",
-    "woman_kneeling": "\ud83e\uddce\u200d\u2640\ufe0f",
-    "woman_kneeling_tone1": "\ud83e\uddce\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_kneeling_light_skin_tone": "\ud83e\uddce\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_kneeling_tone2": "\ud83e\uddce\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_kneeling_medium_light_skin_tone": "\ud83e\uddce\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_kneeling_tone3": "\ud83e\uddce\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_kneeling_medium_skin_tone": "\ud83e\uddce\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_kneeling_tone4": "\ud83e\uddce\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_kneeling_medium_dark_skin_tone": "\ud83e\uddce\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_kneeling_tone5": "\ud83e\uddce\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_kneeling_dark_skin_tone": "\ud83e\uddce\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_kneeling": "\ud83e\uddce\u200d\u2642\ufe0f",
-    "man_kneeling_tone1": "\ud83e\uddce\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_kneeling_light_skin_tone": "\ud83e\uddce\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_kneeling_tone2": "\ud83e\uddce\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_kneeling_medium_light_skin_tone": "\ud83e\uddce\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_kneeling_tone3": "\ud83e\uddce\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_kneeling_medium_skin_tone": "\ud83e\uddce\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_kneeling_tone4": "\ud83e\uddce\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_kneeling_medium_dark_skin_tone": "\ud83e\uddce\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_kneeling_tone5": "\ud83e\uddce\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_kneeling_dark_skin_tone": "\ud83e\uddce\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_running": "\ud83c\udfc3",
-    "person_running_tone1": "\ud83c\udfc3\ud83c\udffb",
-    "runner_tone1": "\ud83c\udfc3\ud83c\udffb",
-    "person_running_tone2": "\ud83c\udfc3\ud83c\udffc",
-    "runner_tone2": "\ud83c\udfc3\ud83c\udffc",
-    "person_running_tone3": "\ud83c\udfc3\ud83c\udffd",
-    "runner_tone3": "\ud83c\udfc3\ud83c\udffd",
-    "person_running_tone4": "\ud83c\udfc3\ud83c\udffe",
-    "runner_tone4": "\ud83c\udfc3\ud83c\udffe",
-    "person_running_tone5": "\ud83c\udfc3\ud83c\udfff",
-    "runner_tone5": "\ud83c\udfc3\ud83c\udfff",
-    "runner": "\ud83c\udfc3",
-    "woman_running": "\ud83c\udfc3\u200d\u2640\ufe0f",
-    "woman_running_tone1": "\ud83c\udfc3\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_running_light_skin_tone": "\ud83c\udfc3\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_running_tone2": "\ud83c\udfc3\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_running_medium_light_skin_tone": "\ud83c\udfc3\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_running_tone3": "\ud83c\udfc3\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_running_medium_skin_tone": "\ud83c\udfc3\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_running_tone4": "\ud83c\udfc3\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_running_medium_dark_skin_tone": "\ud83c\udfc3\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_running_tone5": "\ud83c\udfc3\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_running_dark_skin_tone": "\ud83c\udfc3\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_running": "\ud83c\udfc3\u200d\u2642\ufe0f",
-    "man_running_tone1": "\ud83c\udfc3\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_running_light_skin_tone": "\ud83c\udfc3\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_running_tone2": "\ud83c\udfc3\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_running_medium_light_skin_tone": "\ud83c\udfc3\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_running_tone3": "\ud83c\udfc3\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_running_medium_skin_tone": "\ud83c\udfc3\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_running_tone4": "\ud83c\udfc3\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_running_medium_dark_skin_tone": "\ud83c\udfc3\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_running_tone5": "\ud83c\udfc3\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_running_dark_skin_tone": "\ud83c\udfc3\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_standing": "\ud83e\uddcd",
-    "person_standing_tone1": "\ud83e\uddcd\ud83c\udffb",
-    "person_standing_light_skin_tone": "\ud83e\uddcd\ud83c\udffb",
-    "person_standing_tone2": "\ud83e\uddcd\ud83c\udffc",
-    "person_standing_medium_light_skin_tone": "\ud83e\uddcd\ud83c\udffc",
-    "person_standing_tone3": "\ud83e\uddcd\ud83c\udffd",
-    "person_standing_medium_skin_tone": "\ud83e\uddcd\ud83c\udffd",
-    "person_standing_tone4": "\ud83e\uddcd\ud83c\udffe",
-    "person_standing_medium_dark_skin_tone": "\ud83e\uddcd\ud83c\udffe",
-    "person_standing_tone5": "\ud83e\uddcd\ud83c\udfff",
-    "person_standing_dark_skin_tone": "\ud83e\uddcd\ud83c\udfff",
-    "woman_standing": "\ud83e\uddcd\u200d\u2640\ufe0f",
-    "woman_standing_tone1": "\ud83e\uddcd\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_standing_light_skin_tone": "\ud83e\uddcd\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_standing_tone2": "\ud83e\uddcd\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_standing_medium_light_skin_tone": "\ud83e\uddcd\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_standing_tone3": "\ud83e\uddcd\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_standing_medium_skin_tone": "\ud83e\uddcd\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_standing_tone4": "\ud83e\uddcd\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_standing_medium_dark_skin_tone": "\ud83e\uddcd\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_standing_tone5": "\ud83e\uddcd\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_standing_dark_skin_tone": "\ud83e\uddcd\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_standing": "\ud83e\uddcd\u200d\u2642\ufe0f",
-    "man_standing_tone1": "\ud83e\uddcd\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_standing_light_skin_tone": "\ud83e\uddcd\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_standing_tone2": "\ud83e\uddcd\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_standing_medium_light_skin_tone": "\ud83e\uddcd\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_standing_tone3": "\ud83e\uddcd\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_standing_medium_skin_tone": "\ud83e\uddcd\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_standing_tone4": "\ud83e\uddcd\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_standing_medium_dark_skin_tone": "\ud83e\uddcd\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_standing_tone5": "\ud83e\uddcd\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_standing_dark_skin_tone": "\ud83e\uddcd\ud83c\udfff\u200d\u2642\ufe0f",
-    "people_holding_hands": "\ud83e\uddd1\u200d\ud83e\udd1d\u200d\ud83e\uddd1",
-    "couple": "\ud83d\udc6b",
-    "two_women_holding_hands": "\ud83d\udc6d",
-    "two_men_holding_hands": "\ud83d\udc6c",
-    "couple_with_heart": "\ud83d\udc91",
-    "couple_with_heart_woman_man": "\ud83d\udc69\u200d\u2764\ufe0f\u200d\ud83d\udc68",
-    "couple_ww": "\ud83d\udc69\u200d\u2764\ufe0f\u200d\ud83d\udc69",
-    "couple_with_heart_ww": "\ud83d\udc69\u200d\u2764\ufe0f\u200d\ud83d\udc69",
-    "couple_mm": "\ud83d\udc68\u200d\u2764\ufe0f\u200d\ud83d\udc68",
-    "couple_with_heart_mm": "\ud83d\udc68\u200d\u2764\ufe0f\u200d\ud83d\udc68",
-    "couplekiss": "\ud83d\udc8f",
-    "kiss_woman_man": "\ud83d\udc69\u200d\u2764\ufe0f\u200d\ud83d\udc8b\u200d\ud83d\udc68",
-    "kiss_ww": "\ud83d\udc69\u200d\u2764\ufe0f\u200d\ud83d\udc8b\u200d\ud83d\udc69",
-    "couplekiss_ww": "\ud83d\udc69\u200d\u2764\ufe0f\u200d\ud83d\udc8b\u200d\ud83d\udc69",
-    "kiss_mm": "\ud83d\udc68\u200d\u2764\ufe0f\u200d\ud83d\udc8b\u200d\ud83d\udc68",
-    "couplekiss_mm": "\ud83d\udc68\u200d\u2764\ufe0f\u200d\ud83d\udc8b\u200d\ud83d\udc68",
-    "family": "\ud83d\udc6a",
-    "family_man_woman_boy": "\ud83d\udc68\u200d\ud83d\udc69\u200d\ud83d\udc66",
-    "family_mwg": "\ud83d\udc68\u200d\ud83d\udc69\u200d\ud83d\udc67",
-    "family_mwgb": "\ud83d\udc68\u200d\ud83d\udc69\u200d\ud83d\udc67\u200d\ud83d\udc66",
-    "family_mwbb": "\ud83d\udc68\u200d\ud83d\udc69\u200d\ud83d\udc66\u200d\ud83d\udc66",
-    "family_mwgg": "\ud83d\udc68\u200d\ud83d\udc69\u200d\ud83d\udc67\u200d\ud83d\udc67",
-    "family_wwb": "\ud83d\udc69\u200d\ud83d\udc69\u200d\ud83d\udc66",
-    "family_wwg": "\ud83d\udc69\u200d\ud83d\udc69\u200d\ud83d\udc67",
-    "family_wwgb": "\ud83d\udc69\u200d\ud83d\udc69\u200d\ud83d\udc67\u200d\ud83d\udc66",
-    "family_wwbb": "\ud83d\udc69\u200d\ud83d\udc69\u200d\ud83d\udc66\u200d\ud83d\udc66",
-    "family_wwgg": "\ud83d\udc69\u200d\ud83d\udc69\u200d\ud83d\udc67\u200d\ud83d\udc67",
-    "family_mmb": "\ud83d\udc68\u200d\ud83d\udc68\u200d\ud83d\udc66",
-    "family_mmg": "\ud83d\udc68\u200d\ud83d\udc68\u200d\ud83d\udc67",
-    "family_mmgb": "\ud83d\udc68\u200d\ud83d\udc68\u200d\ud83d\udc67\u200d\ud83d\udc66",
-    "family_mmbb": "\ud83d\udc68\u200d\ud83d\udc68\u200d\ud83d\udc66\u200d\ud83d\udc66",
-    "family_mmgg": "\ud83d\udc68\u200d\ud83d\udc68\u200d\ud83d\udc67\u200d\ud83d\udc67",
-    "family_woman_boy": "\ud83d\udc69\u200d\ud83d\udc66",
-    "family_woman_girl": "\ud83d\udc69\u200d\ud83d\udc67",
-    "family_woman_girl_boy": "\ud83d\udc69\u200d\ud83d\udc67\u200d\ud83d\udc66",
-    "family_woman_boy_boy": "\ud83d\udc69\u200d\ud83d\udc66\u200d\ud83d\udc66",
-    "family_woman_girl_girl": "\ud83d\udc69\u200d\ud83d\udc67\u200d\ud83d\udc67",
-    "family_man_boy": "\ud83d\udc68\u200d\ud83d\udc66",
-    "family_man_girl": "\ud83d\udc68\u200d\ud83d\udc67",
-    "family_man_girl_boy": "\ud83d\udc68\u200d\ud83d\udc67\u200d\ud83d\udc66",
-    "family_man_boy_boy": "\ud83d\udc68\u200d\ud83d\udc66\u200d\ud83d\udc66",
-    "family_man_girl_girl": "\ud83d\udc68\u200d\ud83d\udc67\u200d\ud83d\udc67",
-    "yarn": "\ud83e\uddf6",
-    "thread": "\ud83e\uddf5",
-    "coat": "\ud83e\udde5",
-    "lab_coat": "\ud83e\udd7c",
-    "safety_vest": "\ud83e\uddba",
-    "womans_clothes": "\ud83d\udc5a",
-    "shirt": "\ud83d\udc55",
-    "jeans": "\ud83d\udc56",
-    "briefs": "\ud83e\ude72",
-    "shorts": "\ud83e\ude73",
-    "necktie": "\ud83d\udc54",
-    "dress": "\ud83d\udc57",
-    "bikini": "\ud83d\udc59",
-    "one_piece_swimsuit": "\ud83e\ude71",
-    "kimono": "\ud83d\udc58",
-    "sari": "\ud83e\udd7b",
-    "womans_flat_shoe": "\ud83e\udd7f",
-    "high_heel": "\ud83d\udc60",
-    "sandal": "\ud83d\udc61",
-    "boot": "\ud83d\udc62",
-    "mans_shoe": "\ud83d\udc5e",
-    "athletic_shoe": "\ud83d\udc5f",
-    "hiking_boot": "\ud83e\udd7e",
-    "thong_sandal": "\ud83e\ude74",
-    "socks": "\ud83e\udde6",
-    "gloves": "\ud83e\udde4",
-    "scarf": "\ud83e\udde3",
-    "tophat": "\ud83c\udfa9",
-    "billed_cap": "\ud83e\udde2",
-    "womans_hat": "\ud83d\udc52",
-    "mortar_board": "\ud83c\udf93",
-    "helmet_with_cross": "\u26d1\ufe0f",
-    "helmet_with_white_cross": "\u26d1\ufe0f",
-    "military_helmet": "\ud83e\ude96",
-    "crown": "\ud83d\udc51",
-    "ring": "\ud83d\udc8d",
-    "pouch": "\ud83d\udc5d",
-    "purse": "\ud83d\udc5b",
-    "handbag": "\ud83d\udc5c",
-    "briefcase": "\ud83d\udcbc",
-    "school_satchel": "\ud83c\udf92",
-    "luggage": "\ud83e\uddf3",
-    "eyeglasses": "\ud83d\udc53",
-    "dark_sunglasses": "\ud83d\udd76\ufe0f",
-    "goggles": "\ud83e\udd7d",
-    "closed_umbrella": "\ud83c\udf02",
-    "dog": "\ud83d\udc36",
-    "cat": "\ud83d\udc31",
-    "mouse": "\ud83d\udc2d",
-    "hamster": "\ud83d\udc39",
-    "rabbit": "\ud83d\udc30",
-    "fox": "\ud83e\udd8a",
-    "fox_face": "\ud83e\udd8a",
-    "bear": "\ud83d\udc3b",
-    "panda_face": "\ud83d\udc3c",
-    "polar_bear": "\ud83d\udc3b\u200d\u2744\ufe0f",
-    "koala": "\ud83d\udc28",
-    "tiger": "\ud83d\udc2f",
-    "lion_face": "\ud83e\udd81",
-    "lion": "\ud83e\udd81",
-    "cow": "\ud83d\udc2e",
-    "pig": "\ud83d\udc37",
-    "pig_nose": "\ud83d\udc3d",
-    "frog": "\ud83d\udc38",
-    "monkey_face": "\ud83d\udc35",
-    "see_no_evil": "\ud83d\ude48",
-    "hear_no_evil": "\ud83d\ude49",
-    "speak_no_evil": "\ud83d\ude4a",
-    "monkey": "\ud83d\udc12",
-    "chicken": "\ud83d\udc14",
-    "penguin": "\ud83d\udc27",
-    "bird": "\ud83d\udc26",
-    "baby_chick": "\ud83d\udc24",
-    "hatching_chick": "\ud83d\udc23",
-    "hatched_chick": "\ud83d\udc25",
-    "duck": "\ud83e\udd86",
-    "dodo": "\ud83e\udda4",
-    "eagle": "\ud83e\udd85",
-    "owl": "\ud83e\udd89",
-    "bat": "\ud83e\udd87",
-    "wolf": "\ud83d\udc3a",
-    "boar": "\ud83d\udc17",
-    "horse": "\ud83d\udc34",
-    "unicorn": "\ud83e\udd84",
-    "unicorn_face": "\ud83e\udd84",
-    "bee": "\ud83d\udc1d",
-    "bug": "\ud83d\udc1b",
-    "butterfly": "\ud83e\udd8b",
-    "snail": "\ud83d\udc0c",
-    "worm": "\ud83e\udeb1",
-    "lady_beetle": "\ud83d\udc1e",
-    "ant": "\ud83d\udc1c",
-    "fly": "\ud83e\udeb0",
-    "mosquito": "\ud83e\udd9f",
-    "cockroach": "\ud83e\udeb3",
-    "beetle": "\ud83e\udeb2",
-    "cricket": "\ud83e\udd97",
-    "spider": "\ud83d\udd77\ufe0f",
-    "spider_web": "\ud83d\udd78\ufe0f",
-    "scorpion": "\ud83e\udd82",
-    "turtle": "\ud83d\udc22",
-    "snake": "\ud83d\udc0d",
-    "lizard": "\ud83e\udd8e",
-    "t_rex": "\ud83e\udd96",
-    "sauropod": "\ud83e\udd95",
-    "octopus": "\ud83d\udc19",
-    "squid": "\ud83e\udd91",
-    "shrimp": "\ud83e\udd90",
-    "lobster": "\ud83e\udd9e",
-    "crab": "\ud83e\udd80",
-    "blowfish": "\ud83d\udc21",
-    "tropical_fish": "\ud83d\udc20",
-    "fish": "\ud83d\udc1f",
-    "seal": "\ud83e\uddad",
-    "dolphin": "\ud83d\udc2c",
-    "whale": "\ud83d\udc33",
-    "whale2": "\ud83d\udc0b",
-    "shark": "\ud83e\udd88",
-    "crocodile": "\ud83d\udc0a",
-    "tiger2": "\ud83d\udc05",
-    "leopard": "\ud83d\udc06",
-    "zebra": "\ud83e\udd93",
-    "gorilla": "\ud83e\udd8d",
-    "orangutan": "\ud83e\udda7",
-    "elephant": "\ud83d\udc18",
-    "mammoth": "\ud83e\udda3",
-    "bison": "\ud83e\uddac",
-    "hippopotamus": "\ud83e\udd9b",
-    "rhino": "\ud83e\udd8f",
-    "rhinoceros": "\ud83e\udd8f",
-    "dromedary_camel": "\ud83d\udc2a",
-    "camel": "\ud83d\udc2b",
-    "giraffe": "\ud83e\udd92",
-    "kangaroo": "\ud83e\udd98",
-    "water_buffalo": "\ud83d\udc03",
-    "ox": "\ud83d\udc02",
-    "cow2": "\ud83d\udc04",
-    "racehorse": "\ud83d\udc0e",
-    "pig2": "\ud83d\udc16",
-    "ram": "\ud83d\udc0f",
-    "sheep": "\ud83d\udc11",
-    "llama": "\ud83e\udd99",
-    "goat": "\ud83d\udc10",
-    "deer": "\ud83e\udd8c",
-    "dog2": "\ud83d\udc15",
-    "poodle": "\ud83d\udc29",
-    "guide_dog": "\ud83e\uddae",
-    "service_dog": "\ud83d\udc15\u200d\ud83e\uddba",
-    "cat2": "\ud83d\udc08",
-    "black_cat": "\ud83d\udc08\u200d\u2b1b",
-    "rooster": "\ud83d\udc13",
-    "turkey": "\ud83e\udd83",
-    "peacock": "\ud83e\udd9a",
-    "parrot": "\ud83e\udd9c",
-    "swan": "\ud83e\udda2",
-    "flamingo": "\ud83e\udda9",
-    "dove": "\ud83d\udd4a\ufe0f",
-    "dove_of_peace": "\ud83d\udd4a\ufe0f",
-    "rabbit2": "\ud83d\udc07",
-    "raccoon": "\ud83e\udd9d",
-    "skunk": "\ud83e\udda8",
-    "badger": "\ud83e\udda1",
-    "beaver": "\ud83e\uddab",
-    "otter": "\ud83e\udda6",
-    "sloth": "\ud83e\udda5",
-    "mouse2": "\ud83d\udc01",
-    "rat": "\ud83d\udc00",
-    "chipmunk": "\ud83d\udc3f\ufe0f",
-    "hedgehog": "\ud83e\udd94",
-    "feet": "\ud83d\udc3e",
-    "paw_prints": "\ud83d\udc3e",
-    "dragon": "\ud83d\udc09",
-    "dragon_face": "\ud83d\udc32",
-    "cactus": "\ud83c\udf35",
-    "christmas_tree": "\ud83c\udf84",
-    "evergreen_tree": "\ud83c\udf32",
-    "deciduous_tree": "\ud83c\udf33",
-    "palm_tree": "\ud83c\udf34",
-    "seedling": "\ud83c\udf31",
-    "herb": "\ud83c\udf3f",
-    "shamrock": "\u2618\ufe0f",
-    "four_leaf_clover": "\ud83c\udf40",
-    "bamboo": "\ud83c\udf8d",
-    "tanabata_tree": "\ud83c\udf8b",
-    "leaves": "\ud83c\udf43",
-    "fallen_leaf": "\ud83c\udf42",
-    "maple_leaf": "\ud83c\udf41",
-    "feather": "\ud83e\udeb6",
-    "mushroom": "\ud83c\udf44",
-    "shell": "\ud83d\udc1a",
-    "rock": "\ud83e\udea8",
-    "wood": "\ud83e\udeb5",
-    "ear_of_rice": "\ud83c\udf3e",
-    "potted_plant": "\ud83e\udeb4",
-    "bouquet": "\ud83d\udc90",
-    "tulip": "\ud83c\udf37",
-    "rose": "\ud83c\udf39",
-    "wilted_rose": "\ud83e\udd40",
-    "wilted_flower": "\ud83e\udd40",
-    "hibiscus": "\ud83c\udf3a",
-    "cherry_blossom": "\ud83c\udf38",
-    "blossom": "\ud83c\udf3c",
-    "sunflower": "\ud83c\udf3b",
-    "sun_with_face": "\ud83c\udf1e",
-    "full_moon_with_face": "\ud83c\udf1d",
-    "first_quarter_moon_with_face": "\ud83c\udf1b",
-    "last_quarter_moon_with_face": "\ud83c\udf1c",
-    "new_moon_with_face": "\ud83c\udf1a",
-    "full_moon": "\ud83c\udf15",
-    "waning_gibbous_moon": "\ud83c\udf16",
-    "last_quarter_moon": "\ud83c\udf17",
-    "waning_crescent_moon": "\ud83c\udf18",
-    "new_moon": "\ud83c\udf11",
-    "waxing_crescent_moon": "\ud83c\udf12",
-    "first_quarter_moon": "\ud83c\udf13",
-    "waxing_gibbous_moon": "\ud83c\udf14",
-    "crescent_moon": "\ud83c\udf19",
-    "earth_americas": "\ud83c\udf0e",
-    "earth_africa": "\ud83c\udf0d",
-    "earth_asia": "\ud83c\udf0f",
-    "ringed_planet": "\ud83e\ude90",
-    "dizzy": "\ud83d\udcab",
-    "star": "\u2b50",
-    "star2": "\ud83c\udf1f",
-    "sparkles": "\u2728",
-    "zap": "\u26a1",
-    "comet": "\u2604\ufe0f",
-    "boom": "\ud83d\udca5",
-    "fire": "\ud83d\udd25",
-    "flame": "\ud83d\udd25",
-    "cloud_tornado": "\ud83c\udf2a\ufe0f",
-    "cloud_with_tornado": "\ud83c\udf2a\ufe0f",
-    "rainbow": "\ud83c\udf08",
-    "sunny": "\u2600\ufe0f",
-    "white_sun_small_cloud": "\ud83c\udf24\ufe0f",
-    "white_sun_with_small_cloud": "\ud83c\udf24\ufe0f",
-    "partly_sunny": "\u26c5",
-    "white_sun_cloud": "\ud83c\udf25\ufe0f",
-    "white_sun_behind_cloud": "\ud83c\udf25\ufe0f",
-    "cloud": "\u2601\ufe0f",
-    "white_sun_rain_cloud": "\ud83c\udf26\ufe0f",
-    "white_sun_behind_cloud_with_rain": "\ud83c\udf26\ufe0f",
-    "cloud_rain": "\ud83c\udf27\ufe0f",
-    "cloud_with_rain": "\ud83c\udf27\ufe0f",
-    "thunder_cloud_rain": "\u26c8\ufe0f",
-    "thunder_cloud_and_rain": "\u26c8\ufe0f",
-    "cloud_lightning": "\ud83c\udf29\ufe0f",
-    "cloud_with_lightning": "\ud83c\udf29\ufe0f",
-    "cloud_snow": "\ud83c\udf28\ufe0f",
-    "cloud_with_snow": "\ud83c\udf28\ufe0f",
-    "snowflake": "\u2744\ufe0f",
-    "snowman2": "\u2603\ufe0f",
-    "snowman": "\u26c4",
-    "wind_blowing_face": "\ud83c\udf2c\ufe0f",
-    "dash": "\ud83d\udca8",
-    "droplet": "\ud83d\udca7",
-    "sweat_drops": "\ud83d\udca6",
-    "umbrella": "\u2614",
-    "umbrella2": "\u2602\ufe0f",
-    "ocean": "\ud83c\udf0a",
-    "fog": "\ud83c\udf2b\ufe0f",
-    "green_apple": "\ud83c\udf4f",
-    "apple": "\ud83c\udf4e",
-    "pear": "\ud83c\udf50",
-    "tangerine": "\ud83c\udf4a",
-    "lemon": "\ud83c\udf4b",
-    "banana": "\ud83c\udf4c",
-    "watermelon": "\ud83c\udf49",
-    "grapes": "\ud83c\udf47",
-    "blueberries": "\ud83e\uded0",
-    "strawberry": "\ud83c\udf53",
-    "melon": "\ud83c\udf48",
-    "cherries": "\ud83c\udf52",
-    "peach": "\ud83c\udf51",
-    "mango": "\ud83e\udd6d",
-    "pineapple": "\ud83c\udf4d",
-    "coconut": "\ud83e\udd65",
-    "kiwi": "\ud83e\udd5d",
-    "kiwifruit": "\ud83e\udd5d",
-    "tomato": "\ud83c\udf45",
-    "eggplant": "\ud83c\udf46",
-    "avocado": "\ud83e\udd51",
-    "olive": "\ud83e\uded2",
-    "broccoli": "\ud83e\udd66",
-    "leafy_green": "\ud83e\udd6c",
-    "bell_pepper": "\ud83e\uded1",
-    "cucumber": "\ud83e\udd52",
-    "hot_pepper": "\ud83c\udf36\ufe0f",
-    "corn": "\ud83c\udf3d",
-    "carrot": "\ud83e\udd55",
-    "garlic": "\ud83e\uddc4",
-    "onion": "\ud83e\uddc5",
-    "potato": "\ud83e\udd54",
-    "sweet_potato": "\ud83c\udf60",
-    "croissant": "\ud83e\udd50",
-    "bagel": "\ud83e\udd6f",
-    "bread": "\ud83c\udf5e",
-    "french_bread": "\ud83e\udd56",
-    "baguette_bread": "\ud83e\udd56",
-    "flatbread": "\ud83e\uded3",
-    "pretzel": "\ud83e\udd68",
-    "cheese": "\ud83e\uddc0",
-    "cheese_wedge": "\ud83e\uddc0",
-    "egg": "\ud83e\udd5a",
-    "cooking": "\ud83c\udf73",
-    "butter": "\ud83e\uddc8",
-    "pancakes": "\ud83e\udd5e",
-    "waffle": "\ud83e\uddc7",
-    "bacon": "\ud83e\udd53",
-    "cut_of_meat": "\ud83e\udd69",
-    "poultry_leg": "\ud83c\udf57",
-    "meat_on_bone": "\ud83c\udf56",
-    "hotdog": "\ud83c\udf2d",
-    "hot_dog": "\ud83c\udf2d",
-    "hamburger": "\ud83c\udf54",
-    "fries": "\ud83c\udf5f",
-    "pizza": "\ud83c\udf55",
-    "sandwich": "\ud83e\udd6a",
-    "stuffed_flatbread": "\ud83e\udd59",
-    "stuffed_pita": "\ud83e\udd59",
-    "falafel": "\ud83e\uddc6",
-    "taco": "\ud83c\udf2e",
-    "burrito": "\ud83c\udf2f",
-    "tamale": "\ud83e\uded4",
-    "salad": "\ud83e\udd57",
-    "green_salad": "\ud83e\udd57",
-    "shallow_pan_of_food": "\ud83e\udd58",
-    "paella": "\ud83e\udd58",
-    "fondue": "\ud83e\uded5",
-    "canned_food": "\ud83e\udd6b",
-    "spaghetti": "\ud83c\udf5d",
-    "ramen": "\ud83c\udf5c",
-    "stew": "\ud83c\udf72",
-    "curry": "\ud83c\udf5b",
-    "sushi": "\ud83c\udf63",
-    "bento": "\ud83c\udf71",
-    "dumpling": "\ud83e\udd5f",
-    "oyster": "\ud83e\uddaa",
-    "fried_shrimp": "\ud83c\udf64",
-    "rice_ball": "\ud83c\udf59",
-    "rice": "\ud83c\udf5a",
-    "rice_cracker": "\ud83c\udf58",
-    "fish_cake": "\ud83c\udf65",
-    "fortune_cookie": "\ud83e\udd60",
-    "moon_cake": "\ud83e\udd6e",
-    "oden": "\ud83c\udf62",
-    "dango": "\ud83c\udf61",
-    "shaved_ice": "\ud83c\udf67",
-    "ice_cream": "\ud83c\udf68",
-    "icecream": "\ud83c\udf66",
-    "pie": "\ud83e\udd67",
-    "cupcake": "\ud83e\uddc1",
-    "cake": "\ud83c\udf70",
-    "birthday": "\ud83c\udf82",
-    "custard": "\ud83c\udf6e",
-    "pudding": "\ud83c\udf6e",
-    "flan": "\ud83c\udf6e",
-    "lollipop": "\ud83c\udf6d",
-    "candy": "\ud83c\udf6c",
-    "chocolate_bar": "\ud83c\udf6b",
-    "popcorn": "\ud83c\udf7f",
-    "doughnut": "\ud83c\udf69",
-    "cookie": "\ud83c\udf6a",
-    "chestnut": "\ud83c\udf30",
-    "peanuts": "\ud83e\udd5c",
-    "shelled_peanut": "\ud83e\udd5c",
-    "honey_pot": "\ud83c\udf6f",
-    "milk": "\ud83e\udd5b",
-    "glass_of_milk": "\ud83e\udd5b",
-    "baby_bottle": "\ud83c\udf7c",
-    "coffee": "\u2615",
-    "tea": "\ud83c\udf75",
-    "teapot": "\ud83e\uded6",
-    "mate": "\ud83e\uddc9",
-    "bubble_tea": "\ud83e\uddcb",
-    "beverage_box": "\ud83e\uddc3",
-    "cup_with_straw": "\ud83e\udd64",
-    "sake": "\ud83c\udf76",
-    "beer": "\ud83c\udf7a",
-    "beers": "\ud83c\udf7b",
-    "champagne_glass": "\ud83e\udd42",
-    "clinking_glass": "\ud83e\udd42",
-    "wine_glass": "\ud83c\udf77",
-    "tumbler_glass": "\ud83e\udd43",
-    "whisky": "\ud83e\udd43",
-    "cocktail": "\ud83c\udf78",
-    "tropical_drink": "\ud83c\udf79",
-    "champagne": "\ud83c\udf7e",
-    "bottle_with_popping_cork": "\ud83c\udf7e",
-    "ice_cube": "\ud83e\uddca",
-    "spoon": "\ud83e\udd44",
-    "fork_and_knife": "\ud83c\udf74",
-    "fork_knife_plate": "\ud83c\udf7d\ufe0f",
-    "fork_and_knife_with_plate": "\ud83c\udf7d\ufe0f",
-    "bowl_with_spoon": "\ud83e\udd63",
-    "takeout_box": "\ud83e\udd61",
-    "chopsticks": "\ud83e\udd62",
-    "salt": "\ud83e\uddc2",
-    "soccer": "\u26bd",
-    "basketball": "\ud83c\udfc0",
-    "football": "\ud83c\udfc8",
-    "baseball": "\u26be",
-    "softball": "\ud83e\udd4e",
-    "tennis": "\ud83c\udfbe",
-    "volleyball": "\ud83c\udfd0",
-    "rugby_football": "\ud83c\udfc9",
-    "flying_disc": "\ud83e\udd4f",
-    "boomerang": "\ud83e\ude83",
-    "8ball": "\ud83c\udfb1",
-    "yo_yo": "\ud83e\ude80",
-    "ping_pong": "\ud83c\udfd3",
-    "table_tennis": "\ud83c\udfd3",
-    "badminton": "\ud83c\udff8",
-    "hockey": "\ud83c\udfd2",
-    "field_hockey": "\ud83c\udfd1",
-    "lacrosse": "\ud83e\udd4d",
-    "cricket_game": "\ud83c\udfcf",
-    "cricket_bat_ball": "\ud83c\udfcf",
-    "goal": "\ud83e\udd45",
-    "goal_net": "\ud83e\udd45",
-    "golf": "\u26f3",
-    "kite": "\ud83e\ude81",
-    "bow_and_arrow": "\ud83c\udff9",
-    "archery": "\ud83c\udff9",
-    "fishing_pole_and_fish": "\ud83c\udfa3",
-    "diving_mask": "\ud83e\udd3f",
-    "boxing_glove": "\ud83e\udd4a",
-    "boxing_gloves": "\ud83e\udd4a",
-    "martial_arts_uniform": "\ud83e\udd4b",
-    "karate_uniform": "\ud83e\udd4b",
-    "running_shirt_with_sash": "\ud83c\udfbd",
-    "skateboard": "\ud83d\udef9",
-    "roller_skate": "\ud83d\udefc",
-    "sled": "\ud83d\udef7",
-    "ice_skate": "\u26f8\ufe0f",
-    "curling_stone": "\ud83e\udd4c",
-    "ski": "\ud83c\udfbf",
-    "skier": "\u26f7\ufe0f",
-    "snowboarder": "\ud83c\udfc2",
-    "snowboarder_tone1": "\ud83c\udfc2\ud83c\udffb",
-    "snowboarder_light_skin_tone": "\ud83c\udfc2\ud83c\udffb",
-    "snowboarder_tone2": "\ud83c\udfc2\ud83c\udffc",
-    "snowboarder_medium_light_skin_tone": "\ud83c\udfc2\ud83c\udffc",
-    "snowboarder_tone3": "\ud83c\udfc2\ud83c\udffd",
-    "snowboarder_medium_skin_tone": "\ud83c\udfc2\ud83c\udffd",
-    "snowboarder_tone4": "\ud83c\udfc2\ud83c\udffe",
-    "snowboarder_medium_dark_skin_tone": "\ud83c\udfc2\ud83c\udffe",
-    "snowboarder_tone5": "\ud83c\udfc2\ud83c\udfff",
-    "snowboarder_dark_skin_tone": "\ud83c\udfc2\ud83c\udfff",
-    "parachute": "\ud83e\ude82",
-    "person_lifting_weights": "\ud83c\udfcb\ufe0f",
-    "person_lifting_weights_tone1": "\ud83c\udfcb\ud83c\udffb",
-    "lifter_tone1": "\ud83c\udfcb\ud83c\udffb",
-    "weight_lifter_tone1": "\ud83c\udfcb\ud83c\udffb",
-    "person_lifting_weights_tone2": "\ud83c\udfcb\ud83c\udffc",
-    "lifter_tone2": "\ud83c\udfcb\ud83c\udffc",
-    "weight_lifter_tone2": "\ud83c\udfcb\ud83c\udffc",
-    "person_lifting_weights_tone3": "\ud83c\udfcb\ud83c\udffd",
-    "lifter_tone3": "\ud83c\udfcb\ud83c\udffd",
-    "weight_lifter_tone3": "\ud83c\udfcb\ud83c\udffd",
-    "person_lifting_weights_tone4": "\ud83c\udfcb\ud83c\udffe",
-    "lifter_tone4": "\ud83c\udfcb\ud83c\udffe",
-    "weight_lifter_tone4": "\ud83c\udfcb\ud83c\udffe",
-    "person_lifting_weights_tone5": "\ud83c\udfcb\ud83c\udfff",
-    "lifter_tone5": "\ud83c\udfcb\ud83c\udfff",
-    "weight_lifter_tone5": "\ud83c\udfcb\ud83c\udfff",
-    "lifter": "\ud83c\udfcb\ufe0f",
-    "weight_lifter": "\ud83c\udfcb\ufe0f",
-    "woman_lifting_weights": "\ud83c\udfcb\ufe0f\u200d\u2640\ufe0f",
-    "woman_lifting_weights_tone1": "\ud83c\udfcb\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_lifting_weights_light_skin_tone": "\ud83c\udfcb\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_lifting_weights_tone2": "\ud83c\udfcb\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_lifting_weights_medium_light_skin_tone": "\ud83c\udfcb\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_lifting_weights_tone3": "\ud83c\udfcb\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_lifting_weights_medium_skin_tone": "\ud83c\udfcb\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_lifting_weights_tone4": "\ud83c\udfcb\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_lifting_weights_medium_dark_skin_tone": "\ud83c\udfcb\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_lifting_weights_tone5": "\ud83c\udfcb\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_lifting_weights_dark_skin_tone": "\ud83c\udfcb\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_lifting_weights": "\ud83c\udfcb\ufe0f\u200d\u2642\ufe0f",
-    "man_lifting_weights_tone1": "\ud83c\udfcb\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_lifting_weights_light_skin_tone": "\ud83c\udfcb\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_lifting_weights_tone2": "\ud83c\udfcb\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_lifting_weights_medium_light_skin_tone": "\ud83c\udfcb\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_lifting_weights_tone3": "\ud83c\udfcb\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_lifting_weights_medium_skin_tone": "\ud83c\udfcb\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_lifting_weights_tone4": "\ud83c\udfcb\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_lifting_weights_medium_dark_skin_tone": "\ud83c\udfcb\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_lifting_weights_tone5": "\ud83c\udfcb\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_lifting_weights_dark_skin_tone": "\ud83c\udfcb\ud83c\udfff\u200d\u2642\ufe0f",
-    "people_wrestling": "\ud83e\udd3c",
-    "wrestlers": "\ud83e\udd3c",
-    "wrestling": "\ud83e\udd3c",
-    "women_wrestling": "\ud83e\udd3c\u200d\u2640\ufe0f",
-    "men_wrestling": "\ud83e\udd3c\u200d\u2642\ufe0f",
-    "person_doing_cartwheel": "\ud83e\udd38",
-    "person_doing_cartwheel_tone1": "\ud83e\udd38\ud83c\udffb",
-    "cartwheel_tone1": "\ud83e\udd38\ud83c\udffb",
-    "person_doing_cartwheel_tone2": "\ud83e\udd38\ud83c\udffc",
-    "cartwheel_tone2": "\ud83e\udd38\ud83c\udffc",
-    "person_doing_cartwheel_tone3": "\ud83e\udd38\ud83c\udffd",
-    "cartwheel_tone3": "\ud83e\udd38\ud83c\udffd",
-    "person_doing_cartwheel_tone4": "\ud83e\udd38\ud83c\udffe",
-    "cartwheel_tone4": "\ud83e\udd38\ud83c\udffe",
-    "person_doing_cartwheel_tone5": "\ud83e\udd38\ud83c\udfff",
-    "cartwheel_tone5": "\ud83e\udd38\ud83c\udfff",
-    "cartwheel": "\ud83e\udd38",
-    "woman_cartwheeling": "\ud83e\udd38\u200d\u2640\ufe0f",
-    "woman_cartwheeling_tone1": "\ud83e\udd38\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_cartwheeling_light_skin_tone": "\ud83e\udd38\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_cartwheeling_tone2": "\ud83e\udd38\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_cartwheeling_medium_light_skin_tone": "\ud83e\udd38\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_cartwheeling_tone3": "\ud83e\udd38\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_cartwheeling_medium_skin_tone": "\ud83e\udd38\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_cartwheeling_tone4": "\ud83e\udd38\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_cartwheeling_medium_dark_skin_tone": "\ud83e\udd38\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_cartwheeling_tone5": "\ud83e\udd38\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_cartwheeling_dark_skin_tone": "\ud83e\udd38\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_cartwheeling": "\ud83e\udd38\u200d\u2642\ufe0f",
-    "man_cartwheeling_tone1": "\ud83e\udd38\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_cartwheeling_light_skin_tone": "\ud83e\udd38\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_cartwheeling_tone2": "\ud83e\udd38\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_cartwheeling_medium_light_skin_tone": "\ud83e\udd38\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_cartwheeling_tone3": "\ud83e\udd38\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_cartwheeling_medium_skin_tone": "\ud83e\udd38\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_cartwheeling_tone4": "\ud83e\udd38\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_cartwheeling_medium_dark_skin_tone": "\ud83e\udd38\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_cartwheeling_tone5": "\ud83e\udd38\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_cartwheeling_dark_skin_tone": "\ud83e\udd38\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_bouncing_ball": "\u26f9\ufe0f",
-    "person_bouncing_ball_tone1": "\u26f9\ud83c\udffb",
-    "basketball_player_tone1": "\u26f9\ud83c\udffb",
-    "person_with_ball_tone1": "\u26f9\ud83c\udffb",
-    "person_bouncing_ball_tone2": "\u26f9\ud83c\udffc",
-    "basketball_player_tone2": "\u26f9\ud83c\udffc",
-    "person_with_ball_tone2": "\u26f9\ud83c\udffc",
-    "person_bouncing_ball_tone3": "\u26f9\ud83c\udffd",
-    "basketball_player_tone3": "\u26f9\ud83c\udffd",
-    "person_with_ball_tone3": "\u26f9\ud83c\udffd",
-    "person_bouncing_ball_tone4": "\u26f9\ud83c\udffe",
-    "basketball_player_tone4": "\u26f9\ud83c\udffe",
-    "person_with_ball_tone4": "\u26f9\ud83c\udffe",
-    "person_bouncing_ball_tone5": "\u26f9\ud83c\udfff",
-    "basketball_player_tone5": "\u26f9\ud83c\udfff",
-    "person_with_ball_tone5": "\u26f9\ud83c\udfff",
-    "basketball_player": "\u26f9\ufe0f",
-    "person_with_ball": "\u26f9\ufe0f",
-    "woman_bouncing_ball": "\u26f9\ufe0f\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_tone1": "\u26f9\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_light_skin_tone": "\u26f9\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_tone2": "\u26f9\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_medium_light_skin_tone": "\u26f9\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_tone3": "\u26f9\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_medium_skin_tone": "\u26f9\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_tone4": "\u26f9\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_medium_dark_skin_tone": "\u26f9\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_tone5": "\u26f9\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_bouncing_ball_dark_skin_tone": "\u26f9\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_bouncing_ball": "\u26f9\ufe0f\u200d\u2642\ufe0f",
-    "man_bouncing_ball_tone1": "\u26f9\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_bouncing_ball_light_skin_tone": "\u26f9\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_bouncing_ball_tone2": "\u26f9\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_bouncing_ball_medium_light_skin_tone": "\u26f9\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_bouncing_ball_tone3": "\u26f9\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_bouncing_ball_medium_skin_tone": "\u26f9\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_bouncing_ball_tone4": "\u26f9\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_bouncing_ball_medium_dark_skin_tone": "\u26f9\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_bouncing_ball_tone5": "\u26f9\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_bouncing_ball_dark_skin_tone": "\u26f9\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_fencing": "\ud83e\udd3a",
-    "fencer": "\ud83e\udd3a",
-    "fencing": "\ud83e\udd3a",
-    "person_playing_handball": "\ud83e\udd3e",
-    "person_playing_handball_tone1": "\ud83e\udd3e\ud83c\udffb",
-    "handball_tone1": "\ud83e\udd3e\ud83c\udffb",
-    "person_playing_handball_tone2": "\ud83e\udd3e\ud83c\udffc",
-    "handball_tone2": "\ud83e\udd3e\ud83c\udffc",
-    "person_playing_handball_tone3": "\ud83e\udd3e\ud83c\udffd",
-    "handball_tone3": "\ud83e\udd3e\ud83c\udffd",
-    "person_playing_handball_tone4": "\ud83e\udd3e\ud83c\udffe",
-    "handball_tone4": "\ud83e\udd3e\ud83c\udffe",
-    "person_playing_handball_tone5": "\ud83e\udd3e\ud83c\udfff",
-    "handball_tone5": "\ud83e\udd3e\ud83c\udfff",
-    "handball": "\ud83e\udd3e",
-    "woman_playing_handball": "\ud83e\udd3e\u200d\u2640\ufe0f",
-    "woman_playing_handball_tone1": "\ud83e\udd3e\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_playing_handball_light_skin_tone": "\ud83e\udd3e\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_playing_handball_tone2": "\ud83e\udd3e\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_playing_handball_medium_light_skin_tone": "\ud83e\udd3e\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_playing_handball_tone3": "\ud83e\udd3e\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_playing_handball_medium_skin_tone": "\ud83e\udd3e\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_playing_handball_tone4": "\ud83e\udd3e\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_playing_handball_medium_dark_skin_tone": "\ud83e\udd3e\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_playing_handball_tone5": "\ud83e\udd3e\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_playing_handball_dark_skin_tone": "\ud83e\udd3e\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_playing_handball": "\ud83e\udd3e\u200d\u2642\ufe0f",
-    "man_playing_handball_tone1": "\ud83e\udd3e\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_playing_handball_light_skin_tone": "\ud83e\udd3e\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_playing_handball_tone2": "\ud83e\udd3e\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_playing_handball_medium_light_skin_tone": "\ud83e\udd3e\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_playing_handball_tone3": "\ud83e\udd3e\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_playing_handball_medium_skin_tone": "\ud83e\udd3e\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_playing_handball_tone4": "\ud83e\udd3e\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_playing_handball_medium_dark_skin_tone": "\ud83e\udd3e\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_playing_handball_tone5": "\ud83e\udd3e\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_playing_handball_dark_skin_tone": "\ud83e\udd3e\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_golfing": "\ud83c\udfcc\ufe0f",
-    "person_golfing_tone1": "\ud83c\udfcc\ud83c\udffb",
-    "person_golfing_light_skin_tone": "\ud83c\udfcc\ud83c\udffb",
-    "person_golfing_tone2": "\ud83c\udfcc\ud83c\udffc",
-    "person_golfing_medium_light_skin_tone": "\ud83c\udfcc\ud83c\udffc",
-    "person_golfing_tone3": "\ud83c\udfcc\ud83c\udffd",
-    "person_golfing_medium_skin_tone": "\ud83c\udfcc\ud83c\udffd",
-    "person_golfing_tone4": "\ud83c\udfcc\ud83c\udffe",
-    "person_golfing_medium_dark_skin_tone": "\ud83c\udfcc\ud83c\udffe",
-    "person_golfing_tone5": "\ud83c\udfcc\ud83c\udfff",
-    "person_golfing_dark_skin_tone": "\ud83c\udfcc\ud83c\udfff",
-    "golfer": "\ud83c\udfcc\ufe0f",
-    "woman_golfing": "\ud83c\udfcc\ufe0f\u200d\u2640\ufe0f",
-    "woman_golfing_tone1": "\ud83c\udfcc\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_golfing_light_skin_tone": "\ud83c\udfcc\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_golfing_tone2": "\ud83c\udfcc\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_golfing_medium_light_skin_tone": "\ud83c\udfcc\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_golfing_tone3": "\ud83c\udfcc\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_golfing_medium_skin_tone": "\ud83c\udfcc\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_golfing_tone4": "\ud83c\udfcc\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_golfing_medium_dark_skin_tone": "\ud83c\udfcc\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_golfing_tone5": "\ud83c\udfcc\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_golfing_dark_skin_tone": "\ud83c\udfcc\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_golfing": "\ud83c\udfcc\ufe0f\u200d\u2642\ufe0f",
-    "man_golfing_tone1": "\ud83c\udfcc\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_golfing_light_skin_tone": "\ud83c\udfcc\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_golfing_tone2": "\ud83c\udfcc\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_golfing_medium_light_skin_tone": "\ud83c\udfcc\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_golfing_tone3": "\ud83c\udfcc\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_golfing_medium_skin_tone": "\ud83c\udfcc\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_golfing_tone4": "\ud83c\udfcc\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_golfing_medium_dark_skin_tone": "\ud83c\udfcc\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_golfing_tone5": "\ud83c\udfcc\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_golfing_dark_skin_tone": "\ud83c\udfcc\ud83c\udfff\u200d\u2642\ufe0f",
-    "horse_racing": "\ud83c\udfc7",
-    "horse_racing_tone1": "\ud83c\udfc7\ud83c\udffb",
-    "horse_racing_tone2": "\ud83c\udfc7\ud83c\udffc",
-    "horse_racing_tone3": "\ud83c\udfc7\ud83c\udffd",
-    "horse_racing_tone4": "\ud83c\udfc7\ud83c\udffe",
-    "horse_racing_tone5": "\ud83c\udfc7\ud83c\udfff",
-    "person_in_lotus_position": "\ud83e\uddd8",
-    "person_in_lotus_position_tone1": "\ud83e\uddd8\ud83c\udffb",
-    "person_in_lotus_position_light_skin_tone": "\ud83e\uddd8\ud83c\udffb",
-    "person_in_lotus_position_tone2": "\ud83e\uddd8\ud83c\udffc",
-    "person_in_lotus_position_medium_light_skin_tone": "\ud83e\uddd8\ud83c\udffc",
-    "person_in_lotus_position_tone3": "\ud83e\uddd8\ud83c\udffd",
-    "person_in_lotus_position_medium_skin_tone": "\ud83e\uddd8\ud83c\udffd",
-    "person_in_lotus_position_tone4": "\ud83e\uddd8\ud83c\udffe",
-    "person_in_lotus_position_medium_dark_skin_tone": "\ud83e\uddd8\ud83c\udffe",
-    "person_in_lotus_position_tone5": "\ud83e\uddd8\ud83c\udfff",
-    "person_in_lotus_position_dark_skin_tone": "\ud83e\uddd8\ud83c\udfff",
-    "woman_in_lotus_position": "\ud83e\uddd8\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_tone1": "\ud83e\uddd8\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_light_skin_tone": "\ud83e\uddd8\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_tone2": "\ud83e\uddd8\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_medium_light_skin_tone": "\ud83e\uddd8\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_tone3": "\ud83e\uddd8\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_medium_skin_tone": "\ud83e\uddd8\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_tone4": "\ud83e\uddd8\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_medium_dark_skin_tone": "\ud83e\uddd8\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_tone5": "\ud83e\uddd8\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_in_lotus_position_dark_skin_tone": "\ud83e\uddd8\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_in_lotus_position": "\ud83e\uddd8\u200d\u2642\ufe0f",
-    "man_in_lotus_position_tone1": "\ud83e\uddd8\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_in_lotus_position_light_skin_tone": "\ud83e\uddd8\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_in_lotus_position_tone2": "\ud83e\uddd8\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_in_lotus_position_medium_light_skin_tone": "\ud83e\uddd8\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_in_lotus_position_tone3": "\ud83e\uddd8\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_in_lotus_position_medium_skin_tone": "\ud83e\uddd8\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_in_lotus_position_tone4": "\ud83e\uddd8\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_in_lotus_position_medium_dark_skin_tone": "\ud83e\uddd8\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_in_lotus_position_tone5": "\ud83e\uddd8\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_in_lotus_position_dark_skin_tone": "\ud83e\uddd8\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_surfing": "\ud83c\udfc4",
-    "person_surfing_tone1": "\ud83c\udfc4\ud83c\udffb",
-    "surfer_tone1": "\ud83c\udfc4\ud83c\udffb",
-    "person_surfing_tone2": "\ud83c\udfc4\ud83c\udffc",
-    "surfer_tone2": "\ud83c\udfc4\ud83c\udffc",
-    "person_surfing_tone3": "\ud83c\udfc4\ud83c\udffd",
-    "surfer_tone3": "\ud83c\udfc4\ud83c\udffd",
-    "person_surfing_tone4": "\ud83c\udfc4\ud83c\udffe",
-    "surfer_tone4": "\ud83c\udfc4\ud83c\udffe",
-    "person_surfing_tone5": "\ud83c\udfc4\ud83c\udfff",
-    "surfer_tone5": "\ud83c\udfc4\ud83c\udfff",
-    "surfer": "\ud83c\udfc4",
-    "woman_surfing": "\ud83c\udfc4\u200d\u2640\ufe0f",
-    "woman_surfing_tone1": "\ud83c\udfc4\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_surfing_light_skin_tone": "\ud83c\udfc4\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_surfing_tone2": "\ud83c\udfc4\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_surfing_medium_light_skin_tone": "\ud83c\udfc4\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_surfing_tone3": "\ud83c\udfc4\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_surfing_medium_skin_tone": "\ud83c\udfc4\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_surfing_tone4": "\ud83c\udfc4\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_surfing_medium_dark_skin_tone": "\ud83c\udfc4\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_surfing_tone5": "\ud83c\udfc4\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_surfing_dark_skin_tone": "\ud83c\udfc4\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_surfing": "\ud83c\udfc4\u200d\u2642\ufe0f",
-    "man_surfing_tone1": "\ud83c\udfc4\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_surfing_light_skin_tone": "\ud83c\udfc4\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_surfing_tone2": "\ud83c\udfc4\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_surfing_medium_light_skin_tone": "\ud83c\udfc4\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_surfing_tone3": "\ud83c\udfc4\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_surfing_medium_skin_tone": "\ud83c\udfc4\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_surfing_tone4": "\ud83c\udfc4\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_surfing_medium_dark_skin_tone": "\ud83c\udfc4\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_surfing_tone5": "\ud83c\udfc4\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_surfing_dark_skin_tone": "\ud83c\udfc4\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_swimming": "\ud83c\udfca",
-    "person_swimming_tone1": "\ud83c\udfca\ud83c\udffb",
-    "swimmer_tone1": "\ud83c\udfca\ud83c\udffb",
-    "person_swimming_tone2": "\ud83c\udfca\ud83c\udffc",
-    "swimmer_tone2": "\ud83c\udfca\ud83c\udffc",
-    "person_swimming_tone3": "\ud83c\udfca\ud83c\udffd",
-    "swimmer_tone3": "\ud83c\udfca\ud83c\udffd",
-    "person_swimming_tone4": "\ud83c\udfca\ud83c\udffe",
-    "swimmer_tone4": "\ud83c\udfca\ud83c\udffe",
-    "person_swimming_tone5": "\ud83c\udfca\ud83c\udfff",
-    "swimmer_tone5": "\ud83c\udfca\ud83c\udfff",
-    "swimmer": "\ud83c\udfca",
-    "woman_swimming": "\ud83c\udfca\u200d\u2640\ufe0f",
-    "woman_swimming_tone1": "\ud83c\udfca\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_swimming_light_skin_tone": "\ud83c\udfca\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_swimming_tone2": "\ud83c\udfca\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_swimming_medium_light_skin_tone": "\ud83c\udfca\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_swimming_tone3": "\ud83c\udfca\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_swimming_medium_skin_tone": "\ud83c\udfca\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_swimming_tone4": "\ud83c\udfca\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_swimming_medium_dark_skin_tone": "\ud83c\udfca\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_swimming_tone5": "\ud83c\udfca\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_swimming_dark_skin_tone": "\ud83c\udfca\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_swimming": "\ud83c\udfca\u200d\u2642\ufe0f",
-    "man_swimming_tone1": "\ud83c\udfca\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_swimming_light_skin_tone": "\ud83c\udfca\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_swimming_tone2": "\ud83c\udfca\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_swimming_medium_light_skin_tone": "\ud83c\udfca\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_swimming_tone3": "\ud83c\udfca\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_swimming_medium_skin_tone": "\ud83c\udfca\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_swimming_tone4": "\ud83c\udfca\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_swimming_medium_dark_skin_tone": "\ud83c\udfca\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_swimming_tone5": "\ud83c\udfca\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_swimming_dark_skin_tone": "\ud83c\udfca\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_playing_water_polo": "\ud83e\udd3d",
-    "person_playing_water_polo_tone1": "\ud83e\udd3d\ud83c\udffb",
-    "water_polo_tone1": "\ud83e\udd3d\ud83c\udffb",
-    "person_playing_water_polo_tone2": "\ud83e\udd3d\ud83c\udffc",
-    "water_polo_tone2": "\ud83e\udd3d\ud83c\udffc",
-    "person_playing_water_polo_tone3": "\ud83e\udd3d\ud83c\udffd",
-    "water_polo_tone3": "\ud83e\udd3d\ud83c\udffd",
-    "person_playing_water_polo_tone4": "\ud83e\udd3d\ud83c\udffe",
-    "water_polo_tone4": "\ud83e\udd3d\ud83c\udffe",
-    "person_playing_water_polo_tone5": "\ud83e\udd3d\ud83c\udfff",
-    "water_polo_tone5": "\ud83e\udd3d\ud83c\udfff",
-    "water_polo": "\ud83e\udd3d",
-    "woman_playing_water_polo": "\ud83e\udd3d\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_tone1": "\ud83e\udd3d\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_light_skin_tone": "\ud83e\udd3d\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_tone2": "\ud83e\udd3d\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_medium_light_skin_tone": "\ud83e\udd3d\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_tone3": "\ud83e\udd3d\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_medium_skin_tone": "\ud83e\udd3d\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_tone4": "\ud83e\udd3d\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_medium_dark_skin_tone": "\ud83e\udd3d\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_tone5": "\ud83e\udd3d\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_playing_water_polo_dark_skin_tone": "\ud83e\udd3d\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_playing_water_polo": "\ud83e\udd3d\u200d\u2642\ufe0f",
-    "man_playing_water_polo_tone1": "\ud83e\udd3d\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_playing_water_polo_light_skin_tone": "\ud83e\udd3d\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_playing_water_polo_tone2": "\ud83e\udd3d\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_playing_water_polo_medium_light_skin_tone": "\ud83e\udd3d\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_playing_water_polo_tone3": "\ud83e\udd3d\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_playing_water_polo_medium_skin_tone": "\ud83e\udd3d\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_playing_water_polo_tone4": "\ud83e\udd3d\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_playing_water_polo_medium_dark_skin_tone": "\ud83e\udd3d\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_playing_water_polo_tone5": "\ud83e\udd3d\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_playing_water_polo_dark_skin_tone": "\ud83e\udd3d\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_rowing_boat": "\ud83d\udea3",
-    "person_rowing_boat_tone1": "\ud83d\udea3\ud83c\udffb",
-    "rowboat_tone1": "\ud83d\udea3\ud83c\udffb",
-    "person_rowing_boat_tone2": "\ud83d\udea3\ud83c\udffc",
-    "rowboat_tone2": "\ud83d\udea3\ud83c\udffc",
-    "person_rowing_boat_tone3": "\ud83d\udea3\ud83c\udffd",
-    "rowboat_tone3": "\ud83d\udea3\ud83c\udffd",
-    "person_rowing_boat_tone4": "\ud83d\udea3\ud83c\udffe",
-    "rowboat_tone4": "\ud83d\udea3\ud83c\udffe",
-    "person_rowing_boat_tone5": "\ud83d\udea3\ud83c\udfff",
-    "rowboat_tone5": "\ud83d\udea3\ud83c\udfff",
-    "rowboat": "\ud83d\udea3",
-    "woman_rowing_boat": "\ud83d\udea3\u200d\u2640\ufe0f",
-    "woman_rowing_boat_tone1": "\ud83d\udea3\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_rowing_boat_light_skin_tone": "\ud83d\udea3\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_rowing_boat_tone2": "\ud83d\udea3\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_rowing_boat_medium_light_skin_tone": "\ud83d\udea3\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_rowing_boat_tone3": "\ud83d\udea3\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_rowing_boat_medium_skin_tone": "\ud83d\udea3\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_rowing_boat_tone4": "\ud83d\udea3\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_rowing_boat_medium_dark_skin_tone": "\ud83d\udea3\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_rowing_boat_tone5": "\ud83d\udea3\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_rowing_boat_dark_skin_tone": "\ud83d\udea3\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_rowing_boat": "\ud83d\udea3\u200d\u2642\ufe0f",
-    "man_rowing_boat_tone1": "\ud83d\udea3\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_rowing_boat_light_skin_tone": "\ud83d\udea3\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_rowing_boat_tone2": "\ud83d\udea3\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_rowing_boat_medium_light_skin_tone": "\ud83d\udea3\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_rowing_boat_tone3": "\ud83d\udea3\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_rowing_boat_medium_skin_tone": "\ud83d\udea3\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_rowing_boat_tone4": "\ud83d\udea3\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_rowing_boat_medium_dark_skin_tone": "\ud83d\udea3\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_rowing_boat_tone5": "\ud83d\udea3\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_rowing_boat_dark_skin_tone": "\ud83d\udea3\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_climbing": "\ud83e\uddd7",
-    "person_climbing_tone1": "\ud83e\uddd7\ud83c\udffb",
-    "person_climbing_light_skin_tone": "\ud83e\uddd7\ud83c\udffb",
-    "person_climbing_tone2": "\ud83e\uddd7\ud83c\udffc",
-    "person_climbing_medium_light_skin_tone": "\ud83e\uddd7\ud83c\udffc",
-    "person_climbing_tone3": "\ud83e\uddd7\ud83c\udffd",
-    "person_climbing_medium_skin_tone": "\ud83e\uddd7\ud83c\udffd",
-    "person_climbing_tone4": "\ud83e\uddd7\ud83c\udffe",
-    "person_climbing_medium_dark_skin_tone": "\ud83e\uddd7\ud83c\udffe",
-    "person_climbing_tone5": "\ud83e\uddd7\ud83c\udfff",
-    "person_climbing_dark_skin_tone": "\ud83e\uddd7\ud83c\udfff",
-    "woman_climbing": "\ud83e\uddd7\u200d\u2640\ufe0f",
-    "woman_climbing_tone1": "\ud83e\uddd7\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_climbing_light_skin_tone": "\ud83e\uddd7\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_climbing_tone2": "\ud83e\uddd7\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_climbing_medium_light_skin_tone": "\ud83e\uddd7\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_climbing_tone3": "\ud83e\uddd7\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_climbing_medium_skin_tone": "\ud83e\uddd7\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_climbing_tone4": "\ud83e\uddd7\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_climbing_medium_dark_skin_tone": "\ud83e\uddd7\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_climbing_tone5": "\ud83e\uddd7\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_climbing_dark_skin_tone": "\ud83e\uddd7\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_climbing": "\ud83e\uddd7\u200d\u2642\ufe0f",
-    "man_climbing_tone1": "\ud83e\uddd7\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_climbing_light_skin_tone": "\ud83e\uddd7\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_climbing_tone2": "\ud83e\uddd7\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_climbing_medium_light_skin_tone": "\ud83e\uddd7\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_climbing_tone3": "\ud83e\uddd7\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_climbing_medium_skin_tone": "\ud83e\uddd7\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_climbing_tone4": "\ud83e\uddd7\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_climbing_medium_dark_skin_tone": "\ud83e\uddd7\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_climbing_tone5": "\ud83e\uddd7\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_climbing_dark_skin_tone": "\ud83e\uddd7\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_mountain_biking": "\ud83d\udeb5",
-    "person_mountain_biking_tone1": "\ud83d\udeb5\ud83c\udffb",
-    "mountain_bicyclist_tone1": "\ud83d\udeb5\ud83c\udffb",
-    "person_mountain_biking_tone2": "\ud83d\udeb5\ud83c\udffc",
-    "mountain_bicyclist_tone2": "\ud83d\udeb5\ud83c\udffc",
-    "person_mountain_biking_tone3": "\ud83d\udeb5\ud83c\udffd",
-    "mountain_bicyclist_tone3": "\ud83d\udeb5\ud83c\udffd",
-    "person_mountain_biking_tone4": "\ud83d\udeb5\ud83c\udffe",
-    "mountain_bicyclist_tone4": "\ud83d\udeb5\ud83c\udffe",
-    "person_mountain_biking_tone5": "\ud83d\udeb5\ud83c\udfff",
-    "mountain_bicyclist_tone5": "\ud83d\udeb5\ud83c\udfff",
-    "mountain_bicyclist": "\ud83d\udeb5",
-    "woman_mountain_biking": "\ud83d\udeb5\u200d\u2640\ufe0f",
-    "woman_mountain_biking_tone1": "\ud83d\udeb5\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_mountain_biking_light_skin_tone": "\ud83d\udeb5\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_mountain_biking_tone2": "\ud83d\udeb5\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_mountain_biking_medium_light_skin_tone": "\ud83d\udeb5\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_mountain_biking_tone3": "\ud83d\udeb5\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_mountain_biking_medium_skin_tone": "\ud83d\udeb5\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_mountain_biking_tone4": "\ud83d\udeb5\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_mountain_biking_medium_dark_skin_tone": "\ud83d\udeb5\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_mountain_biking_tone5": "\ud83d\udeb5\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_mountain_biking_dark_skin_tone": "\ud83d\udeb5\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_mountain_biking": "\ud83d\udeb5\u200d\u2642\ufe0f",
-    "man_mountain_biking_tone1": "\ud83d\udeb5\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_mountain_biking_light_skin_tone": "\ud83d\udeb5\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_mountain_biking_tone2": "\ud83d\udeb5\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_mountain_biking_medium_light_skin_tone": "\ud83d\udeb5\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_mountain_biking_tone3": "\ud83d\udeb5\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_mountain_biking_medium_skin_tone": "\ud83d\udeb5\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_mountain_biking_tone4": "\ud83d\udeb5\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_mountain_biking_medium_dark_skin_tone": "\ud83d\udeb5\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_mountain_biking_tone5": "\ud83d\udeb5\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_mountain_biking_dark_skin_tone": "\ud83d\udeb5\ud83c\udfff\u200d\u2642\ufe0f",
-    "person_biking": "\ud83d\udeb4",
-    "person_biking_tone1": "\ud83d\udeb4\ud83c\udffb",
-    "bicyclist_tone1": "\ud83d\udeb4\ud83c\udffb",
-    "person_biking_tone2": "\ud83d\udeb4\ud83c\udffc",
-    "bicyclist_tone2": "\ud83d\udeb4\ud83c\udffc",
-    "person_biking_tone3": "\ud83d\udeb4\ud83c\udffd",
-    "bicyclist_tone3": "\ud83d\udeb4\ud83c\udffd",
-    "person_biking_tone4": "\ud83d\udeb4\ud83c\udffe",
-    "bicyclist_tone4": "\ud83d\udeb4\ud83c\udffe",
-    "person_biking_tone5": "\ud83d\udeb4\ud83c\udfff",
-    "bicyclist_tone5": "\ud83d\udeb4\ud83c\udfff",
-    "bicyclist": "\ud83d\udeb4",
-    "woman_biking": "\ud83d\udeb4\u200d\u2640\ufe0f",
-    "woman_biking_tone1": "\ud83d\udeb4\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_biking_light_skin_tone": "\ud83d\udeb4\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_biking_tone2": "\ud83d\udeb4\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_biking_medium_light_skin_tone": "\ud83d\udeb4\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_biking_tone3": "\ud83d\udeb4\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_biking_medium_skin_tone": "\ud83d\udeb4\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_biking_tone4": "\ud83d\udeb4\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_biking_medium_dark_skin_tone": "\ud83d\udeb4\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_biking_tone5": "\ud83d\udeb4\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_biking_dark_skin_tone": "\ud83d\udeb4\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_biking": "\ud83d\udeb4\u200d\u2642\ufe0f",
-    "man_biking_tone1": "\ud83d\udeb4\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_biking_light_skin_tone": "\ud83d\udeb4\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_biking_tone2": "\ud83d\udeb4\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_biking_medium_light_skin_tone": "\ud83d\udeb4\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_biking_tone3": "\ud83d\udeb4\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_biking_medium_skin_tone": "\ud83d\udeb4\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_biking_tone4": "\ud83d\udeb4\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_biking_medium_dark_skin_tone": "\ud83d\udeb4\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_biking_tone5": "\ud83d\udeb4\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_biking_dark_skin_tone": "\ud83d\udeb4\ud83c\udfff\u200d\u2642\ufe0f",
-    "trophy": "\ud83c\udfc6",
-    "first_place": "\ud83e\udd47",
-    "first_place_medal": "\ud83e\udd47",
-    "second_place": "\ud83e\udd48",
-    "second_place_medal": "\ud83e\udd48",
-    "third_place": "\ud83e\udd49",
-    "third_place_medal": "\ud83e\udd49",
-    "medal": "\ud83c\udfc5",
-    "sports_medal": "\ud83c\udfc5",
-    "military_medal": "\ud83c\udf96\ufe0f",
-    "rosette": "\ud83c\udff5\ufe0f",
-    "reminder_ribbon": "\ud83c\udf97\ufe0f",
-    "ticket": "\ud83c\udfab",
-    "tickets": "\ud83c\udf9f\ufe0f",
-    "admission_tickets": "\ud83c\udf9f\ufe0f",
-    "circus_tent": "\ud83c\udfaa",
-    "person_juggling": "\ud83e\udd39",
-    "person_juggling_tone1": "\ud83e\udd39\ud83c\udffb",
-    "juggling_tone1": "\ud83e\udd39\ud83c\udffb",
-    "juggler_tone1": "\ud83e\udd39\ud83c\udffb",
-    "person_juggling_tone2": "\ud83e\udd39\ud83c\udffc",
-    "juggling_tone2": "\ud83e\udd39\ud83c\udffc",
-    "juggler_tone2": "\ud83e\udd39\ud83c\udffc",
-    "person_juggling_tone3": "\ud83e\udd39\ud83c\udffd",
-    "juggling_tone3": "\ud83e\udd39\ud83c\udffd",
-    "juggler_tone3": "\ud83e\udd39\ud83c\udffd",
-    "person_juggling_tone4": "\ud83e\udd39\ud83c\udffe",
-    "juggling_tone4": "\ud83e\udd39\ud83c\udffe",
-    "juggler_tone4": "\ud83e\udd39\ud83c\udffe",
-    "person_juggling_tone5": "\ud83e\udd39\ud83c\udfff",
-    "juggling_tone5": "\ud83e\udd39\ud83c\udfff",
-    "juggler_tone5": "\ud83e\udd39\ud83c\udfff",
-    "juggling": "\ud83e\udd39",
-    "juggler": "\ud83e\udd39",
-    "woman_juggling": "\ud83e\udd39\u200d\u2640\ufe0f",
-    "woman_juggling_tone1": "\ud83e\udd39\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_juggling_light_skin_tone": "\ud83e\udd39\ud83c\udffb\u200d\u2640\ufe0f",
-    "woman_juggling_tone2": "\ud83e\udd39\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_juggling_medium_light_skin_tone": "\ud83e\udd39\ud83c\udffc\u200d\u2640\ufe0f",
-    "woman_juggling_tone3": "\ud83e\udd39\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_juggling_medium_skin_tone": "\ud83e\udd39\ud83c\udffd\u200d\u2640\ufe0f",
-    "woman_juggling_tone4": "\ud83e\udd39\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_juggling_medium_dark_skin_tone": "\ud83e\udd39\ud83c\udffe\u200d\u2640\ufe0f",
-    "woman_juggling_tone5": "\ud83e\udd39\ud83c\udfff\u200d\u2640\ufe0f",
-    "woman_juggling_dark_skin_tone": "\ud83e\udd39\ud83c\udfff\u200d\u2640\ufe0f",
-    "man_juggling": "\ud83e\udd39\u200d\u2642\ufe0f",
-    "man_juggling_tone1": "\ud83e\udd39\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_juggling_light_skin_tone": "\ud83e\udd39\ud83c\udffb\u200d\u2642\ufe0f",
-    "man_juggling_tone2": "\ud83e\udd39\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_juggling_medium_light_skin_tone": "\ud83e\udd39\ud83c\udffc\u200d\u2642\ufe0f",
-    "man_juggling_tone3": "\ud83e\udd39\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_juggling_medium_skin_tone": "\ud83e\udd39\ud83c\udffd\u200d\u2642\ufe0f",
-    "man_juggling_tone4": "\ud83e\udd39\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_juggling_medium_dark_skin_tone": "\ud83e\udd39\ud83c\udffe\u200d\u2642\ufe0f",
-    "man_juggling_tone5": "\ud83e\udd39\ud83c\udfff\u200d\u2642\ufe0f",
-    "man_juggling_dark_skin_tone": "\ud83e\udd39\ud83c\udfff\u200d\u2642\ufe0f",
-    "performing_arts": "\ud83c\udfad",
-    "ballet_shoes": "\ud83e\ude70",
-    "art": "\ud83c\udfa8",
-    "clapper": "\ud83c\udfac",
-    "microphone": "\ud83c\udfa4",
-    "headphones": "\ud83c\udfa7",
-    "musical_score": "\ud83c\udfbc",
-    "musical_keyboard": "\ud83c\udfb9",
-    "drum": "\ud83e\udd41",
-    "drum_with_drumsticks": "\ud83e\udd41",
-    "long_drum": "\ud83e\ude98",
-    "saxophone": "\ud83c\udfb7",
-    "trumpet": "\ud83c\udfba",
-    "guitar": "\ud83c\udfb8",
-    "banjo": "\ud83e\ude95",
-    "violin": "\ud83c\udfbb",
-    "accordion": "\ud83e\ude97",
-    "game_die": "\ud83c\udfb2",
-    "chess_pawn": "\u265f\ufe0f",
-    "dart": "\ud83c\udfaf",
-    "bowling": "\ud83c\udfb3",
-    "video_game": "\ud83c\udfae",
-    "slot_machine": "\ud83c\udfb0",
-    "jigsaw": "\ud83e\udde9",
-    "red_car": "\ud83d\ude97",
-    "taxi": "\ud83d\ude95",
-    "blue_car": "\ud83d\ude99",
-    "pickup_truck": "\ud83d\udefb",
-    "bus": "\ud83d\ude8c",
-    "trolleybus": "\ud83d\ude8e",
-    "race_car": "\ud83c\udfce\ufe0f",
-    "racing_car": "\ud83c\udfce\ufe0f",
-    "police_car": "\ud83d\ude93",
-    "ambulance": "\ud83d\ude91",
-    "fire_engine": "\ud83d\ude92",
-    "minibus": "\ud83d\ude90",
-    "truck": "\ud83d\ude9a",
-    "articulated_lorry": "\ud83d\ude9b",
-    "tractor": "\ud83d\ude9c",
-    "probing_cane": "\ud83e\uddaf",
-    "manual_wheelchair": "\ud83e\uddbd",
-    "motorized_wheelchair": "\ud83e\uddbc",
-    "scooter": "\ud83d\udef4",
-    "bike": "\ud83d\udeb2",
-    "motor_scooter": "\ud83d\udef5",
-    "motorbike": "\ud83d\udef5",
-    "motorcycle": "\ud83c\udfcd\ufe0f",
-    "racing_motorcycle": "\ud83c\udfcd\ufe0f",
-    "auto_rickshaw": "\ud83d\udefa",
-    "rotating_light": "\ud83d\udea8",
-    "oncoming_police_car": "\ud83d\ude94",
-    "oncoming_bus": "\ud83d\ude8d",
-    "oncoming_automobile": "\ud83d\ude98",
-    "oncoming_taxi": "\ud83d\ude96",
-    "aerial_tramway": "\ud83d\udea1",
-    "mountain_cableway": "\ud83d\udea0",
-    "suspension_railway": "\ud83d\ude9f",
-    "railway_car": "\ud83d\ude83",
-    "train": "\ud83d\ude8b",
-    "mountain_railway": "\ud83d\ude9e",
-    "monorail": "\ud83d\ude9d",
-    "bullettrain_side": "\ud83d\ude84",
-    "bullettrain_front": "\ud83d\ude85",
-    "light_rail": "\ud83d\ude88",
-    "steam_locomotive": "\ud83d\ude82",
-    "train2": "\ud83d\ude86",
-    "metro": "\ud83d\ude87",
-    "tram": "\ud83d\ude8a",
-    "station": "\ud83d\ude89",
-    "airplane": "\u2708\ufe0f",
-    "airplane_departure": "\ud83d\udeeb",
-    "airplane_arriving": "\ud83d\udeec",
-    "airplane_small": "\ud83d\udee9\ufe0f",
-    "small_airplane": "\ud83d\udee9\ufe0f",
-    "seat": "\ud83d\udcba",
-    "satellite_orbital": "\ud83d\udef0\ufe0f",
-    "rocket": "\ud83d\ude80",
-    "flying_saucer": "\ud83d\udef8",
-    "helicopter": "\ud83d\ude81",
-    "canoe": "\ud83d\udef6",
-    "kayak": "\ud83d\udef6",
-    "sailboat": "\u26f5",
-    "speedboat": "\ud83d\udea4",
-    "motorboat": "\ud83d\udee5\ufe0f",
-    "cruise_ship": "\ud83d\udef3\ufe0f",
-    "passenger_ship": "\ud83d\udef3\ufe0f",
-    "ferry": "\u26f4\ufe0f",
-    "ship": "\ud83d\udea2",
-    "anchor": "\u2693",
-    "fuelpump": "\u26fd",
-    "construction": "\ud83d\udea7",
-    "vertical_traffic_light": "\ud83d\udea6",
-    "traffic_light": "\ud83d\udea5",
-    "busstop": "\ud83d\ude8f",
-    "map": "\ud83d\uddfa\ufe0f",
-    "world_map": "\ud83d\uddfa\ufe0f",
-    "moyai": "\ud83d\uddff",
-    "statue_of_liberty": "\ud83d\uddfd",
-    "tokyo_tower": "\ud83d\uddfc",
-    "european_castle": "\ud83c\udff0",
-    "japanese_castle": "\ud83c\udfef",
-    "stadium": "\ud83c\udfdf\ufe0f",
-    "ferris_wheel": "\ud83c\udfa1",
-    "roller_coaster": "\ud83c\udfa2",
-    "carousel_horse": "\ud83c\udfa0",
-    "fountain": "\u26f2",
-    "beach_umbrella": "\u26f1\ufe0f",
-    "umbrella_on_ground": "\u26f1\ufe0f",
-    "beach": "\ud83c\udfd6\ufe0f",
-    "beach_with_umbrella": "\ud83c\udfd6\ufe0f",
-    "island": "\ud83c\udfdd\ufe0f",
-    "desert_island": "\ud83c\udfdd\ufe0f",
-    "desert": "\ud83c\udfdc\ufe0f",
-    "volcano": "\ud83c\udf0b",
-    "mountain": "\u26f0\ufe0f",
-    "mountain_snow": "\ud83c\udfd4\ufe0f",
-    "snow_capped_mountain": "\ud83c\udfd4\ufe0f",
-    "mount_fuji": "\ud83d\uddfb",
-    "camping": "\ud83c\udfd5\ufe0f",
-    "tent": "\u26fa",
-    "house": "\ud83c\udfe0",
-    "house_with_garden": "\ud83c\udfe1",
-    "homes": "\ud83c\udfd8\ufe0f",
-    "house_buildings": "\ud83c\udfd8\ufe0f",
-    "house_abandoned": "\ud83c\udfda\ufe0f",
-    "derelict_house_building": "\ud83c\udfda\ufe0f",
-    "hut": "\ud83d\uded6",
-    "construction_site": "\ud83c\udfd7\ufe0f",
-    "building_construction": "\ud83c\udfd7\ufe0f",
-    "factory": "\ud83c\udfed",
-    "office": "\ud83c\udfe2",
-    "department_store": "\ud83c\udfec",
-    "post_office": "\ud83c\udfe3",
-    "european_post_office": "\ud83c\udfe4",
-    "hospital": "\ud83c\udfe5",
-    "bank": "\ud83c\udfe6",
-    "hotel": "\ud83c\udfe8",
-    "convenience_store": "\ud83c\udfea",
-    "school": "\ud83c\udfeb",
-    "love_hotel": "\ud83c\udfe9",
-    "wedding": "\ud83d\udc92",
-    "classical_building": "\ud83c\udfdb\ufe0f",
-    "church": "\u26ea",
-    "mosque": "\ud83d\udd4c",
-    "synagogue": "\ud83d\udd4d",
-    "hindu_temple": "\ud83d\uded5",
-    "kaaba": "\ud83d\udd4b",
-    "shinto_shrine": "\u26e9\ufe0f",
-    "railway_track": "\ud83d\udee4\ufe0f",
-    "railroad_track": "\ud83d\udee4\ufe0f",
-    "motorway": "\ud83d\udee3\ufe0f",
-    "japan": "\ud83d\uddfe",
-    "rice_scene": "\ud83c\udf91",
-    "park": "\ud83c\udfde\ufe0f",
-    "national_park": "\ud83c\udfde\ufe0f",
-    "sunrise": "\ud83c\udf05",
-    "sunrise_over_mountains": "\ud83c\udf04",
-    "stars": "\ud83c\udf20",
-    "sparkler": "\ud83c\udf87",
-    "fireworks": "\ud83c\udf86",
-    "city_sunset": "\ud83c\udf07",
-    "city_sunrise": "\ud83c\udf07",
-    "city_dusk": "\ud83c\udf06",
-    "cityscape": "\ud83c\udfd9\ufe0f",
-    "night_with_stars": "\ud83c\udf03",
-    "milky_way": "\ud83c\udf0c",
-    "bridge_at_night": "\ud83c\udf09",
-    "foggy": "\ud83c\udf01",
-    "watch": "\u231a",
-    "mobile_phone": "\ud83d\udcf1",
-    "iphone": "\ud83d\udcf1",
-    "calling": "\ud83d\udcf2",
-    "computer": "\ud83d\udcbb",
-    "keyboard": "\u2328\ufe0f",
-    "desktop": "\ud83d\udda5\ufe0f",
-    "desktop_computer": "\ud83d\udda5\ufe0f",
-    "printer": "\ud83d\udda8\ufe0f",
-    "mouse_three_button": "\ud83d\uddb1\ufe0f",
-    "three_button_mouse": "\ud83d\uddb1\ufe0f",
-    "trackball": "\ud83d\uddb2\ufe0f",
-    "joystick": "\ud83d\udd79\ufe0f",
-    "compression": "\ud83d\udddc\ufe0f",
-    "minidisc": "\ud83d\udcbd",
-    "floppy_disk": "\ud83d\udcbe",
-    "cd": "\ud83d\udcbf",
-    "dvd": "\ud83d\udcc0",
-    "vhs": "\ud83d\udcfc",
-    "camera": "\ud83d\udcf7",
-    "camera_with_flash": "\ud83d\udcf8",
-    "video_camera": "\ud83d\udcf9",
-    "movie_camera": "\ud83c\udfa5",
-    "projector": "\ud83d\udcfd\ufe0f",
-    "film_projector": "\ud83d\udcfd\ufe0f",
-    "film_frames": "\ud83c\udf9e\ufe0f",
-    "telephone_receiver": "\ud83d\udcde",
-    "telephone": "\u260e\ufe0f",
-    "pager": "\ud83d\udcdf",
-    "fax": "\ud83d\udce0",
-    "tv": "\ud83d\udcfa",
-    "radio": "\ud83d\udcfb",
-    "microphone2": "\ud83c\udf99\ufe0f",
-    "studio_microphone": "\ud83c\udf99\ufe0f",
-    "level_slider": "\ud83c\udf9a\ufe0f",
-    "control_knobs": "\ud83c\udf9b\ufe0f",
-    "compass": "\ud83e\udded",
-    "stopwatch": "\u23f1\ufe0f",
-    "timer": "\u23f2\ufe0f",
-    "timer_clock": "\u23f2\ufe0f",
-    "alarm_clock": "\u23f0",
-    "clock": "\ud83d\udd70\ufe0f",
-    "mantlepiece_clock": "\ud83d\udd70\ufe0f",
-    "hourglass": "\u231b",
-    "hourglass_flowing_sand": "\u23f3",
-    "satellite": "\ud83d\udce1",
-    "battery": "\ud83d\udd0b",
-    "electric_plug": "\ud83d\udd0c",
-    "bulb": "\ud83d\udca1",
-    "flashlight": "\ud83d\udd26",
-    "candle": "\ud83d\udd6f\ufe0f",
-    "diya_lamp": "\ud83e\ude94",
-    "fire_extinguisher": "\ud83e\uddef",
-    "oil": "\ud83d\udee2\ufe0f",
-    "oil_drum": "\ud83d\udee2\ufe0f",
-    "money_with_wings": "\ud83d\udcb8",
-    "dollar": "\ud83d\udcb5",
-    "yen": "\ud83d\udcb4",
-    "euro": "\ud83d\udcb6",
-    "pound": "\ud83d\udcb7",
-    "coin": "\ud83e\ude99",
-    "moneybag": "\ud83d\udcb0",
-    "credit_card": "\ud83d\udcb3",
-    "gem": "\ud83d\udc8e",
-    "scales": "\u2696\ufe0f",
-    "ladder": "\ud83e\ude9c",
-    "toolbox": "\ud83e\uddf0",
-    "screwdriver": "\ud83e\ude9b",
-    "wrench": "\ud83d\udd27",
-    "hammer": "\ud83d\udd28",
-    "hammer_pick": "\u2692\ufe0f",
-    "hammer_and_pick": "\u2692\ufe0f",
-    "tools": "\ud83d\udee0\ufe0f",
-    "hammer_and_wrench": "\ud83d\udee0\ufe0f",
-    "pick": "\u26cf\ufe0f",
-    "nut_and_bolt": "\ud83d\udd29",
-    "gear": "\u2699\ufe0f",
-    "bricks": "\ud83e\uddf1",
-    "chains": "\u26d3\ufe0f",
-    "hook": "\ud83e\ude9d",
-    "knot": "\ud83e\udea2",
-    "magnet": "\ud83e\uddf2",
-    "gun": "\ud83d\udd2b",
-    "bomb": "\ud83d\udca3",
-    "firecracker": "\ud83e\udde8",
-    "axe": "\ud83e\ude93",
-    "carpentry_saw": "\ud83e\ude9a",
-    "knife": "\ud83d\udd2a",
-    "dagger": "\ud83d\udde1\ufe0f",
-    "dagger_knife": "\ud83d\udde1\ufe0f",
-    "crossed_swords": "\u2694\ufe0f",
-    "shield": "\ud83d\udee1\ufe0f",
-    "smoking": "\ud83d\udeac",
-    "coffin": "\u26b0\ufe0f",
-    "headstone": "\ud83e\udea6",
-    "urn": "\u26b1\ufe0f",
-    "funeral_urn": "\u26b1\ufe0f",
-    "amphora": "\ud83c\udffa",
-    "magic_wand": "\ud83e\ude84",
-    "crystal_ball": "\ud83d\udd2e",
-    "prayer_beads": "\ud83d\udcff",
-    "nazar_amulet": "\ud83e\uddff",
-    "barber": "\ud83d\udc88",
-    "alembic": "\u2697\ufe0f",
-    "telescope": "\ud83d\udd2d",
-    "microscope": "\ud83d\udd2c",
-    "hole": "\ud83d\udd73\ufe0f",
-    "window": "\ud83e\ude9f",
-    "adhesive_bandage": "\ud83e\ude79",
-    "stethoscope": "\ud83e\ude7a",
-    "pill": "\ud83d\udc8a",
-    "syringe": "\ud83d\udc89",
-    "drop_of_blood": "\ud83e\ude78",
-    "dna": "\ud83e\uddec",
-    "microbe": "\ud83e\udda0",
-    "petri_dish": "\ud83e\uddeb",
-    "test_tube": "\ud83e\uddea",
-    "thermometer": "\ud83c\udf21\ufe0f",
-    "mouse_trap": "\ud83e\udea4",
-    "broom": "\ud83e\uddf9",
-    "basket": "\ud83e\uddfa",
-    "sewing_needle": "\ud83e\udea1",
-    "roll_of_paper": "\ud83e\uddfb",
-    "toilet": "\ud83d\udebd",
-    "plunger": "\ud83e\udea0",
-    "bucket": "\ud83e\udea3",
-    "potable_water": "\ud83d\udeb0",
-    "shower": "\ud83d\udebf",
-    "bathtub": "\ud83d\udec1",
-    "bath": "\ud83d\udec0",
-    "bath_tone1": "\ud83d\udec0\ud83c\udffb",
-    "bath_tone2": "\ud83d\udec0\ud83c\udffc",
-    "bath_tone3": "\ud83d\udec0\ud83c\udffd",
-    "bath_tone4": "\ud83d\udec0\ud83c\udffe",
-    "bath_tone5": "\ud83d\udec0\ud83c\udfff",
-    "toothbrush": "\ud83e\udea5",
-    "soap": "\ud83e\uddfc",
-    "razor": "\ud83e\ude92",
-    "sponge": "\ud83e\uddfd",
-    "squeeze_bottle": "\ud83e\uddf4",
-    "bellhop": "\ud83d\udece\ufe0f",
-    "bellhop_bell": "\ud83d\udece\ufe0f",
-    "key": "\ud83d\udd11",
-    "key2": "\ud83d\udddd\ufe0f",
-    "old_key": "\ud83d\udddd\ufe0f",
-    "door": "\ud83d\udeaa",
-    "chair": "\ud83e\ude91",
-    "mirror": "\ud83e\ude9e",
-    "couch": "\ud83d\udecb\ufe0f",
-    "couch_and_lamp": "\ud83d\udecb\ufe0f",
-    "bed": "\ud83d\udecf\ufe0f",
-    "sleeping_accommodation": "\ud83d\udecc",
-    "person_in_bed_tone1": "\ud83d\udecc\ud83c\udffb",
-    "person_in_bed_light_skin_tone": "\ud83d\udecc\ud83c\udffb",
-    "person_in_bed_tone2": "\ud83d\udecc\ud83c\udffc",
-    "person_in_bed_medium_light_skin_tone": "\ud83d\udecc\ud83c\udffc",
-    "person_in_bed_tone3": "\ud83d\udecc\ud83c\udffd",
-    "person_in_bed_medium_skin_tone": "\ud83d\udecc\ud83c\udffd",
-    "person_in_bed_tone4": "\ud83d\udecc\ud83c\udffe",
-    "person_in_bed_medium_dark_skin_tone": "\ud83d\udecc\ud83c\udffe",
-    "person_in_bed_tone5": "\ud83d\udecc\ud83c\udfff",
-    "person_in_bed_dark_skin_tone": "\ud83d\udecc\ud83c\udfff",
-    "teddy_bear": "\ud83e\uddf8",
-    "frame_photo": "\ud83d\uddbc\ufe0f",
-    "frame_with_picture": "\ud83d\uddbc\ufe0f",
-    "shopping_bags": "\ud83d\udecd\ufe0f",
-    "shopping_cart": "\ud83d\uded2",
-    "shopping_trolley": "\ud83d\uded2",
-    "gift": "\ud83c\udf81",
-    "balloon": "\ud83c\udf88",
-    "flags": "\ud83c\udf8f",
-    "ribbon": "\ud83c\udf80",
-    "confetti_ball": "\ud83c\udf8a",
-    "tada": "\ud83c\udf89",
-    "pi\u00f1ata": "\ud83e\ude85",
-    "nesting_dolls": "\ud83e\ude86",
-    "dolls": "\ud83c\udf8e",
-    "izakaya_lantern": "\ud83c\udfee",
-    "wind_chime": "\ud83c\udf90",
-    "red_envelope": "\ud83e\udde7",
-    "envelope": "\u2709\ufe0f",
-    "envelope_with_arrow": "\ud83d\udce9",
-    "incoming_envelope": "\ud83d\udce8",
-    "e_mail": "\ud83d\udce7",
-    "email": "\ud83d\udce7",
-    "love_letter": "\ud83d\udc8c",
-    "inbox_tray": "\ud83d\udce5",
-    "outbox_tray": "\ud83d\udce4",
-    "package": "\ud83d\udce6",
-    "label": "\ud83c\udff7\ufe0f",
-    "mailbox_closed": "\ud83d\udcea",
-    "mailbox": "\ud83d\udceb",
-    "mailbox_with_mail": "\ud83d\udcec",
-    "mailbox_with_no_mail": "\ud83d\udced",
-    "postbox": "\ud83d\udcee",
-    "postal_horn": "\ud83d\udcef",
-    "placard": "\ud83e\udea7",
-    "scroll": "\ud83d\udcdc",
-    "page_with_curl": "\ud83d\udcc3",
-    "page_facing_up": "\ud83d\udcc4",
-    "bookmark_tabs": "\ud83d\udcd1",
-    "receipt": "\ud83e\uddfe",
-    "bar_chart": "\ud83d\udcca",
-    "chart_with_upwards_trend": "\ud83d\udcc8",
-    "chart_with_downwards_trend": "\ud83d\udcc9",
-    "notepad_spiral": "\ud83d\uddd2\ufe0f",
-    "spiral_note_pad": "\ud83d\uddd2\ufe0f",
-    "calendar_spiral": "\ud83d\uddd3\ufe0f",
-    "spiral_calendar_pad": "\ud83d\uddd3\ufe0f",
-    "calendar": "\ud83d\udcc6",
-    "date": "\ud83d\udcc5",
-    "wastebasket": "\ud83d\uddd1\ufe0f",
-    "card_index": "\ud83d\udcc7",
-    "card_box": "\ud83d\uddc3\ufe0f",
-    "card_file_box": "\ud83d\uddc3\ufe0f",
-    "ballot_box": "\ud83d\uddf3\ufe0f",
-    "ballot_box_with_ballot": "\ud83d\uddf3\ufe0f",
-    "file_cabinet": "\ud83d\uddc4\ufe0f",
-    "clipboard": "\ud83d\udccb",
-    "file_folder": "\ud83d\udcc1",
-    "open_file_folder": "\ud83d\udcc2",
-    "dividers": "\ud83d\uddc2\ufe0f",
-    "card_index_dividers": "\ud83d\uddc2\ufe0f",
-    "newspaper2": "\ud83d\uddde\ufe0f",
-    "rolled_up_newspaper": "\ud83d\uddde\ufe0f",
-    "newspaper": "\ud83d\udcf0",
-    "notebook": "\ud83d\udcd3",
-    "notebook_with_decorative_cover": "\ud83d\udcd4",
-    "ledger": "\ud83d\udcd2",
-    "closed_book": "\ud83d\udcd5",
-    "green_book": "\ud83d\udcd7",
-    "blue_book": "\ud83d\udcd8",
-    "orange_book": "\ud83d\udcd9",
-    "books": "\ud83d\udcda",
-    "book": "\ud83d\udcd6",
-    "bookmark": "\ud83d\udd16",
-    "safety_pin": "\ud83e\uddf7",
-    "link": "\ud83d\udd17",
-    "paperclip": "\ud83d\udcce",
-    "paperclips": "\ud83d\udd87\ufe0f",
-    "linked_paperclips": "\ud83d\udd87\ufe0f",
-    "triangular_ruler": "\ud83d\udcd0",
-    "straight_ruler": "\ud83d\udccf",
-    "abacus": "\ud83e\uddee",
-    "pushpin": "\ud83d\udccc",
-    "round_pushpin": "\ud83d\udccd",
-    "scissors": "\u2702\ufe0f",
-    "pen_ballpoint": "\ud83d\udd8a\ufe0f",
-    "lower_left_ballpoint_pen": "\ud83d\udd8a\ufe0f",
-    "pen_fountain": "\ud83d\udd8b\ufe0f",
-    "lower_left_fountain_pen": "\ud83d\udd8b\ufe0f",
-    "black_nib": "\u2712\ufe0f",
-    "paintbrush": "\ud83d\udd8c\ufe0f",
-    "lower_left_paintbrush": "\ud83d\udd8c\ufe0f",
-    "crayon": "\ud83d\udd8d\ufe0f",
-    "lower_left_crayon": "\ud83d\udd8d\ufe0f",
-    "pencil": "\ud83d\udcdd",
-    "memo": "\ud83d\udcdd",
-    "pencil2": "\u270f\ufe0f",
-    "mag": "\ud83d\udd0d",
-    "mag_right": "\ud83d\udd0e",
-    "lock_with_ink_pen": "\ud83d\udd0f",
-    "closed_lock_with_key": "\ud83d\udd10",
-    "lock": "\ud83d\udd12",
-    "unlock": "\ud83d\udd13",
-    "heart": "\u2764\ufe0f",
-    "orange_heart": "\ud83e\udde1",
-    "yellow_heart": "\ud83d\udc9b",
-    "green_heart": "\ud83d\udc9a",
-    "blue_heart": "\ud83d\udc99",
-    "purple_heart": "\ud83d\udc9c",
-    "black_heart": "\ud83d\udda4",
-    "brown_heart": "\ud83e\udd0e",
-    "white_heart": "\ud83e\udd0d",
-    "broken_heart": "\ud83d\udc94",
-    "heart_exclamation": "\u2763\ufe0f",
-    "heavy_heart_exclamation_mark_ornament": "\u2763\ufe0f",
-    "two_hearts": "\ud83d\udc95",
-    "revolving_hearts": "\ud83d\udc9e",
-    "heartbeat": "\ud83d\udc93",
-    "heartpulse": "\ud83d\udc97",
-    "sparkling_heart": "\ud83d\udc96",
-    "cupid": "\ud83d\udc98",
-    "gift_heart": "\ud83d\udc9d",
-    "heart_decoration": "\ud83d\udc9f",
-    "peace": "\u262e\ufe0f",
-    "peace_symbol": "\u262e\ufe0f",
-    "cross": "\u271d\ufe0f",
-    "latin_cross": "\u271d\ufe0f",
-    "star_and_crescent": "\u262a\ufe0f",
-    "om_symbol": "\ud83d\udd49\ufe0f",
-    "wheel_of_dharma": "\u2638\ufe0f",
-    "star_of_david": "\u2721\ufe0f",
-    "six_pointed_star": "\ud83d\udd2f",
-    "menorah": "\ud83d\udd4e",
-    "yin_yang": "\u262f\ufe0f",
-    "orthodox_cross": "\u2626\ufe0f",
-    "place_of_worship": "\ud83d\uded0",
-    "worship_symbol": "\ud83d\uded0",
-    "ophiuchus": "\u26ce",
-    "aries": "\u2648",
-    "taurus": "\u2649",
-    "gemini": "\u264a",
-    "cancer": "\u264b",
-    "leo": "\u264c",
-    "virgo": "\u264d",
-    "libra": "\u264e",
-    "scorpius": "\u264f",
-    "sagittarius": "\u2650",
-    "capricorn": "\u2651",
-    "aquarius": "\u2652",
-    "pisces": "\u2653",
-    "id": "\ud83c\udd94",
-    "atom": "\u269b\ufe0f",
-    "atom_symbol": "\u269b\ufe0f",
-    "accept": "\ud83c\ude51",
-    "radioactive": "\u2622\ufe0f",
-    "radioactive_sign": "\u2622\ufe0f",
-    "biohazard": "\u2623\ufe0f",
-    "biohazard_sign": "\u2623\ufe0f",
-    "mobile_phone_off": "\ud83d\udcf4",
-    "vibration_mode": "\ud83d\udcf3",
-    "u6709": "\ud83c\ude36",
-    "u7121": "\ud83c\ude1a",
-    "u7533": "\ud83c\ude38",
-    "u55b6": "\ud83c\ude3a",
-    "u6708": "\ud83c\ude37\ufe0f",
-    "eight_pointed_black_star": "\u2734\ufe0f",
-    "vs": "\ud83c\udd9a",
-    "white_flower": "\ud83d\udcae",
-    "ideograph_advantage": "\ud83c\ude50",
-    "secret": "\u3299\ufe0f",
-    "congratulations": "\u3297\ufe0f",
-    "u5408": "\ud83c\ude34",
-    "u6e80": "\ud83c\ude35",
-    "u5272": "\ud83c\ude39",
-    "u7981": "\ud83c\ude32",
-    "a": "\ud83c\udd70\ufe0f",
-    "b": "\ud83c\udd71\ufe0f",
-    "ab": "\ud83c\udd8e",
-    "cl": "\ud83c\udd91",
-    "o2": "\ud83c\udd7e\ufe0f",
-    "sos": "\ud83c\udd98",
-    "x": "\u274c",
-    "o": "\u2b55",
-    "octagonal_sign": "\ud83d\uded1",
-    "stop_sign": "\ud83d\uded1",
-    "no_entry": "\u26d4",
-    "name_badge": "\ud83d\udcdb",
-    "no_entry_sign": "\ud83d\udeab",
-    "100": "\ud83d\udcaf",
-    "anger": "\ud83d\udca2",
-    "hotsprings": "\u2668\ufe0f",
-    "no_pedestrians": "\ud83d\udeb7",
-    "do_not_litter": "\ud83d\udeaf",
-    "no_bicycles": "\ud83d\udeb3",
-    "non_potable_water": "\ud83d\udeb1",
-    "underage": "\ud83d\udd1e",
-    "no_mobile_phones": "\ud83d\udcf5",
-    "no_smoking": "\ud83d\udead",
-    "exclamation": "\u2757",
-    "grey_exclamation": "\u2755",
-    "question": "\u2753",
-    "grey_question": "\u2754",
-    "bangbang": "\u203c\ufe0f",
-    "interrobang": "\u2049\ufe0f",
-    "low_brightness": "\ud83d\udd05",
-    "high_brightness": "\ud83d\udd06",
-    "part_alternation_mark": "\u303d\ufe0f",
-    "warning": "\u26a0\ufe0f",
-    "children_crossing": "\ud83d\udeb8",
-    "trident": "\ud83d\udd31",
-    "fleur_de_lis": "\u269c\ufe0f",
-    "beginner": "\ud83d\udd30",
-    "recycle": "\u267b\ufe0f",
-    "white_check_mark": "\u2705",
-    "u6307": "\ud83c\ude2f",
-    "chart": "\ud83d\udcb9",
-    "sparkle": "\u2747\ufe0f",
-    "eight_spoked_asterisk": "\u2733\ufe0f",
-    "negative_squared_cross_mark": "\u274e",
-    "globe_with_meridians": "\ud83c\udf10",
-    "diamond_shape_with_a_dot_inside": "\ud83d\udca0",
-    "m": "\u24c2\ufe0f",
-    "cyclone": "\ud83c\udf00",
-    "zzz": "\ud83d\udca4",
-    "atm": "\ud83c\udfe7",
-    "wc": "\ud83d\udebe",
-    "wheelchair": "\u267f",
-    "parking": "\ud83c\udd7f\ufe0f",
-    "u7a7a": "\ud83c\ude33",
-    "sa": "\ud83c\ude02\ufe0f",
-    "passport_control": "\ud83d\udec2",
-    "customs": "\ud83d\udec3",
-    "baggage_claim": "\ud83d\udec4",
-    "left_luggage": "\ud83d\udec5",
-    "elevator": "\ud83d\uded7",
-    "mens": "\ud83d\udeb9",
-    "womens": "\ud83d\udeba",
-    "baby_symbol": "\ud83d\udebc",
-    "restroom": "\ud83d\udebb",
-    "put_litter_in_its_place": "\ud83d\udeae",
-    "cinema": "\ud83c\udfa6",
-    "signal_strength": "\ud83d\udcf6",
-    "koko": "\ud83c\ude01",
-    "symbols": "\ud83d\udd23",
-    "information_source": "\u2139\ufe0f",
-    "abc": "\ud83d\udd24",
-    "abcd": "\ud83d\udd21",
-    "capital_abcd": "\ud83d\udd20",
-    "ng": "\ud83c\udd96",
-    "ok": "\ud83c\udd97",
-    "up": "\ud83c\udd99",
-    "cool": "\ud83c\udd92",
-    "new": "\ud83c\udd95",
-    "free": "\ud83c\udd93",
-    "zero": "0\ufe0f\u20e3",
-    "one": "1\ufe0f\u20e3",
-    "two": "2\ufe0f\u20e3",
-    "three": "3\ufe0f\u20e3",
-    "four": "4\ufe0f\u20e3",
-    "five": "5\ufe0f\u20e3",
-    "six": "6\ufe0f\u20e3",
-    "seven": "7\ufe0f\u20e3",
-    "eight": "8\ufe0f\u20e3",
-    "nine": "9\ufe0f\u20e3",
-    "keycap_ten": "\ud83d\udd1f",
-    "1234": "\ud83d\udd22",
-    "hash": "#\ufe0f\u20e3",
-    "asterisk": "*\ufe0f\u20e3",
-    "keycap_asterisk": "*\ufe0f\u20e3",
-    "eject": "\u23cf\ufe0f",
-    "eject_symbol": "\u23cf\ufe0f",
-    "arrow_forward": "\u25b6\ufe0f",
-    "pause_button": "\u23f8\ufe0f",
-    "double_vertical_bar": "\u23f8\ufe0f",
-    "play_pause": "\u23ef\ufe0f",
-    "stop_button": "\u23f9\ufe0f",
-    "record_button": "\u23fa\ufe0f",
-    "track_next": "\u23ed\ufe0f",
-    "next_track": "\u23ed\ufe0f",
-    "track_previous": "\u23ee\ufe0f",
-    "previous_track": "\u23ee\ufe0f",
-    "fast_forward": "\u23e9",
-    "rewind": "\u23ea",
-    "arrow_double_up": "\u23eb",
-    "arrow_double_down": "\u23ec",
-    "arrow_backward": "\u25c0\ufe0f",
-    "arrow_up_small": "\ud83d\udd3c",
-    "arrow_down_small": "\ud83d\udd3d",
-    "arrow_right": "\u27a1\ufe0f",
-    "arrow_left": "\u2b05\ufe0f",
-    "arrow_up": "\u2b06\ufe0f",
-    "arrow_down": "\u2b07\ufe0f",
-    "arrow_upper_right": "\u2197\ufe0f",
-    "arrow_lower_right": "\u2198\ufe0f",
-    "arrow_lower_left": "\u2199\ufe0f",
-    "arrow_upper_left": "\u2196\ufe0f",
-    "arrow_up_down": "\u2195\ufe0f",
-    "left_right_arrow": "\u2194\ufe0f",
-    "arrow_right_hook": "\u21aa\ufe0f",
-    "leftwards_arrow_with_hook": "\u21a9\ufe0f",
-    "arrow_heading_up": "\u2934\ufe0f",
-    "arrow_heading_down": "\u2935\ufe0f",
-    "twisted_rightwards_arrows": "\ud83d\udd00",
-    "repeat": "\ud83d\udd01",
-    "repeat_one": "\ud83d\udd02",
-    "arrows_counterclockwise": "\ud83d\udd04",
-    "arrows_clockwise": "\ud83d\udd03",
-    "musical_note": "\ud83c\udfb5",
-    "notes": "\ud83c\udfb6",
-    "heavy_plus_sign": "\u2795",
-    "heavy_minus_sign": "\u2796",
-    "heavy_division_sign": "\u2797",
-    "heavy_multiplication_x": "\u2716\ufe0f",
-    "infinity": "\u267e\ufe0f",
-    "heavy_dollar_sign": "\ud83d\udcb2",
-    "currency_exchange": "\ud83d\udcb1",
-    "tm": "\u2122\ufe0f",
-    "copyright": "\u00a9\ufe0f",
-    "registered": "\u00ae\ufe0f",
-    "wavy_dash": "\u3030\ufe0f",
-    "curly_loop": "\u27b0",
-    "loop": "\u27bf",
-    "end": "\ud83d\udd1a",
-    "back": "\ud83d\udd19",
-    "on": "\ud83d\udd1b",
-    "top": "\ud83d\udd1d",
-    "soon": "\ud83d\udd1c",
-    "heavy_check_mark": "\u2714\ufe0f",
-    "ballot_box_with_check": "\u2611\ufe0f",
-    "radio_button": "\ud83d\udd18",
-    "white_circle": "\u26aa",
-    "black_circle": "\u26ab",
-    "red_circle": "\ud83d\udd34",
-    "blue_circle": "\ud83d\udd35",
-    "brown_circle": "\ud83d\udfe4",
-    "purple_circle": "\ud83d\udfe3",
-    "green_circle": "\ud83d\udfe2",
-    "yellow_circle": "\ud83d\udfe1",
-    "orange_circle": "\ud83d\udfe0",
-    "small_red_triangle": "\ud83d\udd3a",
-    "small_red_triangle_down": "\ud83d\udd3b",
-    "small_orange_diamond": "\ud83d\udd38",
-    "small_blue_diamond": "\ud83d\udd39",
-    "large_orange_diamond": "\ud83d\udd36",
-    "large_blue_diamond": "\ud83d\udd37",
-    "white_square_button": "\ud83d\udd33",
-    "black_square_button": "\ud83d\udd32",
-    "black_small_square": "\u25aa\ufe0f",
-    "white_small_square": "\u25ab\ufe0f",
-    "black_medium_small_square": "\u25fe",
-    "white_medium_small_square": "\u25fd",
-    "black_medium_square": "\u25fc\ufe0f",
-    "white_medium_square": "\u25fb\ufe0f",
-    "black_large_square": "\u2b1b",
-    "white_large_square": "\u2b1c",
-    "orange_square": "\ud83d\udfe7",
-    "blue_square": "\ud83d\udfe6",
-    "red_square": "\ud83d\udfe5",
-    "brown_square": "\ud83d\udfeb",
-    "purple_square": "\ud83d\udfea",
-    "green_square": "\ud83d\udfe9",
-    "yellow_square": "\ud83d\udfe8",
-    "speaker": "\ud83d\udd08",
-    "mute": "\ud83d\udd07",
-    "sound": "\ud83d\udd09",
-    "loud_sound": "\ud83d\udd0a",
-    "bell": "\ud83d\udd14",
-    "no_bell": "\ud83d\udd15",
-    "mega": "\ud83d\udce3",
-    "loudspeaker": "\ud83d\udce2",
-    "speech_left": "\ud83d\udde8\ufe0f",
-    "left_speech_bubble": "\ud83d\udde8\ufe0f",
-    "eye_in_speech_bubble": "\ud83d\udc41\u200d\ud83d\udde8",
-    "speech_balloon": "\ud83d\udcac",
-    "thought_balloon": "\ud83d\udcad",
-    "anger_right": "\ud83d\uddef\ufe0f",
-    "right_anger_bubble": "\ud83d\uddef\ufe0f",
-    "spades": "\u2660\ufe0f",
-    "clubs": "\u2663\ufe0f",
-    "hearts": "\u2665\ufe0f",
-    "diamonds": "\u2666\ufe0f",
-    "black_joker": "\ud83c\udccf",
-    "flower_playing_cards": "\ud83c\udfb4",
-    "mahjong": "\ud83c\udc04",
-    "clock1": "\ud83d\udd50",
-    "clock2": "\ud83d\udd51",
-    "clock3": "\ud83d\udd52",
-    "clock4": "\ud83d\udd53",
-    "clock5": "\ud83d\udd54",
-    "clock6": "\ud83d\udd55",
-    "clock7": "\ud83d\udd56",
-    "clock8": "\ud83d\udd57",
-    "clock9": "\ud83d\udd58",
-    "clock10": "\ud83d\udd59",
-    "clock11": "\ud83d\udd5a",
-    "clock12": "\ud83d\udd5b",
-    "clock130": "\ud83d\udd5c",
-    "clock230": "\ud83d\udd5d",
-    "clock330": "\ud83d\udd5e",
-    "clock430": "\ud83d\udd5f",
-    "clock530": "\ud83d\udd60",
-    "clock630": "\ud83d\udd61",
-    "clock730": "\ud83d\udd62",
-    "clock830": "\ud83d\udd63",
-    "clock930": "\ud83d\udd64",
-    "clock1030": "\ud83d\udd65",
-    "clock1130": "\ud83d\udd66",
-    "clock1230": "\ud83d\udd67",
-    "female_sign": "\u2640\ufe0f",
-    "male_sign": "\u2642\ufe0f",
-    "transgender_symbol": "\u26a7",
-    "medical_symbol": "\u2695\ufe0f",
-    "regional_indicator_z": "\ud83c\uddff",
-    "regional_indicator_y": "\ud83c\uddfe",
-    "regional_indicator_x": "\ud83c\uddfd",
-    "regional_indicator_w": "\ud83c\uddfc",
-    "regional_indicator_v": "\ud83c\uddfb",
-    "regional_indicator_u": "\ud83c\uddfa",
-    "regional_indicator_t": "\ud83c\uddf9",
-    "regional_indicator_s": "\ud83c\uddf8",
-    "regional_indicator_r": "\ud83c\uddf7",
-    "regional_indicator_q": "\ud83c\uddf6",
-    "regional_indicator_p": "\ud83c\uddf5",
-    "regional_indicator_o": "\ud83c\uddf4",
-    "regional_indicator_n": "\ud83c\uddf3",
-    "regional_indicator_m": "\ud83c\uddf2",
-    "regional_indicator_l": "\ud83c\uddf1",
-    "regional_indicator_k": "\ud83c\uddf0",
-    "regional_indicator_j": "\ud83c\uddef",
-    "regional_indicator_i": "\ud83c\uddee",
-    "regional_indicator_h": "\ud83c\udded",
-    "regional_indicator_g": "\ud83c\uddec",
-    "regional_indicator_f": "\ud83c\uddeb",
-    "regional_indicator_e": "\ud83c\uddea",
-    "regional_indicator_d": "\ud83c\udde9",
-    "regional_indicator_c": "\ud83c\udde8",
-    "regional_indicator_b": "\ud83c\udde7",
-    "regional_indicator_a": "\ud83c\udde6",
-    "flag_white": "\ud83c\udff3\ufe0f",
-    "flag_black": "\ud83c\udff4",
-    "checkered_flag": "\ud83c\udfc1",
-    "triangular_flag_on_post": "\ud83d\udea9",
-    "rainbow_flag": "\ud83c\udff3\ufe0f\u200d\ud83c\udf08",
-    "gay_pride_flag": "\ud83c\udff3\ufe0f\u200d\ud83c\udf08",
-    "transgender_flag": "\ud83c\udff3\ufe0f\u200d\u26a7\ufe0f",
-    "pirate_flag": "\ud83c\udff4\u200d\u2620\ufe0f",
-    "flag_af": "\ud83c\udde6\ud83c\uddeb",
-    "flag_ax": "\ud83c\udde6\ud83c\uddfd",
-    "flag_al": "\ud83c\udde6\ud83c\uddf1",
-    "flag_dz": "\ud83c\udde9\ud83c\uddff",
-    "flag_as": "\ud83c\udde6\ud83c\uddf8",
-    "flag_ad": "\ud83c\udde6\ud83c\udde9",
-    "flag_ao": "\ud83c\udde6\ud83c\uddf4",
-    "flag_ai": "\ud83c\udde6\ud83c\uddee",
-    "flag_aq": "\ud83c\udde6\ud83c\uddf6",
-    "flag_ag": "\ud83c\udde6\ud83c\uddec",
-    "flag_ar": "\ud83c\udde6\ud83c\uddf7",
-    "flag_am": "\ud83c\udde6\ud83c\uddf2",
-    "flag_aw": "\ud83c\udde6\ud83c\uddfc",
-    "flag_au": "\ud83c\udde6\ud83c\uddfa",
-    "flag_at": "\ud83c\udde6\ud83c\uddf9",
-    "flag_az": "\ud83c\udde6\ud83c\uddff",
-    "flag_bs": "\ud83c\udde7\ud83c\uddf8",
-    "flag_bh": "\ud83c\udde7\ud83c\udded",
-    "flag_bd": "\ud83c\udde7\ud83c\udde9",
-    "flag_bb": "\ud83c\udde7\ud83c\udde7",
-    "flag_by": "\ud83c\udde7\ud83c\uddfe",
-    "flag_be": "\ud83c\udde7\ud83c\uddea",
-    "flag_bz": "\ud83c\udde7\ud83c\uddff",
-    "flag_bj": "\ud83c\udde7\ud83c\uddef",
-    "flag_bm": "\ud83c\udde7\ud83c\uddf2",
-    "flag_bt": "\ud83c\udde7\ud83c\uddf9",
-    "flag_bo": "\ud83c\udde7\ud83c\uddf4",
-    "flag_ba": "\ud83c\udde7\ud83c\udde6",
-    "flag_bw": "\ud83c\udde7\ud83c\uddfc",
-    "flag_br": "\ud83c\udde7\ud83c\uddf7",
-    "flag_io": "\ud83c\uddee\ud83c\uddf4",
-    "flag_vg": "\ud83c\uddfb\ud83c\uddec",
-    "flag_bn": "\ud83c\udde7\ud83c\uddf3",
-    "flag_bg": "\ud83c\udde7\ud83c\uddec",
-    "flag_bf": "\ud83c\udde7\ud83c\uddeb",
-    "flag_bi": "\ud83c\udde7\ud83c\uddee",
-    "flag_kh": "\ud83c\uddf0\ud83c\udded",
-    "flag_cm": "\ud83c\udde8\ud83c\uddf2",
-    "flag_ca": "\ud83c\udde8\ud83c\udde6",
-    "flag_ic": "\ud83c\uddee\ud83c\udde8",
-    "flag_cv": "\ud83c\udde8\ud83c\uddfb",
-    "flag_bq": "\ud83c\udde7\ud83c\uddf6",
-    "flag_ky": "\ud83c\uddf0\ud83c\uddfe",
-    "flag_cf": "\ud83c\udde8\ud83c\uddeb",
-    "flag_td": "\ud83c\uddf9\ud83c\udde9",
-    "flag_cl": "\ud83c\udde8\ud83c\uddf1",
-    "flag_cn": "\ud83c\udde8\ud83c\uddf3",
-    "flag_cx": "\ud83c\udde8\ud83c\uddfd",
-    "flag_cc": "\ud83c\udde8\ud83c\udde8",
-    "flag_co": "\ud83c\udde8\ud83c\uddf4",
-    "flag_km": "\ud83c\uddf0\ud83c\uddf2",
-    "flag_cg": "\ud83c\udde8\ud83c\uddec",
-    "flag_cd": "\ud83c\udde8\ud83c\udde9",
-    "flag_ck": "\ud83c\udde8\ud83c\uddf0",
-    "flag_cr": "\ud83c\udde8\ud83c\uddf7",
-    "flag_ci": "\ud83c\udde8\ud83c\uddee",
-    "flag_hr": "\ud83c\udded\ud83c\uddf7",
-    "flag_cu": "\ud83c\udde8\ud83c\uddfa",
-    "flag_cw": "\ud83c\udde8\ud83c\uddfc",
-    "flag_cy": "\ud83c\udde8\ud83c\uddfe",
-    "flag_cz": "\ud83c\udde8\ud83c\uddff",
-    "flag_dk": "\ud83c\udde9\ud83c\uddf0",
-    "flag_dj": "\ud83c\udde9\ud83c\uddef",
-    "flag_dm": "\ud83c\udde9\ud83c\uddf2",
-    "flag_do": "\ud83c\udde9\ud83c\uddf4",
-    "flag_ec": "\ud83c\uddea\ud83c\udde8",
-    "flag_eg": "\ud83c\uddea\ud83c\uddec",
-    "flag_sv": "\ud83c\uddf8\ud83c\uddfb",
-    "flag_gq": "\ud83c\uddec\ud83c\uddf6",
-    "flag_er": "\ud83c\uddea\ud83c\uddf7",
-    "flag_ee": "\ud83c\uddea\ud83c\uddea",
-    "flag_et": "\ud83c\uddea\ud83c\uddf9",
-    "flag_eu": "\ud83c\uddea\ud83c\uddfa",
-    "flag_fk": "\ud83c\uddeb\ud83c\uddf0",
-    "flag_fo": "\ud83c\uddeb\ud83c\uddf4",
-    "flag_fj": "\ud83c\uddeb\ud83c\uddef",
-    "flag_fi": "\ud83c\uddeb\ud83c\uddee",
-    "flag_fr": "\ud83c\uddeb\ud83c\uddf7",
-    "flag_gf": "\ud83c\uddec\ud83c\uddeb",
-    "flag_pf": "\ud83c\uddf5\ud83c\uddeb",
-    "flag_tf": "\ud83c\uddf9\ud83c\uddeb",
-    "flag_ga": "\ud83c\uddec\ud83c\udde6",
-    "flag_gm": "\ud83c\uddec\ud83c\uddf2",
-    "flag_ge": "\ud83c\uddec\ud83c\uddea",
-    "flag_de": "\ud83c\udde9\ud83c\uddea",
-    "flag_gh": "\ud83c\uddec\ud83c\udded",
-    "flag_gi": "\ud83c\uddec\ud83c\uddee",
-    "flag_gr": "\ud83c\uddec\ud83c\uddf7",
-    "flag_gl": "\ud83c\uddec\ud83c\uddf1",
-    "flag_gd": "\ud83c\uddec\ud83c\udde9",
-    "flag_gp": "\ud83c\uddec\ud83c\uddf5",
-    "flag_gu": "\ud83c\uddec\ud83c\uddfa",
-    "flag_gt": "\ud83c\uddec\ud83c\uddf9",
-    "flag_gg": "\ud83c\uddec\ud83c\uddec",
-    "flag_gn": "\ud83c\uddec\ud83c\uddf3",
-    "flag_gw": "\ud83c\uddec\ud83c\uddfc",
-    "flag_gy": "\ud83c\uddec\ud83c\uddfe",
-    "flag_ht": "\ud83c\udded\ud83c\uddf9",
-    "flag_hn": "\ud83c\udded\ud83c\uddf3",
-    "flag_hk": "\ud83c\udded\ud83c\uddf0",
-    "flag_hu": "\ud83c\udded\ud83c\uddfa",
-    "flag_is": "\ud83c\uddee\ud83c\uddf8",
-    "flag_in": "\ud83c\uddee\ud83c\uddf3",
-    "flag_id": "\ud83c\uddee\ud83c\udde9",
-    "flag_ir": "\ud83c\uddee\ud83c\uddf7",
-    "flag_iq": "\ud83c\uddee\ud83c\uddf6",
-    "flag_ie": "\ud83c\uddee\ud83c\uddea",
-    "flag_im": "\ud83c\uddee\ud83c\uddf2",
-    "flag_il": "\ud83c\uddee\ud83c\uddf1",
-    "flag_it": "\ud83c\uddee\ud83c\uddf9",
-    "flag_jm": "\ud83c\uddef\ud83c\uddf2",
-    "flag_jp": "\ud83c\uddef\ud83c\uddf5",
-    "crossed_flags": "\ud83c\udf8c",
-    "flag_je": "\ud83c\uddef\ud83c\uddea",
-    "flag_jo": "\ud83c\uddef\ud83c\uddf4",
-    "flag_kz": "\ud83c\uddf0\ud83c\uddff",
-    "flag_ke": "\ud83c\uddf0\ud83c\uddea",
-    "flag_ki": "\ud83c\uddf0\ud83c\uddee",
-    "flag_xk": "\ud83c\uddfd\ud83c\uddf0",
-    "flag_kw": "\ud83c\uddf0\ud83c\uddfc",
-    "flag_kg": "\ud83c\uddf0\ud83c\uddec",
-    "flag_la": "\ud83c\uddf1\ud83c\udde6",
-    "flag_lv": "\ud83c\uddf1\ud83c\uddfb",
-    "flag_lb": "\ud83c\uddf1\ud83c\udde7",
-    "flag_ls": "\ud83c\uddf1\ud83c\uddf8",
-    "flag_lr": "\ud83c\uddf1\ud83c\uddf7",
-    "flag_ly": "\ud83c\uddf1\ud83c\uddfe",
-    "flag_li": "\ud83c\uddf1\ud83c\uddee",
-    "flag_lt": "\ud83c\uddf1\ud83c\uddf9",
-    "flag_lu": "\ud83c\uddf1\ud83c\uddfa",
-    "flag_mo": "\ud83c\uddf2\ud83c\uddf4",
-    "flag_mk": "\ud83c\uddf2\ud83c\uddf0",
-    "flag_mg": "\ud83c\uddf2\ud83c\uddec",
-    "flag_mw": "\ud83c\uddf2\ud83c\uddfc",
-    "flag_my": "\ud83c\uddf2\ud83c\uddfe",
-    "flag_mv": "\ud83c\uddf2\ud83c\uddfb",
-    "flag_ml": "\ud83c\uddf2\ud83c\uddf1",
-    "flag_mt": "\ud83c\uddf2\ud83c\uddf9",
-    "flag_mh": "\ud83c\uddf2\ud83c\udded",
-    "flag_mq": "\ud83c\uddf2\ud83c\uddf6",
-    "flag_mr": "\ud83c\uddf2\ud83c\uddf7",
-    "flag_mu": "\ud83c\uddf2\ud83c\uddfa",
-    "flag_yt": "\ud83c\uddfe\ud83c\uddf9",
-    "flag_mx": "\ud83c\uddf2\ud83c\uddfd",
-    "flag_fm": "\ud83c\uddeb\ud83c\uddf2",
-    "flag_md": "\ud83c\uddf2\ud83c\udde9",
-    "flag_mc": "\ud83c\uddf2\ud83c\udde8",
-    "flag_mn": "\ud83c\uddf2\ud83c\uddf3",
-    "flag_me": "\ud83c\uddf2\ud83c\uddea",
-    "flag_ms": "\ud83c\uddf2\ud83c\uddf8",
-    "flag_ma": "\ud83c\uddf2\ud83c\udde6",
-    "flag_mz": "\ud83c\uddf2\ud83c\uddff",
-    "flag_mm": "\ud83c\uddf2\ud83c\uddf2",
-    "flag_na": "\ud83c\uddf3\ud83c\udde6",
-    "flag_nr": "\ud83c\uddf3\ud83c\uddf7",
-    "flag_np": "\ud83c\uddf3\ud83c\uddf5",
-    "flag_nl": "\ud83c\uddf3\ud83c\uddf1",
-    "flag_nc": "\ud83c\uddf3\ud83c\udde8",
-    "flag_nz": "\ud83c\uddf3\ud83c\uddff",
-    "flag_ni": "\ud83c\uddf3\ud83c\uddee",
-    "flag_ne": "\ud83c\uddf3\ud83c\uddea",
-    "flag_ng": "\ud83c\uddf3\ud83c\uddec",
-    "flag_nu": "\ud83c\uddf3\ud83c\uddfa",
-    "flag_nf": "\ud83c\uddf3\ud83c\uddeb",
-    "flag_kp": "\ud83c\uddf0\ud83c\uddf5",
-    "flag_mp": "\ud83c\uddf2\ud83c\uddf5",
-    "flag_no": "\ud83c\uddf3\ud83c\uddf4",
-    "flag_om": "\ud83c\uddf4\ud83c\uddf2",
-    "flag_pk": "\ud83c\uddf5\ud83c\uddf0",
-    "flag_pw": "\ud83c\uddf5\ud83c\uddfc",
-    "flag_ps": "\ud83c\uddf5\ud83c\uddf8",
-    "flag_pa": "\ud83c\uddf5\ud83c\udde6",
-    "flag_pg": "\ud83c\uddf5\ud83c\uddec",
-    "flag_py": "\ud83c\uddf5\ud83c\uddfe",
-    "flag_pe": "\ud83c\uddf5\ud83c\uddea",
-    "flag_ph": "\ud83c\uddf5\ud83c\udded",
-    "flag_pn": "\ud83c\uddf5\ud83c\uddf3",
-    "flag_pl": "\ud83c\uddf5\ud83c\uddf1",
-    "flag_pt": "\ud83c\uddf5\ud83c\uddf9",
-    "flag_pr": "\ud83c\uddf5\ud83c\uddf7",
-    "flag_qa": "\ud83c\uddf6\ud83c\udde6",
-    "flag_re": "\ud83c\uddf7\ud83c\uddea",
-    "flag_ro": "\ud83c\uddf7\ud83c\uddf4",
-    "flag_ru": "\ud83c\uddf7\ud83c\uddfa",
-    "flag_rw": "\ud83c\uddf7\ud83c\uddfc",
-    "flag_ws": "\ud83c\uddfc\ud83c\uddf8",
-    "flag_sm": "\ud83c\uddf8\ud83c\uddf2",
-    "flag_st": "\ud83c\uddf8\ud83c\uddf9",
-    "flag_sa": "\ud83c\uddf8\ud83c\udde6",
-    "flag_sn": "\ud83c\uddf8\ud83c\uddf3",
-    "flag_rs": "\ud83c\uddf7\ud83c\uddf8",
-    "flag_sc": "\ud83c\uddf8\ud83c\udde8",
-    "flag_sl": "\ud83c\uddf8\ud83c\uddf1",
-    "flag_sg": "\ud83c\uddf8\ud83c\uddec",
-    "flag_sx": "\ud83c\uddf8\ud83c\uddfd",
-    "flag_sk": "\ud83c\uddf8\ud83c\uddf0",
-    "flag_si": "\ud83c\uddf8\ud83c\uddee",
-    "flag_gs": "\ud83c\uddec\ud83c\uddf8",
-    "flag_sb": "\ud83c\uddf8\ud83c\udde7",
-    "flag_so": "\ud83c\uddf8\ud83c\uddf4",
-    "flag_za": "\ud83c\uddff\ud83c\udde6",
-    "flag_kr": "\ud83c\uddf0\ud83c\uddf7",
-    "flag_ss": "\ud83c\uddf8\ud83c\uddf8",
-    "flag_es": "\ud83c\uddea\ud83c\uddf8",
-    "flag_lk": "\ud83c\uddf1\ud83c\uddf0",
-    "flag_bl": "\ud83c\udde7\ud83c\uddf1",
-    "flag_sh": "\ud83c\uddf8\ud83c\udded",
-    "flag_kn": "\ud83c\uddf0\ud83c\uddf3",
-    "flag_lc": "\ud83c\uddf1\ud83c\udde8",
-    "flag_pm": "\ud83c\uddf5\ud83c\uddf2",
-    "flag_vc": "\ud83c\uddfb\ud83c\udde8",
-    "flag_sd": "\ud83c\uddf8\ud83c\udde9",
-    "flag_sr": "\ud83c\uddf8\ud83c\uddf7",
-    "flag_sz": "\ud83c\uddf8\ud83c\uddff",
-    "flag_se": "\ud83c\uddf8\ud83c\uddea",
-    "flag_ch": "\ud83c\udde8\ud83c\udded",
-    "flag_sy": "\ud83c\uddf8\ud83c\uddfe",
-    "flag_tw": "\ud83c\uddf9\ud83c\uddfc",
-    "flag_tj": "\ud83c\uddf9\ud83c\uddef",
-    "flag_tz": "\ud83c\uddf9\ud83c\uddff",
-    "flag_th": "\ud83c\uddf9\ud83c\udded",
-    "flag_tl": "\ud83c\uddf9\ud83c\uddf1",
-    "flag_tg": "\ud83c\uddf9\ud83c\uddec",
-    "flag_tk": "\ud83c\uddf9\ud83c\uddf0",
-    "flag_to": "\ud83c\uddf9\ud83c\uddf4",
-    "flag_tt": "\ud83c\uddf9\ud83c\uddf9",
-    "flag_tn": "\ud83c\uddf9\ud83c\uddf3",
-    "flag_tr": "\ud83c\uddf9\ud83c\uddf7",
-    "flag_tm": "\ud83c\uddf9\ud83c\uddf2",
-    "flag_tc": "\ud83c\uddf9\ud83c\udde8",
-    "flag_vi": "\ud83c\uddfb\ud83c\uddee",
-    "flag_tv": "\ud83c\uddf9\ud83c\uddfb",
-    "flag_ug": "\ud83c\uddfa\ud83c\uddec",
-    "flag_ua": "\ud83c\uddfa\ud83c\udde6",
-    "flag_ae": "\ud83c\udde6\ud83c\uddea",
-    "flag_gb": "\ud83c\uddec\ud83c\udde7",
-    "england": "\ud83c\udff4\udb40\udc67\udb40\udc62\udb40\udc65\udb40\udc6e\udb40\udc67\udb40\udc7f",
-    "scotland": "\ud83c\udff4\udb40\udc67\udb40\udc62\udb40\udc73\udb40\udc63\udb40\udc74\udb40\udc7f",
-    "wales": "\ud83c\udff4\udb40\udc67\udb40\udc62\udb40\udc77\udb40\udc6c\udb40\udc73\udb40\udc7f",
-    "flag_us": "\ud83c\uddfa\ud83c\uddf8",
-    "flag_uy": "\ud83c\uddfa\ud83c\uddfe",
-    "flag_uz": "\ud83c\uddfa\ud83c\uddff",
-    "flag_vu": "\ud83c\uddfb\ud83c\uddfa",
-    "flag_va": "\ud83c\uddfb\ud83c\udde6",
-    "flag_ve": "\ud83c\uddfb\ud83c\uddea",
-    "flag_vn": "\ud83c\uddfb\ud83c\uddf3",
-    "flag_wf": "\ud83c\uddfc\ud83c\uddeb",
-    "flag_eh": "\ud83c\uddea\ud83c\udded",
-    "flag_ye": "\ud83c\uddfe\ud83c\uddea",
-    "flag_zm": "\ud83c\uddff\ud83c\uddf2",
-    "flag_zw": "\ud83c\uddff\ud83c\uddfc",
-    "flag_ac": "\ud83c\udde6\ud83c\udde8",
-    "flag_bv": "\ud83c\udde7\ud83c\uddfb",
-    "flag_cp": "\ud83c\udde8\ud83c\uddf5",
-    "flag_ea": "\ud83c\uddea\ud83c\udde6",
-    "flag_dg": "\ud83c\udde9\ud83c\uddec",
-    "flag_hm": "\ud83c\udded\ud83c\uddf2",
-    "flag_mf": "\ud83c\uddf2\ud83c\uddeb",
-    "flag_sj": "\ud83c\uddf8\ud83c\uddef",
-    "flag_ta": "\ud83c\uddf9\ud83c\udde6",
-    "flag_um": "\ud83c\uddfa\ud83c\uddf2",
-    "united_nations": "\ud83c\uddfa\ud83c\uddf3",
-    "skin-tone-1": "\ud83c\udffb",
-    "skin-tone-2": "\ud83c\udffc",
-    "skin-tone-3": "\ud83c\udffd",
-    "skin-tone-4": "\ud83c\udffe",
-    "skin-tone-5": "\ud83c\udfff"
-}
+def __getattr__(name):
+    if name in ('EMOJI_LIST', 'UNICODE_LIST', 'CODE_TO_DESC', 'UNICODE_EMOJI_PAT', 'UNICODE_EMOJI'):
+        return load()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
-# Your scientists were so preoccupied with whether or not they could that they didn't stop to think if they should.
-EMOJI_LIST = json.loads(json.dumps(_EMOJI_LIST))
 
-UNICODE_LIST = {EMOJI_LIST[k]: k for k in EMOJI_LIST}
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    built = build()
+    save(built)
+    logger.info('Built emoji data with %d names and %d emoji: %s', len(built['names']), len(built['descriptions']),
+                DATA_PATH)
@@ -0,0 +1,82 @@
+"""
+Downloading of log content from URLs. Every download goes through one pooled HTTP session, is capped in size and time,
+and is checked as it arrives, so a log is fetched once, straight into the blob store, and the tasks processing it read
+it from there.
+"""
+import time
+from typing import Iterator
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from api import streams
+from api.blobs import CHUNK_SIZE
+from api.models import Log
+
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_maxsize=settings.FETCH_POOL_SIZE))
+session.mount('https://', HTTPAdapter(pool_maxsize=settings.FETCH_POOL_SIZE))
+
+
+class FetchError(ValueError):
+    pass
+
+
+def iter_url(url: str, content_type: str = None, progress=None) -> Iterator[bytes]:
+    """
+    Download content in chunks, giving up once it's larger than `FETCH_MAX_SIZE` or takes longer than `FETCH_TIMEOUT`.
+    :param url: URL of content.
+    :param content_type: Content type the content must have, if any.
+    :param progress: Progress recorder, given the number of bytes downloaded.
+    """
+    max_size = settings.FETCH_MAX_SIZE
+    deadline = time.monotonic() + settings.FETCH_TIMEOUT
+    try:
+        with session.get(url, stream=True, timeout=settings.FETCH_TIMEOUT) as response:
+            response.raise_for_status()
+            if content_type and content_type not in response.headers.get('content-type', ''):
+                raise FetchError(f'URL Content-Type must be {content_type}!')
+            total = int(response.headers.get('content-length') or 0)
+            if total > max_size:
+                raise FetchError(f'URL content must be smaller than {max_size} bytes!')
+            size = 0
+            for chunk in response.iter_content(CHUNK_SIZE):
+                size += len(chunk)
+                if size > max_size:
+                    raise FetchError(f'URL content must be smaller than {max_size} bytes!')
+                if time.monotonic() > deadline:
+                    raise FetchError(f'URL content must download within {settings.FETCH_TIMEOUT} seconds!')
+                if progress:
+                    progress.set_progress(size, max(total, size))
+                yield chunk
+    except requests.RequestException as e:
+        raise FetchError(f'URL content could not be downloaded: {e}')
+
+
+def iter_text(url: str, progress=None) -> Iterator[str]:
+    """
+    Download plain text content in chunks of text.
+    :param url: URL of content.
+    :param progress: Progress recorder, given the number of bytes downloaded.
+    """
+    try:
+        yield from streams.iter_text(iter_url(url, 'text/plain', progress))
+    except streams.StreamError as e:
+        raise FetchError(str(e))
+
+
+def fetch(url: str, messages: bool = False, progress=None) -> dict:
+    """
+    Download content into the blob store.
+    :param url: URL of content.
+    :param messages: Whether the content is a JSON array or NDJSON of messages, instead of plain text.
+    :param progress: Progress recorder, given the number of bytes downloaded.
+    :return: Fields of a log referencing the content, with the uuid generated from it.
+    """
+    if not messages:
+        return Log.store_content(iter_text(url, progress))
+    try:
+        return Log.store_content(streams.checked(iter_url(url, progress=progress)))
+    except streams.StreamError as e:
+        raise FetchError(str(e))
@@ -1,18 +1,21 @@
+import functools
 import re
 
-import demoji
 import dispy_markdown as md
-import pendulum
+from django.conf import settings
 
-from api.emoji import EMOJI_LIST, UNICODE_LIST
+from api import emoji
+from api.cache import RenderCache
+from discord_logview.celery import redis_app
 
-if not demoji.last_downloaded_timestamp() or pendulum.now() > \
-        (pendulum.instance(demoji.last_downloaded_timestamp()).add(days=7)):
-    demoji.download_codes()
+# Custom and text emoji, unicode emoji are found with emoji.UNICODE_EMOJI instead
+jumbo_pat = re.compile(r'<a?:.*?:\d*>|:[\wñ+-]+:')
+mention_pat = re.compile(r'<@!?(\d*)>')
+# Content made up of only these characters can't match any rule but text, so it renders to itself, escaped
+plain_pat = re.compile(r'[A-Za-z0-9 .,!?\'"()&%$+=;/-]*')
 
-demoji.set_emoji_pattern()
-UNICODE_EMOJI_PAT = demoji._EMOJI_PAT.pattern
-jumbo_pat = re.compile(fr'<a?:.*?:\d*>|:[\wñ+-]+:|{UNICODE_EMOJI_PAT}')
+render_cache = RenderCache(settings.RENDER_CACHE_SIZE, redis_app if settings.RENDER_CACHE_REDIS else None,
+                           settings.RENDER_CACHE_TTL)
 
 
 class BlockQuote(md.classes['block_quote']):
@@ -112,17 +115,28 @@ class DiscordHere(md.classes['discord_here']):
         )
 
 
-def _parse_emoji(emoji: str):
-    title = UNICODE_LIST.get(emoji) or demoji._CODE_TO_DESC.get(emoji, '')
-    if '\u200d' not in emoji:  # If there isn't a zero width joiner, strip out variation selectors
-        emoji = re.sub(r'[\U0000FE00-\U0000FE0F]$', '', emoji)
+@functools.lru_cache(maxsize=None)
+def _emoji_info(code: str):
+    title = emoji.UNICODE_LIST.get(code) or emoji.CODE_TO_DESC.get(code, '')
+    if '\u200d' not in code:  # If there isn't a zero width joiner, strip out variation selectors
+        code = re.sub(r'[\U0000FE00-\U0000FE0F]$', '', code)
+    return title, code
+
+
+def _parse_emoji(code: str):
+    title, code = _emoji_info(code)
     return {
         'type': 'unicode_emoji',
         'title': title,
-        'emoji': emoji
+        'emoji': code
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _literal_pat(code: str):
+    return re.compile(re.escape(code))
+
+
 class DiscordTextEmoji(md.markdown.Rule):
 
     @staticmethod
@@ -131,19 +145,21 @@ class DiscordTextEmoji(md.markdown.Rule):
 
     @staticmethod
     def parse(capture, parse, state):
-        if not capture[1] in EMOJI_LIST:
+        if not capture[1] in emoji.EMOJI_LIST:
             return {
                 'type': 'text',
                 'content': capture[0]
             }
-        return _parse_emoji(EMOJI_LIST[capture[1]])
+        return _parse_emoji(emoji.EMOJI_LIST[capture[1]])
 
 
 class UnicodeEmoji(md.markdown.Rule):
 
     @staticmethod
-    def match(*args, **kwargs):
-        return md.markdown.any_scope_regex(f'^(?:{UNICODE_EMOJI_PAT})')(*args, **kwargs)
+    def match(source, *args, **kwargs):
+        if code := emoji.UNICODE_EMOJI.match(source):
+            return _literal_pat(code).match(source)
+        return None
 
     @staticmethod
     def parse(capture, parse, state):
@@ -204,13 +220,33 @@ parser_embed_lite = md.markdown.parser_for(rules_embed_lite)
 html_output_embed_lite = md.markdown.output_for(rules_embed_lite, 'html')
 
 
-def to_html(source: str, options: dict = None):
-    options = {
-        'embed': False,
-        'escape_html': True,
-        'users': {},
-        **(options if options else {})
-    }
+def _is_jumbo(source: str) -> bool:
+    """Check whether content is nothing but fewer than 28 emoji and whitespace, in a single scan of it."""
+    unicode_emoji = emoji.UNICODE_EMOJI
+    count = 0
+    pos = 0
+    end = len(source)
+    while True:
+        while pos < end and source[pos].isspace():
+            pos += 1
+        if pos == end:
+            return True
+        if count == 27:
+            return False
+        if source[pos] in '<:':
+            if not (match := jumbo_pat.match(source, pos)):
+                return False
+            pos = match.end()
+        elif code := unicode_emoji.match(source, pos):
+            pos += len(code)
+        else:
+            return False
+        count += 1
+
+
+def _render(source: str, options: dict):
+    if options['escape_html'] and plain_pat.fullmatch(source):
+        return md.markdown.sanitize_text(source)
 
     _parser = parser
     _html_output = html_output
@@ -232,7 +268,34 @@ def to_html(source: str, options: dict = None):
     }
 
     if not options['embed']:
-        jumbo = (not re.sub(r'(\s)', '', jumbo_pat.sub('', source))) and (len(jumbo_pat.findall(source)) < 28)
-        state['emoji_class'] = 'emoji jumboable' if jumbo else 'emoji'
+        state['emoji_class'] = 'emoji jumboable' if _is_jumbo(source) else 'emoji'
 
     return _html_output(_parser(source, state), state)
+
+
+def _mentioned_users(source: str, options: dict):
+    """Get the usernames of users mentioned in content, which is all rendered content depends on from the user map."""
+    if options['embed'] == 'lite' or '<@' not in source:  # Lite embeds don't render mentions
+        return ()
+    users = options['users']
+    return tuple((user_id, user.get('username') if (user := users.get(user_id)) else None) for user_id in
+                 mention_pat.findall(source))
+
+
+def to_html(source: str, options: dict = None):
+    options = {
+        'embed': False,
+        'escape_html': True,
+        'users': {},
+        **(options if options else {})
+    }
+
+    if not render_cache.enabled:
+        return _render(source, options)
+
+    key = render_cache.key(options['embed'], options['escape_html'], options.get('css_module_names'), source,
+                           _mentioned_users(source, options))
+    if (html := render_cache.get(key)) is None:
+        html = _render(source, options)
+        render_cache.set(key, html)
+    return html
@@ -0,0 +1,99 @@
+"""
+Rendered pages of the log viewer. A saved log never changes, so each page of messages is rendered once, when the log
+is created, and kept compressed in Redis to be served as is.
+"""
+import zlib
+
+import redis
+from django.conf import settings
+from django.core.paginator import Page, Paginator
+from django.template.loader import render_to_string
+
+from api.objects import LiteLogRenderer
+from discord_logview.celery import redis_app
+
+# Number of messages on a page of the viewer
+PAGE_SIZE = 50
+
+
+class FragmentStore:
+    """
+    Store of rendered viewer pages in Redis, left to expire rather than deleted along with their log.
+    :param client: Redis client, None to not store anything.
+    :param ttl: Seconds pages are kept for, None to keep them until Redis evicts them.
+    :param prefix: Prefix of Redis keys.
+    """
+
+    def __init__(self, client: redis.Redis = None, ttl: int = None, prefix: str = 'fragment'):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def key(self, log, page: int) -> str:
+        # Logs are identified by their content, so the creation time tells apart a log from one deleted before it
+        return f'{self.prefix}:{log.uuid}:{log.created.timestamp()}:{page}'
+
+    def get(self, log, page: int):
+        """
+        Get a rendered page.
+        :param log: Log instance.
+        :param page: Page number, starting at 1.
+        :return: Rendered page, or None if it isn't stored.
+        """
+        if not self.client:
+            return None
+        try:
+            value = self.client.get(self.key(log, page))
+        except redis.RedisError:
+            return None
+        return zlib.decompress(value).decode('utf-8') if value is not None else None
+
+    def set_many(self, log, pages: dict):
+        """
+        Store rendered pages of a log.
+        :param log: Log instance.
+        :param pages: Rendered pages, by page number.
+        """
+        if not self.client or not pages:
+            return
+        pipe = self.client.pipeline(transaction=False)
+        for page, html in pages.items():
+            pipe.set(self.key(log, page), zlib.compress(html.encode('utf-8')), ex=self.ttl)
+        try:
+            pipe.execute()
+        except redis.RedisError:
+            pass
+
+
+def render_page(uuid: str, page, authors: list = None) -> str:
+    """
+    Render a page of messages the way the viewer shows it.
+    :param uuid: Log uuid.
+    :param page: Paginator page of messages.
+    :param authors: Author table of the log, if its messages are compacted.
+    """
+    return render_to_string('discord_logview/messages.html', context={
+        'log': LiteLogRenderer({'uuid': uuid, 'page': page, 'authors': authors})
+    })
+
+
+def render_pages(uuid: str, messages: list, authors: list = None, start: int = 0, more: bool = False) -> dict:
+    """
+    Render every page of messages of a log, or of a part of it.
+    :param uuid: Log uuid.
+    :param messages: Formatted messages.
+    :param authors: Author table of the log, if its messages are compacted.
+    :param start: Position of the first of :param messages in the log, a multiple of `PAGE_SIZE`.
+    :param more: Whether more messages of the log follow :param messages.
+    :return: Rendered pages, by page number.
+    """
+    # Paginate the whole log as far as it's known, so every page links to the next one if there is one
+    paginator = Paginator(range(start + len(messages) + more), PAGE_SIZE)
+    pages = {}
+    for offset in range(0, len(messages), PAGE_SIZE):
+        number = (start + offset) // PAGE_SIZE + 1
+        pages[number] = render_page(uuid, Page(messages[offset:offset + PAGE_SIZE], number, paginator), authors)
+    return pages
+
+
+fragment_store = FragmentStore(redis_app if settings.FRAGMENT_STORE else None, settings.FRAGMENT_TTL)
@@ -0,0 +1,154 @@
+import json
+import random
+import re
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api import emoji, formatter
+from api.normalizer import Normalizer
+from api.serializers import MessageSerializer
+
+
+def generate_messages(count: int, seed: int = 0) -> list:
+    """
+    Generate a log of messages resembling a Discord export.
+    :param count: Number of messages.
+    :param seed: Random seed, so that runs can be compared.
+    """
+    rng = random.Random(seed)
+    authors = [{
+        'id': str(rng.randrange(10 ** 17, 10 ** 18)),
+        'username': f'User {i}',
+        'discriminator': f'{rng.randrange(1, 10000):04}',
+        'avatar': rng.choice([None, f'{rng.getrandbits(128):032x}', f'a_{rng.getrandbits(128):032x}']),
+        'bot': i == 0,
+    } for i in range(25)]
+    words = ['hello', 'there', '**bold**', '*italic*', '`code`', 'https://example.com', ':smile:', '😀', '<@!{}>',
+             '||spoiler||', '> quote', 'lorem', 'ipsum']
+    timestamp = 1577836800
+    messages = []
+    for i in range(count):
+        timestamp += rng.randrange(1, 120)
+        author = rng.choice(authors)
+        content = ' '.join(rng.choice(words) for _ in range(rng.randrange(0, 30)))
+        message = {
+            'id': str(rng.randrange(10 ** 17, 10 ** 18)),
+            'channel_id': '0',
+            'author': author,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S.000000+00:00', time.gmtime(timestamp)),
+            'edited_timestamp': None,
+            'content': content.replace('{}', rng.choice(authors)['id']),
+            'mentions': rng.sample(authors, rng.randrange(0, 3)),
+            'attachments': [],
+            'embeds': [],
+        }
+        if rng.random() < 0.1:
+            size = rng.choice([(None, None), (1920, 1080), (640, 480)])
+            message['attachments'].append({
+                'id': str(rng.randrange(10 ** 17, 10 ** 18)), 'filename': rng.choice(['a.png', 'b.mp4', 'c.txt']),
+                'url': 'https://cdn.discordapp.com/attachments/1/2/a.png', 'size': rng.randrange(1, 10 ** 7),
+                'width': size[0], 'height': size[1]
+            })
+        if rng.random() < 0.1:
+            message['embeds'].append({
+                'type': 'rich', 'title': 'Title', 'description': content, 'color': rng.randrange(0, 0xFFFFFF),
+                'fields': [{'name': 'Name', 'value': 'Value', 'inline': rng.random() < 0.5}],
+                'footer': {'text': 'Footer'}, 'timestamp': message['timestamp']
+            })
+        messages.append(message)
+    return messages
+
+
+def benchmark_normalizer(messages: list, stdout):
+    """Compare the compiled normalizer against the message serializer."""
+    users = {msg['author']['id']: msg['author'] for msg in messages}
+
+    start = time.perf_counter()
+    expected = []
+    for msg in messages:
+        serializer = MessageSerializer(data=msg, context={'users': users})
+        expected.append(serializer.data if serializer.is_valid() else serializer.errors)
+    serializer_time = time.perf_counter() - start
+
+    normalize = Normalizer(MessageSerializer)
+    normalize(messages[0], {'users': users})  # Compile outside of the timed run
+    start = time.perf_counter()
+    results = [data if errors is None else errors for data, errors in (
+        normalize(msg, {'users': users}) for msg in messages
+    )]
+    normalizer_time = time.perf_counter() - start
+
+    if json.dumps(expected) != json.dumps(results):
+        raise CommandError('Normalizer output does not match the serializer output!')
+    stdout.write(f'Serializer: {len(messages) / serializer_time:,.0f} messages/s')
+    stdout.write(f'Normalizer: {len(messages) / normalizer_time:,.0f} messages/s '
+                 f'({serializer_time / normalizer_time:.1f}x, identical output)')
+
+
+def benchmark_render(messages: list, stdout):
+    """Render message content without the render cache, then twice with it."""
+    users = {msg['author']['id']: msg['author'] for msg in messages}
+    contents = [msg.get('content') or '' for msg in messages]
+    cache = formatter.render_cache
+    size = cache.size
+    try:
+        start = time.perf_counter()
+        for content in contents:
+            formatter._render(content, {'embed': False, 'escape_html': True, 'users': users})
+        stdout.write(f'Uncached: {len(contents) / (time.perf_counter() - start):,.0f} renders/s')
+        cache.size = size or 50000
+        cache.clear()
+        for run in ('Cold cache', 'Warm cache'):
+            start = time.perf_counter()
+            for content in contents:
+                formatter.to_html(content, {'users': users})
+            stdout.write(f'{run}: {len(contents) / (time.perf_counter() - start):,.0f} renders/s ({cache.stats()})')
+    finally:
+        cache.size = size
+
+
+def benchmark_emoji(messages: list, stdout):
+    """Look for unicode emoji at every position of message content like the parser does, with the regex and the trie."""
+    contents = [msg.get('content') or '' for msg in messages]
+    positions = sum(len(content) for content in contents)
+    pattern = re.compile(f'^(?:{emoji.UNICODE_EMOJI_PAT})')
+    trie = emoji.UNICODE_EMOJI
+
+    start = time.perf_counter()
+    expected = [[(m.group() if (m := pattern.match(content[pos:])) else None) for pos in range(len(content))]
+                for content in contents]
+    regex_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = [[trie.match(content[pos:]) for pos in range(len(content))] for content in contents]
+    trie_time = time.perf_counter() - start
+
+    if expected != results:
+        raise CommandError('Trie matches do not match the regex matches!')
+    stdout.write(f'Regex: {positions / regex_time:,.0f} positions/s')
+    stdout.write(f'Trie: {positions / trie_time:,.0f} positions/s ({regex_time / trie_time:.1f}x, identical matches)')
+
+
+benchmarks = {
+    'emoji': benchmark_emoji,
+    'normalizer': benchmark_normalizer,
+    'render': benchmark_render,
+}
+
+
+class Command(BaseCommand):
+    help = 'Benchmark parts of log processing.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('benchmark', choices=sorted(benchmarks))
+        parser.add_argument('--messages', type=int, default=10000, help='Number of messages to generate.')
+        parser.add_argument('--file', help='JSON log to use instead of generated messages.')
+
+    def handle(self, *args, **options):
+        if options['file']:
+            with open(options['file'], encoding='utf-8') as file:
+                messages = json.load(file)
+        else:
+            messages = generate_messages(options['messages'])
+        benchmarks[options['benchmark']](messages, self.stdout)
@@ -0,0 +1,79 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from api import compression
+from api.models import CompressionDictionary, Log, Page
+
+
+class Command(BaseCommand):
+    help = 'Train compression dictionaries for each log type, and compress or decompress stored pages.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--train', action='store_true', help='Train a new dictionary for each log type first.')
+        parser.add_argument('--type', dest='log_types', action='append', help='Only handle this log type.')
+        parser.add_argument('--samples', type=int, default=10000, help='Number of messages to train on.')
+        parser.add_argument('--dictionary-size', type=int, default=112640, help='Maximum dictionary size, in bytes.')
+        parser.add_argument('--batch', type=int, default=50, help='Number of pages converted at once.')
+        parser.add_argument('--decompress', action='store_true', help='Decompress pages instead.')
+
+    def handle(self, *args, **options):
+        if compression.zstandard is None:
+            raise CommandError('Page compression requires the zstandard package!')
+        log_types = options['log_types'] or list(Log.objects.order_by().values_list('type', flat=True).distinct())
+
+        if options['train']:
+            for log_type in log_types:
+                self.train(log_type, options['samples'], options['dictionary_size'])
+
+        type_filter = Q(log__type__in=[log_type for log_type in log_types if log_type is not None])
+        if None in log_types:
+            type_filter |= Q(log__type__isnull=True)
+        pages = Page.objects.filter(type_filter, compressed__isnull=not options['decompress'])
+        converted = size = new_size = 0
+        dictionaries = {}
+        while batch := list(pages.select_related('log').order_by('pk')[:options['batch']]):
+            for page in batch:
+                messages = page.get_messages()
+                if options['decompress']:
+                    size += len(page.compressed)
+                    page.messages, page.compressed, page.dictionary_id = messages, None, None
+                    new_size += len(json.dumps(messages, separators=(',', ':')))
+                else:
+                    if page.log.type not in dictionaries:
+                        dictionaries[page.log.type] = compression.dictionary_for(page.log.type)
+                    size += len(json.dumps(messages, separators=(',', ':')))
+                    page.dictionary_id = dictionaries[page.log.type]
+                    page.messages, page.compressed = None, compression.compress(messages, page.dictionary_id)
+                    new_size += len(page.compressed)
+            Page.objects.bulk_update(batch, ['messages', 'compressed', 'dictionary'])
+            converted += len(batch)
+            self.stdout.write(f'{"Decompressed" if options["decompress"] else "Compressed"} {converted} pages...')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{"Decompressed" if options["decompress"] else "Compressed"} {converted} pages, {size:,} bytes to '
+            f'{new_size:,} bytes.'
+        ))
+
+    def train(self, log_type, samples: int, size: int):
+        """
+        Train a dictionary on the newest messages of a log type.
+        :param log_type: Log type.
+        :param samples: Number of messages to train on.
+        :param size: Maximum dictionary size, in bytes.
+        """
+        messages = []
+        for page in Page.objects.filter(log__type=log_type).order_by('-log__created', 'index').iterator():
+            messages.extend(page.get_messages())
+            if len(messages) >= samples:
+                break
+        name = log_type or 'JSON'
+        try:
+            data = compression.train(messages[:samples], size)
+        except compression.zstandard.ZstdError as e:
+            self.stderr.write(f'Not enough messages to train a dictionary for {name} logs ({len(messages)}): {e}')
+            return
+        dictionary = CompressionDictionary.objects.create(log_type=log_type, data=data)
+        self.stdout.write(f'Trained a {len(data):,} byte dictionary for {name} logs on {len(messages[:samples])} '
+                          f'messages ({dictionary}).')
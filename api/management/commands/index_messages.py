@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from api import search
+from api.models import Log
+from api.storage import log_messages
+
+
+class Command(BaseCommand):
+    help = 'Build the full-text search index of saved logs that don\'t have one yet.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Rebuild the index of every log.')
+
+    def handle(self, *args, **options):
+        logs = Log.objects.filter(state=Log.State.DONE)
+        if not options['all']:
+            logs = logs.filter(search_entries__isnull=True)
+        indexed = 0
+        for log in logs.distinct().order_by('created').iterator():
+            search.index_messages(log, log_messages(log))
+            indexed += 1
+            self.stdout.write(f'Indexed {log} ({log.message_count} messages).')
+
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} logs.'))
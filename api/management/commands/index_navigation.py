@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from api import navigation
+from api.models import Log
+from api.storage import log_messages
+
+
+class Command(BaseCommand):
+    help = 'Build the navigation index of saved logs that don\'t have one yet.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true', help='Rebuild the index of every log.')
+
+    def handle(self, *args, **options):
+        logs = Log.objects.filter(state=Log.State.DONE)
+        if not options['all']:
+            logs = logs.filter(navigation__isnull=True)
+        indexed = 0
+        for log in logs.order_by('created').iterator():
+            navigation.build_index(log, log_messages(log))
+            indexed += 1
+            self.stdout.write(f'Indexed {log} ({log.message_count} messages).')
+
+        self.stdout.write(self.style.SUCCESS(f'Indexed {indexed} logs.'))
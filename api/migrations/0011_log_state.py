@@ -0,0 +1,46 @@
+# Generated by Django 3.1 on 2026-10-18 12:00
+
+from django.db import migrations, models
+
+
+def backfill_counts(apps, schema_editor):
+    Log = apps.get_model('api', 'Log')
+    Page = apps.get_model('api', 'Page')
+    for uuid in Log.objects.filter(pages__isnull=False).distinct().values_list('uuid', flat=True).iterator():
+        sizes = list(Page.objects.filter(log_id=uuid).order_by('index').values_list(
+            models.Func(models.F('messages'), function='jsonb_array_length', output_field=models.IntegerField()),
+            flat=True
+        ))
+        Log.objects.filter(uuid=uuid).update(state='done', message_count=sum(sizes), page_count=len(sizes),
+                                             page_sizes=sizes)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_auto_20201130_1639'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='log',
+            name='message_count',
+            field=models.IntegerField(default=0, help_text='Number of messages in log.'),
+        ),
+        migrations.AddField(
+            model_name='log',
+            name='page_count',
+            field=models.IntegerField(default=0, help_text='Number of stored pages.'),
+        ),
+        migrations.AddField(
+            model_name='log',
+            name='page_sizes',
+            field=models.JSONField(default=list, help_text='Number of messages in each stored page.'),
+        ),
+        migrations.AddField(
+            model_name='log',
+            name='state',
+            field=models.CharField(choices=[('processing', 'Processing'), ('done', 'Done')], default='processing', help_text='Processing state.', max_length=10),
+        ),
+        migrations.RunPython(backfill_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 3.1 on 2026-10-18 12:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_log_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompressionDictionary',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('log_type', models.CharField(help_text='Log type the dictionary was trained on.', max_length=40, null=True)),
+                ('data', models.BinaryField(help_text='Zstandard dictionary.')),
+                ('created', models.DateTimeField(auto_now_add=True, help_text='Dictionary creation date.')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='compressed',
+            field=models.BinaryField(help_text="Page's messages, compressed with zstandard.", null=True),
+        ),
+        migrations.AlterField(
+            model_name='page',
+            name='messages',
+            field=models.JSONField(editable=False, help_text="Page's messages, unless they are compressed.", null=True),
+        ),
+        migrations.AddField(
+            model_name='page',
+            name='dictionary',
+            field=models.ForeignKey(editable=False, help_text='Dictionary the messages were compressed with.', null=True, on_delete=django.db.models.deletion.PROTECT, related_name='pages', to='api.compressiondictionary'),
+        ),
+    ]
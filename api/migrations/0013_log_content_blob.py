@@ -0,0 +1,46 @@
+# Generated by Django 3.1 on 2026-10-18 13:00
+
+from django.db import migrations, models
+
+
+def move_content(apps, schema_editor):
+    from api.blobs import blob_store
+
+    Log = apps.get_model('api', 'Log')
+    for log in Log.objects.filter(content__isnull=False).only('uuid', 'content').iterator():
+        key, size = blob_store.put(log.content)
+        Log.objects.filter(uuid=log.uuid).update(content_key=key, content_size=size, content=None)
+
+
+def restore_content(apps, schema_editor):
+    from api.blobs import blob_store
+
+    Log = apps.get_model('api', 'Log')
+    for log in Log.objects.filter(content_key__isnull=False).only('uuid', 'content_key').iterator():
+        Log.objects.filter(uuid=log.uuid).update(content=blob_store.read(log.content_key))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_page_compression'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='log',
+            name='content_key',
+            field=models.CharField(editable=False, help_text='Blob key of raw log content.', max_length=64, null=True),
+        ),
+        migrations.AddField(
+            model_name='log',
+            name='content_size',
+            field=models.BigIntegerField(default=0, editable=False, help_text='Size of raw log content, in bytes.'),
+        ),
+        migrations.AlterField(
+            model_name='log',
+            name='content',
+            field=models.TextField(editable=False, help_text='Raw log content.', null=True),
+        ),
+        migrations.RunPython(move_content, restore_content),
+    ]
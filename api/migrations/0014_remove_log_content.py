@@ -0,0 +1,17 @@
+# Generated by Django 3.1 on 2026-10-18 13:00
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_log_content_blob'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='log',
+            name='content',
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1 on 2026-10-18 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_remove_log_content'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='log',
+            name='content_key',
+            field=models.CharField(db_index=True, editable=False, help_text='Blob key of raw log content, its BLAKE2 digest.', max_length=64, null=True),
+        ),
+    ]
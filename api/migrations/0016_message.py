@@ -0,0 +1,48 @@
+# Generated by Django 3.1 on 2026-10-18 14:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_log_content_key_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='log',
+            name='storage',
+            field=models.CharField(choices=[('pages', 'Pages'), ('rows', 'Rows')], default='pages', help_text='How messages are stored, in pages or as rows.', max_length=10),
+        ),
+        migrations.CreateModel(
+            name='Message',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sequence', models.IntegerField(editable=False, help_text='Position of the message in its log.')),
+                ('message_id', models.BigIntegerField(db_index=True, help_text='Discord message id.', null=True)),
+                ('author_id', models.BigIntegerField(help_text='Discord id of the message author.', null=True)),
+                ('channel_id', models.BigIntegerField(help_text='Discord channel id.', null=True)),
+                ('timestamp', models.DateTimeField(help_text='Message creation date.', null=True)),
+                ('payload', models.JSONField(editable=False, help_text='Formatted message.')),
+                ('log', models.ForeignKey(editable=False, help_text='Log', on_delete=django.db.models.deletion.CASCADE, related_name='messages', to='api.log')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['log', 'author_id'], name='api_message_log_author'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['log', 'channel_id'], name='api_message_log_channel'),
+        ),
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(fields=['log', 'timestamp'], name='api_message_log_timestamp'),
+        ),
+        migrations.AddConstraint(
+            model_name='message',
+            constraint=models.UniqueConstraint(fields=('log', 'sequence'), name='api_message_log_sequence'),
+        ),
+    ]
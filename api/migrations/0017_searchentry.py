@@ -0,0 +1,35 @@
+# Generated by Django 3.1 on 2026-10-18 15:00
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_message'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchEntry',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('sequence', models.IntegerField(editable=False, help_text='Position of the message in its log.')),
+                ('message_id', models.BigIntegerField(help_text='Discord message id.', null=True)),
+                ('content', models.TextField(help_text='Raw message content.')),
+                ('vector', django.contrib.postgres.search.SearchVectorField(help_text='Search vector of the message content.', null=True)),
+                ('log', models.ForeignKey(editable=False, help_text='Log', on_delete=django.db.models.deletion.CASCADE, related_name='search_entries', to='api.log')),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='searchentry',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['vector'], name='api_searchentry_vector'),
+        ),
+        migrations.AddConstraint(
+            model_name='searchentry',
+            constraint=models.UniqueConstraint(fields=('log', 'sequence'), name='api_searchentry_log_sequence'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.1 on 2026-10-18 15:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0017_searchentry'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NavigationIndex',
+            fields=[
+                ('log', models.OneToOneField(editable=False, help_text='Log', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='navigation', serialize=False, to='api.log')),
+                ('first_ids', models.JSONField(default=list, help_text='Id of the first message of each viewer page.')),
+                ('last_ids', models.JSONField(default=list, help_text='Id of the last message of each viewer page.')),
+                ('first_timestamps', models.JSONField(default=list, help_text='Time of the first message of each viewer page.')),
+                ('last_timestamps', models.JSONField(default=list, help_text='Time of the last message of each viewer page.')),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.1 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_navigationindex'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='log',
+            name='authors',
+            field=models.JSONField(default=list, help_text='Authors and mentioned users referenced by stored messages.'),
+        ),
+    ]
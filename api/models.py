@@ -1,19 +1,48 @@
+from typing import Iterable, Union
+from uuid import UUID
+
 import shortuuid
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from api import compression, timestamps
+from api.blobs import blob_store
 
 
 # Create your models here.
 class Log(models.Model):
+
+    class State(models.TextChoices):
+        PROCESSING = 'processing', 'Processing'
+        DONE = 'done', 'Done'
+
+    class Storage(models.TextChoices):
+        PAGES = 'pages', 'Pages'
+        ROWS = 'rows', 'Rows'
+
     owner = models.ForeignKey('auth.User', on_delete=models.CASCADE, related_name='logs', help_text='Log owner.')
     uuid = models.CharField(primary_key=True, max_length=22, editable=False, help_text='Log\'s UUID.')
     created = models.DateTimeField(auto_now_add=True, help_text='Log creation date.')
     expires = models.DateTimeField(null=True, help_text='Log expiration date.')
-    content = models.TextField(editable=False, help_text='Raw log content.')
+    content_key = models.CharField(max_length=64, null=True, editable=False, db_index=True,
+                                   help_text='Blob key of raw log content, its BLAKE2 digest.')
+    content_size = models.BigIntegerField(default=0, editable=False, help_text='Size of raw log content, in bytes.')
     type = models.CharField(max_length=40, null=True, help_text='Log type.')
     users = models.JSONField(default=list, help_text='List of users in log.')
+    authors = models.JSONField(default=list, help_text='Authors and mentioned users referenced by stored messages.')
     privacy = models.CharField(max_length=10, default='public')
     guild = models.BigIntegerField(null=True)
     data = models.JSONField(default=dict, help_text='Extraneous data.')
+    state = models.CharField(max_length=10, choices=State.choices, default=State.PROCESSING,
+                             help_text='Processing state.')
+    message_count = models.IntegerField(default=0, help_text='Number of messages in log.')
+    page_count = models.IntegerField(default=0, help_text='Number of stored pages.')
+    page_sizes = models.JSONField(default=list, help_text='Number of messages in each stored page.')
+    storage = models.CharField(max_length=10, choices=Storage.choices, default=Storage.PAGES,
+                               help_text='How messages are stored, in pages or as rows.')
 
     class Meta:
         permissions = [
@@ -24,23 +53,148 @@ class Log(models.Model):
         ordering = ['-created']
 
     @classmethod
-    def generate_uuid(cls, content):
-        """Generate short uuid, used to uniquely identify logs based on content."""
-        return shortuuid.uuid(str(content))
+    def generate_uuid(cls, content_key: str) -> str:
+        """
+        Generate short uuid, used to uniquely identify logs based on content.
+        :param content_key: Blob key of raw log content.
+        """
+        return shortuuid.encode(UUID(bytes=bytes.fromhex(content_key)[:16]))
+
+    @property
+    def content(self) -> str:
+        """Raw log content, read from the blob store."""
+        return blob_store.read(self.content_key) if self.content_key else ''
+
+    @classmethod
+    def store_content(cls, content: Union[str, Iterable[str]]) -> dict:
+        """
+        Store raw log content in the blob store, hashing it as it's written.
+        :param content: Raw log content, or chunks of it.
+        :return: Fields of a log referencing the content, with the uuid generated from it.
+        """
+        key, size = blob_store.put(content) if isinstance(content, str) else blob_store.put_stream(content)
+        return {'uuid': cls.generate_uuid(key), 'content_key': key, 'content_size': size}
+
+    @classmethod
+    def find_content(cls, content_key: str):
+        """
+        Find a log with the same raw content.
+        :param content_key: Blob key of raw log content.
+        :return: Log instance, or None if there isn't one.
+        """
+        return cls.objects.filter(content_key=content_key).first()
 
     def __str__(self):
         return f'Log {self.uuid}'
 
 
+@receiver(post_delete, sender=Log)
+def delete_content(sender, instance, **kwargs):
+    if instance.content_key and not Log.objects.filter(content_key=instance.content_key).exists():
+        blob_store.delete(instance.content_key)
+
+
 class Page(models.Model):
-    messages = models.JSONField(editable=False, help_text='Page\'s messages.')
+    messages = models.JSONField(editable=False, null=True, help_text='Page\'s messages, unless they are compressed.')
+    compressed = models.BinaryField(null=True, help_text='Page\'s messages, compressed with zstandard.')
+    dictionary = models.ForeignKey('CompressionDictionary', null=True, editable=False, on_delete=models.PROTECT,
+                                   related_name='pages', help_text='Dictionary the messages were compressed with.')
     index = models.IntegerField(editable=False, help_text='Page index.')
     log = models.ForeignKey('Log', editable=False, on_delete=models.CASCADE, related_name='pages', help_text='Log')
 
+    def get_messages(self) -> list:
+        return compression.decode_page(self.messages, self.compressed, self.dictionary_id)
+
     def __str__(self):
         return f'Log {self.log.uuid} Page {self.index}'
 
 
+def snowflake(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class Message(models.Model):
+    log = models.ForeignKey('Log', editable=False, on_delete=models.CASCADE, related_name='messages', help_text='Log')
+    sequence = models.IntegerField(editable=False, help_text='Position of the message in its log.')
+    message_id = models.BigIntegerField(null=True, db_index=True, help_text='Discord message id.')
+    author_id = models.BigIntegerField(null=True, help_text='Discord id of the message author.')
+    channel_id = models.BigIntegerField(null=True, help_text='Discord channel id.')
+    timestamp = models.DateTimeField(null=True, help_text='Message creation date.')
+    payload = models.JSONField(editable=False, help_text='Formatted message.')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['log', 'sequence'], name='api_message_log_sequence'),
+        ]
+        indexes = [
+            models.Index(fields=['log', 'author_id'], name='api_message_log_author'),
+            models.Index(fields=['log', 'channel_id'], name='api_message_log_channel'),
+            models.Index(fields=['log', 'timestamp'], name='api_message_log_timestamp'),
+        ]
+
+    @classmethod
+    def from_payload(cls, log, sequence: int, payload: dict, stored: dict = None):
+        """
+        Build the row of a formatted message.
+        :param log: Log instance.
+        :param sequence: Position of the message in the log.
+        :param payload: Formatted message.
+        :param stored: Message as it's stored, if not as is.
+        """
+        return cls(log=log, sequence=sequence, message_id=snowflake(payload.get('id')),
+                   author_id=snowflake((payload.get('author') or {}).get('id')),
+                   channel_id=snowflake(payload.get('channel_id')),
+                   timestamp=timestamps.parse(payload['timestamp']) if payload.get('timestamp') else None,
+                   payload=payload if stored is None else stored)
+
+    def __str__(self):
+        return f'Log {self.log_id} Message {self.sequence}'
+
+
+class NavigationIndex(models.Model):
+    log = models.OneToOneField('Log', primary_key=True, editable=False, on_delete=models.CASCADE,
+                               related_name='navigation', help_text='Log')
+    first_ids = models.JSONField(default=list, help_text='Id of the first message of each viewer page.')
+    last_ids = models.JSONField(default=list, help_text='Id of the last message of each viewer page.')
+    first_timestamps = models.JSONField(default=list, help_text='Time of the first message of each viewer page.')
+    last_timestamps = models.JSONField(default=list, help_text='Time of the last message of each viewer page.')
+
+    def __str__(self):
+        return f'Log {self.log_id} Navigation Index'
+
+
+class SearchEntry(models.Model):
+    log = models.ForeignKey('Log', editable=False, on_delete=models.CASCADE, related_name='search_entries',
+                            help_text='Log')
+    sequence = models.IntegerField(editable=False, help_text='Position of the message in its log.')
+    message_id = models.BigIntegerField(null=True, help_text='Discord message id.')
+    content = models.TextField(help_text='Raw message content.')
+    vector = SearchVectorField(null=True, help_text='Search vector of the message content.')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['log', 'sequence'], name='api_searchentry_log_sequence'),
+        ]
+        indexes = [
+            GinIndex(fields=['vector'], name='api_searchentry_vector'),
+        ]
+
+    def __str__(self):
+        return f'Log {self.log_id} Search Entry {self.sequence}'
+
+
+class CompressionDictionary(models.Model):
+    log_type = models.CharField(max_length=40, null=True, help_text='Log type the dictionary was trained on.')
+    data = models.BinaryField(help_text='Zstandard dictionary.')
+    created = models.DateTimeField(auto_now_add=True, help_text='Dictionary creation date.')
+
+    def __str__(self):
+        return f'{(self.log_type or "JSON").capitalize()} Dictionary {self.pk}'
+
+
 class Whitelist(models.Model):
     log_type = models.CharField(max_length=40, help_text='Whitelisted log type.')
     users = models.ManyToManyField('auth.User', related_name='whitelists', help_text='User whitelists.', blank=True)
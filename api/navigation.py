@@ -0,0 +1,92 @@
+"""
+Index for jumping to a message of a log by id or time. The id and time of the first and last message of each viewer
+page are kept when a log is saved, so the page holding a message is found by binary search instead of reading pages.
+Logs whose messages aren't in order of id or time can't be navigated that way, and keep no index for it. Logs saved
+before the index existed get one from the `index_navigation` command.
+"""
+import datetime
+from bisect import bisect_left
+from typing import Optional
+
+from api import timestamps
+from api.fragments import PAGE_SIZE
+from api.models import NavigationIndex, snowflake
+
+
+def _ordered(firsts: list, lasts: list) -> bool:
+    bounds = [bound for pair in zip(firsts, lasts) for bound in pair]
+    return None not in bounds and all(a <= b for a, b in zip(bounds, bounds[1:]))
+
+
+class IndexBuilder:
+    """
+    Navigation index of a log, built from its messages as they're saved.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.first_ids, self.last_ids, self.first_times, self.last_times = [], [], [], []
+
+    def add(self, messages):
+        """
+        Add the next messages of the log.
+        :param messages: Formatted messages, in order.
+        """
+        for message in messages:
+            message_id = snowflake(message.get('id'))
+            time = timestamps.parse(message['timestamp']).timestamp() if message.get('timestamp') else None
+            if self.count % PAGE_SIZE == 0:
+                self.first_ids.append(message_id)
+                self.first_times.append(time)
+                self.last_ids.append(message_id)
+                self.last_times.append(time)
+            else:
+                self.last_ids[-1], self.last_times[-1] = message_id, time
+            self.count += 1
+
+    def save(self, log) -> NavigationIndex:
+        """
+        Save the index of a log, replacing any it had.
+        :param log: Log instance.
+        """
+        first_ids, last_ids, first_times, last_times = self.first_ids, self.last_ids, self.first_times, self.last_times
+        if not _ordered(first_ids, last_ids):
+            first_ids, last_ids = [], []
+        if not _ordered(first_times, last_times):
+            first_times, last_times = [], []
+        return NavigationIndex.objects.update_or_create(log=log, defaults={
+            'first_ids': first_ids, 'last_ids': last_ids, 'first_timestamps': first_times, 'last_timestamps': last_times
+        })[0]
+
+
+def build_index(log, messages) -> NavigationIndex:
+    """
+    Build the navigation index of a log, replacing any it had.
+    :param log: Log instance.
+    :param messages: Formatted messages, in order.
+    """
+    builder = IndexBuilder()
+    builder.add(messages)
+    return builder.save(log)
+
+
+def find_page(log, message_id: int = None, time: datetime.datetime = None) -> Optional[int]:
+    """
+    Find the viewer page of a message, or of the first message sent at or after a time.
+    :param log: Log instance.
+    :param message_id: Message id.
+    :param time: Time, if no message id is given. Times past either end of the log give its first or last page.
+    :return: Viewer page number, or None if the log doesn't have the message or can't be navigated that way, or has no
+        index yet.
+    """
+    index = NavigationIndex.objects.filter(log=log).first()
+    if index is None:
+        return None
+    if message_id is not None:
+        page = bisect_left(index.last_ids, message_id)
+        if page == len(index.last_ids) or index.first_ids[page] > message_id:
+            return None
+        return page + 1
+    if not index.last_timestamps:
+        return None
+    return min(bisect_left(index.last_timestamps, time.timestamp()), len(index.last_timestamps) - 1) + 1
@@ -0,0 +1,249 @@
+"""
+Compiled stand-in for validating data with a serializer and reading it back out. Building a serializer tree for every
+message costs far more than the validation itself, so the fields of a serializer are compiled once into plain
+functions that check and represent a value in one step. Anything these functions aren't certain about, from an
+unusual input type to a value that fails validation, is handed to the serializer itself, so results and errors are
+always the ones the serializer would give.
+"""
+import re
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import MaxLengthValidator, MinLengthValidator, ProhibitNullCharactersValidator
+from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
+from rest_framework.fields import empty, SkipField
+
+from api.serializers import BaseSerializer
+
+integer_re = re.compile(r'-?[0-9]+')
+
+
+class Fallback(Exception):
+    """Raised when a value, or a whole serializer, has to be handled by the serializer itself."""
+
+
+def _compile_validators(field):
+    """
+    Compile the validators of a field into a single function.
+    :param field: Serializer field.
+    :return: Function telling whether a value is valid.
+    """
+    checks = []
+    for validator in field.validators:
+        if getattr(validator, 'requires_context', False) or hasattr(validator, 'set_context'):
+            raise Fallback
+        limit = getattr(validator, 'limit_value', None)
+        if type(validator) is MaxLengthValidator and isinstance(limit, int):
+            checks.append(lambda value, limit=limit: len(value) <= limit)
+        elif type(validator) is MinLengthValidator and isinstance(limit, int):
+            checks.append(lambda value, limit=limit: len(value) >= limit)
+        elif type(validator) is ProhibitNullCharactersValidator:
+            checks.append(lambda value: '\x00' not in value)
+        else:
+            def check(value, validator=validator):
+                try:
+                    validator(value)
+                except (ValidationError, DjangoValidationError):
+                    return False
+                return True
+            checks.append(check)
+    return lambda value: all(check(value) for check in checks)
+
+
+def _compile_char(field):
+    allow_blank, trim, valid = field.allow_blank, field.trim_whitespace, _compile_validators(field)
+
+    def convert(raw, context):
+        if type(raw) is str:
+            value = raw.strip() if trim else raw
+        elif type(raw) in (int, float):
+            value = str(raw)
+        else:
+            raise Fallback
+        if not value:
+            if allow_blank:
+                return ''
+            raise Fallback
+        if not valid(value):
+            raise Fallback
+        return value
+    return convert
+
+
+def _compile_integer(field):
+    valid = _compile_validators(field)
+
+    def convert(raw, context):
+        if type(raw) is int:
+            value = raw
+        elif type(raw) is str and len(raw) <= field.MAX_STRING_LENGTH and integer_re.fullmatch(raw):
+            value = int(raw)
+        else:
+            raise Fallback
+        if not valid(value):
+            raise Fallback
+        return value
+    return convert
+
+
+def _compile_boolean(field):
+    def convert(raw, context):
+        if raw is True or raw is False:
+            return raw
+        raise Fallback
+    return convert
+
+
+def _compile_generic(field):
+    def convert(raw, context):
+        try:
+            value = field.run_validation(raw)
+        except (ValidationError, DjangoValidationError, SkipField):
+            raise Fallback
+        return None if value is None else field.to_representation(value)
+    return convert
+
+
+def _compile_list(field):
+    child, allow_empty = _compile_value(field.child), field.allow_empty
+
+    def convert(raw, context):
+        if type(raw) is not list or not (raw or allow_empty):
+            raise Fallback
+        return [child(item, context) if item is not None else _fallback() for item in raw]
+    return convert
+
+
+def _compile_serializer(serializer):
+    """
+    Compile a serializer into a function validating and representing a mapping.
+    :param serializer: Serializer instance.
+    """
+    if type(serializer).validate is not serializers.Serializer.validate or serializer.validators:
+        raise Fallback
+    if isinstance(serializer, BaseSerializer):
+        finish = serializer.format
+    elif type(serializer).to_representation is serializers.Serializer.to_representation:
+        finish = None
+    else:
+        raise Fallback
+
+    getters = []
+    for name, field in serializer.fields.items():
+        if field.read_only or field.write_only or field.source != name or hasattr(serializer, f'validate_{name}'):
+            raise Fallback
+        getters.append((name, _compile_field(field)))
+
+    def convert(raw, context):
+        if type(raw) is not dict:
+            raise Fallback
+        ret = {name: get(raw, context) for name, get in getters}
+        return finish(ret, context) if finish else ret
+    return convert
+
+
+def _compile_value(field):
+    """
+    Compile a field into a function validating and representing a value that is neither missing nor null.
+    :param field: Serializer field.
+    """
+    if isinstance(field, serializers.ListSerializer):
+        return _compile_list(field)
+    if isinstance(field, serializers.Serializer):
+        return _compile_serializer(field)
+    if type(field) in (serializers.CharField, serializers.URLField):
+        return _compile_char(field)
+    if type(field) is serializers.IntegerField:
+        return _compile_integer(field)
+    if type(field) is serializers.BooleanField:
+        return _compile_boolean(field)
+    if isinstance(field, serializers.BaseSerializer):
+        raise Fallback
+    return _compile_generic(field)
+
+
+def _compile_default(field, convert):
+    """
+    Compile the default of a field into a function giving its representation.
+    :param field: Serializer field.
+    :param convert: Compiled field.
+    """
+    default = field.default
+    if default is None:
+        return lambda context: None
+    if default == [] and type(default) is list:
+        return lambda context: []
+    if default == {} and type(default) is dict and isinstance(field, serializers.Serializer):
+        # Representing an empty mapping only matches validating one if every missing field falls back to a default
+        if any(child.default is empty for child in field.fields.values()):
+            raise Fallback
+        return lambda context: convert({}, context)
+    if type(default) in (str, int, float, bool):
+        value = field.to_representation(default)
+        return lambda context: value
+    raise Fallback
+
+
+def _compile_field(field):
+    """
+    Compile a field into a function getting its validated representation out of a mapping.
+    :param field: Serializer field.
+    """
+    name, required, allow_null = field.field_name, field.required, field.allow_null
+    convert = _compile_value(field)
+    default = _compile_default(field, convert) if field.default is not empty else None
+
+    def get(data, context):
+        raw = data.get(name, empty)
+        if raw is empty:
+            if required or default is None:
+                raise Fallback
+            return default(context)
+        if raw is None:
+            if not allow_null:
+                raise Fallback
+            return None
+        return convert(raw, context)
+    return get
+
+
+def _fallback():
+    raise Fallback
+
+
+class Normalizer:
+    """
+    Validate data and get its representation like a serializer would, through a compiled version of it.
+    :param serializer_class: Serializer class.
+    """
+
+    def __init__(self, serializer_class):
+        self.serializer_class = serializer_class
+        self._convert = empty
+
+    @property
+    def convert(self):
+        """Compiled serializer, or None if it can't be compiled."""
+        if self._convert is empty:
+            try:
+                self._convert = _compile_serializer(self.serializer_class())
+            except Fallback:
+                self._convert = None
+        return self._convert
+
+    def __call__(self, data, context):
+        """
+        Validate data and get its representation.
+        :param data: Data to validate.
+        :param context: Serializer context.
+        :return: Representation and None if the data is valid, otherwise None and the validation errors.
+        """
+        if self.convert:
+            try:
+                return self.convert(data, context), None
+            except Exception:  # Let the serializer deal with anything unexpected, including raising it again
+                pass
+        serializer = self.serializer_class(data=data, context=context)
+        if serializer.is_valid():
+            return serializer.data, None
+        return None, serializer.errors
@@ -2,6 +2,8 @@ import pendulum
 
 from natural.date import duration
 
+from api import timestamps
+
 embed_grid_values = [['1 / 13'], ['1 / 7', '7 / 13'], ['1 / 5', '5 / 9', '9 / 13']]
 
 
@@ -10,7 +12,9 @@ class LiteLogRenderer:
         self.uuid = data['uuid']
         self.page = data.get('page')
         self._messages = self.page.object_list if self.page else data['messages']
-        self.messages = [Message(**m) for m in self._messages]
+        # Messages of saved logs reference their author by index in the log's author table
+        authors = [User(author) for author in data.get('authors') or ()]
+        self.messages = [Message(authors, **m) for m in self._messages]
 
     @property
     def message_groups(self):
@@ -91,7 +95,7 @@ class User:
         return f'{self.username}#{self.discriminator}'
 
     def __eq__(self, other):
-        return other.__dict__ == self.__dict__
+        return other is self or other.__dict__ == self.__dict__
 
 
 class Embed:
@@ -102,7 +106,7 @@ class Embed:
         self.type = data.get('type', 'rich')
         self.author = data.get('author')
         self.provider = data.get('provider')
-        self.timestamp_ = pendulum.parse(data['timestamp']) if data.get('timestamp') else None
+        self.timestamp_ = timestamps.parse(data['timestamp']) if data.get('timestamp') else None
         self.color = data.get('color')
         self.image = data.get('image')
         self.thumbnail = data.get('thumbnail')
@@ -149,17 +153,19 @@ class Embed:
 
 
 class Message:
-    def __init__(self, **kwargs):
+    def __init__(self, authors=(), **kwargs):
         self.id = kwargs.get('id')
         self.channel_id = kwargs.get('channel_id')
         self.guild_id = kwargs.get('guild_id')
-        self.author = User(kwargs.get('author'))
-        self.timestamp_ = pendulum.parse(kwargs['timestamp']) if kwargs.get('timestamp') else None
-        self.edited_timestamp_ = pendulum.parse(kwargs['edited_timestamp']) if kwargs.get('edited_timestamp') else None
+        author = kwargs.get('author')
+        self.author = authors[author] if type(author) is int else User(author)
+        self.timestamp_ = timestamps.parse(kwargs['timestamp']) if kwargs.get('timestamp') else None
+        self.edited_timestamp_ = timestamps.parse(kwargs['edited_timestamp']) if kwargs.get('edited_timestamp') \
+            else None
         self.raw_content = kwargs.get('_content')
         self.content = kwargs.get('content')
         self.attachments = kwargs.get('attachments')
-        self.embeds = [Embed(e) for e in kwargs.get('embeds')]
+        self.embeds = [Embed(e) for e in kwargs.get('embeds') or ()]
 
         self.error = False
         if not any([self.raw_content, self.attachments, self.embeds]):  # No content, attachments or embeds
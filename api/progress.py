@@ -0,0 +1,54 @@
+import time
+
+from celery_progress.websockets.backend import WebSocketProgressRecorder
+
+
+class ThrottledProgressRecorder(WebSocketProgressRecorder):
+    """
+    Websocket progress recorder that coalesces updates, since every update is a result backend write and a channel
+    layer message. An update is only sent once both `interval` seconds have passed and progress has moved by `step`
+    percent since the last one, except for the final update, which is always sent.
+    :param task: Task instance.
+    :param interval: Minimum number of seconds between updates.
+    :param step: Minimum change in percent between updates.
+    """
+
+    def __init__(self, task, interval: float = 0.25, step: float = 1):
+        super().__init__(task)
+        self.interval = interval
+        self.step = step
+        self.sent_at = 0
+        self.sent_percent = -step
+
+    def set_progress(self, current, total, description=""):
+        now = time.monotonic()
+        if current < total:
+            percent = current * 100 / total
+            if now - self.sent_at < self.interval or percent - self.sent_percent < self.step:
+                return
+        else:
+            percent = 100
+        self.sent_at, self.sent_percent = now, percent
+        self.send_progress(current, total, description)
+
+    def send_progress(self, current, total, description=""):
+        """Send a progress update that made it through the throttle."""
+        super().set_progress(current, total, description)
+
+
+class StageProgress:
+    """
+    Progress recorder for one stage of a task made up of several, reporting it as its share of the task's progress.
+    :param recorder: Progress recorder of the task.
+    :param stage: Index of the stage.
+    :param stages: Number of stages.
+    """
+
+    def __init__(self, recorder, stage: int, stages: int):
+        self.recorder = recorder
+        self.stage = stage
+        self.stages = stages
+
+    def set_progress(self, current, total, description=""):
+        total = max(total, 1)
+        self.recorder.set_progress(self.stage * total + min(current, total), self.stages * total, description)
@@ -0,0 +1,65 @@
+"""
+Full-text search inside a log. The raw content of each message is indexed as a Postgres tsvector when the log is saved,
+and searches return the positions of matching messages, along with the viewer page each one is on.
+"""
+from itertools import islice
+
+from django.contrib.postgres.search import SearchQuery, SearchVector
+
+from api.fragments import PAGE_SIZE
+from api.models import SearchEntry, snowflake
+from api.storage import MESSAGES_PER_PAGE
+
+# Text search configuration, "simple" doesn't stem or drop stop words, which suits chat in any language
+SEARCH_CONFIG = 'simple'
+
+# Number of characters of message content returned with each result
+EXCERPT_LENGTH = 200
+
+
+def add_entries(log, messages: list, start: int = 0):
+    """
+    Add messages to the search index of a log.
+    :param log: Log instance.
+    :param messages: Formatted messages, in order.
+    :param start: Position of the first of :param messages in the log.
+    """
+    SearchEntry.objects.bulk_create((
+        SearchEntry(log=log, sequence=start + i, message_id=snowflake(message.get('id')), content=message['_content'])
+        for i, message in enumerate(messages) if message.get('_content')
+    ), batch_size=MESSAGES_PER_PAGE)
+    log.search_entries.filter(sequence__gte=start, sequence__lt=start + len(messages)).update(
+        vector=SearchVector('content', config=SEARCH_CONFIG)
+    )
+
+
+def index_messages(log, messages):
+    """
+    Build the search index of a log, replacing any it had.
+    :param log: Log instance.
+    :param messages: Formatted messages, in order.
+    """
+    log.search_entries.all().delete()
+    messages, start = iter(messages), 0
+    while batch := list(islice(messages, MESSAGES_PER_PAGE)):
+        add_entries(log, batch, start)
+        start += len(batch)
+
+
+def search_messages(log, query: str, limit: int = 50) -> list:
+    """
+    Search the messages of a log.
+    :param log: Log instance.
+    :param query: Search terms, in web search syntax.
+    :param limit: Maximum number of results.
+    :return: Matching messages, in order.
+    """
+    entries = log.search_entries.filter(
+        vector=SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+    ).order_by('sequence').values_list('sequence', 'message_id', 'content')[:limit]
+    return [{
+        'id': str(message_id) if message_id is not None else None,
+        'index': sequence,
+        'page': sequence // PAGE_SIZE + 1,
+        'content': content[:EXCERPT_LENGTH]
+    } for sequence, message_id, content in entries]
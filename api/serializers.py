@@ -1,6 +1,7 @@
 from natural.size import filesize
 from rest_framework import serializers
 
+from api import timestamps
 from api.formatter import to_html
 
 
@@ -25,7 +26,38 @@ def scale_image(height, width, max_height, max_width):
     return int(height), int(width)
 
 
-class AuthorSerializer(serializers.Serializer):
+class TimestampField(serializers.DateTimeField):
+    """DateTimeField that decodes plain ISO-8601 timestamps without going through Django's parser."""
+
+    def to_internal_value(self, value):
+        if isinstance(value, str) and (parsed := timestamps.decode_iso(value)) is not None:
+            return self.enforce_timezone(parsed)
+        return super().to_internal_value(value)
+
+
+class BaseSerializer(serializers.Serializer):
+    """Serializer whose output is finished off by :meth:`format`, so that it can be applied to output built elsewhere."""
+
+    @staticmethod
+    def format(ret, context):
+        """
+        Finish off serialized data.
+        :param ret: Serialized data.
+        :param context: Serializer context.
+        """
+        return ret
+
+    def to_representation(self, instance):
+        return self.format(super().to_representation(instance), self.context)
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
+class AuthorSerializer(BaseSerializer):
     id = serializers.IntegerField()
     username = serializers.CharField(min_length=2, max_length=32)
     discriminator = serializers.CharField(min_length=0, max_length=4, allow_null=True, default="0")
@@ -33,8 +65,8 @@ class AuthorSerializer(serializers.Serializer):
     bot = serializers.BooleanField(default=False)
     color = serializers.IntegerField(default=None)
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
+    @staticmethod
+    def format(ret, context):
         if ret.get('color'):
             ret['color'] = f'#{ret["color"]:06X}'
         if not ret.get('avatar'):
@@ -44,14 +76,8 @@ class AuthorSerializer(serializers.Serializer):
             ret['avatar'] = f'https://cdn.discordapp.com/avatars/{ret["id"]}/{ret["avatar"]}.{ending}'
         return ret
 
-    def update(self, instance, validated_data):
-        pass
 
-    def create(self, validated_data):
-        pass
-
-
-class AttachmentSerializer(serializers.Serializer):
+class AttachmentSerializer(BaseSerializer):
     id = serializers.IntegerField(default=None, allow_null=True)
     filename = serializers.CharField()
     url = serializers.CharField()
@@ -60,8 +86,8 @@ class AttachmentSerializer(serializers.Serializer):
     width = serializers.IntegerField(default=None, allow_null=True)
     height = serializers.IntegerField(default=None, allow_null=True)
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
+    @staticmethod
+    def format(ret, context):
         ext = ret.get('filename').rsplit('.', 1)[-1].lower()
         if ext in ['png', 'jpg', 'jpeg', 'webp']:
             ret['type'] = 'image'
@@ -74,105 +100,69 @@ class AttachmentSerializer(serializers.Serializer):
         ret['size'] = filesize(ret['size'] or 0)
         return ret
 
-    def update(self, instance, validated_data):
-        pass
-
-    def create(self, validated_data):
-        pass
 
-
-class ImageSerializer(serializers.Serializer):
+class ImageSerializer(BaseSerializer):
     url = serializers.URLField()
     proxy_url = serializers.URLField(default=None, allow_null=True)
     width = serializers.IntegerField(default=None, allow_null=True)
     height = serializers.IntegerField(default=None, allow_null=True)
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
+    @staticmethod
+    def format(ret, context):
         if ret.get('width') is not None:
             ret['height'], ret['width'] = scale_image(ret['height'], ret['width'], 300, 400)
 
         return sort_null(ret)
 
-    def update(self, instance, validated_data):
-        pass
-
-    def create(self, validated_data):
-        pass
 
-
-class EmbedAuthorSerializer(serializers.Serializer):
+class EmbedAuthorSerializer(BaseSerializer):
     name = serializers.CharField(default=None, allow_null=True)
     url = serializers.URLField(default=None, allow_null=True)
     icon_url = serializers.URLField(default=None, allow_null=True)
     proxy_icon_url = serializers.URLField(default=None, allow_null=True)
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
+    @staticmethod
+    def format(ret, context):
         return sort_null(ret)
 
-    def update(self, instance, validated_data):
-        pass
-
-    def create(self, validated_data):
-        pass
 
-
-class EmbedProviderSerializer(serializers.Serializer):
+class EmbedProviderSerializer(BaseSerializer):
     name = serializers.CharField(default=None, allow_null=True)
     url = serializers.URLField(default=None, allow_null=True)
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
+    @staticmethod
+    def format(ret, context):
         return sort_null(ret)
 
-    def update(self, instance, validated_data):
-        pass
-
-    def create(self, validated_data):
-        pass
-
 
-class EmbedFieldSerializer(serializers.Serializer):
+class EmbedFieldSerializer(BaseSerializer):
     name = serializers.CharField(max_length=256)
     value = serializers.CharField(max_length=2048)
     inline = serializers.BooleanField(default=False)
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
-        ret['name'] = to_html(ret['name'], options={'embed': 'lite', 'users': self.context['users']})
-        ret['value'] = to_html(ret['value'], options={'embed': True, 'users': self.context['users']})
+    @staticmethod
+    def format(ret, context):
+        ret['name'] = to_html(ret['name'], options={'embed': 'lite', 'users': context['users']})
+        ret['value'] = to_html(ret['value'], options={'embed': True, 'users': context['users']})
         return ret
 
-    def update(self, instance, validated_data):
-        pass
-
-    def create(self, validated_data):
-        pass
-
 
-class EmbedFooterSerializer(serializers.Serializer):
+class EmbedFooterSerializer(BaseSerializer):
     text = serializers.CharField(default=None, allow_null=True)
     icon_url = serializers.URLField(default=None, allow_null=True)
     proxy_icon_url = serializers.URLField(default=None, allow_null=True)
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
+    @staticmethod
+    def format(ret, context):
         return sort_null(ret)
 
-    def update(self, instance, validated_data):
-        pass
-
-    def create(self, validated_data):
-        pass
-
 
-class EmbedSerializer(serializers.Serializer):
+class EmbedSerializer(BaseSerializer):
     title = serializers.CharField(max_length=256, default=None, allow_null=True)
     description = serializers.CharField(max_length=2048, default=None, allow_null=True)
     url = serializers.URLField(default=None, allow_null=True)
     type = serializers.CharField(max_length=20, default='rich')
-    timestamp = serializers.DateTimeField(default=None, allow_null=True)
+    timestamp = TimestampField(default=None, allow_null=True)
     color = serializers.IntegerField(default=None, allow_null=True)
     image = ImageSerializer(default=None, allow_null=True)
     thumbnail = ImageSerializer(default=None, allow_null=True)
@@ -182,12 +172,12 @@ class EmbedSerializer(serializers.Serializer):
     fields = EmbedFieldSerializer(many=True, default=[], allow_null=True)
     footer = EmbedFooterSerializer(required=False, default={}, allow_null=True)
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
+    @staticmethod
+    def format(ret, context):
         if ret.get('title'):
-            ret['title'] = to_html(ret['title'], options={'embed': 'lite', 'users': self.context['users']})
+            ret['title'] = to_html(ret['title'], options={'embed': 'lite', 'users': context['users']})
         if ret.get('description'):
-            ret['description'] = to_html(ret['description'], options={'embed': True, 'users': self.context['users']})
+            ret['description'] = to_html(ret['description'], options={'embed': True, 'users': context['users']})
         ret['color'] = f'#{ret["color"]:06X}' if ret.get('color') else None
 
         if ret['type'] == 'article' and not (ret.get('title') or ret.get('description')):
@@ -202,34 +192,22 @@ class EmbedSerializer(serializers.Serializer):
 
         return ret
 
-    def update(self, instance, validated_data):
-        pass
 
-    def create(self, validated_data):
-        pass
-
-
-class MessageSerializer(serializers.Serializer):
+class MessageSerializer(BaseSerializer):
     id = serializers.IntegerField(default=None)
     channel_id = serializers.IntegerField(default=None)
     guild_id = serializers.IntegerField(default=None)
     author = AuthorSerializer()
     mentions = AuthorSerializer(many=True, default=[])
-    timestamp = serializers.DateTimeField(default=None)
-    edited_timestamp = serializers.DateTimeField(default=None, allow_null=True)
+    timestamp = TimestampField(default=None)
+    edited_timestamp = TimestampField(default=None, allow_null=True)
     content = serializers.CharField(default='', allow_blank=True)
     attachments = AttachmentSerializer(many=True, default=[])
     embeds = EmbedSerializer(many=True, default=[])
 
-    def to_representation(self, instance):
-        ret = super().to_representation(instance)
+    @staticmethod
+    def format(ret, context):
         ret['_content'] = ret['content']
         webhook_mode = True if ret['author'].get('bot') and ret['author'].get('discriminator') == '0000' else False
-        ret['content'] = to_html(ret['content'], options={'embed': webhook_mode, 'users': self.context['users']})
+        ret['content'] = to_html(ret['content'], options={'embed': webhook_mode, 'users': context['users']})
         return ret
-
-    def update(self, instance, validated_data):
-        pass
-
-    def create(self, validated_data):
-        pass
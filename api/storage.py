@@ -0,0 +1,162 @@
+"""
+Access to the messages of a saved log. Messages are stored in pages of `MESSAGES_PER_PAGE`, and the size of each page
+is kept on the log, so any range of them can be read from the few pages covering it, and cut out of those pages by
+Postgres, without loading the rest of the log. Compressed pages are cut once decompressed instead. Logs stored as rows
+instead keep each message in its own row, numbered by its position, and are read by ranges of those numbers.
+
+Either way, messages are stored compacted: authors and mentioned users are kept once in the author table of the log and
+referenced by their index in it, and empty fields are left out.
+"""
+from bisect import bisect_right
+from itertools import accumulate
+
+from django.db import models
+from django.db.models import F, Func, Value
+
+from api import compression
+
+# Number of messages in each stored page of a log, all pages but the last are full, or the first for logs stored in
+# reverse
+MESSAGES_PER_PAGE = 1000
+
+
+def _compact(data: dict) -> dict:
+    return {key: value for key, value in data.items() if value is not None and value != '' and value != []}
+
+
+class AuthorTable:
+    """
+    Author table of a log, filled in as its messages are compacted for storage, one at a time.
+    """
+
+    def __init__(self):
+        self.authors = []
+        self.indexes = {}
+
+    def intern(self, user: dict) -> int:
+        key = tuple(sorted(user.items()))
+        if (index := self.indexes.get(key)) is None:
+            index = self.indexes[key] = len(self.authors)
+            self.authors.append(_compact(user))
+        return index
+
+    def compact(self, message: dict) -> dict:
+        """
+        Compact a formatted message for storage.
+        :param message: Formatted message.
+        :return: Compacted message, referencing the table.
+        """
+        message = _compact(message)
+        if 'author' in message:
+            message['author'] = self.intern(message['author'])
+        if 'mentions' in message:
+            message['mentions'] = [self.intern(user) for user in message['mentions']]
+        return message
+
+    def expand(self, message: dict) -> dict:
+        """
+        Get a compacted message back with its author and mentions in full, its empty fields still left out.
+        :param message: Compacted message, referencing the table.
+        """
+        message = dict(message)
+        if 'author' in message:
+            message['author'] = self.authors[message['author']]
+        if 'mentions' in message:
+            message['mentions'] = [self.authors[index] for index in message['mentions']]
+        return message
+
+
+class JSONBPathQueryArray(Func):
+    function = 'jsonb_path_query_array'
+    template = '%(function)s(%(expressions)s::jsonpath)'
+    output_field = models.JSONField()
+
+
+class LogMessages:
+    """
+    Messages of a saved log, as a sequence that only reads the messages it's sliced to. It can be handed to Django's
+    paginator, which only counts and slices it.
+    :param log: Log instance.
+    """
+
+    def __init__(self, log):
+        self.log = log
+        # Position of the first message of each page
+        self.offsets = [0, *accumulate(log.page_sizes)][:-1]
+
+    def count(self) -> int:
+        return self.log.message_count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            if key < 0:
+                key += self.count()
+            if not (messages := self[key:key + 1]):
+                raise IndexError('message index out of range')
+            return messages[0]
+
+        start, stop, step = key.indices(self.count())
+        if start >= stop:
+            return []
+        messages = []
+        for index in range(bisect_right(self.offsets, start) - 1, bisect_right(self.offsets, stop - 1)):
+            offset = self.offsets[index]
+            first, last = max(start - offset, 0), min(stop - offset, self.log.page_sizes[index])
+            page = self.log.pages.filter(index=index).values_list(
+                JSONBPathQueryArray(F('messages'), Value(f'$[{first} to {last - 1}]')), 'compressed', 'dictionary_id'
+            ).first()
+            if page:
+                part, compressed, dictionary_id = page
+                messages.extend(part if compressed is None else
+                                compression.decompress(compressed, dictionary_id)[first:last])
+        return messages[::step] if step != 1 else messages
+
+    def __iter__(self):
+        for page in self.log.pages.order_by('index').values_list('messages', 'compressed', 'dictionary_id').iterator():
+            yield from compression.decode_page(*page)
+
+
+class MessageRows:
+    """
+    Messages of a log saved as rows, as a sequence read with keyset queries on the log and position of each message.
+    :param log: Log instance.
+    """
+
+    def __init__(self, log):
+        self.log = log
+
+    def count(self) -> int:
+        return self.log.message_count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            if key < 0:
+                key += self.count()
+            if not (messages := self[key:key + 1]):
+                raise IndexError('message index out of range')
+            return messages[0]
+
+        start, stop, step = key.indices(self.count())
+        if start >= stop:
+            return []
+        messages = list(self.log.messages.filter(sequence__gte=start, sequence__lt=stop).order_by(
+            'sequence').values_list('payload', flat=True))
+        return messages[::step] if step != 1 else messages
+
+    def __iter__(self):
+        yield from self.log.messages.order_by('sequence').values_list('payload', flat=True).iterator(
+            chunk_size=MESSAGES_PER_PAGE)
+
+
+def log_messages(log):
+    """
+    Get the messages of a saved log, however they are stored.
+    :param log: Log instance.
+    """
+    return MessageRows(log) if log.storage == log.Storage.ROWS else LogMessages(log)
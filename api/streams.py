@@ -0,0 +1,176 @@
+"""
+Incremental reading of uploaded messages. Messages can be sent as a JSON array or as NDJSON, optionally gzip or zstd
+encoded, and are decoded and parsed chunk by chunk, one message at a time, so a log never has to be held in memory as
+a whole to be checked, stored or processed.
+"""
+import codecs
+import json
+import re
+import zlib
+from typing import Iterable, Iterator
+
+from api import compression
+from api.blobs import CHUNK_SIZE, blob_store
+
+# Content types of request bodies holding nothing but messages
+STREAM_CONTENT_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl')
+
+# Largest a single message can be, so a malformed stream isn't buffered whole looking for the end of one
+MAX_MESSAGE_SIZE = 4 * 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r'\s*')
+
+
+class StreamError(ValueError):
+    pass
+
+
+def decompress(chunks: Iterable[bytes], encoding: str = None) -> Iterator[bytes]:
+    """
+    Decompress chunks of content.
+    :param chunks: Chunks of encoded content.
+    :param encoding: Content encoding, one of gzip, deflate or zstd, or None if it isn't encoded.
+    """
+    encoding = (encoding or 'identity').strip().lower()
+    if encoding == 'identity':
+        yield from chunks
+        return
+    if encoding in ('gzip', 'x-gzip', 'deflate'):
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS if encoding != 'deflate' else zlib.MAX_WBITS)
+    elif encoding == 'zstd' and compression.zstandard is not None:
+        decompressor = compression.zstandard.ZstdDecompressor().decompressobj()
+    else:
+        raise StreamError(f'Unsupported content encoding "{encoding}"!')
+    try:
+        for chunk in chunks:
+            if data := decompressor.decompress(chunk):
+                yield data
+        if hasattr(decompressor, 'flush') and (data := decompressor.flush()):
+            yield data
+    except (zlib.error, getattr(compression.zstandard, 'ZstdError', zlib.error)) as e:
+        raise StreamError(f'Content could not be decompressed: {e}')
+
+
+def iter_text(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Decode chunks of UTF-8 content into text.
+    :param chunks: Chunks of content.
+    """
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    try:
+        for chunk in chunks:
+            if text := decoder.decode(chunk):
+                yield text
+        if text := decoder.decode(b'', final=True):
+            yield text
+    except UnicodeDecodeError as e:
+        raise StreamError(f'Content is not valid UTF-8: {e}')
+
+
+def iter_messages(chunks: Iterable[str]) -> Iterator[dict]:
+    """
+    Parse messages out of chunks of text, as they arrive. The text is either a JSON array of messages, or messages
+    separated by whitespace, like NDJSON.
+    :param chunks: Chunks of text.
+    """
+    chunks = iter(chunks)
+    buffer, pos = '', 0
+    array = None  # Whether the messages are in an array, unknown until the first character
+    count, separated, closed = 0, False, False
+    while True:
+        pos = _whitespace.match(buffer, pos).end()
+        if pos == len(buffer):
+            if (chunk := next(chunks, None)) is None:
+                break
+            buffer, pos = chunk, 0
+            continue
+        if closed:
+            raise StreamError('Unexpected content after the end of the array!')
+        char = buffer[pos]
+        if array is None:
+            array = char == '['
+            if array:
+                pos += 1
+                continue
+        if array and count and not separated:
+            if char == ']':
+                closed = True
+            elif char != ',':
+                raise StreamError('Messages must be separated by commas!')
+            separated, pos = char == ',', pos + 1
+            continue
+        if array and not count and char == ']':
+            closed, pos = True, pos + 1
+            continue
+        try:
+            message, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # The message may not have arrived in full yet
+            if len(buffer) - pos > MAX_MESSAGE_SIZE or (chunk := next(chunks, None)) is None:
+                raise StreamError('Messages must be a valid JSON array or NDJSON of Discord message objects!')
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        if not isinstance(message, dict):
+            raise StreamError('Messages must be Discord message objects!')
+        count, separated, pos = count + 1, False, end
+        yield message
+    if array and not closed:
+        raise StreamError('Messages must be a valid JSON array or NDJSON of Discord message objects!')
+
+
+def encode(messages: Iterable[dict]) -> Iterator[str]:
+    """
+    Encode messages as canonical NDJSON, one compact line per message with its keys sorted, so the same messages are
+    stored under the same content key whether they were sent as a JSON body, a stream or an archive URL.
+    :param messages: Messages to encode.
+    """
+    for message in messages:
+        yield json.dumps(message, ensure_ascii=False, separators=(',', ':'), sort_keys=True) + '\n'
+
+
+def checked(chunks: Iterable[bytes]) -> Iterator[str]:
+    """
+    Parse the messages out of chunks of content as they arrive, checking that they're valid and that there's at least
+    one of them, and encode them as canonical NDJSON.
+    :param chunks: Chunks of decompressed content.
+    """
+    found = False
+    for line in encode(iter_messages(iter_text(chunks))):
+        found = True
+        yield line
+    if not found:
+        raise StreamError('You must include at least one message to parse!')
+
+
+def request_chunks(request, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Read the body of a request in chunks.
+    :param request: Request instance.
+    :param chunk_size: Number of bytes read at once.
+    """
+    if (stream := getattr(request, 'stream', request)) is None:
+        return
+    while chunk := stream.read(chunk_size):
+        yield chunk
+
+
+def is_stream(request) -> bool:
+    """Check if the body of a request holds only messages, to be read as a stream."""
+    media_type = (request.content_type or '').split(';')[0].strip().lower()
+    return media_type in STREAM_CONTENT_TYPES or bool(request.META.get('HTTP_CONTENT_ENCODING'))
+
+
+class StoredMessages:
+    """
+    Messages of raw content in the blob store, parsed again each time they're iterated.
+    :param key: Content key.
+    :param progress: Progress recorder, given the share of the content read.
+    """
+
+    def __init__(self, key: str, progress=None):
+        self.key = key
+        self.progress = progress
+
+    def __iter__(self):
+        return iter_messages(blob_store.iter_text(self.key, progress=self.progress))
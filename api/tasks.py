@@ -1,10 +1,22 @@
 import time
+from itertools import chain, islice
 
+import celery
+import pendulum
 from celery import shared_task
-from celery_progress.websockets.backend import WebSocketProgressRecorder
+from django.conf import settings
+from django.db.models import F
 
-from api.models import Log, Page
+from api import compression, fetch, navigation, search
+from api.blobs import blob_store
+from api.fragments import fragment_store, render_pages
+from api.models import Log, Message, Page, snowflake
+from api.normalizer import Normalizer
+from api.progress import StageProgress, ThrottledProgressRecorder
 from api.serializers import MessageSerializer
+from api.storage import MESSAGES_PER_PAGE, AuthorTable, log_messages
+from api.streams import StoredMessages
+from api.v1 import tasks as v1_tasks
 
 # Sample author dictionary if author isn't supplied
 unknown_author = {
@@ -13,48 +25,244 @@ unknown_author = {
     'discriminator': '0'
 }
 
+normalize_message = Normalizer(MessageSerializer)
 
-@shared_task(bind=True)
-def parse_json(self, json_data: dict):
+
+def _user_key(user: dict):
+    return user.get('id') or f'{user.get("username")}#{user.get("discriminator")}'
+
+
+def collect_users(json_data) -> dict:
     """
-    Convert raw JSON into finished message objects.
-    :param self: Task instance, supplied by Celery.
-    :param json_data: Raw JSON.
-    :return: Parsed data.
+    Collect the authors of raw JSON messages, so that mentions of users who only speak later in a log can be rendered.
+    :param json_data: Raw JSON messages.
+    :type json_data: Iterable[dict]
+    :return: Authors by id.
     """
-    messages = []
-    bad_messages = []
-    data = {}
-
-    _users = {a['id'] or f'{a["username"]}#{a["discriminator"]}': a for a in [
-        msg.get('author', unknown_author) for msg in json_data
-    ]}
+    return {_user_key(author): author for author in (msg.get('author', unknown_author) for msg in json_data)}
 
-    total = len(json_data)
-    progress = WebSocketProgressRecorder(self)
 
+def iter_formatted(json_data, users: dict, progress=None):
+    """
+    Convert raw JSON into finished message objects one at a time.
+    :param json_data: Raw JSON messages.
+    :type json_data: Iterable[dict]
+    :param users: Authors of the messages by id, from :func:`collect_users`.
+    :param progress: Progress recorder, None if :param json_data reports its own progress.
+    """
+    total = len(json_data) if progress else 0
+    context = {'users': users}
     for count, msg in enumerate(json_data):
-        msg = MessageSerializer(data=msg, context={'users': _users})
-        if msg.is_valid():
-            messages.append(msg.data)
-        else:
-            bad_messages.append((msg.initial_data, msg.errors))
+        message, errors = normalize_message(msg, context)
+        if errors is None:
+            yield message
+
+        if progress:
+            progress.set_progress(count, total)
 
-        progress.set_progress(count, total)
 
-    if any([messages[0].get('timestamp'), messages[0].get('id')]):
-        messages.sort(key=lambda value: int(value.get('id') or 0) or value.get('timestamp'))
-    data['messages'] = messages
+def format_messages(json_data, progress, users: dict = None) -> dict:
+    """
+    Convert raw JSON into finished message objects.
+    :param json_data: Raw JSON, as a list or as stored messages reporting their own progress.
+    :type json_data: Union[list, StoredMessages]
+    :param progress: Progress recorder.
+    :param users: Authors of the messages by id, collected from :param json_data if not supplied.
+    :return: Formatted data.
+    """
+    data = {}
+    _users = collect_users(json_data) if users is None else users
+    messages = list(iter_formatted(json_data, _users, progress if isinstance(json_data, list) else None))
+
+    data['messages'] = sort_messages(messages)
 
     users = list(_users.values())
     users.sort(key=lambda value: value['username'])
     data['users'] = users
 
-    progress.set_progress(total, total)
+    progress.set_progress(len(messages), len(messages))
 
     return data
 
 
+def _sort_key(message: dict):
+    return snowflake(message.get('id')) or message.get('timestamp')
+
+
+def _sortable(message: dict) -> bool:
+    return bool(message.get('timestamp') or message.get('id'))
+
+
+def sort_messages(messages: list) -> list:
+    """
+    Sort messages in place by id, or by time for messages without one, unless the first of them has neither.
+    :param messages: Raw or formatted messages.
+    :return: Sorted messages.
+    """
+    if messages and _sortable(messages[0]):
+        messages.sort(key=_sort_key)
+    return messages
+
+
+def _batches(messages, size: int = MESSAGES_PER_PAGE):
+    messages = iter(messages)
+    while batch := list(islice(messages, size)):
+        yield batch
+
+
+def _reporting(messages: list, progress):
+    total = len(messages)
+    for count, message in enumerate(messages):
+        progress.set_progress(count, total)
+        yield message
+
+
+def _indexed(log, batches, authors: AuthorTable, index: navigation.IndexBuilder):
+    """
+    Pass stored pages of messages through in order, adding them to the navigation index and rendering their viewer
+    pages. A stored page is rendered once it's known whether messages follow it, so its last viewer page links on.
+    """
+    pending, count = None, 0
+    for batch in batches:
+        index.add(batch)
+        if fragment_store.client:
+            if pending:
+                fragment_store.set_many(log, render_pages(log.uuid, pending, authors.authors, count - len(pending),
+                                                          True))
+            pending = batch
+        count += len(batch)
+        yield batch
+    if pending:
+        fragment_store.set_many(log, render_pages(log.uuid, pending, authors.authors, count - len(pending)))
+
+
+def write_messages(log, messages, authors: AuthorTable, descending: bool = False) -> bool:
+    """
+    Store the messages of a log a stored page at a time as they arrive, along with their search entries, navigation
+    index and rendered viewer pages, replacing any it had. Only the page being stored is held in memory.
+    :param log: Log instance.
+    :param messages: Compacted messages.
+    :type messages: Iterable[dict]
+    :param authors: Author table the messages reference.
+    :param descending: Whether the messages arrive newest first, to be stored in reverse.
+    :return: Whether the messages arrived in the order expected, or have no id or timestamp to be ordered by.
+    """
+    log.storage = settings.MESSAGE_STORAGE
+    log.pages.all().delete()
+    log.messages.all().delete()
+    log.search_entries.all().delete()
+    dictionary_id = compression.dictionary_for(log.type) if settings.PAGE_COMPRESSION else None
+    index = navigation.IndexBuilder()
+    page_sizes, count = [], 0
+    sortable, ordered, last_key = None, True, None
+
+    # Viewer pages count from the oldest message, so a log stored in reverse is only indexed once it's all stored
+    batches = _batches(messages) if descending else _indexed(log, _batches(messages), authors, index)
+    for number, batch in enumerate(batches):
+        if sortable is None:
+            sortable = _sortable(batch[0])
+        if sortable:
+            for message in batch:
+                key = _sort_key(message)
+                if last_key is not None and (key > last_key if descending else key < last_key):
+                    ordered = False
+                last_key = key
+
+        if descending:
+            # Stored at negative positions counting back from the end, shifted into place once every message is in
+            batch.reverse()
+            start, page = -count - len(batch), -number - 1
+        else:
+            start, page = count, number
+        if log.storage == Log.Storage.ROWS:
+            Message.objects.bulk_create([Message.from_payload(log, start + i, authors.expand(message), message)
+                                         for i, message in enumerate(batch)])
+        else:
+            Page.objects.create(log=log, index=page, **compression.encode_page(batch, dictionary_id))
+            page_sizes.append(len(batch))
+        if settings.MESSAGE_SEARCH:
+            search.add_entries(log, batch, start)
+        count += len(batch)
+
+    if descending:
+        log.pages.update(index=F('index') + len(page_sizes))
+        log.messages.update(sequence=F('sequence') + count)
+        log.search_entries.update(sequence=F('sequence') + count)
+        page_sizes.reverse()
+    log.message_count = count
+    log.page_sizes = page_sizes
+    log.page_count = len(page_sizes)
+    if descending and ordered:
+        for _ in _indexed(log, _batches(log_messages(log)), authors, index):
+            pass
+    index.save(log)
+    return ordered
+
+
+def save_messages(messages, uuid: str, users: dict) -> str:
+    """
+    Save formatted messages to a log as they arrive. Messages arriving newest first, like Discord exports them, are
+    stored in reverse. Messages in no order at all are read back, sorted and saved again once all have arrived, which
+    is the only case holding every message of the log in memory at once.
+    :param messages: Formatted messages, sorted already if they're a list.
+    :type messages: Iterable[dict]
+    :param uuid: Log uuid.
+    :param users: Authors of the messages by id.
+    :return: Log uuid.
+    """
+    messages = iter(messages)
+    if not (head := list(islice(messages, 2))):
+        raise IndexError('No valid messages to save!')
+    descending = len(head) == 2 and _sortable(head[0]) and _sortable(head[1]) and \
+        _sort_key(head[1]) < _sort_key(head[0])
+
+    while not Log.objects.filter(uuid=uuid).exists():
+        time.sleep(1)
+    log = Log.objects.get(uuid=uuid)
+    authors = AuthorTable()
+    if not write_messages(log, (authors.compact(message) for message in chain(head, messages)), authors, descending):
+        write_messages(log, sort_messages(list(log_messages(log))), authors)
+
+    log.users = sorted(users.values(), key=lambda value: value['username'])
+    log.authors = authors.authors
+    log.state = Log.State.DONE
+    log.save(update_fields=['users', 'authors', 'message_count', 'page_count', 'page_sizes', 'storage', 'state'])
+    return uuid
+
+
+def save_pages(data: dict, uuid: str, progress) -> str:
+    """
+    Take formatted JSON log data and save it to a log.
+    :param data: Formatted data.
+    :param uuid: Log uuid.
+    :param progress: Progress recorder.
+    :return: Log uuid.
+    """
+    messages = data.pop('messages')
+    users = {_user_key(user): user for user in data.pop('users')}
+    save_messages(_reporting(messages, progress), uuid, users)
+    progress.set_progress(len(messages), len(messages))
+
+    return uuid
+
+
+@shared_task(bind=True)
+def parse_json(self, json_data: dict, content_key: str = None):
+    """
+    Convert raw JSON into finished message objects.
+    :param self: Task instance, supplied by Celery.
+    :param json_data: Raw JSON, None to read it from the blob store.
+    :param content_key: Blob key of the raw JSON, if it isn't given.
+    :return: Parsed data.
+    """
+    progress = ThrottledProgressRecorder(self)
+    if json_data is None:
+        # Authors are read in a pass of their own, so the messages never have to be held together to collect them
+        users = collect_users(StoredMessages(content_key, StageProgress(progress, 0, 2)))
+        return format_messages(StoredMessages(content_key, StageProgress(progress, 1, 2)), progress, users)
+    return format_messages(json_data, progress)
+
+
 @shared_task(bind=True)
 def create_pages(self, data: dict, uuid: str):
     """
@@ -64,24 +272,114 @@ def create_pages(self, data: dict, uuid: str):
     :param uuid: Log uuid.
     :return: Log uuid.
     """
-    progress = WebSocketProgressRecorder(self)
+    return save_pages(data, uuid, ThrottledProgressRecorder(self))
 
-    messages = data.pop('messages')
 
-    batch_list = []
-    batches = range(0, len(messages), 1000)
-    total = len(batches)
-    for count, batch in enumerate(batches):
-        progress.set_progress(count, total)
-        # [[0, 1, 2...], [1000, 1001, 1002...], [2000, 2001, 2002...]...]
-        batch_list.append(messages[batch:batch + 1000])  # Split messages by the 1000
+@shared_task(bind=True)
+def ingest(self, content, uuid: str, log_type: str = None, content_key: str = None):
+    """
+    Parse, format and save a log in a single task. Messages are formatted and saved a stored page at a time, instead of
+    going through the result backend between tasks. Raw messages are held in memory and sorted there, unless they're
+    read from the blob store, which is read once for their authors and once more for the messages themselves.
+    :param self: Task instance, supplied by Celery.
+    :param content: Raw content of log, None to read it from the blob store.
+    :type content: Union[str, list, None]
+    :param uuid: Log uuid.
+    :param log_type: Type of log, None if :param content is a list.
+    :param content_key: Blob key of the raw content, if it isn't given.
+    :return: Log uuid.
+    """
+    progress = ThrottledProgressRecorder(self)
+    if content is None and not log_type:
+        # Authors are read in a pass of their own, so the messages never have to be held together to collect them
+        users = collect_users(StoredMessages(content_key, StageProgress(progress, 0, 2)))
+        messages = iter_formatted(StoredMessages(content_key, StageProgress(progress, 1, 2)), users)
+    else:
+        if content is None:
+            content = blob_store.read(content_key)
+        if log_type:
+            content = v1_tasks.parse_messages(log_type, content, StageProgress(progress, 0, 2))
+        sort_messages(content)
+        users = collect_users(content)
+        messages = iter_formatted(content, users, StageProgress(progress, 1, 2) if log_type else progress)
+    save_messages(messages, uuid, users)
+    progress.set_progress(1, 1)
+    return uuid
 
-    while not Log.objects.filter(uuid=uuid).exists():
-        time.sleep(1)
-    log = Log.objects.update_or_create(uuid=uuid, defaults={'users': data.pop('users')})[0]
-    pages = Page.objects.bulk_create([Page(log=log, messages=batch_list[i], index=i) for i in range(
-        len(batch_list))])
-    log.pages.set(pages)
-    progress.set_progress(total, total)
 
-    return uuid
+@shared_task(bind=True)
+def fetch_log(self, url: str, log_type: str, owner_id: int, expires: str = None, privacy: str = 'public',
+              guild: int = None, messages: bool = False) -> str:
+    """
+    Download a log from a URL and create it, starting the pipeline processing it. A log with the same content as an
+    existing one isn't created again.
+    :param self: Task instance, supplied by Celery.
+    :param url: URL of log content.
+    :param log_type: Type of log.
+    :param owner_id: ID of log owner.
+    :param expires: Expiration time of log.
+    :param privacy: Log privacy setting.
+    :param guild: Linked guild of log. Must be set if privacy setting is either guild or mods.
+    :param messages: Whether the content is a JSON array or NDJSON of messages, instead of text of :param log_type.
+    :return: Log uuid.
+    """
+    data = fetch.fetch(url, messages, ThrottledProgressRecorder(self))
+    if log := Log.find_content(data['content_key']):
+        return log.uuid
+    Log.objects.create(type=log_type, owner_id=owner_id, privacy=privacy, guild=guild,
+                       expires=pendulum.parse(expires) if expires else None,
+                       data=start_pipeline(None, data['uuid'], None if messages else log_type, data['content_key']),
+                       **data)
+    return data['uuid']
+
+
+def fused(log_type: str = None) -> bool:
+    """
+    Check if a log is processed by the fused task. Text logs are parsed by the chain instead when `LOG_PARSE_CHUNKS`
+    allows splitting them up, since the fused task parses a log in one piece.
+    :param log_type: Type of log, None if its content is a list of messages.
+    """
+    return settings.LOG_PIPELINE == 'fused' and not (log_type and settings.LOG_PARSE_CHUNKS > 1)
+
+
+def pipeline(content, uuid: str, log_type: str = None, content_key: str = None):
+    """
+    Build the tasks processing a log, either as one fused task or as a chain of tasks, see :func:`fused`.
+    :param content: Raw content of log, None to read it from the blob store instead of the broker.
+    :type content: Union[str, list, None]
+    :param uuid: Log uuid.
+    :param log_type: Type of log, None if :param content is a list.
+    :param content_key: Blob key of the raw content, if it isn't given.
+    :return: Task signature.
+    """
+    if fused(log_type):
+        return ingest.si(content, uuid, log_type, content_key)
+    if log_type:
+        return celery.chain(v1_tasks.parse_text.s(log_type, content, content_key),
+                            parse_json.s() | create_pages.s(uuid))
+    return celery.chain(parse_json.s(content, content_key) | create_pages.s(uuid))
+
+
+def pipeline_data(result, log_type: str = None) -> dict:
+    """
+    Describe the tasks of a started pipeline.
+    :param result: Result of the pipeline.
+    :param log_type: Type of log, None if its content is a list of messages.
+    :return: Log data describing the started tasks.
+    """
+    if fused(log_type):
+        return {'pipeline': 'fused', 'tasks': [result.id]}
+    return {'pipeline': 'chain', 'tasks': list(reversed(result.as_list()))}
+
+
+def start_pipeline(content, uuid: str, log_type: str = None, content_key: str = None) -> dict:
+    """
+    Start processing a log.
+    :param content: Raw content of log, None to read it from the blob store instead of the broker.
+    :type content: Union[str, list, None]
+    :param uuid: Log uuid.
+    :param log_type: Type of log, None if :param content is a list.
+    :param content_key: Blob key of the raw content, if it isn't given.
+    :return: Log data describing the started tasks.
+    """
+    return pipeline_data(pipeline(content, uuid, log_type, content_key).apply_async(), log_type)
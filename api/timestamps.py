@@ -0,0 +1,122 @@
+"""
+Fast timestamp decoding. The layouts found in supported logs, along with ISO-8601, are decoded by matching a fixed
+pattern and converting the date and time up to the second, which is memoized since neighbouring messages tend to
+share it. Anything that doesn't fit a known layout is handed to pendulum.
+"""
+import datetime
+import functools
+import re
+import time
+
+import pendulum
+
+MONTHS = {name: index for index, name in enumerate(
+    ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'], 1
+)}
+
+WEEKDAYS = {name: index for index, name in enumerate(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])}
+
+iso_re = re.compile(r'(\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d)(?:\.(\d{1,6}))?(Z|[+-]\d\d:\d\d)?$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _numeric(prefix):
+    """Decode a YYYY-MM-DD HH:mm:ss prefix."""
+    return (int(prefix[0:4]), int(prefix[5:7]), int(prefix[8:10]), int(prefix[11:13]), int(prefix[14:16]),
+            int(prefix[17:19]))
+
+
+@functools.lru_cache(maxsize=4096)
+def _ctime(prefix):
+    """Decode a ddd MMM DD HH:mm:ss YYYY prefix."""
+    value = (int(prefix[20:24]), MONTHS[prefix[4:7]], int(prefix[8:10]), int(prefix[11:13]), int(prefix[14:16]),
+             int(prefix[17:19]))
+    if datetime.date(*value[:3]).weekday() != WEEKDAYS[prefix[0:3]]:
+        raise ValueError('Weekday does not match date')
+    return value
+
+
+@functools.lru_cache(maxsize=4096)
+def _rfc(prefix):
+    """Decode a ddd, D MMM YYYY HH:mm:ss prefix."""
+    weekday, day, month, year, clock = prefix.split(' ')
+    value = (int(year), MONTHS[month], int(day), int(clock[0:2]), int(clock[3:5]), int(clock[6:8]))
+    if datetime.date(*value[:3]).weekday() != WEEKDAYS[weekday[:-1]]:
+        raise ValueError('Weekday does not match date')
+    return value
+
+
+# Known pendulum formats, mapped to a pattern capturing the part up to the second and an optional fraction, and the
+# decoder for that part
+layouts = {
+    'YYYY-MM-DD HH:mm:ss.SSSSSS': (re.compile(r'(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)\.(\d{6})$'), _numeric),
+    'YYYY-MM-DD HH:mm:ss': (re.compile(r'(\d{4}-\d\d-\d\d \d\d:\d\d:\d\d)()$'), _numeric),
+    'ddd MMM DD HH:mm:ss YYYY': (re.compile(r'([A-Z][a-z]{2} [A-Z][a-z]{2} \d\d \d\d:\d\d:\d\d \d{4})()$'), _ctime),
+    'ddd, D MMM YYYY HH:mm:ss z': (
+        re.compile(r'([A-Z][a-z]{2}, \d{1,2} [A-Z][a-z]{2} \d{4} \d\d:\d\d:\d\d)() (?:GMT|UTC)$'), _rfc
+    ),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _timezone(offset):
+    """Get the timezone for an ISO-8601 offset."""
+    if offset in ('Z', '+00:00', '-00:00'):
+        return pendulum.UTC
+    seconds = int(offset[1:3]) * 3600 + int(offset[4:6]) * 60
+    return pendulum.tz.fixed_timezone(-seconds if offset[0] == '-' else seconds)
+
+
+def _build(fields, fraction, tz=pendulum.UTC):
+    return pendulum.DateTime(*fields, int(fraction.ljust(6, '0')) if fraction else 0, tzinfo=tz)
+
+
+def decode_iso(value):
+    """
+    Decode a plain ISO-8601 timestamp, without falling back to anything else.
+    :param value: Timestamp string.
+    :return: Decoded timestamp, in UTC if it doesn't have an offset, or None if it isn't a plain ISO-8601 timestamp.
+    """
+    if not (match := iso_re.match(value)):
+        return None
+    prefix, fraction, offset = match.groups()
+    try:
+        return _build(_numeric(prefix), fraction, _timezone(offset) if offset else pendulum.UTC)
+    except (ValueError, OverflowError):
+        return None
+
+
+def parse(value):
+    """
+    Parse an ISO-8601 timestamp.
+    :param value: Timestamp string.
+    :return: Parsed timestamp.
+    """
+    if (decoded := decode_iso(value)) is not None:
+        return decoded
+    return pendulum.parse(value)
+
+
+def from_format(value, fmt):
+    """
+    Parse a timestamp in a known format.
+    :param value: Timestamp string.
+    :param fmt: Pendulum format string.
+    :return: Parsed timestamp.
+    """
+    if (layout := layouts.get(fmt)) and (match := layout[0].match(value)):
+        try:
+            return _build(layout[1](match.group(1)), match.group(2))
+        except (KeyError, ValueError, OverflowError):
+            pass
+    return pendulum.from_format(value, fmt)
+
+
+def from_snowflake(snowflake):
+    """
+    Get the creation time of a Discord snowflake.
+    :param snowflake: Snowflake ID.
+    :return: Creation timestamp.
+    """
+    seconds, milliseconds = divmod((int(snowflake) >> 22) + 1420070400000, 1000)
+    return pendulum.DateTime(*time.gmtime(seconds)[:6], milliseconds * 1000, tzinfo=pendulum.UTC)
@@ -1,5 +1,10 @@
+import functools
+
 import pendulum
+from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
 from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
 from itsdangerous import URLSafeSerializer
 from rest_framework import serializers
 
@@ -26,3 +31,27 @@ def validate_expires(user, value):
 def get_default_timestamp():
     return pendulum.now().add(minutes=30)
 
+
+def run_sync(request, func, *args, **kwargs):
+    """
+    Run sync code, like database queries or Redis calls, from an async view without blocking the event loop. Under
+    ASGI it runs in a thread pool, closing the database connections it leaves behind, instead of in the one thread
+    Django runs every sync view in. Under WSGI it runs in the thread serving the request, like any sync view.
+    :param request: Request being served.
+    :param func: Function to run.
+    :return: Awaitable result of the function.
+    """
+    if isinstance(request, ASGIRequest):
+        return database_sync_to_async(func)(*args, **kwargs)
+    return sync_to_async(func, thread_sensitive=True)(*args, **kwargs)
+
+
+def async_view(view):
+    """
+    Serve a sync view as an async one, running it with :func:`run_sync` so requests to it are handled concurrently.
+    :param view: View function.
+    """
+    @functools.wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        return await run_sync(request, view, request, *args, **kwargs)
+    return wrapper
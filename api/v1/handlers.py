@@ -1,237 +1,292 @@
 import re
 
-import pendulum
-
-from api import consts
-
-
-def _rough_match(regex, lines, splitter):
-    _matches = list()
-    for text in lines:
-        if re.match(regex, text):
-            _matches.append(text)
+from api import consts, timestamps
+
+# Registry of every text log format we know how to parse, filled in by register()
+formats = {}
+
+
+def _rough_match(pattern, content, splitter, progress, start=0, end=None):
+    """
+    Lazily assemble records out of delimited segments. A segment that matches the record pattern starts a new record,
+    anything else is joined onto the record before it.
+    :param pattern: Compiled record pattern.
+    :param content: Log content.
+    :param splitter: Record delimiter.
+    :param progress: Progress recorder.
+    :param start: Offset to start reading from.
+    :param end: Offset to stop reading at.
+    """
+    end = len(content) if end is None else end
+    parts = []
+
+    while start <= end:
+        stop = content.find(splitter, start, end)
+        stop = end if stop == -1 else stop
+        text = content[start:stop]
+        if pattern.match(text):
+            if parts:
+                yield pattern.match(splitter.join(parts))
+            parts = [text]
+        elif parts:
+            parts.append(text)
+        progress.set_progress(stop, end)
+        start = stop + len(splitter)
+
+    if parts:
+        yield pattern.match(splitter.join(parts))
+
+
+def _compile_fields(fields, groups):
+    """
+    Compile a field map into a function building a dictionary out of a match.
+    :param fields: Mapping of keys to group names, (group name, default) tuples or nested field maps.
+    :param groups: Group indexes of the pattern being matched.
+    """
+    getters = []
+    for key, field in fields.items():
+        if isinstance(field, dict):
+            getters.append((key, _compile_fields(field, groups)))
+            continue
+        group, default = field if isinstance(field, tuple) else (field, None)
+        if (index := groups.get(group)) is None:
+            getters.append((key, lambda match, value=default: value))
+        elif default is None:
+            getters.append((key, lambda match, index=index: match.group(index)))
         else:
-            _matches[-1] += f'{splitter}{text}'
-
-    return (re.match(regex, m) for m in _matches)
-
-
-def rowboat(content, progress):
-    matches = (re.finditer(consts.rowboat_re, content, re.MULTILINE))
-    match_data = list(m.groupdict() for m in matches)
-    message_array = []
-
-    total = len(match_data)
-
-    for count, match in enumerate(match_data):
-        message_array.append({
-            'id': match['message_id'],
-            'guild_id': match['guild_id'],
-            'author': {
-                'id': match['user_id'],
-                'username': match['username'],
-                'discriminator': match['discriminator']
-            },
-            'content': match['content'],
-            'timestamp': pendulum.from_format(match['timestamp'], 'YYYY-MM-DD HH:mm:ss.SSSSSS').isoformat(),
-            'attachments': [
-                {
-                    'filename': url.rsplit('/', 1)[1],
-                    'url': url
-                }
-                for url in (match['attachments'].split(', ') if match.get('attachments') else [])
-            ]
-        })
-
-        progress.set_progress(count + 1, total)
-
-    return message_array
-
-
-def rosalina_bottings(content, progress):
-    matches = (re.finditer(consts.rosalina_bottings_re, content, re.MULTILINE))
-    match_data = list(m.groupdict() for m in matches)
-    message_array = []
-
-    total = len(match_data)
-
-    for count, match in enumerate(match_data):
-        message_array.append({
-            'id': match['message_id'],
-            'channel_id': match['channel_id'],
-            'guild_id': match['guild_id'],
-            'author': {
-                'id': match['user_id'],
-                'username': match['username'],
-                'discriminator': '0'
-            },
-            'content': match['content'],
-            'timestamp': pendulum.parse(match['timestamp']),
-            'attachments': [
-                {
-                    'filename': url.rsplit('/', 1)[1],
-                    'url': url
-                }
-                for url in (match['attachments'].split(', ') if match.get('attachments') else [])
-            ]
-        })
-
-        progress.set_progress(count + 1, total)
-
-    return message_array
-
-
-def auttaja(content, progress):
-    content = content[:-1] if content.endswith('\n') else content
-    matches = _rough_match(consts.auttaja_re, content.split('\n\n'), '\n\n')
-    match_data = list(m.groupdict() for m in matches)
-    message_array = []
-
-    total = len(match_data)
-
-    for count, match in enumerate(match_data):
-        message_array.append({
-            'id': match['message_id'],
-            'author': {
-                'id': match['user_id'],
-                'username': match['username'],
-                'discriminator': match['discriminator']
-            },
-            'content': match['content'],
-            'timestamp': pendulum.from_format(match['timestamp'], 'ddd MMM DD HH:mm:ss YYYY').isoformat(),
-            'attachments': [
-                {
-                    'filename': url.rsplit('/', 1)[1],
-                    'url': url
-                }
-                for url in (match['attachments'].split(' ') if match.get('attachments') else [])
-            ]
-        })
-
-        progress.set_progress(count + 1, total)
-
-    return message_array
-
-
-def gearbot(content, progress):
-    matches = (re.finditer(consts.gearbot_re, content, re.MULTILINE))
-    match_data = list(m.groupdict() for m in matches)
-    message_array = []
-
-    total = len(match_data)
-
-    for count, match in enumerate(match_data):
-        message_array.append({
-            'id': match['message_id'],
-            'channel_id': match['channel_id'],
-            'guild_id': match['guild_id'],
-            'author': {
-                'id': match['user_id'],
-                'username': match['username'],
-                'discriminator': match['discriminator']
-            },
-            'content': match['content'],
-            'timestamp': pendulum.from_format(match['timestamp'], 'YYYY-MM-DD HH:mm:ss.SSSSSS').isoformat(),
-            'attachments': [
-                {
-                    'filename': url.rsplit('/', 1)[1],
-                    'url': url
-                }
-                for url in (match['attachments'].split(', ') if match.get('attachments') else [])
-            ]
-        })
-
-        progress.set_progress(count + 1, total)
-
-    return message_array
-
-
-def vortex(content, progress):
-    matches = _rough_match(consts.vortex_re, content.split('\n\n')[1:], '\n\n')
-    match_data = list(m.groupdict() for m in matches)
-    message_array = []
-
-    total = len(match_data)
-
-    for count, match in enumerate(match_data):
-        message_array.append({
-            'author': {
-                'id': match['user_id'],
-                'username': match['username'],
-                'discriminator': match['discriminator']
-            },
-            'content': match['content'],
-            'timestamp': pendulum.from_format(match['timestamp'], 'ddd, D MMM YYYY HH:mm:ss z').isoformat(),
-            'attachments': [
-                {
-                    'filename': url.rsplit('/', 1)[1],
-                    'url': url
-                }
-                for url in (match['attachments'].split('\n')[1:] if match.get('attachments') else [])
-            ]
-        })
-
-        progress.set_progress(count + 1, total)
-
-    return message_array
-
-
-def modmailbot(content, progress):
-    content = content.split('────────────────\n', 1)[1]  # Gets rid of useless header
-
-    matches = _rough_match(consts.modmailbot_re, content.split('\n'), '\n')
-    match_data = list(m.groupdict() for m in matches if not m.group('bot_content'))
-    message_array = []
-
-    total = len(match_data)
-
-    for count, match in enumerate(match_data):
-        message_array.append({
-            'author': {
-                'id': 0,
-                'username': match['username'],
-                'discriminator': match.get('discriminator') or '0'
-            },
-            'content': match['content'],
-            'timestamp': pendulum.from_format(match['timestamp'], 'YYYY-MM-DD HH:mm:ss').isoformat(),
-            'attachments': [
-                {
-                    'filename': url.rsplit('/', 1)[1],
-                    'url': url
-                }
-                for url in (match['attachments'].split(', ') if match.get('attachments') else [])
-            ]
-        })
-
-        progress.set_progress(count + 1, total)
-
-    return message_array
-
-
-def yggdrasil(content, progress):
-    content = re.sub(r'-- Phone Report --\nReport By : .*\nReason : [\S\s]+?\nConnected Parties :\n=> .*\n<= .*\n\n',
-                     '', content)  # Remove unneeded header data
-
-    matches = _rough_match(consts.yggdrasil_re, content.split('\n\n'), '\n\n')
-    match_data = list(m.groupdict() for m in matches)
-    message_array = []
-
-    total = len(match_data)
-
-    for count, match in enumerate(match_data):
-        message_array.append({
-            'id': match['message_id'],
-            'author': {
-                'id': match['user_id'],
-                'username': match['username'],
-                'discriminator': match['discriminator'],
-            },
-            'content': match['content'],
-            'timestamp': pendulum.from_timestamp(
-                ((int(match['message_id']) >> 22) + 1420070400000)/1000, tz=pendulum.UTC
-            ).isoformat()
-        })
-
-        progress.set_progress(count + 1, total)
-
-    return message_array
+            getters.append((key, lambda match, index=index, value=default: match.group(index) or value))
+    return lambda match: {key: get(match) for key, get in getters}
+
+
+def _compile_timestamp(timestamp):
+    """
+    Compile a timestamp layout into a function converting a matched timestamp into an ISO-8601 string.
+    :param timestamp: Pendulum format string, `'snowflake'` for message IDs or None for ISO-8601.
+    """
+    if timestamp == 'snowflake':
+        return lambda value: timestamps.from_snowflake(value).isoformat()
+    if timestamp is None:
+        return lambda value: timestamps.parse(value).isoformat()
+    return lambda value: timestamps.from_format(value, timestamp).isoformat()
+
+
+def _compile_attachments(separator):
+    """
+    Compile an attachment separator into a function splitting matched attachment URLs into attachment objects.
+    :param separator: Attachment URL separator.
+    """
+    def attachments(value):
+        return [{'filename': url.rsplit('/', 1)[1], 'url': url} for url in value.split(separator) if url] if value \
+            else []
+    return attachments
+
+
+class Format:
+    """
+    Declarative description of a text log format.
+    :param pattern: Record pattern.
+    :param fields: Mapping of message keys to pattern groups. A (group, default) tuple falls back to the default when
+        the group is missing or empty.
+    :param timestamp: Pendulum format of the timestamp group, `'snowflake'` to derive timestamps from message IDs or
+        None for ISO-8601.
+    :param delimiter: Record delimiter. If not set, records are matched line by line.
+    :param attachments: Attachment URL separator. If not set, messages don't have attachments.
+    :param header: Marker ending the header of a log, everything up to and including it is skipped.
+    :param strip: Pattern of extraneous data to remove before parsing.
+    :param exclude: Group that, when matched, means a record isn't a message.
+    :param trim: Whether to ignore a trailing newline.
+    """
+
+    def __init__(self, pattern, fields, timestamp=None, delimiter=None, attachments=None, header=None, strip=None,
+                 exclude=None, trim=False):
+        self.pattern = re.compile(pattern, 0 if delimiter else re.MULTILINE)
+        self.fields = fields
+        self.timestamp = timestamp
+        self.delimiter = delimiter
+        self.attachments = attachments
+        self.header = header
+        self.strip = re.compile(strip) if strip else None
+        self.exclude = exclude
+        self.trim = trim
+        self.parse = self.compile()
+
+    def bounds(self, content):
+        """
+        Get the part of the content that holds records.
+        :param content: Log content.
+        :return: Content, start offset and end offset. Both offsets are None if there aren't any records.
+        """
+        if self.strip:
+            content = self.strip.sub('', content)
+        start, end = 0, len(content)
+        if self.header:
+            if (start := content.find(self.header)) == -1:
+                return content, None, None
+            start += len(self.header)
+        if self.trim and content.endswith('\n'):
+            end -= 1
+        return content, start, end
+
+    def _delimiter_boundary(self, content, offset, start, end):
+        """
+        Find the first delimiter at or after offset that a sequential parse would also split on and that is followed by
+        the start of a record.
+        :return: Offsets where the previous chunk stops and the next one resumes, or None if there aren't any.
+        """
+        delimiter, size = self.delimiter, len(self.delimiter)
+        while (index := content.find(delimiter, offset, end)) != -1:
+            offset = index + 1
+            # Overlapping delimiters (e.g. a run of blank lines) split differently depending on where the scan started
+            if content.find(delimiter, max(index - size + 1, start), index + size * 2 - 1) != index or \
+                    content.find(delimiter, index + 1, index + size * 2 - 1) != -1:
+                continue
+            if (resume := index + size) >= end:
+                return None
+            stop = content.find(delimiter, resume, end)
+            if self.pattern.match(content, resume, end if stop == -1 else stop):
+                return index, resume
+        return None
+
+    def _line_boundary(self, content, offset, start, end, window=100):
+        """
+        Find the first line start at or after offset where a record starts, right after a record that ends on the
+        previous line.
+        :return: Offsets where the previous chunk stops and the next one resumes, or None if there aren't any.
+        """
+        pattern = self.pattern
+        while (index := content.find('\n', offset, end)) != -1:
+            offset = resume = index + 1
+            if resume >= end or not pattern.match(content, resume, end):
+                continue
+            line = index
+            for _ in range(window):
+                if line <= start:
+                    break
+                line = max(content.rfind('\n', start, line - 1) + 1, start)
+                if (match := pattern.match(content, line, end)) and match.end() == index:
+                    return index, resume
+        return None
+
+    def split(self, content, count, start, end):
+        """
+        Split the records between start and end into up to count chunks, cut where a sequential parse ends one record
+        and begins the next, so that parsing every chunk on its own gives the same messages.
+        :param content: Log content, as returned by :meth:`bounds`.
+        :param count: Maximum number of chunks.
+        :param start: Offset of the first record.
+        :param end: Offset to stop reading at.
+        :return: List of (start, end) offsets of each chunk.
+        """
+        boundary = self._delimiter_boundary if self.delimiter else self._line_boundary
+        size = (end - start) // count
+        chunks = []
+        for _ in range(count - 1):
+            if not (found := boundary(content, max(start + size, start + 1), start, end)):
+                break
+            chunks.append((start, found[0]))
+            start = found[1]
+        chunks.append((start, end))
+        return chunks
+
+    def compile(self):
+        """Compile this format into a parser function yielding messages out of log content."""
+        pattern, delimiter = self.pattern, self.delimiter
+        build = _compile_fields(self.fields, pattern.groupindex)
+        timestamp = _compile_timestamp(self.timestamp)
+        timestamp_group = pattern.groupindex['message_id' if self.timestamp == 'snowflake' else 'timestamp']
+        attachments = _compile_attachments(self.attachments) if self.attachments else None
+        attachments_group = pattern.groupindex.get('attachments')
+        exclude_group = pattern.groupindex.get(self.exclude)
+
+        def records(content, progress, start, end):
+            if delimiter:
+                yield from _rough_match(pattern, content, delimiter, progress, start, end)
+                return
+            for match in pattern.finditer(content, start, end):
+                progress.set_progress(match.end(), end)
+                yield match
+            progress.set_progress(end, end)
+
+        def parse(content, progress, start=None, end=None):
+            """
+            Parse log content into messages.
+            :param content: Log content.
+            :param progress: Progress recorder.
+            :param start: Offset to start parsing from. Header data is skipped if not set.
+            :param end: Offset to stop parsing at.
+            """
+            if start is None:
+                content, start, end = self.bounds(content)
+                if start is None:
+                    return
+            for match in records(content, progress, start, end):
+                if exclude_group and match.group(exclude_group):
+                    continue
+                message = build(match)
+                message['timestamp'] = timestamp(match.group(timestamp_group))
+                if attachments:
+                    message['attachments'] = attachments(match.group(attachments_group))
+                yield message
+
+        return parse
+
+
+def register(name, pattern, **kwargs):
+    """
+    Register a text log format.
+    :param name: Log type.
+    :param pattern: Record pattern.
+    :param kwargs: Format options, see :class:`Format`.
+    """
+    formats[name] = Format(pattern, **kwargs)
+    return formats[name]
+
+
+register('rowboat', consts.rowboat_re, timestamp='YYYY-MM-DD HH:mm:ss.SSSSSS', attachments=', ', fields={
+    'id': 'message_id',
+    'guild_id': 'guild_id',
+    'author': {'id': 'user_id', 'username': 'username', 'discriminator': 'discriminator'},
+    'content': 'content'
+})
+
+register('rosalina_bottings', consts.rosalina_bottings_re, attachments=', ', fields={
+    'id': 'message_id',
+    'channel_id': 'channel_id',
+    'guild_id': 'guild_id',
+    'author': {'id': 'user_id', 'username': 'username', 'discriminator': ('discriminator', '0')},
+    'content': 'content'
+})
+
+register('auttaja', consts.auttaja_re, timestamp='ddd MMM DD HH:mm:ss YYYY', delimiter='\n\n', attachments=' ',
+         trim=True, fields={
+             'id': 'message_id',
+             'author': {'id': 'user_id', 'username': 'username', 'discriminator': 'discriminator'},
+             'content': 'content'
+         })
+
+register('gearbot', consts.gearbot_re, timestamp='YYYY-MM-DD HH:mm:ss.SSSSSS', attachments=', ', fields={
+    'id': 'message_id',
+    'channel_id': 'channel_id',
+    'guild_id': 'guild_id',
+    'author': {'id': 'user_id', 'username': 'username', 'discriminator': 'discriminator'},
+    'content': 'content'
+})
+
+register('vortex', consts.vortex_re, timestamp='ddd, D MMM YYYY HH:mm:ss z', delimiter='\n\n', attachments='\n',
+         header='\n\n', fields={
+             'author': {'id': 'user_id', 'username': 'username', 'discriminator': 'discriminator'},
+             'content': 'content'
+         })
+
+register('modmailbot', consts.modmailbot_re, timestamp='YYYY-MM-DD HH:mm:ss', delimiter='\n', attachments=', ',
+         header='────────────────\n', exclude='bot_content', fields={
+             'author': {'id': ('user_id', 0), 'username': 'username', 'discriminator': ('discriminator', '0')},
+             'content': 'content'
+         })
+
+register('yggdrasil', consts.yggdrasil_re, timestamp='snowflake', delimiter='\n\n',
+         strip=consts.yggdrasil_header_re, fields={
+             'id': 'message_id',
+             'author': {'id': 'user_id', 'username': 'username', 'discriminator': 'discriminator'},
+             'content': 'content'
+         })
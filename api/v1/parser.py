@@ -1,16 +1,14 @@
-import celery
 import pendulum
 
 from api import tasks, utils
 from api.models import Log
-from api.v1 import tasks as v1_tasks
 
 
 def create_log(content, log_type, owner, expires, privacy, guild, **kwargs) -> Log:
     """
     Create a log using specified data.
-    :param content: Raw content of log.
-    :type content: str
+    :param content: Raw content of log, or chunks of it, which are read back from the blob store by the tasks.
+    :type content: Union[str, Iterable[str]]
     :param log_type: Type of log, can be none if :param content is a list.
     :type log_type: Union[str, None]
     :param owner: Log owner.
@@ -22,17 +20,16 @@ def create_log(content, log_type, owner, expires, privacy, guild, **kwargs) -> L
     :type guild: int
     :param kwargs: Extraneous data.
     """
-    data = {'type': log_type, 'content': content, 'owner': owner, 'privacy': privacy, 'guild': guild}
-    uuid = data['uuid'] = Log.generate_uuid(content)
-    if Log.objects.filter(uuid=uuid).exists():
-        return Log.objects.get(uuid=uuid)
+    data = {'type': log_type, 'owner': owner, 'privacy': privacy, 'guild': guild}
+    data.update(Log.store_content(content))
+    if log := Log.find_content(data['content_key']):
+        return log
+    uuid = data['uuid']
 
     data['expires'] = pendulum.parse(expires) if expires else None
 
-    result = celery.chain(
-        v1_tasks.parse_text.s(log_type, content), tasks.parse_json.s() | tasks.create_pages.s(uuid)
-    )()
-
-    data['data'] = {'tasks': list(reversed(result.as_list())), **kwargs}
+    if not isinstance(content, str):
+        content = None
+    data['data'] = {**tasks.start_pipeline(content, uuid, log_type, data['content_key']), **kwargs}
 
     return Log.objects.create(**data)
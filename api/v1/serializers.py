@@ -1,4 +1,3 @@
-import requests
 from api import utils
 from rest_framework import serializers
 
@@ -9,7 +8,7 @@ from api.utils import validate_expires, get_default_timestamp
 
 class LogCreateSerializer(serializers.Serializer):
     type = serializers.CharField(help_text='Log type.')
-    url = serializers.URLField(help_text='URL containing messages.')
+    url = serializers.URLField(help_text='URL containing messages, served as text/plain.')
     expires = serializers.DateTimeField(allow_null=True, default=get_default_timestamp,
                                         help_text='Log expiration in UTC.')
     privacy = serializers.CharField(default='public', help_text='Log privacy.')
@@ -26,13 +25,6 @@ class LogCreateSerializer(serializers.Serializer):
                                               f'https://discord.gg/3X8WwbU')
         return value
 
-    @staticmethod
-    def validate_url(value):
-        """Check if url content type is text/plain"""
-        if 'text/plain' not in requests.head(value).headers['content-type']:
-            raise serializers.ValidationError('URL Content-Type must be text/plain!')
-        return value
-
     def validate_expires(self, value):
         """Check if expiry time is within parameters"""
         return validate_expires(self.context['user'], value)
@@ -52,7 +44,6 @@ class LogCreateSerializer(serializers.Serializer):
 
     def to_representation(self, instance):
         ret = super().to_representation(instance)
-        ret['messages'] = requests.get(ret.pop('url')).text
         if ret['privacy'] == 'public':
             ret['guild'] = None
         return ret
@@ -1,27 +1,114 @@
-import re
-
+import celery
 from celery import shared_task
-from celery_progress.websockets.backend import WebSocketProgressRecorder
+from celery_progress.backend import KnownResult, Progress, PROGRESS_STATE
+from django.conf import settings
 
+from api.blobs import blob_store
 from api.consts import rowboat_types
+from api.progress import ThrottledProgressRecorder
 from api.v1 import handlers
+from discord_logview.celery import redis_app
+
+
+class ChunkProgressRecorder(ThrottledProgressRecorder):
+    """
+    Progress recorder for one chunk of a log being parsed in parallel, reporting the combined progress of every chunk
+    under the task that split them up.
+    :param task: Chunk task instance.
+    :param task_id: ID of the task that split the log.
+    :param total: Length of the whole log.
+    """
+
+    def __init__(self, task, task_id: str, total: int):
+        super().__init__(task)
+        self.task_id = task_id
+        self.total = total
+        self.key = f'parse-progress:{task_id}'
+        self.reported = 0
+
+    def send_progress(self, current, total, description=""):
+        done = redis_app.incrby(self.key, current - self.reported)
+        redis_app.expire(self.key, 60 * 60)
+        self.reported = current
+        meta = {'pending': False, 'current': done, 'total': self.total, 'percent': round(done / self.total * 100, 2),
+                'description': description}
+        self.task.update_state(task_id=self.task_id, state=PROGRESS_STATE, meta=meta)
+        self.push_update(self.task_id, Progress(KnownResult(self.task_id, meta, PROGRESS_STATE)).get_info())
+
+
+def parse_messages(log_type: str, content: str, progress) -> list:
+    """
+    Convert raw log content into usable data within the current process.
+    :param log_type: Log type.
+    :param content: Log content.
+    :param progress: Progress recorder.
+    :return: Parsed data.
+    """
+    if '\r' in content:
+        content = content.replace('\r\n', '\n')
+    if log_type in rowboat_types:
+        log_type = 'rowboat'
+    message_array = list(handlers.formats[log_type].parse(content, progress))
+    if not message_array:
+        raise IndexError('No messages match this pattern!')
+    return message_array
 
 
 @shared_task(bind=True)
-def parse_text(self, log_type: str, content: str):
+def parse_text(self, log_type: str, content: str, content_key: str = None):
     """
-    Convert raw log content into usable data.
+    Convert raw log content into usable data. Logs larger than `LOG_PARSE_CHUNK_SIZE` are split into up to
+    `LOG_PARSE_CHUNKS` chunks, which are parsed in parallel and merged back in order.
     :param self: Task instance, supplied by Celery.
     :param log_type: Log type.
-    :param content: Log content.
+    :param content: Log content, None to read it from the blob store.
+    :param content_key: Blob key of the log content, if it isn't given.
     :return: Parsed data.
     """
+    if content is None:
+        content = blob_store.read(content_key)
     if '\r' in content:
-        content = re.sub('\r\n', '\n', content)
+        content = content.replace('\r\n', '\n')
     if log_type in rowboat_types:
         log_type = 'rowboat'
-    parser = getattr(handlers, log_type)
-    message_array = parser(content, WebSocketProgressRecorder(self))
+    count = min(settings.LOG_PARSE_CHUNKS, len(content) // settings.LOG_PARSE_CHUNK_SIZE)
+    if count > 1:
+        log_format = handlers.formats[log_type]
+        content, start, end = log_format.bounds(content)
+        chunks = log_format.split(content, count, start, end) if start is not None else []
+        if len(chunks) > 1:
+            return self.replace(celery.chord(
+                [parse_chunk.s(log_type, content[start:end], self.request.id, len(content)) for start, end in chunks],
+                merge_chunks.s()
+            ))
+    return parse_messages(log_type, content, ThrottledProgressRecorder(self))
+
+
+@shared_task(bind=True)
+def parse_chunk(self, log_type: str, content: str, task_id: str, total: int):
+    """
+    Parse one chunk of a log split up by :func:`parse_text`.
+    :param self: Task instance, supplied by Celery.
+    :param log_type: Log type.
+    :param content: Chunk content.
+    :param task_id: ID of the task that split the log.
+    :param total: Length of the whole log.
+    :return: Parsed data.
+    """
+    return list(handlers.formats[log_type].parse(content, ChunkProgressRecorder(self, task_id, total), 0,
+                                                 len(content)))
+
+
+@shared_task(bind=True)
+def merge_chunks(self, results: list):
+    """
+    Join the parsed chunks of a log back together. This task takes over the ID of the task that split the log.
+    :param self: Task instance, supplied by Celery.
+    :param results: Parsed data of every chunk, in order.
+    :return: Parsed data.
+    """
+    redis_app.delete(f'parse-progress:{self.request.id}')
+    message_array = [message for messages in results for message in messages]
     if not message_array:
         raise IndexError('No messages match this pattern!')
     return message_array
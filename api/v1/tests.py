@@ -1,9 +1,11 @@
 import pendulum
-from django.test import TestCase, Client
+from django.test import SimpleTestCase, TestCase, Client
 from django.urls import reverse
 from rest_framework import status
 
+from api import tasks
 from api.models import Whitelist
+from api.v1 import handlers, tasks as v1_tasks
 from api.tests import create_user, default_headers, create_credentials
 
 
@@ -105,3 +107,46 @@ class WhitelistTestCase(TestCase):
         # Test to see if creation succeeds after being whitelisted
         whitelist_response = self._create_log()
         self.assertEqual(whitelist_response.status_code, status.HTTP_201_CREATED)
+
+
+class ChunkTestCase(SimpleTestCase):
+
+    class Progress:
+        def set_progress(self, current, total):
+            pass
+
+    def test_chunks_match_sequential_parse(self):
+        """Test to see if parsing a log in chunks gives the same messages as parsing it all at once."""
+        log_format = handlers.formats['gearbot']
+        content = '\n'.join(
+            f'2020-01-01 00:00:{i % 60:02d}.000000 {10 ** 17 + i} - {10 ** 17 + i} - {10 ** 17 + i} | User#0001 '
+            f'({10 ** 17}) | line {i}{" with | pipes" if i % 3 else ""}{chr(10) + "continued |" if i % 5 else ""} |'
+            for i in range(500)
+        )
+        messages = list(log_format.parse(content, self.Progress()))
+        content, start, end = log_format.bounds(content)
+        chunks = log_format.split(content, 8, start, end)
+        self.assertEqual(len(chunks), 8)
+        self.assertEqual(messages, [message for start, end in chunks for message in log_format.parse(
+            content[start:end], self.Progress(), 0, end - start)])
+
+
+class FormatTestCase(SimpleTestCase):
+
+    class Progress:
+        def set_progress(self, current, total):
+            pass
+
+    def test_forward_mention(self):
+        """Test to see if a mention of a user who only speaks later in a text log is rendered with their name."""
+        early, later = 10 ** 17 + 1, 10 ** 17 + 2
+        content = (f'2020-01-01 00:00:00.000000 {10 ** 17} - {10 ** 17} - {10 ** 17} | Early#0001 ({early}) | '
+                   f'hi <@{later}> |\n'
+                   f'2020-01-01 00:00:01.000000 {10 ** 17 + 1} - {10 ** 17} - {10 ** 17} | Later#0002 ({later}) | '
+                   f'hello |')
+        parsed = v1_tasks.parse_messages('gearbot', content, self.Progress())
+
+        formatted = tasks.format_messages(parsed, self.Progress())['messages']
+        self.assertIn('@Later', formatted[0]['content'])
+        streamed = list(tasks.iter_formatted(parsed, tasks.collect_users(parsed)))
+        self.assertIn('@Later', streamed[0]['content'])
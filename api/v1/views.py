@@ -3,6 +3,7 @@ from drf_yasg.utils import swagger_auto_schema
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 
+from api import fetch
 from api.models import Log, Whitelist
 from api.permissions import HasAPIAccess, filter_queryset
 from api.v1 import schemas
@@ -57,8 +58,11 @@ class LogViewSet(viewsets.ViewSet):
         if whitelist and request.user not in whitelist.users.all():
             return Response({'errors': {'type': [f'You are not authorized to use log type "{data["type"]}"!']}},
                             status=status.HTTP_400_BAD_REQUEST)
-        log = create_log(content=data['messages'], log_type=data['type'], owner=request.user, expires=data['expires'],
-                         privacy=data['privacy'], guild=data['guild'])
+        try:
+            log = create_log(content=fetch.iter_text(data['url']), log_type=data['type'], owner=request.user,
+                             expires=data['expires'], privacy=data['privacy'], guild=data['guild'])
+        except fetch.FetchError as e:
+            return Response({'errors': {'url': [str(e)]}}, status=status.HTTP_400_BAD_REQUEST)
         serializer = LogListSerializer(log, context={'request': request})
         return Response(data=serializer.data, status=status.HTTP_201_CREATED)
 
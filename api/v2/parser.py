@@ -1,9 +1,7 @@
-import json
-
 import celery
 import pendulum
 
-from api import tasks, utils
+from api import streams, tasks, utils
 from api.models import Log
 
 
@@ -23,16 +21,78 @@ def create_log(content, log_type, owner, expires, privacy, guild, **kwargs) -> L
     :type guild: int
     :param kwargs: Extraneous data.
     """
-    data = {'type': log_type, 'content': json.dumps(content, indent=4), 'owner': owner, 'privacy': privacy,
-            'guild': guild}
-    uuid = data['uuid'] = Log.generate_uuid(content)
-    if Log.objects.filter(uuid=uuid).exists():
-        return Log.objects.get(uuid=uuid)
+    data = {'type': log_type, 'owner': owner, 'privacy': privacy, 'guild': guild}
+    data.update(Log.store_content(streams.encode(content)))
+    if log := Log.find_content(data['content_key']):
+        return log
+    uuid = data['uuid']
 
     data['expires'] = pendulum.parse(expires) if expires else None
 
-    result = celery.chain(tasks.parse_json.s(content) | tasks.create_pages.s(uuid))()
+    data['data'] = {**tasks.start_pipeline(content, uuid), **kwargs}
+
+    return Log.objects.create(**data)
 
-    data['data'] = {'tasks': list(reversed(result.as_list())), **kwargs}
+
+def create_stored_log(chunks, log_type, owner, expires, privacy, guild, encoding=None, **kwargs) -> Log:
+    """
+    Create a log from raw messages as they are read, without holding them in memory. The messages are checked and
+    stored as they arrive, raising a StreamError if they aren't valid, and read back by the tasks processing them.
+    :param chunks: Chunks of a JSON array or NDJSON of messages.
+    :type chunks: Iterable[bytes]
+    :param log_type: Type of log.
+    :type log_type: Union[str, None]
+    :param owner: Log owner.
+    :param expires: Expiration time of log.
+    :type expires: Union[str, None]
+    :param privacy: Log privacy setting.
+    :type privacy: str
+    :param guild: Linked guild of log. Must be set if privacy setting is either guild or mods.
+    :type guild: int
+    :param encoding: Content encoding of the chunks, None if they aren't encoded.
+    :type encoding: Union[str, None]
+    :param kwargs: Extraneous data.
+    """
+    data = {'type': log_type, 'owner': owner, 'privacy': privacy, 'guild': guild}
+    data.update(Log.store_content(streams.checked(streams.decompress(chunks, encoding))))
+    if log := Log.find_content(data['content_key']):
+        return log
+    uuid = data['uuid']
+
+    data['expires'] = pendulum.parse(expires) if expires else None
+
+    data['data'] = {**tasks.start_pipeline(None, uuid, content_key=data['content_key']), **kwargs}
 
     return Log.objects.create(**data)
+
+
+def create_logs(items, owner) -> list:
+    """
+    Create many logs at once. Logs already holding the same content are found with one query, the new ones are
+    inserted together, and their pipelines are started as one group.
+    :param items: Validated data of each log, with its messages, type, expires, privacy and guild.
+    :type items: list
+    :param owner: Log owner.
+    :return: Log of each item, with whether it was created by this request.
+    """
+    stored = [Log.store_content(streams.encode(item['messages'])) for item in items]
+    existing = Log.objects.filter(content_key__in={data['content_key'] for data in stored})
+    logs = {log.content_key: log for log in existing}
+    new_logs, signatures = {}, []
+    for item, data in zip(items, stored):
+        if data['content_key'] in logs:
+            continue
+        logs[data['content_key']] = new_logs[data['content_key']] = Log(
+            type=item['type'], owner=owner, privacy=item['privacy'], guild=item['guild'],
+            expires=pendulum.parse(item['expires']) if item['expires'] else None, **data
+        )
+        signatures.append(tasks.pipeline(item['messages'], data['uuid']))
+
+    if new_logs:
+        results = celery.group(signatures).apply_async()
+        for log, result in zip(new_logs.values(), results.results):
+            log.data = tasks.pipeline_data(result)
+        Log.objects.bulk_create(new_logs.values())
+
+    # Only the first item holding new content created its log
+    return [(logs[data['content_key']], new_logs.pop(data['content_key'], None) is not None) for data in stored]
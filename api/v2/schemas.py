@@ -18,7 +18,7 @@ archive_responses = {
         'application/json': {
             'errors': {
                 'url': [
-                    'URL must lead to a valid JSON array of Discord message objects!'
+                    'URL must be an http or https URL!'
                 ],
                 'expires': [
                     'Expiry time must be an iso-8601 timestamp of a date less than 1 week from now!'
@@ -44,7 +44,9 @@ create_responses = {
             'created': '1970-01-01T00:00:00.000000',
             'expires': now,
             'privacy': 'public',
-            'guild': None
+            'guild': None,
+            'state': 'processing',
+            'message_count': 0
         }
     }),
     status.HTTP_400_BAD_REQUEST: openapi.Response('Bad Request', serializers.LogErrorSerializer, examples={
@@ -67,6 +69,47 @@ create_responses = {
     })
 }
 
+bulk_create_responses = {
+    status.HTTP_207_MULTI_STATUS: openapi.Response('Logs Created', serializers.LogBulkResponseSerializer, examples={
+        'application/json': {
+            'results': [
+                {
+                    'status': 201,
+                    'log': {
+                        'owner': 'lorem',
+                        'uuid': '6kd6nYMuebE5yhwvGWohCQ',
+                        'url': 'https://logs.discord.website/logs/6kd6nYMuebE5yhwvGWohCQ',
+                        'type': 'logger',
+                        'created': '1970-01-01T00:00:00.000000',
+                        'expires': now,
+                        'privacy': 'public',
+                        'guild': None,
+                        'state': 'processing',
+                        'message_count': 0
+                    }
+                },
+                {
+                    'status': 400,
+                    'errors': {
+                        'messages': [
+                            'You must include at least one message to parse!'
+                        ]
+                    }
+                }
+            ]
+        }
+    }),
+    status.HTTP_400_BAD_REQUEST: openapi.Response('Bad Request', serializers.LogErrorSerializer, examples={
+        'application/json': {
+            'errors': {
+                'logs': [
+                    'Ensure this field has no more than 100 elements.'
+                ]
+            }
+        }
+    })
+}
+
 list_responses = {
     status.HTTP_200_OK: openapi.Response('List Logs', serializers.LogListSerializer, examples={
         'application/json': [
@@ -78,7 +121,9 @@ list_responses = {
                 'created': '1970-01-01T00:00:00.000000',
                 'expires': now,
                 'privacy': 'public',
-                'guild': None
+                'guild': None,
+                'state': 'done',
+                'message_count': 1000
             },
             {
                 'owner': 'ipsum',
@@ -114,7 +159,9 @@ read_responses = {
             'created': '1970-01-01T00:00:00.000000',
             'expires': now,
             'privacy': 'public',
-            'guild': None
+            'guild': None,
+            'state': 'done',
+            'message_count': 1000
         },
     }),
     status.HTTP_404_NOT_FOUND: openapi.Response('Not Found')
@@ -130,7 +177,9 @@ partial_update_responses = {
             'created': '1970-01-01T00:00:00.000000',
             'expires': now,
             'privacy': 'public',
-            'guild': None
+            'guild': None,
+            'state': 'done',
+            'message_count': 1000
         },
     }),
     status.HTTP_400_BAD_REQUEST: openapi.Response('Bad Request', serializers.LogErrorSerializer, examples={
@@ -151,4 +200,49 @@ partial_update_responses = {
     status.HTTP_404_NOT_FOUND: openapi.Response('Not Found')
 }
 
+search_responses = {
+    status.HTTP_200_OK: openapi.Response('Search Log', serializers.LogSearchResponseSerializer, examples={
+        'application/json': {
+            'query': 'lorem ipsum',
+            'results': [
+                {
+                    'id': '617545903666102272',
+                    'index': 1234,
+                    'page': 25,
+                    'content': 'Lorem ipsum dolor sit amet'
+                }
+            ]
+        },
+    }),
+    status.HTTP_400_BAD_REQUEST: openapi.Response('Bad Request', serializers.LogErrorSerializer, examples={
+        'application/json': {
+            'errors': {
+                'q': [
+                    'This field is required.'
+                ]
+            }
+        }
+    }),
+    status.HTTP_404_NOT_FOUND: openapi.Response('Not Found')
+}
+
+jump_responses = {
+    status.HTTP_200_OK: openapi.Response('Jump To Message', serializers.LogJumpResultSerializer, examples={
+        'application/json': {
+            'page': 25,
+            'url': 'https://logs.discord.website/logs/DHYCLTzjqREHg2ttnWvbYk?page=25#message-617545903666102272'
+        },
+    }),
+    status.HTTP_400_BAD_REQUEST: openapi.Response('Bad Request', serializers.LogErrorSerializer, examples={
+        'application/json': {
+            'errors': {
+                'non_field_errors': [
+                    'A message id or time is required!'
+                ]
+            }
+        }
+    }),
+    status.HTTP_404_NOT_FOUND: openapi.Response('Not Found')
+}
+
 url_parameter = openapi.Parameter('uuid', openapi.IN_PATH, description='Log\'s UUID', type=openapi.TYPE_STRING)
@@ -1,6 +1,5 @@
-import json
+from urllib.parse import urlsplit
 
-import requests
 from rest_framework import serializers
 
 from api import utils
@@ -8,10 +7,12 @@ from api.consts import privacy_types
 from api.models import Log
 from api.utils import get_default_timestamp
 
+# Most logs that can be created in one bulk request
+MAX_BULK_LOGS = 100
 
-class LogCreateSerializer(serializers.Serializer):
+
+class LogStreamCreateSerializer(serializers.Serializer):
     type = serializers.CharField(help_text='Log type.')
-    messages = serializers.JSONField(help_text='Array of Discord message objects.')
     expires = serializers.DateTimeField(allow_null=True, default=get_default_timestamp,
                                         help_text='Log expiration in UTC.')
     privacy = serializers.CharField(default='public', help_text='Log privacy.')
@@ -19,15 +20,6 @@ class LogCreateSerializer(serializers.Serializer):
                                      help_text='Linked guild of log. Must be set if privacy '
                                                'setting is either guild or mods.')
 
-    @staticmethod
-    def validate_messages(value):
-        """Check if messages are a list"""
-        if not isinstance(value, list):
-            raise serializers.ValidationError('Messages must be a valid JSON array of Discord message objects!')
-        if not len(value):
-            raise serializers.ValidationError('You must include at least one message to parse!')
-        return value
-
     def validate_expires(self, value):
         """Check if expiry time is within parameters"""
         return utils.validate_expires(self.context['user'], value)
@@ -58,6 +50,31 @@ class LogCreateSerializer(serializers.Serializer):
         pass
 
 
+class LogCreateSerializer(LogStreamCreateSerializer):
+    messages = serializers.JSONField(help_text='Array of Discord message objects.')
+
+    @staticmethod
+    def validate_messages(value):
+        """Check if messages are a list"""
+        if not isinstance(value, list):
+            raise serializers.ValidationError('Messages must be a valid JSON array of Discord message objects!')
+        if not len(value):
+            raise serializers.ValidationError('You must include at least one message to parse!')
+        return value
+
+
+class LogBulkCreateSerializer(serializers.Serializer):
+    logs = serializers.ListField(child=serializers.DictField(), min_length=1, max_length=MAX_BULK_LOGS,
+                                 help_text=f'Logs to create, each with the fields of a single log, at most '
+                                           f'{MAX_BULK_LOGS} at once.')
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
 class LogPatchSerializer(serializers.Serializer):
     expires = serializers.DateTimeField(required=False, help_text='Log expiration in UTC.')
     privacy = serializers.CharField(required=False, help_text='Log privacy.')
@@ -111,9 +128,9 @@ class LogArchiveCreateSerializer(serializers.Serializer):
 
     @staticmethod
     def validate_url(value):
-        """Check if url content is a valid list"""
-        if not isinstance(json.loads(requests.get(value).text), list):
-            raise serializers.ValidationError('URL must lead to a valid JSON array of Discord message objects!')
+        """Check if url is one a log can be downloaded from, its content is checked when the archive is opened"""
+        if urlsplit(value).scheme not in ('http', 'https'):
+            raise serializers.ValidationError('URL must be an http or https URL!')
         return value
 
     def validate_expires(self, value):
@@ -156,10 +173,97 @@ class LogArchiveSerializer(serializers.Serializer):
         pass
 
 
+class LogSearchSerializer(serializers.Serializer):
+    q = serializers.CharField(help_text='Search terms, quoted for phrases and prefixed with - to exclude.')
+    limit = serializers.IntegerField(default=50, min_value=1, max_value=200, help_text='Maximum number of results.')
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
+class LogSearchResultSerializer(serializers.Serializer):
+    id = serializers.CharField(allow_null=True, help_text='Message id.')
+    index = serializers.IntegerField(help_text='Position of the message in the log.')
+    page = serializers.IntegerField(help_text='Viewer page the message is on.')
+    content = serializers.CharField(help_text='Start of the raw message content.')
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
+class LogSearchResponseSerializer(serializers.Serializer):
+    query = serializers.CharField(help_text='Search terms.')
+    results = LogSearchResultSerializer(many=True, help_text='Matching messages, in order.')
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
+class LogJumpSerializer(serializers.Serializer):
+    id = serializers.IntegerField(required=False, help_text='Message id.')
+    at = serializers.DateTimeField(required=False, help_text='Time to jump to, if no message id is given.')
+
+    def validate(self, attrs):
+        """Check to see if there is a message id or a time"""
+        if 'id' not in attrs and 'at' not in attrs:
+            raise serializers.ValidationError('A message id or time is required!')
+        return attrs
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
+class LogJumpResultSerializer(serializers.Serializer):
+    page = serializers.IntegerField(help_text='Viewer page the message is on.')
+    url = serializers.URLField(help_text='URL of the viewer at that page.')
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
 class LogListSerializer(serializers.HyperlinkedModelSerializer):
     owner = serializers.ReadOnlyField(source='owner.username', help_text='Log\'s owner.')
     url = serializers.HyperlinkedIdentityField(view_name='log-html', help_text='Log\'s URL.')
 
     class Meta:
         model = Log
-        fields = ('owner', 'uuid', 'url', 'type', 'created', 'expires', 'privacy', 'guild')
+        fields = ('owner', 'uuid', 'url', 'type', 'created', 'expires', 'privacy', 'guild', 'state', 'message_count')
+        read_only_fields = ('state', 'message_count')
+
+
+class LogBulkResultSerializer(serializers.Serializer):
+    status = serializers.IntegerField(help_text='Status of the log, 201 if it was created, 200 if a log with the same '
+                                                'messages already existed, or 400 if it was invalid.')
+    log = LogListSerializer(required=False, help_text='Created or existing log.')
+    errors = serializers.JSONField(required=False, help_text='Errors of the log, if it was invalid.')
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
+
+
+class LogBulkResponseSerializer(serializers.Serializer):
+    results = LogBulkResultSerializer(many=True, help_text='Result of each log, in the order they were sent.')
+
+    def update(self, instance, validated_data):
+        pass
+
+    def create(self, validated_data):
+        pass
@@ -1,12 +1,23 @@
+import gzip
+import json
 import random
+import re
+import tempfile
+from unittest import mock
 
 import pendulum
-from django.test import Client, TestCase
+from django.test import Client, RequestFactory, SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
+from rest_framework.request import Request
 
+from api import emoji, fetch, formatter, navigation, tasks
+from api.blobs import FileSystemBlobStore, digest
 from api.consts import all_types
-from api.models import Whitelist
+from api.models import Log, Whitelist
+from api.objects import LiteLogRenderer
+from api.storage import AuthorTable, log_messages
+from api.streams import checked, decompress, encode, is_stream, iter_messages
 from api.tests import create_user, default_headers, create_credentials
 
 import responses
@@ -93,7 +104,10 @@ class ArchiveTestCase(TestCase):
         }
         archive_response = self.client.post(reverse('v2:archive'), data=payload)
         self.assertEqual(archive_response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(responses.calls), 0)  # The URL is only downloaded once the archive is opened
         signed_data = archive_response.json()['url'].rsplit('/', 1)[1]
+        bad_response = self.client.post(reverse('v2:archive'), data={**payload, 'url': 'ftp://example.com/log'})
+        self.assertEqual(bad_response.status_code, status.HTTP_400_BAD_REQUEST)
 
         # Test un-archiving
         accepts_headers = {**default_headers, 'ACCEPTS': 'application/json'}
@@ -109,6 +123,7 @@ class LogTestCase(TestCase):
         self.user, self.token_headers = create_user(**self.credentials)
         self.client = Client()
         self.client.login(**self.credentials)
+        self.start = pendulum.datetime(2019, 7, 13, 17, 42)
 
     def _create_log(self):
         messages = create_message(str(self.credentials))
@@ -120,6 +135,26 @@ class LogTestCase(TestCase):
         resp = self.client.post(reverse('v2:logs-list'), data=payload, **self.token_headers)
         return resp
 
+    def _save_log(self, count, newest_first=False):
+        """Save a log of numbered messages sent a minute apart, in this process instead of through Celery."""
+        messages = [dict(create_message('test')[0], id=i + 1, content=f'message {i}',
+                         timestamp=self.start.add(minutes=i).isoformat()) for i in range(count)]
+        messages[74]['content'] = 'needle in the log'
+        if newest_first:
+            messages.reverse()
+        log = Log.objects.create(uuid='testlog', owner=self.user, type='json')
+        users = tasks.collect_users(messages)
+        tasks.save_messages(tasks.iter_formatted(messages, users), log.uuid, users)
+        log.refresh_from_db()
+        return log
+
+    def test_log_save_newest_first(self):
+        """Tests to see if a log sent newest first, like Discord exports, is stored oldest first."""
+        log = self._save_log(2100, newest_first=True)
+        self.assertEqual(log.page_sizes, [100, 1000, 1000])
+        self.assertEqual([message['id'] for message in log_messages(log)], list(range(1, 2101)))
+        self.assertEqual(navigation.find_page(log, message_id=75), 2)
+
     def test_log_create(self):
         """Tests to see if we can successfully create a log.
 
@@ -127,6 +162,26 @@ class LogTestCase(TestCase):
         create_response = self._create_log()
         self.assertEqual(create_response.status_code, status.HTTP_201_CREATED)
 
+    def test_log_create_stream(self):
+        """Tests to see if we can create a log from gzipped NDJSON messages, with the other fields in the query."""
+        messages = [message for i in range(5) for message in create_message(f'{self.credentials} {i}')]
+        body = gzip.compress('\n'.join(json.dumps(message) for message in messages).encode('utf-8'))
+        url = f'{reverse("v2:logs-list")}?type={random.choice(list(all_types.keys()))}'
+        headers = {**self.token_headers, 'content_type': 'application/x-ndjson', 'HTTP_CONTENT_ENCODING': 'gzip'}
+        create_response = self.client.post(url, data=body, **headers)
+        self.assertEqual(create_response.status_code, status.HTTP_201_CREATED)
+
+    def test_log_bulk_create(self):
+        """Tests to see if we can create many logs at once, getting the status of each."""
+        log = {'type': random.choice(list(all_types.keys())), 'messages': create_message(str(self.credentials))}
+        payload = {'logs': [log, log, {**log, 'messages': []}]}
+        bulk_response = self.client.post(reverse('v2:logs-bulk'), data=payload, **self.token_headers)
+        self.assertEqual(bulk_response.status_code, status.HTTP_207_MULTI_STATUS)
+        results = bulk_response.json()['results']
+        self.assertEqual([result['status'] for result in results],
+                         [status.HTTP_201_CREATED, status.HTTP_200_OK, status.HTTP_400_BAD_REQUEST])
+        self.assertEqual(results[0]['log']['uuid'], results[1]['log']['uuid'])
+
     def test_log_retrieve(self):
         """Tests to see if we can retrieve the log we just created."""
         uuid = self._create_log().json()['uuid']
@@ -139,6 +194,50 @@ class LogTestCase(TestCase):
         destroy_response = self.client.delete(reverse('v2:logs-detail', kwargs={'pk': uuid}), **self.token_headers)
         self.assertEqual(destroy_response.status_code, status.HTTP_204_NO_CONTENT)
 
+    def test_log_search(self):
+        """Tests to see if we can search the log we just created, and need search terms to do it."""
+        uuid = self._create_log().json()['uuid']
+        url = reverse('v2:logs-search', kwargs={'pk': uuid})
+        self.assertEqual(self.client.get(url, **self.token_headers).status_code, status.HTTP_400_BAD_REQUEST)
+        search_response = self.client.get(url, data={'q': 'test'}, **self.token_headers)
+        self.assertEqual(search_response.status_code, status.HTTP_200_OK)
+        self.assertIn('results', search_response.json())
+
+    @override_settings(MESSAGE_SEARCH=True)
+    def test_log_search_results(self):
+        """Tests to see if searching a log of several viewer pages finds a message on the second one."""
+        log = self._save_log(120)
+        url = reverse('v2:logs-search', kwargs={'pk': log.uuid})
+        search_response = self.client.get(url, data={'q': 'needle'}, **self.token_headers)
+        self.assertEqual(search_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(search_response.json()['results'],
+                         [{'id': '75', 'index': 74, 'page': 2, 'content': 'needle in the log'}])
+        self.assertEqual(len(self.client.get(url, data={'q': 'message'}, **self.token_headers).json()['results']), 50)
+
+    def test_log_jump(self):
+        """Tests to see if jumping in the log we just created needs a message id or time."""
+        uuid = self._create_log().json()['uuid']
+        jump_response = self.client.get(reverse('v2:logs-jump', kwargs={'pk': uuid}), **self.token_headers)
+        self.assertEqual(jump_response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_log_jump_pages(self):
+        """Tests to see if jumping in a log of several viewer pages finds the second one by message id or time."""
+        log = self._save_log(120)
+        self.assertEqual(navigation.find_page(log, message_id=75), 2)
+        self.assertEqual(navigation.find_page(log, time=self.start.add(minutes=60)), 2)
+        self.assertEqual(navigation.find_page(log, time=self.start.add(days=1)), 3)
+        self.assertIsNone(navigation.find_page(log, message_id=500))
+
+        url = reverse('v2:logs-jump', kwargs={'pk': log.uuid})
+        jump_response = self.client.get(url, data={'id': 75}, **self.token_headers)
+        self.assertEqual(jump_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(jump_response.json()['page'], 2)
+        self.assertTrue(jump_response.json()['url'].endswith('?page=2#message-75'))
+        jump_response = self.client.get(url, data={'at': self.start.add(minutes=60).isoformat()}, **self.token_headers)
+        self.assertEqual(jump_response.json()['page'], 2)
+        jump_response = self.client.get(url, data={'id': 500}, **self.token_headers)
+        self.assertEqual(jump_response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_log_list(self):
         """Tests to see if we can list our logs after deleting one."""
         self._create_log()
@@ -180,3 +279,111 @@ class WhitelistTestCase(TestCase):
         # Test to see if creation succeeds after being whitelisted
         whitelist_response = self._create_log()
         self.assertEqual(whitelist_response.status_code, status.HTTP_201_CREATED)
+
+
+class FetchTestCase(SimpleTestCase):
+
+    @responses.activate
+    @override_settings(FETCH_MAX_SIZE=1024)
+    def test_fetch_size_cap(self):
+        """Test to see if downloads are stopped once they're larger than the size cap."""
+        responses.add(responses.GET, 'https://example.com/log', body='a' * 2048, content_type='text/plain')
+        with self.assertRaises(fetch.FetchError):
+            list(fetch.iter_text('https://example.com/log'))
+
+
+class ContentDigestTestCase(SimpleTestCase):
+
+    def test_streamed_content_digest(self):
+        """Test to see if streaming encoded messages into the blob store gives the digest of the whole content."""
+        content = [message for i in range(2000) for message in create_message(f'message {i} \U0001f600')]
+        with tempfile.TemporaryDirectory() as root:
+            key, size = FileSystemBlobStore(root).put_stream(json.JSONEncoder(indent=4).iterencode(content))
+        encoded = json.dumps(content, indent=4)
+        self.assertEqual(key, digest(encoded))
+        self.assertEqual(size, len(encoded.encode('utf-8')))
+
+
+class AuthorTableTestCase(SimpleTestCase):
+
+    def test_authors_are_interned(self):
+        """Test to see if compacted messages share one author, and render with one user object for it."""
+        messages = [message for i in range(10) for message in create_message(f'message {i}')]
+        table = AuthorTable()
+        compacted = [table.compact(message) for message in messages]
+        self.assertEqual(table.authors, [{'id': 0, 'username': 'test', 'discriminator': '0'}])
+        self.assertTrue(all(message['author'] == 0 and 'mentions' not in message for message in compacted))
+        self.assertEqual(table.expand(compacted[0])['author'], table.authors[0])
+        renderer = LiteLogRenderer({'uuid': None, 'messages': compacted, 'authors': table.authors})
+        self.assertEqual(len({id(message.author) for message in renderer.messages}), 1)
+
+
+class StreamTestCase(SimpleTestCase):
+
+    def test_chunked_messages(self):
+        """Test to see if messages split across chunks parse the same as a JSON array and as NDJSON."""
+        messages = [message for i in range(20) for message in create_message(f'message {i} \U0001f600')]
+        for text in (json.dumps(messages, indent=4), '\n'.join(json.dumps(message) for message in messages)):
+            chunks = [text[i:i + 7] for i in range(0, len(text), 7)]
+            self.assertEqual(list(iter_messages(chunks)), messages)
+
+    def test_canonical_content(self):
+        """Test to see if the same messages are stored under the same key however they're uploaded."""
+        messages = [message for i in range(20) for message in create_message(f'message {i} \U0001f600')]
+        key = digest(encode(messages))
+        for text in (json.dumps(messages, indent=4), '\n'.join(json.dumps(message) for message in messages)):
+            data = text.encode('utf-8')
+            self.assertEqual(digest(checked([data[i:i + 7] for i in range(0, len(data), 7)])), key)
+            self.assertEqual(digest(checked(decompress([gzip.compress(data)], 'gzip'))), key)
+        self.assertEqual(list(iter_messages(encode(messages))), messages)
+
+    def test_stream_content_type_parameters(self):
+        """Test to see if NDJSON request bodies are read as a stream when their content type has parameters."""
+        request = Request(RequestFactory().post('/', data=b'{}', content_type='application/x-ndjson; charset=utf-8'))
+        self.assertTrue(is_stream(request))
+        request = Request(RequestFactory().post('/', data=b'{}', content_type='application/json; charset=utf-8'))
+        self.assertFalse(is_stream(request))
+
+
+class FormatterTestCase(SimpleTestCase):
+    # Plain content the fast path renders, along with content it leaves to the parser
+    contents = [
+        'Hello world',
+        'Tom & Jerry\'s "big" day (100% fun), for $5 + tax; 1/2 off!',
+        'spaced  out   words',
+        ' leading and trailing ',
+        '',
+        'line one\nline two',
+        '<b>not bold</b> & <script>',
+        '**bold** and _italic_',
+        ':smile:',
+        '😀 😀\n😀',
+    ]
+
+    # Emoji-only content, and content that isn't
+    jumbo_contents = [
+        '', '   ', '😀', '😀 😀\n😀', ':smile:', '<:custom:123>', '<a:animated:456> 😀', '👍🏽👍🏽', '😀' * 27, '😀' * 28,
+        '😀 hi', 'hi 😀', ':smile: text', '<:custom:123>x',
+    ]
+
+    def test_fast_path_matches_parser(self):
+        """Test to see if plain content rendered without the parser gives the same HTML as the parser."""
+        self.assertTrue(formatter.plain_pat.fullmatch(self.contents[1]))
+        for embed in (False, True, 'lite'):
+            options = {'embed': embed, 'escape_html': True, 'users': {}}
+            for content in self.contents:
+                with self.subTest(content=content, embed=embed):
+                    fast = formatter._render(content, options)
+                    with mock.patch.object(formatter, 'plain_pat', re.compile(r'(?!)')):
+                        self.assertEqual(fast, formatter._render(content, options))
+
+    def test_jumbo_matches_pattern(self):
+        """Test to see if the jumbo emoji scan agrees with stripping every emoji out of the content."""
+        jumbo_pat = re.compile(fr'{formatter.jumbo_pat.pattern}|{emoji.UNICODE_EMOJI_PAT}')
+        for content in self.jumbo_contents:
+            with self.subTest(content=content):
+                jumbo = not re.sub(r'\s', '', jumbo_pat.sub('', content)) and len(jumbo_pat.findall(content)) < 28
+                self.assertEqual(formatter._is_jumbo(content), jumbo)
+                if content.strip():
+                    html = formatter._render(content, {'embed': False, 'escape_html': True, 'users': {}})
+                    self.assertEqual('jumboable' in html, jumbo)
@@ -1,20 +1,21 @@
-import json
-
-import requests
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from drf_yasg.utils import swagger_auto_schema
 from itsdangerous import BadSignature
 from rest_framework import viewsets, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
 
+from api import navigation, tasks
 from api.models import Log, Whitelist
 from api.permissions import HasAPIAccess, filter_queryset
-from api.utils import signer
+from api.search import search_messages
+from api.streams import StreamError, is_stream, request_chunks
+from api.utils import async_view, signer
 from api.v2 import schemas
-from api.v2.parser import create_log
-from api.v2.serializers import LogListSerializer, LogCreateSerializer, LogArchiveCreateSerializer, LogPatchSerializer
+from api.v2.parser import create_log, create_logs, create_stored_log
+from api.v2.serializers import LogListSerializer, LogCreateSerializer, LogArchiveCreateSerializer, LogPatchSerializer, \
+    LogSearchSerializer, LogJumpSerializer, LogStreamCreateSerializer, LogBulkCreateSerializer
 
 
 @swagger_auto_schema(method='POST', query_serializer=LogArchiveCreateSerializer, responses=schemas.archive_responses)
@@ -41,18 +42,22 @@ def un_archive(request, signed_data: str):
         data = signer.loads(signed_data)
     except BadSignature:
         return Response(status=status.HTTP_400_BAD_REQUEST)
-    try:
-        messages = requests.get(data['url']).json()
-    except json.JSONDecodeError:
-        return Response(status=status.HTTP_400_BAD_REQUEST)
-    log = create_log(content=messages, log_type=data['type'], owner=request.user, expires=data['expires'],
-                     privacy=data['privacy'], guild=data['guild'])
-    return redirect('log-html', pk=log.uuid)
+    result = tasks.fetch_log.delay(data['url'], data['type'], request.user.pk, expires=data['expires'],
+                                   privacy=data['privacy'], guild=data['guild'], messages=True)
+    return redirect('log-fetch', task_id=result.id)
 
 
 class LogViewSet(viewsets.ViewSet):
     permission_classes = (HasAPIAccess,)
 
+    @classmethod
+    def as_view(cls, actions=None, **initkwargs):
+        view = super().as_view(actions, **initkwargs)
+        # Reads are served async, so slow queries for one request don't hold up the others under ASGI
+        if actions and actions.get('get') in ('list', 'retrieve'):
+            return async_view(view)
+        return view
+
     def get_queryset(self):
         return filter_queryset(self.request, Log.objects.all())
 
@@ -71,6 +76,36 @@ class LogViewSet(viewsets.ViewSet):
         serializer = LogListSerializer(log, context={'request': request})
         return Response(serializer.data, status=status.HTTP_200_OK)
 
+    @swagger_auto_schema(query_serializer=LogSearchSerializer, manual_parameters=[schemas.url_parameter],
+                         responses=schemas.search_responses)
+    @action(detail=True, methods=['get'])
+    def search(self, request, pk=None):
+        """Search the messages of a log that you own."""
+        serializer = LogSearchSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        log = get_object_or_404(self.get_queryset(), pk=pk)
+        data = serializer.validated_data
+        return Response({'query': data['q'], 'results': search_messages(log, data['q'], data['limit'])},
+                        status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(query_serializer=LogJumpSerializer, manual_parameters=[schemas.url_parameter],
+                         responses=schemas.jump_responses)
+    @action(detail=True, methods=['get'])
+    def jump(self, request, pk=None):
+        """Find the viewer page of a message of a log that you own, by its id or the time it was sent."""
+        serializer = LogJumpSerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        log = get_object_or_404(self.get_queryset(), pk=pk)
+        data = serializer.validated_data
+        page = navigation.find_page(log, message_id=data.get('id'), time=data.get('at'))
+        if page is None:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+        anchor = f'#message-{data["id"]}' if 'id' in data else ''
+        url = request.build_absolute_uri(f'{reverse("log-html", kwargs={"pk": log.pk})}?page={page}{anchor}')
+        return Response({'page': page, 'url': url}, status=status.HTTP_200_OK)
+
     @swagger_auto_schema(query_serializer=LogPatchSerializer, manual_parameters=[schemas.url_parameter],
                          responses=schemas.partial_update_responses)
     def partial_update(self, request, pk=None):
@@ -88,8 +123,13 @@ class LogViewSet(viewsets.ViewSet):
 
     @swagger_auto_schema(query_serializer=LogCreateSerializer, responses=schemas.create_responses)
     def create(self, request):
-        """Create a log."""
-        serializer = LogCreateSerializer(data=request.data, context={'user': request.user})
+        """Create a log. The messages can instead be sent on their own as the request body, as a JSON array or NDJSON
+        (application/x-ndjson), optionally gzip or zstd encoded, with the other fields as query parameters."""
+        streamed = is_stream(request)
+        if streamed:
+            serializer = LogStreamCreateSerializer(data=request.query_params, context={'user': request.user})
+        else:
+            serializer = LogCreateSerializer(data=request.data, context={'user': request.user})
         if not serializer.is_valid():
             return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
         data = serializer.data
@@ -97,11 +137,47 @@ class LogViewSet(viewsets.ViewSet):
         if whitelist and request.user not in whitelist.users.all():
             return Response({'errors': {'type': [f'You are not authorized to use log type "{data["type"]}"!']}},
                             status=status.HTTP_400_BAD_REQUEST)
-        log = create_log(content=data['messages'], log_type=data['type'], owner=request.user, expires=data['expires'],
-                         privacy=data['privacy'], guild=data['guild'])
+        if streamed:
+            try:
+                log = create_stored_log(request_chunks(request), log_type=data['type'], owner=request.user,
+                                        expires=data['expires'], privacy=data['privacy'], guild=data['guild'],
+                                        encoding=request.META.get('HTTP_CONTENT_ENCODING'))
+            except StreamError as e:
+                return Response({'errors': {'messages': [str(e)]}}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            log = create_log(content=data['messages'], log_type=data['type'], owner=request.user,
+                             expires=data['expires'], privacy=data['privacy'], guild=data['guild'])
         serializer = LogListSerializer(log, context={'request': request})
         return Response(data=serializer.data, status=status.HTTP_201_CREATED)
 
+    @swagger_auto_schema(request_body=LogBulkCreateSerializer, responses=schemas.bulk_create_responses)
+    @action(detail=False, methods=['post'])
+    def bulk(self, request):
+        """Create many logs at once. Each log is checked on its own, and the status of each is returned in order."""
+        serializer = LogBulkCreateSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response({'errors': serializer.errors}, status=status.HTTP_400_BAD_REQUEST)
+        items = [LogCreateSerializer(data=item, context={'user': request.user})
+                 for item in serializer.validated_data['logs']]
+        types = {item.data['type'] for item in items if item.is_valid()}
+        denied = set(Whitelist.objects.filter(log_type__in=types).exclude(users=request.user)
+                     .values_list('log_type', flat=True))
+        results, accepted = [None] * len(items), []
+        for i, item in enumerate(items):
+            if not item.is_valid():
+                results[i] = {'status': status.HTTP_400_BAD_REQUEST, 'errors': item.errors}
+            elif item.data['type'] in denied:
+                results[i] = {'status': status.HTTP_400_BAD_REQUEST, 'errors': {
+                    'type': [f'You are not authorized to use log type "{item.data["type"]}"!']
+                }}
+            else:
+                accepted.append(i)
+        logs = create_logs([items[i].data for i in accepted], owner=request.user) if accepted else []
+        for i, (log, created) in zip(accepted, logs):
+            results[i] = {'status': status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+                          'log': LogListSerializer(log, context={'request': request}).data}
+        return Response({'results': results}, status=status.HTTP_207_MULTI_STATUS)
+
     @swagger_auto_schema(manual_parameters=[schemas.url_parameter])
     def destroy(self, request, pk=None):
         """Delete a log that you own."""
@@ -1,8 +1,20 @@
 from channels.auth import AuthMiddlewareStack
 from channels.routing import ProtocolTypeRouter, URLRouter
 from celery_progress.websockets import routing
+from django.core.asgi import get_asgi_application
+
+django_application = get_asgi_application()
+
+
+def http_application(scope):
+    """Serve HTTP with Django's own ASGI handler, so async views run on the event loop."""
+    async def application(receive, send):
+        await django_application(scope, receive, send)
+    return application
+
 
 application = ProtocolTypeRouter({
+    'http': http_application,
     'websocket': AuthMiddlewareStack(
         URLRouter(
             routing.urlpatterns
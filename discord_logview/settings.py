@@ -161,6 +161,51 @@ CELERY_TASK_SERIALIZER = 'json'
 
 CELERY_RESULT_SERIALIZER = 'json'
 
+# Text logs larger than this many bytes are split into chunks that are parsed in parallel
+LOG_PARSE_CHUNK_SIZE = config('LOG_PARSE_CHUNK_SIZE', default=4 * 1024 * 1024, cast=int)
+
+# Maximum number of chunks a text log is split into by the chain pipeline, 1 disables parallel parsing. Text logs go
+# through the chain pipeline whenever this is more than 1
+LOG_PARSE_CHUNKS = config('LOG_PARSE_CHUNKS', default=1, cast=int)
+
+# How logs are processed, either "fused" to run every stage in one task or "chain" for a chain of tasks
+LOG_PIPELINE = config('LOG_PIPELINE', default='fused')
+
+# Number of rendered markdown snippets each process keeps in memory, 0 disables the in-process cache
+RENDER_CACHE_SIZE = config('RENDER_CACHE_SIZE', default=50000, cast=int)
+
+# Whether rendered markdown is also shared between processes through Redis, and for how many seconds
+RENDER_CACHE_REDIS = config('RENDER_CACHE_REDIS', default=False, cast=bool)
+
+RENDER_CACHE_TTL = config('RENDER_CACHE_TTL', default=60 * 60 * 24, cast=int)
+
+# Whether pages of the log viewer are rendered once when a log is saved and kept in Redis, and for how many seconds
+FRAGMENT_STORE = config('FRAGMENT_STORE', default=True, cast=bool)
+
+FRAGMENT_TTL = config('FRAGMENT_TTL', default=60 * 60 * 24 * 7, cast=int)
+
+# Whether new pages are stored compressed with zstandard (requires the zstandard package), and at which level
+PAGE_COMPRESSION = config('PAGE_COMPRESSION', default=False, cast=bool)
+
+PAGE_COMPRESSION_LEVEL = config('PAGE_COMPRESSION_LEVEL', default=3, cast=int)
+
+# How messages of new logs are stored, "pages" of JSON arrays or "rows" with a row and indexed columns per message
+MESSAGE_STORAGE = config('MESSAGE_STORAGE', default='pages')
+
+# Whether messages of new logs are indexed for full-text search when they're saved
+MESSAGE_SEARCH = config('MESSAGE_SEARCH', default=True, cast=bool)
+
+# Largest log that can be downloaded from a URL, in bytes, and how many seconds the download can take
+FETCH_MAX_SIZE = config('FETCH_MAX_SIZE', default=64 * 1024 * 1024, cast=int)
+
+FETCH_TIMEOUT = config('FETCH_TIMEOUT', default=30, cast=int)
+
+# Number of connections to each host kept open by the session logs are downloaded with
+FETCH_POOL_SIZE = config('FETCH_POOL_SIZE', default=10, cast=int)
+
+# Directory raw log content is stored in
+BLOB_STORE_ROOT = config('BLOB_STORE_ROOT', default=os.path.join(BASE_DIR, 'blobs'))
+
 # Email configuration
 # https://docs.djangoproject.com/en/2.2/topics/email/
 
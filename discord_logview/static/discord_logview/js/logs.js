@@ -113,6 +113,32 @@ window.addEventListener('DOMContentLoaded', (event) => {
     }
 });
 
+function searchLog(form) {
+    let results = document.getElementById('search-results');
+    let query = form.elements['q'].value.trim();
+    results.innerHTML = '';
+    if (!query) {
+        return false;
+    }
+    fetch(form.dataset.url + '?q=' + encodeURIComponent(query)).then(response => response.json()).then(data => {
+        if (!data.results || !data.results.length) {
+            let item = document.createElement('li');
+            item.textContent = 'No messages found';
+            results.appendChild(item);
+            return;
+        }
+        for (let result of data.results) {
+            let item = document.createElement('li');
+            let link = document.createElement('a');
+            link.href = '?page=' + result.page + (result.id ? '#message-' + result.id : '');
+            link.textContent = result.content;
+            item.appendChild(link);
+            results.appendChild(item);
+        }
+    });
+    return false;
+}
+
 function toggleDrawer(element) {
     element.classList.toggle('rotated');
 }
@@ -1,19 +1,10 @@
 import pendulum
-import requests
 from allauth.socialaccount.models import SocialAccount
 from django import forms
-from django.core.exceptions import ValidationError
 
 from api.consts import form_types, form_expiry_times, form_privacy_types, expiry_times
 
 
-def validate_url(value):
-    """Check if url content type is text/plain"""
-    if 'text/plain' not in requests.head(value).headers['content-type']:
-        raise ValidationError('URL Content-Type must be text/plain!')
-    return value
-
-
 class LogCreateForm(forms.Form):
     def __init__(self, *args, **kwargs):
         user = kwargs.pop('user', None)
@@ -42,7 +33,6 @@ class LogCreateForm(forms.Form):
         ]
     )
     url = forms.URLField(
-        validators=[validate_url],
         required=False,
         widget=forms.URLInput(
             attrs={
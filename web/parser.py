@@ -2,6 +2,7 @@ import celery
 import pendulum
 
 from api import tasks, utils
+from api.blobs import digest
 from api.models import Log
 from api.v1 import tasks as v1_tasks
 
@@ -17,7 +18,7 @@ def create_preview(content, log_type, expires, **kwargs) -> dict:
     :type expires: Union[str, None]
     :param kwargs: Extraneous data.
     """
-    data = {'type': log_type, 'content': content, 'uuid': Log.generate_uuid(content), 'expires': expires}
+    data = {'type': log_type, 'content': content, 'uuid': Log.generate_uuid(digest(content)), 'expires': expires}
 
     result = celery.chain(v1_tasks.parse_text.s(log_type, content), tasks.parse_json.s())()
     data['data'] = {**result.get(), **kwargs}
@@ -32,6 +33,9 @@ def save_preview(data, owner) -> Log:
     :type data: dict
     :param owner: Log owner.
     """
+    data.update(Log.store_content(data.pop('content')))
+    if log := Log.find_content(data['content_key']):
+        return log
     data['expires'] = pendulum.parse(data['expires']) if data['expires'] else None
     data['owner'] = owner
     log_data = data.get('data')
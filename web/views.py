@@ -1,22 +1,28 @@
-import json
+import secrets
 
-import celery
 import pendulum
-import requests
+from celery.result import AsyncResult
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required
-from django.http import Http404
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
 from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
 from django.shortcuts import render, get_object_or_404, redirect
+from django.urls import reverse
+from django.template.loader import render_to_string
+from django.utils.html import escape
 from itsdangerous import BadSignature
 from sentry_sdk import capture_exception
 
-from api import tasks
-from api.consts import all_types, task_messages
+from api import fetch, navigation, tasks, timestamps
+from api.blobs import blob_store
+from api.consts import all_types, fetch_message, ingest_message, task_messages
+from api.fragments import PAGE_SIZE, fragment_store, render_page
 from api.models import Log
 from api.objects import LogRenderer, LiteLogRenderer
 from api.permissions import filter_view_queryset
-from api.utils import signer
+from api.search import search_messages
+from api.storage import log_messages
+from api.utils import run_sync, signer
 from api.v1.parser import create_log
 from web.forms import LogCreateForm
 from web.parser import create_preview, save_preview
@@ -35,8 +41,14 @@ def new(request):
                 content = form.cleaned_data['file'].read()
                 if isinstance(content, bytes):
                     content = content.decode()
+            elif request.POST['submit_type'] == 'Convert':
+                # Logs from a URL are downloaded by a worker, which creates them once they're stored
+                result = tasks.fetch_log.delay(form.cleaned_data['url'], form.cleaned_data['type'], request.user.pk,
+                                               form.cleaned_data['expires'], form.cleaned_data['privacy'],
+                                               form.cleaned_data['guild'])
+                return redirect('log-fetch', task_id=result.id)
             else:
-                content = requests.get(form.cleaned_data['url']).text
+                content = None
             data = {
                 'content': content,
                 'log_type': form.cleaned_data['type'],
@@ -48,7 +60,11 @@ def new(request):
                 log = create_log(**data, owner=request.user)
                 return redirect('log-html', pk=log.pk)
             try:
+                if data['content'] is None:
+                    data['content'] = ''.join(fetch.iter_text(form.cleaned_data['url']))
                 data = create_preview(**data)
+            except fetch.FetchError as e:
+                form.add_error('url', str(e))
             except IndexError as e:
                 form.add_error('type', str(e))
             else:
@@ -67,7 +83,7 @@ def _get_log(request, pk):
 
 
 def _paginate_logs(msgs, data):
-    if (paginator := Paginator(msgs, 50)).num_pages > 1:
+    if (paginator := Paginator(msgs, PAGE_SIZE)).num_pages > 1:
         data['chunked'] = True
     try:
         msg_page = paginator.page(data.pop('page'))
@@ -79,24 +95,41 @@ def _paginate_logs(msgs, data):
     return data
 
 
-def log_html(request, pk):
-    log = _get_log(request, pk)
+async def log_html(request, pk):
+    log = await run_sync(request, _get_log, request, pk)
+
+    page = request.GET.get('page')
+    fragment = None
+    if log.state == Log.State.DONE and fragment_store.client:
+        fragment = await run_sync(request, fragment_store.get, log, int(page) if page and page.isdigit() else 1)
+        # Requests for a page from the viewer get only its messages, straight from the fragment store when it has them
+        if page and request.is_ajax() and fragment is not None:
+            return HttpResponse(fragment)
+
+    return await run_sync(request, _render_log, request, log, page, fragment)
+
 
-    if not log.pages.count():
+def _render_log(request, log, page, fragment):
+    if log.state != Log.State.DONE:
         task_data = log.data.get('tasks')
+        task_labels = [ingest_message] if log.data.get('pipeline') == 'fused' else task_messages[-len(task_data):]
         return render(request, 'discord_logview/loading.html', context={
-            'task_ids': list(zip(task_data, task_messages[-len(task_data):])),
+            'task_ids': list(zip(task_data, task_labels)),
             'iso': pendulum.now().isoformat()
         })
 
-    data = {'uuid': log.uuid}
-    page = data['page'] = request.GET.get('page')
-    msgs = [msg for msgs in [p.messages for p in log.pages.order_by('index')] for msg in msgs]
-    data = _paginate_logs(msgs, data)
-    if page:
-        if not request.is_ajax():
-            return redirect('log-html', pk=pk)
-        return render(request, 'discord_logview/messages.html', context={'log': LiteLogRenderer(data)})
+    # Requests for a page from the viewer get only its messages, anyone else gets the viewer starting at that page
+    partial = page and request.is_ajax()
+
+    if fragment is None:
+        data = _paginate_logs(log_messages(log), {'uuid': log.uuid, 'page': page, 'authors': log.authors})
+        fragment = render_page(log.uuid, data['page'], log.authors)
+        fragment_store.set_many(log, {data['page'].number: fragment})
+    else:
+        # The page was rendered before, so neither its rows nor its messages are loaded
+        data = {'uuid': log.uuid, 'messages': [], 'chunked': log.message_count > PAGE_SIZE}
+    if partial:
+        return HttpResponse(fragment)
 
     if log.expires:
         if log.expires < pendulum.now():
@@ -106,47 +139,99 @@ def log_html(request, pk):
                       f'This log will expire on <time datetime="{log.expires.isoformat()}">'
                       f'{log.expires.strftime("%A, %B %d, %Y at %H:%M:%S UTC")}</time>')
 
-    data = {**data, 'created': log.created, 'users': log.users, 'raw_content': log.content, 'raw_type': log.type,
-            'type': all_types.get(log.type), 'user_id': None,
-            'delete_token': signer.dumps(f'log.{pk}.{pendulum.now().isoformat()}') if log.owner == request.user
+    data = {**data, 'created': log.created, 'users': log.users, 'raw_content': bool(log.content_size),
+            'raw_type': log.type, 'type': all_types.get(log.type), 'user_id': None,
+            'delete_token': signer.dumps(f'log.{log.pk}.{pendulum.now().isoformat()}') if log.owner == request.user
             else None,
-            'total_messages': len(msgs)}
+            'total_messages': log.message_count}
+
+    return render(request, 'discord_logview/logs.html', context={'log': LogRenderer(data), 'fragment': fragment})
+
+
+def log_fetch(request, task_id):
+    result = AsyncResult(task_id)
+    if result.successful():
+        return redirect('log-html', pk=result.result)
+    if result.failed():
+        messages.add_message(request, messages.ERROR, f'The log could not be downloaded: {escape(result.result)}')
+        return redirect('new')
+    return render(request, 'discord_logview/loading.html', context={
+        'task_ids': [(task_id, fetch_message)],
+        'iso': pendulum.now().isoformat()
+    })
 
-    return render(request, 'discord_logview/logs.html', context={'log': LogRenderer(data)})
 
 def log_rerun(request, pk):
     log = _get_log(request, pk)
 
     num_reruns = log.data.get('reruns', 0)
-    if log.pages.count() != 0 or (num_reruns > 5 and not request.user.is_superuser):
+    if log.state == Log.State.DONE or (num_reruns > 5 and not request.user.is_superuser):
         messages.add_message(request, messages.ERROR, 'This log cannot be reran!')
         return redirect('log-html', pk=log.pk)
 
-    content = json.loads(log.content)
-    result = celery.chain(tasks.parse_json.s(content) | tasks.create_pages.s(log.uuid))()
-
-    log.data['tasks'] = list(reversed(result.as_list()))
+    log.data.update(tasks.start_pipeline(None, log.uuid, content_key=log.content_key))
     log.data['reruns'] = log.data.get('reruns', 0) + 1
     log.save()
 
     messages.add_message(request, messages.SUCCESS, 'The log is being rerun...')
     return redirect('log-html', pk=log.pk)
 
+
+def log_jump(request, pk):
+    log = _get_log(request, pk)
+
+    message_id, at = request.GET.get('id'), request.GET.get('at')
+    try:
+        if message_id:
+            page = navigation.find_page(log, message_id=int(message_id))
+        elif at:
+            page = navigation.find_page(log, time=timestamps.parse(at))
+        else:
+            return handle400(request, exception='A message id or time is required!')
+    except ValueError:
+        return handle400(request, exception='Invalid message id or time!')
+    if page is None:
+        raise Http404
+    anchor = f'#message-{message_id}' if message_id else ''
+    return redirect(f'{reverse("log-html", kwargs={"pk": log.pk})}?page={page}{anchor}')
+
+
+def log_search(request, pk):
+    log = _get_log(request, pk)
+
+    if not (query := request.GET.get('q', '').strip()):
+        return JsonResponse({'errors': {'q': ['This field is required.']}}, status=400)
+    return JsonResponse({'query': query, 'results': search_messages(log, query)})
+
+
+def _stream_content(head, chunks, tail):
+    yield head
+    for chunk in chunks:
+        yield escape(chunk)
+    yield tail
+
+
 def log_raw(request, pk):
     log = _get_log(request, pk)
 
-    return render(request, 'discord_logview/lograw.html', context={'content': log.content, 'log': {'type': log.type}})
+    # Render the page around a placeholder, and stream the content in its place
+    placeholder = secrets.token_hex(16)
+    head, tail = render_to_string('discord_logview/lograw.html', context={
+        'content': placeholder, 'log': {'type': log.type}
+    }, request=request).split(placeholder, 1)
+    chunks = blob_store.iter_text(log.content_key) if log.content_key else ()
+    return StreamingHttpResponse(_stream_content(head, chunks, tail))
 
 
 def log_export(request, pk):
     log = _get_log(request, pk)
 
-    data = {'uuid': log.uuid, 'created': log.created, 'users': log.users, 'raw_content': log.content,
+    data = {'uuid': log.uuid, 'created': log.created, 'users': log.users, 'raw_content': bool(log.content_size),
             'raw_type': log.type, 'type': all_types.get(log.type), 'user_id': None}
 
-    msgs = [msg for msgs in [p.messages for p in log.pages.order_by('index')] for msg in msgs]
-    data['total_messages'] = len(msgs)
-    data['messages'] = msgs
+    data['total_messages'] = log.message_count
+    data['messages'] = list(log_messages(log))
+    data['authors'] = log.authors
     return render(request, 'discord_logview/logs.html', context={'log': LogRenderer(data), 'export': True})
 
 